@@ -0,0 +1,244 @@
+"""Simulated network device SSH server for benchmarks.
+
+An asyncssh server that accepts any credentials and emulates the CLI of a
+MikroTik RouterOS or Cisco IOS-XE device closely enough for the scrapli
+drivers used by networka: prompt detection, command echo (asyncssh's line
+editor echoes input on a PTY), deterministic command output of configurable
+size, and SFTP for file transfers and backup downloads.
+
+Every device in a benchmark inventory points at the same server; the server
+does not need to know device names. Latency is injected per login and per
+command to model AAA and WAN round trips.
+
+Run standalone for manual testing::
+
+    python -m benchmarks.fake_device --platform mikrotik_routeros --port 2222
+    ssh -p 2222 admin@127.0.0.1    # any password
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+import asyncssh
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceProfile:
+    """Prompt and housekeeping commands of an emulated platform."""
+
+    platform: str
+    prompt: str
+    quiet_commands: tuple[str, ...]
+    exit_commands: tuple[str, ...]
+    # Files present on the device's flash, served over SFTP
+    files: tuple[str, ...] = ()
+
+
+PROFILES: dict[str, DeviceProfile] = {
+    "mikrotik_routeros": DeviceProfile(
+        platform="mikrotik_routeros",
+        prompt="[admin@MikroTik] > ",
+        quiet_commands=(),
+        exit_commands=("/quit", "quit"),
+        files=("nw-backup.backup", "nw-export.rsc"),
+    ),
+    "cisco_iosxe": DeviceProfile(
+        platform="cisco_iosxe",
+        prompt="Router#",
+        quiet_commands=("terminal length 0", "terminal width 512"),
+        exit_commands=("exit", "logout"),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FakeDeviceSettings:
+    """Tunable behaviour of the simulated devices."""
+
+    platform: str = "mikrotik_routeros"
+    login_latency: float = 0.0
+    command_latency: float = 0.0
+    output_lines: int = 50
+    line_width: int = 80
+    file_size: int = 64 * 1024
+
+    @property
+    def profile(self) -> DeviceProfile:
+        try:
+            return PROFILES[self.platform]
+        except KeyError:
+            msg = f"Unknown platform '{self.platform}'; choose from {sorted(PROFILES)}"
+            raise ValueError(msg) from None
+
+
+def render_output(command: str, settings: FakeDeviceSettings) -> str:
+    """Return the deterministic output the fake device prints for ``command``."""
+    digest = hashlib.sha256(command.encode()).hexdigest()
+    filler = (digest * (settings.line_width // len(digest) + 1))[
+        : max(0, settings.line_width - 16)
+    ]
+    return "\n".join(f"{index:>6} {filler}" for index in range(settings.output_lines))
+
+
+class _Server(asyncssh.SSHServer):
+    def __init__(self, settings: FakeDeviceSettings) -> None:
+        self._settings = settings
+
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    async def validate_password(self, username: str, password: str) -> bool:
+        if self._settings.login_latency:
+            await asyncio.sleep(self._settings.login_latency)
+        return True
+
+
+async def _handle_shell(
+    process: asyncssh.SSHServerProcess[str], settings: FakeDeviceSettings
+) -> None:
+    profile = settings.profile
+    outputs: dict[str, str] = {}
+    try:
+        process.stdout.write(profile.prompt)
+        while not process.stdin.at_eof():
+            line = await process.stdin.readline()
+            if not line:
+                break
+            command = line.strip()
+            if command in profile.exit_commands:
+                break
+            if settings.command_latency:
+                await asyncio.sleep(settings.command_latency)
+            if command and command not in profile.quiet_commands:
+                output = outputs.get(command)
+                if output is None:
+                    output = outputs[command] = render_output(command, settings)
+                process.stdout.write(output + "\n")
+            process.stdout.write(profile.prompt)
+    except (asyncssh.BreakReceived, asyncssh.TerminalSizeChanged):
+        pass
+    except (BrokenPipeError, ConnectionError):
+        return
+    process.exit(0)
+
+
+class FakeDeviceServer:
+    """Run the simulated device server on a background event loop thread.
+
+    Use as a context manager; :attr:`port` is the bound port (pass ``port=0``
+    to let the OS choose one).
+    """
+
+    def __init__(
+        self,
+        settings: FakeDeviceSettings | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.settings = settings or FakeDeviceSettings()
+        self.host = host
+        self.port = port
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="fake-device-server", daemon=True
+        )
+        self._server: asyncssh.SSHAcceptor | None = None
+        self._workdir = tempfile.TemporaryDirectory(prefix="nw-fake-device-")
+        self.sftp_root = Path(self._workdir.name) / "flash"
+
+    def _prepare_files(self) -> None:
+        self.sftp_root.mkdir(parents=True, exist_ok=True)
+        for name in self.settings.profile.files:
+            (self.sftp_root / name).write_bytes(b"\0" * self.settings.file_size)
+
+    async def _start(self) -> None:
+        host_key = asyncssh.generate_private_key("ssh-ed25519")
+        settings = self.settings
+        sftp_root = str(self.sftp_root)
+
+        self._server = await asyncssh.create_server(
+            lambda: _Server(settings),
+            self.host,
+            self.port,
+            server_host_keys=[host_key],
+            process_factory=lambda process: _handle_shell(process, settings),
+            sftp_factory=lambda chan: asyncssh.SFTPServer(chan, chroot=sftp_root),
+            allow_scp=True,
+            backlog=1024,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self) -> FakeDeviceServer:
+        """Start serving; returns self once the port is bound."""
+        self._prepare_files()
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the event loop and files."""
+        if self._server is not None:
+            server = self._server
+
+            async def _close() -> None:
+                server.close()
+                await server.wait_closed()
+
+            asyncio.run_coroutine_threadsafe(_close(), self._loop).result()
+            self._server = None
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+        self._workdir.cleanup()
+
+    def __enter__(self) -> FakeDeviceServer:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulated network device server")
+    parser.add_argument("--platform", default="mikrotik_routeros", choices=PROFILES)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument("--login-latency", type=float, default=0.0)
+    parser.add_argument("--command-latency", type=float, default=0.0)
+    parser.add_argument("--output-lines", type=int, default=50)
+    args = parser.parse_args()
+
+    settings = FakeDeviceSettings(
+        platform=args.platform,
+        login_latency=args.login_latency,
+        command_latency=args.command_latency,
+        output_lines=args.output_lines,
+    )
+    with FakeDeviceServer(settings, host=args.host, port=args.port) as server:
+        print(f"Fake {args.platform} device listening on {server.host}:{server.port}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
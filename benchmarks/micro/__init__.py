@@ -0,0 +1 @@
+"""CPU-bound micro-benchmarks (pytest-benchmark)."""
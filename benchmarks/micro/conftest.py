@@ -0,0 +1,43 @@
+"""Fixtures for the CPU-bound micro-benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from benchmarks.micro.synthetic import write_inventory
+from network_toolkit.config import NetworkConfig, load_modular_config
+
+
+@pytest.fixture(scope="session")
+def inventory_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int], Path]:
+    """Return a factory for generated config directories, one per size."""
+    cache: dict[int, Path] = {}
+
+    def _get(size: int) -> Path:
+        if size not in cache:
+            cache[size] = write_inventory(
+                tmp_path_factory.mktemp(f"inventory-{size}"), size
+            )
+        return cache[size]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def loaded_config(
+    inventory_dir: Callable[[int], Path],
+) -> Callable[[int], NetworkConfig]:
+    """Return a factory for loaded configurations, one per size."""
+    cache: dict[int, NetworkConfig] = {}
+
+    def _get(size: int) -> NetworkConfig:
+        if size not in cache:
+            cache[size] = load_modular_config(inventory_dir(size))
+        return cache[size]
+
+    return _get
@@ -0,0 +1,127 @@
+"""Synthetic inventories and captured outputs for micro-benchmarks.
+
+Everything is generated deterministically from the requested size so runs
+on different commits benchmark identical inputs.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import yaml
+
+SIZES = (1_000, 10_000, 100_000)
+MAX_DEVICES_ENV = "NW_BENCH_MAX_DEVICES"
+DEVICES_PER_FILE = 1_000
+SITES = 50
+ROLES = ("core", "dist", "access", "edge", "wireless")
+DEVICE_TYPES = ("mikrotik_routeros", "cisco_iosxe", "arista_eos", "juniper_junos")
+
+
+def bench_sizes() -> list[int]:
+    """Inventory sizes to benchmark, capped by ``NW_BENCH_MAX_DEVICES``."""
+    cap = int(os.environ.get(MAX_DEVICES_ENV, max(SIZES)))
+    return [size for size in SIZES if size <= cap]
+
+
+def size_id(size: int) -> str:
+    return f"{size // 1000}k"
+
+
+def device_name(index: int) -> str:
+    return f"dev-{index:06d}"
+
+
+def device_record(index: int) -> dict[str, object]:
+    site = index % SITES
+    role = ROLES[index % len(ROLES)]
+    return {
+        "host": f"10.{site}.{(index // 250) % 256}.{index % 250 + 1}",
+        "device_type": DEVICE_TYPES[index % len(DEVICE_TYPES)],
+        "description": f"{role} device {index} at site {site}",
+        "location": f"site-{site:02d}",
+        "tags": [role, f"site-{site:02d}", "prod" if index % 3 else "lab"],
+    }
+
+
+def group_records() -> dict[str, dict[str, object]]:
+    groups: dict[str, dict[str, object]] = {
+        f"{role}_all": {"description": f"All {role} devices", "match_tags": [role]}
+        for role in ROLES
+    }
+    for site in range(SITES):
+        groups[f"site_{site:02d}"] = {
+            "description": f"Site {site}",
+            "match_tags": [f"site-{site:02d}"],
+        }
+        groups[f"site_{site:02d}_core"] = {
+            "description": f"Site {site} core",
+            "match_tags": [f"site-{site:02d}", "core"],
+        }
+    groups["lab_first"] = {
+        "description": "Hand-picked lab devices",
+        "members": [device_name(i) for i in range(0, 300, 3)],
+    }
+    return groups
+
+
+def write_inventory(root: Path, size: int) -> Path:
+    """Write a modular config directory with ``size`` devices; return it."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "config.yml").write_text(
+        yaml.safe_dump({"general": {"results_dir": str(root / "results")}}),
+        encoding="utf-8",
+    )
+    devices_dir = root / "devices"
+    devices_dir.mkdir(exist_ok=True)
+    for start in range(0, size, DEVICES_PER_FILE):
+        chunk = {
+            device_name(i): device_record(i)
+            for i in range(start, min(size, start + DEVICES_PER_FILE))
+        }
+        (devices_dir / f"devices-{start // DEVICES_PER_FILE:04d}.yml").write_text(
+            yaml.safe_dump({"devices": chunk}, sort_keys=False), encoding="utf-8"
+        )
+    groups_dir = root / "groups"
+    groups_dir.mkdir(exist_ok=True)
+    (groups_dir / "groups.yml").write_text(
+        yaml.safe_dump({"groups": group_records()}, sort_keys=False),
+        encoding="utf-8",
+    )
+    return root
+
+
+def target_expression(size: int) -> str:
+    """A realistic mixed target: groups plus a spread of individual devices."""
+    names = ["core_all", "site_07", "site_13_core", "lab_first"]
+    names.extend(device_name(i) for i in range(0, size, max(1, size // 200)))
+    return ",".join(names)
+
+
+def captured_output(lines: int, *, seed: int = 0) -> list[str]:
+    """Interface/status style output with timestamps, counters and uptimes."""
+    out: list[str] = []
+    for i in range(lines):
+        kind = i % 4
+        if kind == 0:
+            out.append(f"interface ether{i % 48 + 1}")
+        elif kind == 1:
+            out.append(
+                f"  rx-byte={1_000_000 + i * 7 + seed} tx-byte={2_000_000 + i * 11 + seed}"
+            )
+        elif kind == 2:
+            out.append(
+                f"  last-link-up-time=2026-01-{i % 28 + 1:02d} 12:{i % 60:02d}:00"
+            )
+        else:
+            out.append(f'  uptime={i % 9}w{i % 7}d{i % 24}h comment="port {i}"')
+    return out
+
+
+def changed_output(base: list[str], *, every: int = 100) -> list[str]:
+    """Copy of ``base`` with every ``every``-th line edited."""
+    return [
+        f"{line} changed" if index % every == 0 else line
+        for index, line in enumerate(base)
+    ]
@@ -0,0 +1,43 @@
+"""Canonicalization and unified diffing of large captured outputs."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.micro.synthetic import captured_output, changed_output
+from network_toolkit.api.diff_stream import unified_diff_stream
+from network_toolkit.api.state_diff import Canonicalizer
+
+LINE_COUNTS = pytest.mark.parametrize(
+    "lines", [10_000, 100_000], ids=lambda n: f"{n // 1000}k-lines"
+)
+
+
+@LINE_COUNTS
+def test_canonicalizer_normalize(benchmark: BenchmarkFixture, lines: int) -> None:
+    benchmark.group = "Canonicalizer.normalize"
+    output = captured_output(lines)
+    canonicalizer = Canonicalizer()
+
+    def _normalize_all() -> list[str]:
+        return [canonicalizer.normalize(line) for line in output]
+
+    normalized = benchmark(_normalize_all)
+    assert len(normalized) == lines
+
+
+@LINE_COUNTS
+def test_unified_diff_stream(benchmark: BenchmarkFixture, lines: int) -> None:
+    # Streaming replacement for the former in-memory _make_unified_diff helper
+    benchmark.group = "unified_diff"
+    baseline = captured_output(lines)
+    current = changed_output(baseline)
+
+    def _diff() -> int:
+        counter = deque(enumerate(unified_diff_stream(baseline, current)), maxlen=1)
+        return counter[0][0] + 1 if counter else 0
+
+    assert benchmark(_diff) > 0
@@ -0,0 +1,109 @@
+"""Config loading, target resolution and sequence setup at 1k/10k/100k devices."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.micro.synthetic import (
+    bench_sizes,
+    device_name,
+    size_id,
+    target_expression,
+)
+from network_toolkit.config import NetworkConfig, load_modular_config
+from network_toolkit.inventory.catalog import InventoryCatalog
+from network_toolkit.inventory.resolve import resolve_named_targets
+from network_toolkit.sequence_manager import SequenceManager
+
+SIZES = pytest.mark.parametrize("size", bench_sizes(), ids=size_id)
+
+
+@SIZES
+def test_load_modular_config(
+    benchmark: BenchmarkFixture, inventory_dir: Callable[[int], Path], size: int
+) -> None:
+    benchmark.group = "load_modular_config"
+    config_dir = inventory_dir(size)
+    config = benchmark.pedantic(
+        load_modular_config, args=(config_dir,), rounds=3, warmup_rounds=1
+    )
+    assert config.devices is not None
+    assert len(config.devices) == size
+
+
+@SIZES
+def test_resolve_named_targets(
+    benchmark: BenchmarkFixture,
+    loaded_config: Callable[[int], NetworkConfig],
+    size: int,
+) -> None:
+    benchmark.group = "resolve_named_targets"
+    config = loaded_config(size)
+    expr = target_expression(size)
+    result = benchmark(resolve_named_targets, config, expr)
+    assert result.resolved_devices
+    assert not result.unknown_targets
+
+
+def _two_source_catalog(config: NetworkConfig) -> InventoryCatalog:
+    """Two sources sharing every tenth device name, as with overlapping inventories."""
+    devices = config.devices or {}
+    groups = config.device_groups or {}
+    shared = {name: dev for i, (name, dev) in enumerate(devices.items()) if i % 10 == 0}
+    catalog = InventoryCatalog()
+    catalog.add_source(
+        source_id="primary",
+        kind="config",
+        root=None,
+        inventory_file=None,
+        devices=devices,
+        groups=groups,
+    )
+    catalog.add_source(
+        source_id="nornir",
+        kind="nornir_simple",
+        root=None,
+        inventory_file=None,
+        devices=shared,
+        groups={},
+    )
+    return catalog
+
+
+@SIZES
+def test_inventory_catalog_resolve_one(
+    benchmark: BenchmarkFixture,
+    loaded_config: Callable[[int], NetworkConfig],
+    size: int,
+) -> None:
+    benchmark.group = "InventoryCatalog._resolve_one"
+    catalog = _two_source_catalog(loaded_config(size))
+    names = [device_name(i) for i in range(size)]
+
+    def _resolve_all() -> int:
+        resolved = 0
+        for name in names:
+            # Shared names need an explicit source; unique ones resolve directly
+            entries = catalog.devices_by_name[name]
+            source = "primary" if len(entries) > 1 else None
+            if catalog._resolve_one(entries, name, prefer=None, source_id=source):
+                resolved += 1
+        return resolved
+
+    assert benchmark(_resolve_all) == size
+
+
+@SIZES
+def test_sequence_manager_construction(
+    benchmark: BenchmarkFixture,
+    loaded_config: Callable[[int], NetworkConfig],
+    size: int,
+) -> None:
+    benchmark.group = "SequenceManager"
+    config = loaded_config(size)
+    manager = benchmark(SequenceManager, config)
+    assert manager.list_vendor_sequences("mikrotik_routeros")
@@ -0,0 +1,424 @@
+"""End-to-end benchmarks against simulated devices.
+
+Starts a :class:`~benchmarks.fake_device.FakeDeviceServer`, generates an
+inventory of N devices that all point at it, and times the public API calls
+a real job would make:
+
+``run``
+    ``run_commands`` with one command per device.
+``backup``
+    ``run_backup`` including the SFTP download of the backup files.
+``diff``
+    ``diff_targets`` of one command against a baseline file.
+``upload``
+    ``upload_file`` of one file to every device (without verification).
+
+Results are written as JSON. Passing ``--compare`` with the JSON of an earlier
+commit prints the change per scenario and exits with status 1 when any
+scenario got slower than ``--threshold`` allows, so a CI job can run the
+suite on both commits and fail on regressions::
+
+    # on the base commit
+    python -m benchmarks.run_benchmarks --output base.json
+    # on the change
+    python -m benchmarks.run_benchmarks --compare base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_device import (
+    PROFILES,
+    FakeDeviceServer,
+    FakeDeviceSettings,
+    render_output,
+)
+from network_toolkit.api.backup import BackupOptions, run_backup
+from network_toolkit.api.diff import DiffOptions, diff_targets
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.api.upload import UploadOptions, upload_file
+from network_toolkit.config import (
+    DeviceConfig,
+    DeviceGroup,
+    GeneralConfig,
+    NetworkConfig,
+)
+
+SCENARIOS = ("run", "backup", "diff", "upload")
+DEFAULT_DEVICE_COUNTS = (10, 100, 1000)
+BENCH_GROUP = "bench"
+BENCH_COMMAND = "/system/resource/print"
+
+console = Console()
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Outcome of one scenario at one inventory size."""
+
+    scenario: str
+    devices: int
+    duration: float
+    succeeded: int
+    failed: int
+    metrics: dict[str, Any] | None = None
+
+    @property
+    def devices_per_minute(self) -> float:
+        return self.devices * 60.0 / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["devices_per_minute"] = round(self.devices_per_minute, 3)
+        return data
+
+
+@dataclass(slots=True)
+class BenchmarkContext:
+    """Everything a scenario needs for one inventory size."""
+
+    config: NetworkConfig
+    workdir: Path
+    settings: FakeDeviceSettings
+    upload_concurrency: int
+
+
+def build_inventory(
+    count: int,
+    port: int,
+    settings: FakeDeviceSettings,
+    *,
+    workdir: Path,
+    transport: str,
+) -> NetworkConfig:
+    """Return a configuration with ``count`` devices in the ``bench`` group."""
+    devices = {
+        f"bench-{index:05d}": DeviceConfig(
+            host="127.0.0.1",
+            port=port,
+            device_type=settings.platform,
+            tags=[BENCH_GROUP],
+        )
+        for index in range(count)
+    }
+    general = GeneralConfig(
+        transport=transport,
+        ssh_config_file=False,
+        ssh_strict_host_key_checking=False,
+        connection_retries=1,
+        retry_delay=0,
+        backup_dir=str(workdir / "backups"),
+        results_dir=str(workdir / "results"),
+    )
+    return NetworkConfig(
+        general=general,
+        devices=devices,
+        device_groups={
+            BENCH_GROUP: DeviceGroup(
+                description="Simulated benchmark devices", match_tags=[BENCH_GROUP]
+            )
+        },
+    )
+
+
+def _scenario_run(ctx: BenchmarkContext) -> BenchmarkResult:
+    result = run_commands(
+        RunOptions(
+            target=BENCH_GROUP, command_or_sequence=BENCH_COMMAND, config=ctx.config
+        )
+    )
+    return BenchmarkResult(
+        scenario="run",
+        devices=result.totals.total,
+        duration=result.duration,
+        succeeded=result.totals.succeeded,
+        failed=result.totals.failed,
+        metrics=result.metrics.to_dict() if result.metrics else None,
+    )
+
+
+def _scenario_backup(ctx: BenchmarkContext) -> BenchmarkResult:
+    result = run_backup(BackupOptions(target=BENCH_GROUP, config=ctx.config))
+    return BenchmarkResult(
+        scenario="backup",
+        devices=result.totals.total,
+        duration=result.duration,
+        succeeded=result.totals.succeeded,
+        failed=result.totals.failed,
+        metrics=result.metrics.to_dict() if result.metrics else None,
+    )
+
+
+def _scenario_diff(ctx: BenchmarkContext) -> BenchmarkResult:
+    baseline = ctx.workdir / "baseline.txt"
+    if not baseline.exists():
+        # Differs from the device output in a few lines so a diff is rendered
+        lines = render_output(BENCH_COMMAND, ctx.settings).splitlines()
+        for index in range(0, len(lines), 10):
+            lines[index] = f"{lines[index]} changed"
+        baseline.write_text("\n".join(lines), encoding="utf-8")
+
+    started = time.perf_counter()
+    result = diff_targets(
+        DiffOptions(
+            targets=BENCH_GROUP,
+            subject=BENCH_COMMAND,
+            config=ctx.config,
+            baseline=baseline,
+        )
+    )
+    duration = time.perf_counter() - started
+    failed = sum(1 for item in result.results if item.error)
+    return BenchmarkResult(
+        scenario="diff",
+        devices=len(result.results),
+        duration=duration,
+        succeeded=len(result.results) - failed,
+        failed=failed,
+    )
+
+
+def _scenario_upload(ctx: BenchmarkContext) -> BenchmarkResult:
+    payload = ctx.workdir / "payload.bin"
+    if not payload.exists():
+        payload.write_bytes(os.urandom(ctx.settings.file_size))
+
+    result = upload_file(
+        UploadOptions(
+            target=BENCH_GROUP,
+            local_file=payload,
+            config=ctx.config,
+            verify=False,
+            max_concurrent=ctx.upload_concurrency,
+        )
+    )
+    return BenchmarkResult(
+        scenario="upload",
+        devices=result.totals.total,
+        duration=result.duration,
+        succeeded=result.totals.succeeded,
+        failed=result.totals.failed,
+    )
+
+
+SCENARIO_FUNCS: dict[str, Callable[[BenchmarkContext], BenchmarkResult]] = {
+    "run": _scenario_run,
+    "backup": _scenario_backup,
+    "diff": _scenario_diff,
+    "upload": _scenario_upload,
+}
+
+
+def run_suite(
+    scenarios: list[str],
+    device_counts: list[int],
+    settings: FakeDeviceSettings,
+    *,
+    transport: str = "paramiko",
+    repeat: int = 1,
+    upload_concurrency: int = 50,
+) -> list[BenchmarkResult]:
+    """Run every scenario at every size; keeps the fastest of ``repeat`` runs."""
+    results: list[BenchmarkResult] = []
+    with (
+        FakeDeviceServer(settings) as server,
+        tempfile.TemporaryDirectory(prefix="nw-bench-") as tmp,
+    ):
+        for count in device_counts:
+            workdir = Path(tmp) / str(count)
+            workdir.mkdir()
+            ctx = BenchmarkContext(
+                config=build_inventory(
+                    count, server.port, settings, workdir=workdir, transport=transport
+                ),
+                workdir=workdir,
+                settings=settings,
+                upload_concurrency=upload_concurrency,
+            )
+            for scenario in scenarios:
+                best: BenchmarkResult | None = None
+                for _ in range(max(1, repeat)):
+                    outcome = SCENARIO_FUNCS[scenario](ctx)
+                    if best is None or outcome.duration < best.duration:
+                        best = outcome
+                assert best is not None
+                console.print(
+                    f"{scenario:>7} x {count:<5} {best.duration:8.2f}s "
+                    f"({best.devices_per_minute:,.0f} devices/min, "
+                    f"{best.failed} failed)"
+                )
+                results.append(best)
+    return results
+
+
+def compare_results(
+    current: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Print a comparison table; return the keys of regressed scenarios."""
+    previous = {(r["scenario"], r["devices"]): r for r in baseline}
+    table = Table(title="Benchmark comparison")
+    for column in ("Scenario", "Devices", "Baseline", "Current", "Change"):
+        table.add_column(column)
+
+    regressions: list[str] = []
+    for entry in current:
+        key = (entry["scenario"], entry["devices"])
+        before = previous.get(key)
+        if before is None or not before["duration"]:
+            table.add_row(
+                entry["scenario"],
+                str(entry["devices"]),
+                "-",
+                f"{entry['duration']:.2f}s",
+                "new",
+            )
+            continue
+        change = entry["duration"] / before["duration"] - 1.0
+        marker = ""
+        if change > threshold:
+            marker = " REGRESSION"
+            regressions.append(f"{entry['scenario']}@{entry['devices']}")
+        table.add_row(
+            entry["scenario"],
+            str(entry["devices"]),
+            f"{before['duration']:.2f}s",
+            f"{entry['duration']:.2f}s",
+            f"{change:+.1%}{marker}",
+        )
+    console.print(table)
+    return regressions
+
+
+def _git_commit() -> str | None:
+    git = shutil.which("git")
+    if git is None:
+        return None
+    try:
+        completed = subprocess.run(
+            [git, "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _parse_counts(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Networka end-to-end benchmarks")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--devices",
+        type=_parse_counts,
+        default=list(DEFAULT_DEVICE_COUNTS),
+        help="Comma-separated inventory sizes (default: 10,100,1000)",
+    )
+    parser.add_argument("--platform", default="mikrotik_routeros", choices=PROFILES)
+    parser.add_argument(
+        "--transport",
+        default="paramiko",
+        help="Scrapli transport for command sessions (default: paramiko)",
+    )
+    parser.add_argument("--login-latency", type=float, default=0.0)
+    parser.add_argument("--command-latency", type=float, default=0.0)
+    parser.add_argument("--output-lines", type=int, default=200)
+    parser.add_argument("--file-size", type=int, default=256 * 1024)
+    parser.add_argument("--upload-concurrency", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier results JSON to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed slowdown before a scenario counts as regressed (default: 0.15)",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    # The fake server accepts any credentials
+    os.environ.setdefault("NW_USER_DEFAULT", "admin")
+    os.environ.setdefault("NW_PASSWORD_DEFAULT", "admin")
+    # Teardown noise from thousands of short-lived sessions
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+    logging.getLogger("asyncio").setLevel(logging.ERROR)
+
+    settings = FakeDeviceSettings(
+        platform=args.platform,
+        login_latency=args.login_latency,
+        command_latency=args.command_latency,
+        output_lines=args.output_lines,
+        file_size=args.file_size,
+    )
+    results = run_suite(
+        scenarios,
+        args.devices,
+        settings,
+        transport=args.transport,
+        repeat=args.repeat,
+        upload_concurrency=args.upload_concurrency,
+    )
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created": datetime.now(tz=UTC).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "transport": args.transport,
+            "settings": asdict(settings),
+        },
+        "results": [r.to_dict() for r in results],
+    }
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    console.print(f"Results written to {args.output}")
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    regressions = compare_results(
+        report["results"], baseline.get("results", []), args.threshold
+    )
+    if regressions:
+        console.print(f"Regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
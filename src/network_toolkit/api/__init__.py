@@ -20,7 +20,7 @@ from network_toolkit.api.download import (
     DownloadResult,
     download_file,
 )
-from network_toolkit.api.execution import execute_parallel
+from network_toolkit.api.execution import AdaptiveLimiter, execute_parallel
 from network_toolkit.api.firmware import (
     DeviceUpgradeResult,
     FirmwareUpgradeOptions,
@@ -65,6 +65,7 @@ from network_toolkit.api.run import (
     TargetResolution,
     TargetResolutionError,
     run_commands,
+    timings_to_dict,
 )
 from network_toolkit.api.upload import (
     DeviceUploadResult,
@@ -74,6 +75,8 @@ from network_toolkit.api.upload import (
 )
 
 __all__ = [
+    # execution
+    "AdaptiveLimiter",
     # backup
     "BackupOptions",
     "BackupResult",
@@ -134,6 +137,7 @@ __all__ = [
     "list_platforms",
     "run_backup",
     "run_commands",
+    "timings_to_dict",
     "upgrade_firmware",
     "upgrade_routerboard",
     "upload_file",
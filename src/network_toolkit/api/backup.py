@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
 from collections.abc import Iterator
@@ -13,17 +14,21 @@ from pathlib import Path
 from time import perf_counter
 
 from network_toolkit.api.run import RunTotals, TargetResolution
+from network_toolkit.common.compression import compressed_path, open_text
 from network_toolkit.config import NetworkConfig
 from network_toolkit.device import DeviceSession
 from network_toolkit.exceptions import NetworkToolkitError
 from network_toolkit.inventory.resolve import resolve_named_targets
 from network_toolkit.ip_device import extract_ips_from_target, is_ip_list
+from network_toolkit.metrics import RunMetrics
 from network_toolkit.platforms import (
     UnsupportedOperationError,
     get_platform_operations,
 )
 from network_toolkit.sequence_manager import SequenceManager
 from network_toolkit.session_pool import SessionPoolProtocol
+from network_toolkit.timing import TimingSpan, recording
+from network_toolkit.tracing import device_span, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +57,7 @@ class DeviceBackupResult:
     text_outputs: dict[str, str] = field(default_factory=dict)
     downloaded_files: list[str] = field(default_factory=list)
     error: str | None = None
+    timings: list[TimingSpan] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -65,6 +71,7 @@ class BackupResult:
     totals: RunTotals
     device_results: list[DeviceBackupResult] = field(default_factory=list)
     notices: list[str] = field(default_factory=list)
+    metrics: RunMetrics | None = None
 
 
 def _resolve_targets(target_expr: str, config: NetworkConfig) -> TargetResolution:
@@ -140,6 +147,19 @@ def _perform_device_backup(
     run_timestamp: str,
 ) -> DeviceBackupResult:
     """Perform backup for a single device."""
+    with device_span(options.config, device_name) as span, recording() as recorder:
+        result = _backup_device(device_name, options, run_timestamp)
+        if not result.success:
+            span.set_error(result.error or "backup failed")
+    result.timings = recorder.spans
+    return result
+
+
+def _backup_device(
+    device_name: str,
+    options: BackupOptions,
+    run_timestamp: str,
+) -> DeviceBackupResult:
     try:
         with _get_session(device_name, options.config, options.session_pool) as session:
             # Get platform-specific operations
@@ -187,10 +207,14 @@ def _perform_device_backup(
             )
             backup_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save text outputs
+            # Save text outputs, compressed as they are written if configured
+            compression = options.config.general.results_compression
+            text_outputs: dict[str, str] = {}
             for filename, content in backup_op_result.text_outputs.items():
-                output_file = backup_dir / filename
-                output_file.write_text(content, encoding="utf-8")
+                output_file = compressed_path(backup_dir / filename, compression)
+                with open_text(output_file, "w", compression) as f:
+                    f.write(content)
+                text_outputs[output_file.name] = content
 
             downloaded_files = []
             # Download files if requested
@@ -231,7 +255,7 @@ def _perform_device_backup(
                 "timestamp": run_timestamp,
                 "platform": platform_name,
                 "transport": transport_type,
-                "text_outputs": list(backup_op_result.text_outputs.keys()),
+                "text_outputs": list(text_outputs),
                 "downloaded_files": downloaded_files,
             }
             manifest_file = backup_dir / "manifest.json"
@@ -243,7 +267,7 @@ def _perform_device_backup(
                 platform=platform_name,
                 transport=transport_type,
                 backup_dir=backup_dir,
-                text_outputs=backup_op_result.text_outputs,
+                text_outputs=text_outputs,
                 downloaded_files=downloaded_files,
             )
 
@@ -263,6 +287,18 @@ def _perform_device_backup(
 
 def run_backup(options: BackupOptions) -> BackupResult:
     """Execute backup operation."""
+    with trace_span("nw.backup", target=options.target) as span:
+        result = _run_backup(options)
+        span.set_attributes(
+            {
+                "devices.total": result.totals.total,
+                "devices.failed": result.totals.failed,
+            }
+        )
+        return result
+
+
+def _run_backup(options: BackupOptions) -> BackupResult:
     start_time = perf_counter()
 
     # Resolve targets
@@ -276,18 +312,33 @@ def run_backup(options: BackupOptions) -> BackupResult:
     run_timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
 
     results: list[DeviceBackupResult] = []
+    metrics = RunMetrics("backup", options.target)
 
     # Run in parallel
     with ThreadPoolExecutor() as executor:
+        # Run each device in a copy of this context so its span joins the run
         future_to_device = {
-            executor.submit(_perform_device_backup, dev, options, run_timestamp): dev
+            executor.submit(
+                contextvars.copy_context().run,
+                _perform_device_backup,
+                dev,
+                options,
+                run_timestamp,
+            ): dev
             for dev in resolution.resolved
         }
 
         for future in as_completed(future_to_device):
-            results.append(future.result())
+            dev_result = future.result()
+            metrics.observe_device(
+                dev_result.timings,
+                error=None if dev_result.success else dev_result.error or "failed",
+            )
+            results.append(dev_result)
 
     duration = perf_counter() - start_time
+    metrics.observe_unresolved(len(resolution.unknown))
+    metrics.finish(duration)
 
     succeeded = sum(1 for r in results if r.success)
     failed = sum(1 for r in results if not r.success) + len(resolution.unknown)
@@ -305,4 +356,5 @@ def run_backup(options: BackupOptions) -> BackupResult:
         duration=duration,
         totals=totals,
         device_results=results,
+        metrics=metrics,
     )
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import difflib
+import contextvars
 import logging
 import re
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import partial
+from functools import cached_property, partial
 from pathlib import Path
 
+from network_toolkit.api.diff_stream import (
+    iter_text_lines,
+    open_lines,
+    unified_diff_stream,
+)
 from network_toolkit.api.execution import execute_parallel
-from network_toolkit.api.state_diff import StateDiffer
+from network_toolkit.api.state_diff import IgnoreRuleSet, StateDiffer
+from network_toolkit.api.structured_diff import StructuredDiffer
+from network_toolkit.common.compression import find_variant
 from network_toolkit.config import NetworkConfig
 from network_toolkit.device import DeviceSession
 from network_toolkit.exceptions import NetworkToolkitError
@@ -21,6 +28,7 @@ from network_toolkit.inventory.resolve import resolve_named_targets
 from network_toolkit.results_enhanced import ResultsManager
 from network_toolkit.sequence_manager import SequenceManager
 from network_toolkit.session_pool import SessionPoolProtocol
+from network_toolkit.tracing import device_span, trace_span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +48,12 @@ class DiffOptions:
     verbose: bool = False
     session_pool: SessionPoolProtocol | None = None
     heuristic: bool = False
+    structured: bool = False
+
+    @cached_property
+    def ignore_rules(self) -> IgnoreRuleSet:
+        """User ignore patterns, compiled once for the whole diff run."""
+        return IgnoreRuleSet.compile(self.ignore_patterns)
 
 
 @dataclass
@@ -74,32 +88,19 @@ def _sanitize_filename(text: str) -> str:
     return re.sub(r"[\\/:*?\"<>|\s]+", "_", text).strip("_.")
 
 
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
-
-
 def _write_text(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text, encoding="utf-8")
 
 
-def _filter_lines(text: str, ignore_patterns: list[str]) -> list[str]:
-    if not ignore_patterns:
-        return text.splitlines(keepends=False)
-    regexes = [re.compile(p) for p in ignore_patterns]
-    lines: list[str] = []
-    for line in text.splitlines(keepends=False):
-        if any(r.search(line) for r in regexes):
-            continue
-        lines.append(line)
-    return lines
-
-
-def _make_unified_diff(
-    a_lines: list[str], b_lines: list[str], a_label: str, b_label: str
-) -> str:
-    diff = difflib.unified_diff(a_lines, b_lines, fromfile=a_label, tofile=b_label)
-    return "\n".join(diff)
+@contextmanager
+def _open_lines(source: str | Path) -> Iterator[Iterator[str]]:
+    """Yield a lazy line iterator for in-memory text or a (memory-mapped) file."""
+    if isinstance(source, Path):
+        with open_lines(source) as lines:
+            yield lines
+    else:
+        yield iter_text_lines(source)
 
 
 @contextmanager
@@ -141,44 +142,70 @@ def _get_session(
             yield session
 
 
+@traced("diff.compare")
 def _diff_texts(
     *,
-    baseline_text: str,
-    current_text: str,
+    baseline: str | Path,
+    current: str | Path,
     baseline_label: str,
     current_label: str,
-    ignore_patterns: list[str],
+    ignore_rules: IgnoreRuleSet,
     heuristic: bool = False,
+    structured: StructuredDiffer | None = None,
 ) -> DiffOutcome:
+    """Compare two outputs given as text or as paths to (baseline) files.
+
+    File inputs are memory-mapped and streamed line by line, so the unified
+    and structured modes never hold a whole large output in memory.
+    """
+    if structured is not None:
+        # Known command: parse into keyed records once and diff as dict sets
+        with _open_lines(baseline) as a, _open_lines(current) as b:
+            result = structured.diff(ignore_rules.filter(a), ignore_rules.filter(b))
+        out = result.to_string()
+        return DiffOutcome(
+            changed=bool(out.strip() and "No significant" not in out), output=out
+        )
+
     if heuristic:
-        differ = StateDiffer()
-        # Note: ignore_patterns are handled inside StateDiffer via canonicalization
-        # but we might want to support user-supplied patterns too.
-        # For now, StateDiffer uses its built-in patterns + IGNORE_PATTERNS.
-        # If user supplied ignore_patterns, we could potentially add them to StateDiffer
-        # but StateDiffer design currently relies on hardcoded patterns.
-        # We will apply user ignore patterns as a pre-filter if provided.
-        if ignore_patterns:
-            baseline_text = "\n".join(_filter_lines(baseline_text, ignore_patterns))
-            current_text = "\n".join(_filter_lines(current_text, ignore_patterns))
-
-        result = differ.diff(baseline_text, current_text)
+        # User rules drop raw lines before segmentation, so an ignored header
+        # does not open a block; the builtin IGNORE_PATTERNS are applied by
+        # the canonicalizer.
+        with _open_lines(baseline) as a, _open_lines(current) as b:
+            result = StateDiffer().diff(ignore_rules.filter(a), ignore_rules.filter(b))
         out = result.to_string()
         return DiffOutcome(
             changed=bool(out.strip() and "No significant" not in out), output=out
         )
 
-    a = _filter_lines(baseline_text, ignore_patterns)
-    b = _filter_lines(current_text, ignore_patterns)
-    out = _make_unified_diff(a, b, baseline_label, current_label)
+    with _open_lines(baseline) as a, _open_lines(current) as b:
+        out = "\n".join(
+            unified_diff_stream(
+                ignore_rules.filter(a),
+                ignore_rules.filter(b),
+                fromfile=baseline_label,
+                tofile=current_label,
+            )
+        )
     return DiffOutcome(changed=bool(out.strip()), output=out)
 
 
+def _structured_differ(
+    options: DiffOptions, device: str, command: str
+) -> StructuredDiffer | None:
+    """Return a structured differ when requested and a template is known."""
+    if not options.structured:
+        return None
+    device_cfg = (options.config.devices or {}).get(device)
+    device_type = getattr(device_cfg, "device_type", None)
+    return StructuredDiffer.for_command(device_type, command)
+
+
 def _find_baseline_file_for_command(base_dir: Path, command: str) -> Path | None:
     stem = f"cmd_{_sanitize_filename(command)}"
     for ext in (".txt", ".log", ".out"):
-        candidate = base_dir / f"{stem}{ext}"
-        if candidate.exists():
+        candidate = find_variant(base_dir / f"{stem}{ext}")
+        if candidate is not None:
             return candidate
     return None
 
@@ -201,6 +228,20 @@ def _save_artifact(device: str, name: str, text: str, save_path: Path | None) ->
 
 def _perform_device_diff(
     device: str, options: DiffOptions, sequence_manager: SequenceManager
+) -> list[DiffItemResult]:
+    with device_span(options.config, device) as span:
+        results = _diff_device(device, options, sequence_manager)
+        errors = [r.error for r in results if r.error]
+        if errors:
+            span.set_error(errors[0])
+        span.set_attribute(
+            "diff.changed", sum(1 for r in results if r.outcome and r.outcome.changed)
+        )
+        return results
+
+
+def _diff_device(
+    device: str, options: DiffOptions, sequence_manager: SequenceManager
 ) -> list[DiffItemResult]:
     if options.baseline is None:
         return [
@@ -222,15 +263,15 @@ def _perform_device_diff(
             # Diff config vs file
             if options.baseline.is_dir():
                 # Try to find file in dir
-                cand = options.baseline / f"{device}.rsc"
-                if not cand.exists():
-                    cand = options.baseline / f"{device}.txt"
-                if not cand.exists():
+                cand = options.baseline / f"{device}.txt"
+                found = find_variant(options.baseline / f"{device}.rsc")
+                found = found or find_variant(cand)
+                if found is None:
                     # Try finding any file with device name
                     matches = list(options.baseline.glob(f"*{device}*"))
                     if matches:
-                        cand = matches[0]
-                base_file = cand
+                        found = matches[0]
+                base_file = found or cand
             else:
                 base_file = options.baseline
 
@@ -244,18 +285,17 @@ def _perform_device_diff(
                     )
                 ]
 
-            base_text = _read_text(base_file)
             with _get_session(device, options.config, options.session_pool) as s:
                 curr_text = s.execute_command("/export compact")
 
             _save_artifact(device, "export_compact", curr_text, options.save_current)
 
             outcome = _diff_texts(
-                baseline_text=base_text,
-                current_text=curr_text,
+                baseline=base_file,
+                current=curr_text,
                 baseline_label=str(base_file),
                 current_label=f"{device}:/export compact",
-                ignore_patterns=options.ignore_patterns or [],
+                ignore_rules=options.ignore_rules,
                 heuristic=options.heuristic,
             )
             results.append(
@@ -280,19 +320,19 @@ def _perform_device_diff(
                     )
                 ]
 
-            base_text = _read_text(cmd_base_file)
             with _get_session(device, options.config, options.session_pool) as s:
                 curr_text = s.execute_command(subj)
 
             _save_artifact(device, subj, curr_text, options.save_current)
 
             outcome = _diff_texts(
-                baseline_text=base_text,
-                current_text=curr_text,
+                baseline=cmd_base_file,
+                current=curr_text,
                 baseline_label=str(cmd_base_file),
                 current_label=f"{device}:{subj}",
-                ignore_patterns=options.ignore_patterns or [],
+                ignore_rules=options.ignore_rules,
                 heuristic=options.heuristic,
+                structured=_structured_differ(options, device, subj),
             )
             results.append(DiffItemResult(device=device, subject=subj, outcome=outcome))
 
@@ -329,17 +369,17 @@ def _perform_device_diff(
                         )
                         continue
 
-                    base_text = _read_text(seq_base_file)
                     curr_text = s.execute_command(cmd)
                     _save_artifact(device, cmd, curr_text, options.save_current)
 
                     outcome = _diff_texts(
-                        baseline_text=base_text,
-                        current_text=curr_text,
+                        baseline=seq_base_file,
+                        current=curr_text,
                         baseline_label=str(seq_base_file),
                         current_label=f"{device}:{cmd}",
-                        ignore_patterns=options.ignore_patterns or [],
+                        ignore_rules=options.ignore_rules,
                         heuristic=options.heuristic,
+                        structured=_structured_differ(options, device, cmd),
                     )
                     results.append(
                         DiffItemResult(device=device, subject=cmd, outcome=outcome)
@@ -358,27 +398,44 @@ def diff_files(
     heuristic: bool = False,
     ignore_patterns: list[str] | None = None,
 ) -> DiffOutcome:
-    """Compare two local files."""
-    text_a = _read_text(file_a)
-    text_b = _read_text(file_b)
+    """Compare two local files.
 
+    Both files are memory-mapped and streamed, so arbitrarily large files can
+    be compared with bounded memory (except in heuristic mode).
+    """
     return _diff_texts(
-        baseline_text=text_a,
-        current_text=text_b,
+        baseline=file_a,
+        current=file_b,
         baseline_label=str(file_a),
         current_label=str(file_b),
-        ignore_patterns=ignore_patterns or [],
+        ignore_rules=IgnoreRuleSet.compile(ignore_patterns),
         heuristic=heuristic,
     )
 
 
 def diff_targets(options: DiffOptions) -> DiffResult:
     """Execute the diff operation based on the provided options."""
+    with trace_span(
+        "nw.diff", targets=options.targets, subject=options.subject
+    ) as span:
+        result = _diff_targets(options)
+        span.set_attributes(
+            {
+                "diff.changed": result.total_changed,
+                "diff.missing": result.total_missing,
+            }
+        )
+        return result
+
+
+def _diff_targets(options: DiffOptions) -> DiffResult:
     subj = options.subject.strip()
     is_config = subj.lower() == "config"
     is_command = subj.startswith("/")
 
     sm = SequenceManager(options.config)
+    # Compile ignore rules up front so workers share them and bad regexes fail fast
+    _ = options.ignore_rules
     mode_label = "config" if is_config else ("command" if is_command else "sequence")
     cmd_ctx = f"diff_{options.targets}_{mode_label}_{_sanitize_filename(subj)}"
 
@@ -408,7 +465,10 @@ def diff_targets(options: DiffOptions) -> DiffResult:
         try:
 
             def _fetch_device_output(dev: str) -> str:
-                with _get_session(dev, options.config, options.session_pool) as s:
+                with (
+                    device_span(options.config, dev),
+                    _get_session(dev, options.config, options.session_pool) as s,
+                ):
                     if is_config:
                         return s.execute_command("/export compact")
                     elif is_command:
@@ -418,8 +478,12 @@ def diff_targets(options: DiffOptions) -> DiffResult:
                         raise NetworkToolkitError(msg)
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                future_a = executor.submit(_fetch_device_output, dev_a)
-                future_b = executor.submit(_fetch_device_output, dev_b)
+                future_a = executor.submit(
+                    contextvars.copy_context().run, _fetch_device_output, dev_a
+                )
+                future_b = executor.submit(
+                    contextvars.copy_context().run, _fetch_device_output, dev_b
+                )
                 curr_a = future_a.result()
                 curr_b = future_b.result()
 
@@ -437,11 +501,14 @@ def diff_targets(options: DiffOptions) -> DiffResult:
             )
 
             outcome = _diff_texts(
-                baseline_text=curr_a,
-                current_text=curr_b,
+                baseline=curr_a,
+                current=curr_b,
                 baseline_label=f"{dev_a}:{subj}",
                 current_label=f"{dev_b}:{subj}",
-                ignore_patterns=options.ignore_patterns or [],
+                ignore_rules=options.ignore_rules,
+                structured=(
+                    _structured_differ(options, dev_a, subj) if is_command else None
+                ),
             )
             results.append(
                 DiffItemResult(
@@ -0,0 +1,187 @@
+"""Bounded-memory line streaming and unified diffing for large outputs.
+
+Baselines are read through ``mmap`` (or decompressed on the fly) and iterated
+lazily, so a 500 MB routing table dump is never materialized as a ``str`` plus
+a ``splitlines()`` list.
+The unified diff walks both sides in windows of at most ``chunk_lines`` lines:
+identical windows are skipped with a plain list comparison, and differing
+windows are matched with :class:`difflib.SequenceMatcher` and cut at the last
+long run of equal lines so the next window starts re-synchronized.
+
+For inputs that fit into a single window the output is identical to
+:func:`difflib.unified_diff`.
+"""
+
+from __future__ import annotations
+
+import difflib
+import io
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Literal
+
+from network_toolkit.common.compression import codec_for, open_text
+
+DEFAULT_CHUNK_LINES = 20_000
+
+Opcode = tuple[Literal["replace", "delete", "insert", "equal"], int, int, int, int]
+
+
+@contextmanager
+def open_lines(path: Path) -> Iterator[Iterator[str]]:
+    """Yield a lazy iterator over the lines of a UTF-8 file (without newlines).
+
+    Non-empty files are memory-mapped read-only; pages are faulted in as the
+    iterator advances and can be dropped by the OS afterwards. Compressed
+    files (``.gz``, ``.zst``) are decompressed as they are read instead.
+    """
+    if codec_for(path):
+        with open_text(path) as f:
+            yield (line.rstrip("\r\n") for line in f)
+        return
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield iter(())
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield (raw.decode("utf-8").rstrip("\r\n") for raw in iter(mm.readline, b""))
+
+
+def iter_text_lines(text: str) -> Iterator[str]:
+    """Iterate over the lines of an in-memory string without building a list."""
+    return (line.rstrip("\r\n") for line in io.StringIO(text))
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Convert a range to the unified diff ``start,length`` format."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _group_opcodes(codes: list[Opcode], n: int) -> Iterator[list[Opcode]]:
+    """Group opcodes into hunks with ``n`` lines of context.
+
+    Mirrors :meth:`difflib.SequenceMatcher.get_grouped_opcodes` but works on
+    an arbitrary (e.g. truncated) opcode list.
+    """
+    if not codes:
+        return
+    codes = list(codes)
+    tag, i1, i2, j1, j2 = codes[0]
+    if tag == "equal":
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    tag, i1, i2, j1, j2 = codes[-1]
+    if tag == "equal":
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        start_a, start_b = i1, j1
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            start_a, start_b = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, start_a, i2, start_b, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _cut_point(
+    codes: list[Opcode], n: int, *, final: bool
+) -> tuple[list[Opcode], int, int]:
+    """Choose where to end the current window.
+
+    The window is cut ``n`` lines before the end of the last equal run that is
+    at least ``2n`` long, leaving those ``n`` lines as leading context for the
+    next window. Without such a run (or on the final window) everything is
+    consumed.
+    """
+    if not final:
+        for idx in range(len(codes) - 1, -1, -1):
+            tag, i1, i2, j1, j2 = codes[idx]
+            if tag == "equal" and i2 - i1 >= max(2 * n, 1) and i2 - n > 0:
+                cut_a, cut_b = i2 - n, j2 - n
+                return [*codes[:idx], (tag, i1, cut_a, j1, cut_b)], cut_a, cut_b
+    last = codes[-1]
+    return codes, last[2], last[4]
+
+
+def unified_diff_stream(
+    a: Iterable[str],
+    b: Iterable[str],
+    fromfile: str = "",
+    tofile: str = "",
+    *,
+    n: int = 3,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+) -> Iterator[str]:
+    """Yield unified diff lines for two line iterables using bounded memory.
+
+    Output lines follow :func:`difflib.unified_diff` with its default
+    ``lineterm`` (header lines end in ``"\\n"``, content lines do not).
+    """
+    it_a, it_b = iter(a), iter(b)
+    buf_a: list[str] = []
+    buf_b: list[str] = []
+    off_a = off_b = 0
+    done_a = done_b = False
+    started = False
+
+    while True:
+        if not done_a and len(buf_a) < chunk_lines:
+            more = list(islice(it_a, chunk_lines - len(buf_a)))
+            done_a = len(buf_a) + len(more) < chunk_lines
+            buf_a.extend(more)
+        if not done_b and len(buf_b) < chunk_lines:
+            more = list(islice(it_b, chunk_lines - len(buf_b)))
+            done_b = len(buf_b) + len(more) < chunk_lines
+            buf_b.extend(more)
+        final = done_a and done_b
+        if not buf_a and not buf_b:
+            return
+
+        if buf_a == buf_b:
+            # Identical window: nothing to report, keep n lines of context
+            codes: list[Opcode] = [("equal", 0, len(buf_a), 0, len(buf_b))]
+        else:
+            codes = difflib.SequenceMatcher(None, buf_a, buf_b).get_opcodes()
+        window, cut_a, cut_b = _cut_point(codes, n, final=final)
+
+        for group in _group_opcodes(window, n):
+            if not started:
+                started = True
+                yield f"--- {fromfile}\n"
+                yield f"+++ {tofile}\n"
+            first, last = group[0], group[-1]
+            range_a = _format_range(first[1] + off_a, last[2] + off_a)
+            range_b = _format_range(first[3] + off_b, last[4] + off_b)
+            yield f"@@ -{range_a} +{range_b} @@\n"
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    for line in buf_a[i1:i2]:
+                        yield " " + line
+                    continue
+                if tag in {"replace", "delete"}:
+                    for line in buf_a[i1:i2]:
+                        yield "-" + line
+                if tag in {"replace", "insert"}:
+                    for line in buf_b[j1:j2]:
+                        yield "+" + line
+
+        if final:
+            return
+        del buf_a[:cut_a]
+        del buf_b[:cut_b]
+        off_a += cut_a
+        off_b += cut_b
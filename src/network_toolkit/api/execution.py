@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
 from typing import TypeVar
 
+from network_toolkit.bastion import spread_across_bastions
+
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -14,6 +29,9 @@ def execute_parallel(
     items: list[T],
     func: Callable[[T], R],
     max_workers: int | None = None,
+    *,
+    limiter: AdaptiveLimiter | None = None,
+    spread_key: Callable[[T], Hashable] | None = None,
 ) -> list[R]:
     """
     Execute a function in parallel across a list of items using threads.
@@ -26,6 +44,14 @@ def execute_parallel(
         Function to execute for each item
     max_workers : int | None
         Maximum number of threads to use. Defaults to len(items).
+    limiter : AdaptiveLimiter | None
+        Optional adaptive limit on how many items run at once. Each call is
+        timed and its exceptions are reported to the limiter; ``max_workers``
+        still caps the thread count.
+    spread_key : Callable[[T], Hashable] | None
+        Optional grouping (e.g. the bastion a device sits behind). Items are
+        started round-robin across groups instead of in input order, so no
+        single group is saturated while others wait.
 
     Returns
     -------
@@ -34,13 +60,23 @@ def execute_parallel(
     """
     if not items:
         return []
+    order = (
+        spread_across_bastions(items, spread_key)
+        if spread_key is not None
+        else range(len(items))
+    )
+    if limiter is not None:
+        return _execute_adaptive(items, func, max_workers, limiter, order)
 
     workers = max_workers if max_workers is not None else len(items)
     results: list[R] = [None] * len(items)  # type: ignore[list-item]
 
     with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Each call runs in a copy of the caller's context so trace spans and
+        # other context variables carry over into the worker threads
         future_to_index = {
-            executor.submit(func, item): index for index, item in enumerate(items)
+            executor.submit(contextvars.copy_context().run, func, items[index]): index
+            for index in order
         }
 
         for future in as_completed(future_to_index):
@@ -49,3 +85,196 @@ def execute_parallel(
 
     # `results` is fully populated because we submitted exactly one future per item.
     return results
+
+
+def _execute_adaptive(
+    items: list[T],
+    func: Callable[[T], R],
+    max_workers: int | None,
+    limiter: AdaptiveLimiter,
+    order: Sequence[int],
+) -> list[R]:
+    """Run ``func`` over ``items`` keeping ``limiter.limit`` calls in flight."""
+    workers = min(len(items), limiter.max_limit)
+    if max_workers is not None:
+        workers = min(workers, max_workers)
+    workers = max(1, workers)
+    results: list[R] = [None] * len(items)  # type: ignore[list-item]
+
+    def _tracked(item: T) -> R:
+        with limiter.track():
+            return func(item)
+
+    next_index = 0
+    in_flight: dict[Future[R], int] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while next_index < len(order) or in_flight:
+            while next_index < len(order) and len(in_flight) < min(
+                limiter.limit, workers
+            ):
+                index = order[next_index]
+                future = executor.submit(
+                    contextvars.copy_context().run, _tracked, items[index]
+                )
+                in_flight[future] = index
+                next_index += 1
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[in_flight.pop(future)] = future.result()
+
+    return results
+
+
+# Substrings of error messages that indicate the far end (or something in
+# between) is overloaded rather than that the operation itself is wrong
+_CONGESTION_MARKERS = (
+    "timed out",
+    "timeout",
+    "connection reset",
+    "reset by peer",
+    "connection aborted",
+    "too many",
+    "try again later",
+    "rate limit",
+    "throttl",
+    "maxstartups",
+    "ssh protocol banner",
+)
+
+
+def is_congestion_error(error: BaseException | str | None) -> bool:
+    """Return True if ``error`` looks like overload: timeouts, resets, throttling.
+
+    Refused connections and ordinary command or authentication errors are not
+    congestion signals; backing off would not help with those.
+    """
+    seen: set[int] = set()
+    current: BaseException | str | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ConnectionRefusedError):
+            return False
+        if isinstance(
+            current, TimeoutError | ConnectionResetError | ConnectionAbortedError
+        ):
+            return True
+        text = str(current).lower()
+        if any(marker in text for marker in _CONGESTION_MARKERS):
+            return True
+        if isinstance(current, str):
+            break
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit driven by observed latency and errors.
+
+    The limit grows by one after a full window (``limit`` consecutive
+    operations) completes without congestion while latencies stay within
+    ``latency_tolerance`` times their baseline. A congestion error (see
+    :func:`is_congestion_error`) multiplies the limit by ``backoff``; further
+    decreases are suppressed until the operations that were already in flight
+    at that point have completed.
+
+    Latency baselines are tracked per ``key`` (e.g. ``"connect"`` or the
+    command text) because different commands legitimately take very different
+    amounts of time. The limiter is thread-safe and does not block; schedulers
+    read :attr:`limit` before starting more work.
+
+    Usage::
+
+        limiter = AdaptiveLimiter(initial=5, max_limit=32)
+        with limiter.track(key="connect"):
+            session.connect()
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.3,
+        latency_floor: float = 0.01,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self._limit = min(max(int(initial), self.min_limit), self.max_limit)
+        self._backoff = backoff
+        self._tolerance = latency_tolerance
+        self._smoothing = smoothing
+        self._latency_floor = latency_floor
+        self._lock = threading.Lock()
+        # key -> (smoothed latency, baseline latency)
+        self._latency: dict[str, tuple[float, float]] = {}
+        self._good_in_window = 0
+        self._cooldown = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of operations allowed in flight."""
+        with self._lock:
+            return self._limit
+
+    def record_success(self, latency: float, *, key: str = "default") -> None:
+        """Record a completed operation and how long it took (seconds)."""
+        # Sub-floor jitter (local labs, fakes) is not a congestion signal
+        latency = max(latency, self._latency_floor)
+        with self._lock:
+            self._tick_cooldown_locked()
+            smoothed, baseline = self._latency.get(key, (latency, latency))
+            smoothed += self._smoothing * (latency - smoothed)
+            # Let the baseline creep up slowly so a permanently slower path
+            # does not pin the limit forever
+            baseline = min(baseline * 1.01, latency)
+            self._latency[key] = (smoothed, baseline)
+            if smoothed > baseline * self._tolerance:
+                self._good_in_window = 0
+                return
+            self._good_in_window += 1
+            if self._good_in_window >= self._limit and self._limit < self.max_limit:
+                self._limit += 1
+                self._good_in_window = 0
+                logger.debug("Adaptive concurrency increased to %d", self._limit)
+
+    def record_failure(self, error: BaseException | str | None = None) -> bool:
+        """Record a failed operation; back off if it signals congestion.
+
+        Returns True if the failure was treated as a congestion signal.
+        """
+        congested = is_congestion_error(error)
+        with self._lock:
+            self._tick_cooldown_locked()
+            if not congested:
+                return False
+            self._good_in_window = 0
+            if self._cooldown > 0:
+                return True
+            previous = self._limit
+            self._limit = max(self.min_limit, int(self._limit * self._backoff))
+            self._cooldown = previous
+            logger.debug(
+                "Adaptive concurrency decreased from %d to %d: %s",
+                previous,
+                self._limit,
+                error,
+            )
+        return True
+
+    def _tick_cooldown_locked(self) -> None:
+        if self._cooldown > 0:
+            self._cooldown -= 1
+
+    @contextmanager
+    def track(self, *, key: str = "default") -> Iterator[None]:
+        """Time the enclosed block and record its outcome."""
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.record_failure(e)
+            raise
+        self.record_success(time.monotonic() - started, key=key)
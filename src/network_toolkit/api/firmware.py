@@ -6,6 +6,7 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from network_toolkit.api.readiness import DeviceReadiness, wait_for_rebooted_devices
 from network_toolkit.config import NetworkConfig
 from network_toolkit.device import DeviceSession
 from network_toolkit.exceptions import NetworkToolkitError
@@ -29,6 +30,8 @@ class FirmwareUpgradeOptions:
     precheck_sequence: str = "pre_maintenance"
     skip_precheck: bool = False
     verbose: bool = False
+    wait_ready: bool = False
+    ready_timeout: float = 600.0
 
 
 @dataclass
@@ -41,6 +44,7 @@ class DeviceUpgradeResult:
     platform: str = "unknown"
     transport: str = "unknown"
     error_details: str | None = None
+    readiness: DeviceReadiness | None = None
 
 
 @dataclass
@@ -84,9 +88,29 @@ def upgrade_firmware(options: FirmwareUpgradeOptions) -> FirmwareUpgradeResult:
         else:
             result.failed_count += 1
 
+    if options.wait_ready:
+        _wait_until_ready(result, options)
+
     return result
 
 
+def _wait_until_ready(
+    result: FirmwareUpgradeResult, options: FirmwareUpgradeOptions
+) -> None:
+    """Poll rebooting devices and fail those that do not come back in time."""
+    readiness = wait_for_rebooted_devices(
+        options.config,
+        [r.device_name for r in result.results if r.success],
+        timeout=options.ready_timeout,
+    )
+    for dev_result in result.results:
+        dev_result.readiness = readiness.get(dev_result.device_name)
+        if dev_result.readiness is not None and not dev_result.readiness.ready:
+            dev_result.success = False
+            result.success_count -= 1
+            result.failed_count += 1
+
+
 def _process_device_upgrade(
     dev: str, options: FirmwareUpgradeOptions
 ) -> DeviceUpgradeResult:
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
 
 from network_toolkit.config import NetworkConfig
-from network_toolkit.inventory.catalog import get_inventory_catalog
+from network_toolkit.inventory.catalog import InventoryCatalog, get_inventory_catalog
 from network_toolkit.sequence_manager import SequenceManager, SequenceRecord
 
 
@@ -161,7 +160,9 @@ def _source_from_config(config: NetworkConfig, name: str, *, kind: str) -> str:
     return "config"
 
 
-def _group_memberships_by_source(catalog: Any) -> dict[tuple[str, str], set[str]]:
+def _group_memberships_by_source(
+    catalog: InventoryCatalog,
+) -> dict[tuple[str, str], set[str]]:
     memberships: dict[tuple[str, str], set[str]] = {}
 
     for group_name, entries in catalog.groups_by_name.items():
@@ -175,19 +176,10 @@ def _group_memberships_by_source(catalog: Any) -> dict[tuple[str, str], set[str]
         for entry in entries:
             if entry.ref.source_id != "config":
                 continue
-            tags = set(entry.group.match_tags or [])
-            if not tags:
+            if not entry.group.match_tags:
                 continue
-            for dev_entries in catalog.devices_by_name.values():
-                for dev_entry in dev_entries:
-                    if dev_entry.ref.source_id != "config":
-                        continue
-                    dev_tags = set(dev_entry.device.tags or [])
-                    if tags.issubset(dev_tags):
-                        memberships.setdefault(("config", dev_entry.name), set()).add(
-                            group_name
-                        )
-                        break
+            for dev_name in catalog.devices_with_tags("config", entry.group.match_tags):
+                memberships.setdefault(("config", dev_name), set()).add(group_name)
 
     return memberships
 
@@ -0,0 +1,274 @@
+"""Programmatic API for waiting until rebooted devices are usable again.
+
+Firmware upgrades, RouterBOARD upgrades and config resets finish by sending a
+reboot and dropping the session. This module polls any number of rebooting
+devices concurrently on a single asyncio event loop:
+
+1. TCP connect probes against the device's SSH port with exponential backoff
+   (cheap, no authentication, nothing blocks the loop).
+2. Once the port accepts connections, a :class:`DeviceSession` is opened in a
+   worker thread and a version/package command is run. SSH daemons often
+   accept TCP before they accept logins, so a failed check simply goes back
+   to probing.
+3. Optionally the check output must contain an expected version string.
+
+Devices behind a bastion are not reachable from here, so they skip the TCP
+probe and retry the SSH check itself, which goes through the bastion.
+
+Checks connect once, without the configured connection retries, and are cut
+off at the overall timeout together with any wait for a free check slot.
+
+Each device reports how long it took until the port was open and until the
+SSH check passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from network_toolkit.bastion import bastion_route
+from network_toolkit.config import NetworkConfig
+from network_toolkit.device import DeviceSession
+from network_toolkit.exceptions import NetworkToolkitError
+
+logger = logging.getLogger(__name__)
+
+# Commands that prove the control plane is up and show the running software
+DEFAULT_CHECK_COMMANDS: dict[str, str] = {
+    "mikrotik_routeros": "/system/package/print",
+    "cisco_ios": "show version",
+    "cisco_iosxe": "show version",
+}
+
+
+@dataclass
+class ReadinessOptions:
+    """Options for waiting on rebooting devices."""
+
+    devices: list[str]
+    config: NetworkConfig
+    timeout: float = 600.0
+    initial_delay: float = 10.0
+    probe_interval: float = 2.0
+    max_probe_interval: float = 30.0
+    backoff: float = 1.5
+    connect_timeout: float = 3.0
+    check_command: str | None = None
+    expected_version: str | None = None
+    max_concurrent_checks: int = 16
+
+
+@dataclass
+class DeviceReadiness:
+    """Readiness of a single device after a reboot."""
+
+    device_name: str
+    ready: bool
+    message: str
+    time_to_port: float | None = None
+    time_to_ready: float | None = None
+    probes: int = 0
+    check_output: str | None = None
+
+
+@dataclass
+class ReadinessResult:
+    """Result of waiting for a set of devices."""
+
+    results: list[DeviceReadiness] = field(default_factory=list)
+    ready_count: int = 0
+    not_ready_count: int = 0
+
+
+def wait_for_devices_ready(options: ReadinessOptions) -> ReadinessResult:
+    """Block until all devices are ready or have timed out."""
+    return asyncio.run(wait_for_devices_ready_async(options))
+
+
+def wait_for_rebooted_devices(
+    config: NetworkConfig, devices: list[str], *, timeout: float
+) -> dict[str, DeviceReadiness]:
+    """Wait for devices that were just rebooted; keyed by device name."""
+    if not devices:
+        return {}
+    result = wait_for_devices_ready(
+        ReadinessOptions(devices=devices, config=config, timeout=timeout)
+    )
+    return {r.device_name: r for r in result.results}
+
+
+async def wait_for_devices_ready_async(options: ReadinessOptions) -> ReadinessResult:
+    """Poll all devices concurrently on the running event loop."""
+    devices = options.config.devices or {}
+    unknown = [name for name in options.devices if name not in devices]
+    if unknown:
+        msg = f"Device(s) not found in configuration: {', '.join(unknown)}"
+        raise NetworkToolkitError(msg)
+
+    checks = asyncio.Semaphore(max(1, options.max_concurrent_checks))
+    # Probing already retries; a check must not sit in connect retries past
+    # the deadline
+    check_config = options.config.model_copy(
+        update={
+            "general": options.config.general.model_copy(
+                update={"connection_retries": 1}
+            )
+        }
+    )
+    # Not the loop's default executor: asyncio.run() would wait for checks
+    # that were abandoned at the deadline
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, options.max_concurrent_checks),
+        thread_name_prefix="nw-ready",
+    )
+    started = time.monotonic()
+    try:
+        results = await asyncio.gather(
+            *(
+                _wait_device(
+                    name,
+                    options,
+                    check_config=check_config,
+                    checks=checks,
+                    executor=executor,
+                    started=started,
+                )
+                for name in options.devices
+            )
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    result = ReadinessResult(results=list(results))
+    result.ready_count = sum(1 for r in results if r.ready)
+    result.not_ready_count = len(results) - result.ready_count
+    return result
+
+
+def _probe_address(config: NetworkConfig, device_name: str) -> tuple[str, int]:
+    """Return host and SSH port using the same precedence as connections."""
+    device = (config.devices or {})[device_name]
+    port = device.port or config.general.port
+    if device.overrides and device.overrides.port:
+        port = device.overrides.port
+    return device.host, int(port)
+
+
+def _check_command(options: ReadinessOptions, device_name: str) -> str:
+    if options.check_command:
+        return options.check_command
+    device_type = (options.config.devices or {})[device_name].device_type
+    return DEFAULT_CHECK_COMMANDS.get(device_type, "show version")
+
+
+async def _probe_port(host: str, port: int, timeout: float) -> bool:
+    """Return True if a TCP connection to host:port succeeds."""
+    try:
+        _reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout
+        )
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+def _run_check(device_name: str, config: NetworkConfig, command: str) -> str:
+    """Open a fresh session and run the readiness check command (blocking)."""
+    with DeviceSession(device_name, config) as session:
+        return session.execute_command(command)
+
+
+async def _checked(
+    device_name: str,
+    config: NetworkConfig,
+    command: str,
+    checks: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+) -> str:
+    async with checks:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, _run_check, device_name, config, command
+        )
+
+
+async def _wait_device(
+    device_name: str,
+    options: ReadinessOptions,
+    *,
+    check_config: NetworkConfig,
+    checks: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    started: float,
+) -> DeviceReadiness:
+    host, port = _probe_address(options.config, device_name)
+    # The device's port is only reachable from the bastion
+    direct = bastion_route(options.config, device_name) is None
+    command = _check_command(options, device_name)
+    deadline = started + options.timeout
+    status = DeviceReadiness(
+        device_name=device_name, ready=False, message="Timed out waiting for device"
+    )
+
+    # Give the device time to actually go down before the first probe
+    await asyncio.sleep(min(options.initial_delay, options.timeout))
+
+    interval = options.probe_interval
+    last_error: str | None = None
+    while time.monotonic() < deadline:
+        status.probes += 1
+        if not direct or await _probe_port(host, port, options.connect_timeout):
+            if direct and status.time_to_port is None:
+                status.time_to_port = time.monotonic() - started
+                logger.info(
+                    "%s: port %s open after %.1fs",
+                    device_name,
+                    port,
+                    status.time_to_port,
+                )
+            try:
+                # The worker thread cannot be stopped; stop waiting for it
+                output = await asyncio.wait_for(
+                    _checked(device_name, check_config, command, checks, executor),
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+            except TimeoutError:
+                last_error = "readiness check did not finish before the timeout"
+                break
+            except Exception as e:
+                last_error = str(e)
+                logger.debug("%s: readiness check failed: %s", device_name, e)
+            else:
+                status.check_output = output
+                status.time_to_ready = time.monotonic() - started
+                if options.expected_version and (
+                    options.expected_version not in output
+                ):
+                    status.message = (
+                        f"Device is up but '{options.expected_version}' "
+                        f"not found in '{command}' output"
+                    )
+                    return status
+                status.ready = True
+                status.message = f"Ready after {status.time_to_ready:.1f}s"
+                return status
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * options.backoff, options.max_probe_interval)
+
+    if last_error:
+        status.message = f"Timed out waiting for device (last error: {last_error})"
+    elif direct and status.time_to_port is None:
+        status.message = f"Timed out waiting for {host}:{port}"
+    return status
@@ -5,13 +5,14 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from functools import partial
+from functools import partial, wraps
 from pathlib import Path
 from time import perf_counter
-from typing import TypeVar
+from typing import Any, TypeVar
 
 import network_toolkit.device as device_module
 from network_toolkit.api.execution import execute_parallel
+from network_toolkit.bastion import bastion_key
 from network_toolkit.common.credentials import InteractiveCredentials
 from network_toolkit.config import NetworkConfig
 from network_toolkit.exceptions import NetworkToolkitError
@@ -25,9 +26,12 @@ from network_toolkit.ip_device import (
     is_ip_list,
     validate_platform,
 )
-from network_toolkit.results_enhanced import ResultsManager
+from network_toolkit.metrics import RunMetrics
+from network_toolkit.results_enhanced import CapturedOutput, ResultsManager
 from network_toolkit.sequence_manager import SequenceManager
 from network_toolkit.session_pool import SessionPoolProtocol
+from network_toolkit.timing import TimingSpan, recording, spans_to_dicts
+from network_toolkit.tracing import device_span, trace_span
 from network_toolkit.transport.factory import get_transport_factory
 
 logger = logging.getLogger(__name__)
@@ -62,6 +66,12 @@ class DeviceCommandResult:
     output: str | None
     error: str | None = None
     stored_path: Path | None = None
+    timings: list[TimingSpan] = field(default_factory=list)
+    # Output went to ``RunOptions.on_output`` and the results file as it
+    # arrived; ``output`` is then None
+    streamed: bool = False
+    # Output written to disk as it arrived (``RunOptions.capture``)
+    captured: CapturedOutput | None = None
 
 
 @dataclass(slots=True)
@@ -73,6 +83,7 @@ class DeviceSequenceResult:
     outputs: dict[str, str] | None
     error: str | None = None
     stored_paths: list[Path] = field(default_factory=list)
+    timings: list[TimingSpan] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -90,6 +101,11 @@ class RunOptions:
     results_dir: str | None = None
     no_strict_host_key_checking: bool = False
     session_pool: SessionPoolProtocol | None = None
+    # Stream command output: called with (device, chunk) as output arrives
+    on_output: Callable[[str, str], None] | None = None
+    # Write command output to disk as it arrives; results refer to the file
+    # (``DeviceCommandResult.captured``) instead of holding the output
+    capture: bool = False
 
 
 @dataclass(slots=True)
@@ -107,6 +123,23 @@ class RunResult:
     sequence_results: list[DeviceSequenceResult] = field(default_factory=list)
     results_dir: Path | None = None
     notices: list[str] = field(default_factory=list)
+    metrics: RunMetrics | None = None
+
+
+DeviceResultT = TypeVar("DeviceResultT", DeviceCommandResult, DeviceSequenceResult)
+
+
+def timings_to_dict(result: RunResult) -> dict[str, Any]:
+    """Return the run's per-device timing spans as a JSON-serializable dict."""
+    device_results: list[DeviceCommandResult] | list[DeviceSequenceResult] = (
+        result.sequence_results if result.is_sequence else result.command_results
+    )
+    return {
+        "target": result.target,
+        "command_or_sequence": result.command_or_sequence,
+        "duration": result.duration,
+        "devices": {r.device: spans_to_dicts(r.timings) for r in device_results},
+    }
 
 
 class TargetResolutionError(NetworkToolkitError):
@@ -164,9 +197,49 @@ def _build_results_manager(
         store_results=store_results,
         results_dir=results_dir,
         command_context=command_context,
+        async_writes=True,
     )
 
 
+def _collect_metrics(
+    options: RunOptions,
+    resolution: TargetResolution,
+    device_results: list[DeviceCommandResult] | list[DeviceSequenceResult],
+    duration: float,
+) -> RunMetrics:
+    metrics = RunMetrics("run", options.target)
+    for r in device_results:
+        metrics.observe_device(r.timings, error=r.error)
+    metrics.observe_unresolved(len(resolution.unknown))
+    metrics.finish(duration)
+    return metrics
+
+
+def _with_timings(
+    func: Callable[..., DeviceResultT],
+) -> Callable[..., DeviceResultT]:
+    """Record timing (and trace) spans for one device's work.
+
+    The wrapped function takes the device name as its first argument and the
+    configuration as ``config=``; the spans end up on the returned result.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> DeviceResultT:
+        with (
+            device_span(kwargs.get("config"), args[0]) as span,
+            recording() as recorder,
+        ):
+            result = func(*args, **kwargs)
+            if result.error:
+                span.set_error(result.error)
+        result.timings = recorder.spans
+        return result
+
+    return wrapper
+
+
+@_with_timings
 def _run_command_on_device(
     device_name: str,
     config: NetworkConfig,
@@ -174,10 +247,34 @@ def _run_command_on_device(
     username_override: str | None,
     password_override: str | None,
     transport_override: str | None,
+    *,
     results_mgr: ResultsManager,
     session_pool: SessionPoolProtocol | None = None,
+    on_output: Callable[[str, str], None] | None = None,
+    capture: bool = False,
 ) -> DeviceCommandResult:
     try:
+        if on_output is not None or capture:
+            stored_path, captured = _stream_command(
+                device_name,
+                config,
+                command,
+                username_override=username_override,
+                password_override=password_override,
+                transport_override=transport_override,
+                results_mgr=results_mgr,
+                session_pool=session_pool,
+                on_output=on_output,
+                capture=capture,
+            )
+            return DeviceCommandResult(
+                device=device_name,
+                command=command,
+                output=None,
+                stored_path=stored_path,
+                streamed=on_output is not None,
+                captured=captured,
+            )
         if session_pool is not None:
             output = _execute_with_session_pool(
                 device_name,
@@ -223,6 +320,73 @@ def _run_command_on_device(
     )
 
 
+def _stream_command(
+    device_name: str,
+    config: NetworkConfig,
+    command: str,
+    *,
+    username_override: str | None,
+    password_override: str | None,
+    transport_override: str | None,
+    results_mgr: ResultsManager,
+    session_pool: SessionPoolProtocol | None,
+    on_output: Callable[[str, str], None] | None,
+    capture: bool,
+) -> tuple[Path | None, CapturedOutput | None]:
+    """Run a command, passing each output chunk on and into its results file.
+
+    Returns the stored result path and, with ``capture``, the file holding
+    the output. A pooled session that fails is only retried while no output
+    has been passed on, so output is never repeated and a command that did
+    start on the device is not run twice.
+    """
+    started = False
+
+    def stream(
+        session: device_module.DeviceSession,
+    ) -> tuple[Path | None, CapturedOutput | None]:
+        nonlocal started
+        result_stream = results_mgr.open_command_stream(
+            device_name, command, capture=capture
+        )
+        try:
+            for chunk in session.stream_command(command):
+                started = True
+                if result_stream is not None:
+                    result_stream.write(chunk)
+                if on_output is not None:
+                    on_output(device_name, chunk)
+        except Exception as exc:
+            if result_stream is not None:
+                result_stream.close(error=getattr(exc, "message", None) or str(exc))
+                if result_stream.captured is not None:
+                    result_stream.captured.discard()
+            raise
+        if result_stream is None:
+            return None, None
+        return result_stream.close(), result_stream.captured
+
+    if session_pool is not None:
+        return _with_session_retry(
+            device_name,
+            config,
+            username_override,
+            password_override,
+            transport_override,
+            session_pool,
+            stream,
+            retry=lambda: not started,
+        )
+    with device_module.DeviceSession(
+        device_name,
+        config,
+        username_override,
+        password_override,
+        transport_override,
+    ) as session:
+        return stream(session)
+
+
 def _with_session_retry(
     device_name: str,
     config: NetworkConfig,
@@ -231,6 +395,8 @@ def _with_session_retry(
     transport_override: str | None,
     session_pool: SessionPoolProtocol,
     execute_fn: Callable[[device_module.DeviceSession], T],
+    *,
+    retry: Callable[[], bool] | None = None,
 ) -> T:
     """
     Execute an operation using a pooled session with stale session retry.
@@ -240,6 +406,8 @@ def _with_session_retry(
 
     Args:
         execute_fn: Callable that takes a connected session and returns result
+        retry: Called after a failure; returning False re-raises it instead
+            of retrying (the session is still dropped from the pool)
     """
 
     def create_session() -> device_module.DeviceSession:
@@ -270,6 +438,8 @@ def _with_session_retry(
             session.disconnect()
         except Exception:
             pass
+        if retry is not None and not retry():
+            raise
 
         session = create_session()
         session.connect()
@@ -299,6 +469,7 @@ def _execute_with_session_pool(
     )
 
 
+@_with_timings
 def _run_sequence_on_device(
     device_name: str,
     config: NetworkConfig,
@@ -431,7 +602,23 @@ def run_commands(options: RunOptions) -> RunResult:
     NetworkToolkitError
         For configuration or execution errors that prevent the run
     """
+    with trace_span(
+        "nw.run",
+        target=options.target,
+        command_or_sequence=options.command_or_sequence,
+    ) as span:
+        result = _run_commands(options)
+        span.set_attributes(
+            {
+                "is_sequence": result.is_sequence,
+                "devices.total": result.totals.total,
+                "devices.failed": result.totals.failed,
+            }
+        )
+        return result
 
+
+def _run_commands(options: RunOptions) -> RunResult:
     _validate_transport(options.transport_type)
 
     config = options.config
@@ -463,6 +650,45 @@ def run_commands(options: RunOptions) -> RunResult:
         command_context=command_context,
     )
 
+    # Queued result writes are flushed before results are handed back
+    with results_mgr:
+        result = _run_resolved(
+            options,
+            config,
+            results_mgr=results_mgr,
+            sequence_manager=sequence_manager,
+            notices=notices,
+        )
+    _drop_unwritten_paths(result, results_mgr.failed_writes)
+    return result
+
+
+def _drop_unwritten_paths(result: RunResult, failed: list[Path]) -> None:
+    """Forget result paths whose queued write failed after they were returned."""
+    if not failed:
+        return
+    unwritten = set(failed)
+    for command_result in result.command_results:
+        if command_result.stored_path in unwritten:
+            command_result.stored_path = None
+    for sequence_result in result.sequence_results:
+        sequence_result.stored_paths = [
+            path for path in sequence_result.stored_paths if path not in unwritten
+        ]
+    result.notices.append(
+        f"{len(failed)} result file(s) could not be written: "
+        + ", ".join(str(path) for path in failed)
+    )
+
+
+def _run_resolved(
+    options: RunOptions,
+    config: NetworkConfig,
+    *,
+    results_mgr: ResultsManager,
+    sequence_manager: SequenceManager,
+    notices: list[str],
+) -> RunResult:
     resolution = _resolve_targets(options.target, config)
     if not resolution.resolved:
         msg = f"No devices resolved for target '{options.target}'"
@@ -482,6 +708,11 @@ def run_commands(options: RunOptions) -> RunResult:
     started_at = perf_counter()
 
     if is_sequence:
+        if options.on_output is not None or options.capture:
+            notices.append(
+                "Output streaming and capture apply to single commands; "
+                "sequence output is collected in memory"
+            )
         run_func = partial(
             _run_sequence_on_device,
             config=config,
@@ -495,7 +726,9 @@ def run_commands(options: RunOptions) -> RunResult:
         )
 
         if is_group:
-            sequence_results = execute_parallel(resolution.resolved, run_func)
+            sequence_results = execute_parallel(
+                resolution.resolved, run_func, spread_key=bastion_key(config)
+            )
         else:
             sequence_results = [run_func(resolution.resolved[0])]
 
@@ -530,8 +763,9 @@ def run_commands(options: RunOptions) -> RunResult:
             duration=duration,
             totals=totals,
             sequence_results=sequence_results,
-            results_dir=results_mgr.session_dir,
+            results_dir=results_mgr.results_location,
             notices=notices,
+            metrics=_collect_metrics(options, resolution, sequence_results, duration),
         )
 
     # Command mode
@@ -544,10 +778,14 @@ def run_commands(options: RunOptions) -> RunResult:
         transport_override=options.transport_type,
         results_mgr=results_mgr,
         session_pool=options.session_pool,
+        on_output=options.on_output,
+        capture=options.capture,
     )
 
     if is_group:
-        command_results = execute_parallel(resolution.resolved, run_cmd_func)
+        command_results = execute_parallel(
+            resolution.resolved, run_cmd_func, spread_key=bastion_key(config)
+        )
         order_index = {name: idx for idx, name in enumerate(resolution.resolved)}
         command_results.sort(key=lambda r: order_index.get(r.device, 0))
     else:
@@ -577,6 +815,7 @@ def run_commands(options: RunOptions) -> RunResult:
         duration=duration,
         totals=totals,
         command_results=command_results,
-        results_dir=results_mgr.session_dir,
+        results_dir=results_mgr.results_location,
         notices=notices,
+        metrics=_collect_metrics(options, resolution, command_results, duration),
     )
@@ -9,12 +9,16 @@ Key components:
 - BlockSegmenter: Detects logical blocks via indentation/headers.
 - EntityExtractor: Infers stable identifiers (interfaces, IPs).
 - SetDiffer: Compares entities as sets (Added/Removed/Modified).
+- IgnoreRuleSet: Compiled line-ignore rules shared by both diff modes.
 """
 
 from __future__ import annotations
 
 import difflib
+import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from network_toolkit.api.state_diff_patterns import (
     BGP_NEIGHBOR_IDENTITY_PATTERN,
@@ -29,6 +33,47 @@ from network_toolkit.api.state_diff_patterns import (
 )
 
 
+@dataclass(frozen=True)
+class IgnoreRuleSet:
+    """Compiled, reusable set of line-ignore rules.
+
+    Build it once (e.g. per ``DiffOptions``) and reuse it for every comparison
+    instead of recompiling user patterns on each call. Filtering works on line
+    iterators so no intermediate joined strings are built.
+    """
+
+    rules: tuple[re.Pattern[str], ...] = ()
+
+    @classmethod
+    def compile(cls, patterns: Iterable[str] | None) -> IgnoreRuleSet:
+        """Compile user-supplied regex strings into a rule set."""
+        return cls(tuple(re.compile(p) for p in patterns or ()))
+
+    @cached_property
+    def with_builtin(self) -> IgnoreRuleSet:
+        """This rule set merged with the builtin ``IGNORE_PATTERNS``."""
+        return IgnoreRuleSet((*IGNORE_PATTERNS, *self.rules))
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def matches(self, line: str) -> bool:
+        """Return True if any rule matches the line."""
+        return any(r.search(line) for r in self.rules)
+
+    def filter(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield only the lines that no rule matches."""
+        if not self.rules:
+            yield from lines
+            return
+        for line in lines:
+            if not self.matches(line):
+                yield line
+
+
+BUILTIN_IGNORE_RULES = IgnoreRuleSet().with_builtin
+
+
 @dataclass
 class HeuristicDiffOutcome:
     """Result of a heuristic diff operation."""
@@ -71,12 +116,14 @@ class HeuristicDiffOutcome:
 class Canonicalizer:
     """Normalizes volatile fields in text lines."""
 
+    def __init__(self, ignore_rules: IgnoreRuleSet | None = None) -> None:
+        self.ignore_rules = ignore_rules or BUILTIN_IGNORE_RULES
+
     def normalize(self, line: str) -> str:
         """Replace volatile fields with placeholders."""
         # 1. Check ignore patterns first
-        for pattern in IGNORE_PATTERNS:
-            if pattern.search(line):
-                return ""  # Mark for removal
+        if self.ignore_rules.matches(line):
+            return ""  # Mark for removal
 
         # 2. Normalize timestamps
         for pattern in TIMESTAMP_PATTERNS:
@@ -100,17 +147,20 @@ class Canonicalizer:
 class BlockSegmenter:
     """Segments text into logical blocks based on indentation and headers."""
 
-    def segment(self, text: str) -> list[list[str]]:
-        """Segment text into hierarchical blocks.
+    def segment(self, text: str | Iterable[str]) -> list[list[str]]:
+        """Segment text (or an iterable of lines) into hierarchical blocks.
 
         Returns a list of blocks, where each block is a list of lines.
         The first line of a block is typically the parent/header.
         """
-        lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+        raw_lines = text.splitlines() if isinstance(text, str) else text
         blocks: list[list[str]] = []
         current_block: list[str] = []
 
-        for line in lines:
+        for raw in raw_lines:
+            if not raw.strip():
+                continue
+            line = raw.rstrip()
             # Heuristic: Lines starting with space are children
             if line.startswith(" ") or line.startswith("\t"):
                 if current_block:
@@ -172,13 +222,20 @@ class EntityExtractor:
 class StateDiffer:
     """Main class for heuristic operational state diffing."""
 
-    def __init__(self) -> None:
-        self.canonicalizer = Canonicalizer()
+    def __init__(self, ignore_rules: IgnoreRuleSet | None = None) -> None:
+        """Create a differ.
+
+        ``ignore_rules`` replaces the builtin ignore patterns; pass
+        ``rules.with_builtin`` to apply user patterns on top of the builtins.
+        """
+        self.canonicalizer = Canonicalizer(ignore_rules)
         self.segmenter = BlockSegmenter()
         self.extractor = EntityExtractor()
 
-    def diff(self, text_a: str, text_b: str) -> HeuristicDiffOutcome:
-        """Perform heuristic diff between two text outputs."""
+    def diff(
+        self, text_a: str | Iterable[str], text_b: str | Iterable[str]
+    ) -> HeuristicDiffOutcome:
+        """Perform heuristic diff between two text outputs or line iterables."""
         blocks_a = self.segmenter.segment(text_a)
         blocks_b = self.segmenter.segment(text_b)
 
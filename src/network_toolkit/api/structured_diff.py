@@ -0,0 +1,364 @@
+"""Structured (record-based) operational state diffing.
+
+Where the heuristic :class:`~network_toolkit.api.state_diff.StateDiffer` has to
+guess entity identities from block headers, this engine knows the shape of a
+handful of common commands. Output is parsed once into records, each record is
+keyed by the template's identity fields, and the two sides are compared as
+keyed dictionaries (Added/Removed/Modified).
+
+Key components:
+- RecordTemplate: A compiled parser plus the identity/volatile field names.
+- Built-in templates: IOS-XE and RouterOS route, address and interface tables.
+- TextFSM templates: Optional, loaded and compiled once when ``textfsm`` is
+  installed (``pip install textfsm``).
+- StructuredDiffer: Diffs two outputs for a (device_type, command) pair.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from network_toolkit.api.state_diff import HeuristicDiffOutcome
+
+Record = dict[str, str]
+RecordParser = Callable[[Iterable[str]], list[Record]]
+
+
+@dataclass(frozen=True)
+class RecordTemplate:
+    """Parser for one command's output plus how to key and compare its records."""
+
+    name: str
+    key: tuple[str, ...]
+    parse: RecordParser
+    ignore_fields: frozenset[str] = field(default_factory=frozenset)
+
+    def records_by_key(self, lines: Iterable[str]) -> dict[tuple[str, ...], Record]:
+        """Parse lines and index the records by their identity fields.
+
+        Duplicate keys (e.g. ECMP routes listed twice) are disambiguated with a
+        running suffix so no record is silently dropped.
+        """
+        keyed: dict[tuple[str, ...], Record] = {}
+        for record in self.parse(lines):
+            key = tuple(record.get(k, "") for k in self.key)
+            if key in keyed:
+                n = 2
+                while (*key, f"#{n}") in keyed:
+                    n += 1
+                key = (*key, f"#{n}")
+            keyed[key] = {
+                k: v
+                for k, v in record.items()
+                if k not in self.ignore_fields and k not in self.key
+            }
+        return keyed
+
+
+# --- Generic parsers -------------------------------------------------------
+
+
+def _normalize_column(name: str) -> str:
+    return name.strip().lower()
+
+
+def fixed_width_table_parser(required_columns: Iterable[str]) -> RecordParser:
+    """Build a parser for column-aligned tables.
+
+    The header is the first line whose (lowercased) tokens contain all
+    ``required_columns``; column boundaries are taken from the header offsets.
+    This fits both IOS ``show ... brief`` tables and RouterOS v7 ``print``.
+    """
+    required = frozenset(_normalize_column(c) for c in required_columns)
+    token_re = re.compile(r"\S+")
+
+    def parse(lines: Iterable[str]) -> list[Record]:
+        records: list[Record] = []
+        columns: list[tuple[str, int]] | None = None
+        for line in lines:
+            if columns is None:
+                tokens = [(m.group(0), m.start()) for m in token_re.finditer(line)]
+                if required <= {_normalize_column(t) for t, _ in tokens}:
+                    columns = [(_normalize_column(t), pos) for t, pos in tokens]
+                continue
+            if not line.strip():
+                continue
+            record: Record = {}
+            for idx, (name, start) in enumerate(columns):
+                end = columns[idx + 1][1] if idx + 1 < len(columns) else None
+                record[name] = line[start:end].strip()
+            if all(record.get(c) for c in required):
+                records.append(record)
+        return records
+
+    return parse
+
+
+_KV_RE = re.compile(r'([\w.-]+)=("(?:[^"\\]|\\.)*"|\S*)')
+
+
+def parse_key_value_records(lines: Iterable[str]) -> list[Record]:
+    """Parse RouterOS ``print terse``/``print detail`` style ``key=value`` output.
+
+    A line starting with a record number begins a new record; indented lines
+    continue the previous one (``detail`` wraps long records).
+    """
+    records: list[Record] = []
+    current: Record | None = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith(("Flags:", "Columns:")):
+            continue
+        if stripped.split(maxsplit=1)[0].isdigit() or current is None:
+            current = {}
+            records.append(current)
+        for key, value in _KV_RE.findall(stripped):
+            current[key] = value.strip('"')
+    return [r for r in records if r]
+
+
+_IOS_ROUTE_RE = re.compile(
+    r"^(?P<protocol>[A-Za-z*+%][A-Za-z0-9*+%]*(?:\s+(?:E1|E2|N1|N2|IA|L1|L2|ia))?)\s+"
+    r"(?P<prefix>\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?)"
+    r"(?:\s+\[(?P<distance>\d+)/(?P<metric>\d+)\]\s+via\s+(?P<nexthop>[\d.]+)"
+    r"(?:,\s+(?P<age>[\w:.]+))?(?:,\s+(?P<interface>\S+))?"
+    r"|\s+is directly connected,\s+(?P<connected>\S+))"
+)
+_IOS_ROUTE_CONT_RE = re.compile(
+    r"^\s+\[(?P<distance>\d+)/(?P<metric>\d+)\]\s+via\s+(?P<nexthop>[\d.]+)"
+    r"(?:,\s+(?P<age>[\w:.]+))?(?:,\s+(?P<interface>\S+))?"
+)
+
+
+def parse_ios_routes(lines: Iterable[str]) -> list[Record]:
+    """Parse IOS/IOS-XE ``show ip route`` into one record per prefix/next-hop."""
+    records: list[Record] = []
+    last: Record | None = None
+    for line in lines:
+        m = _IOS_ROUTE_RE.match(line)
+        if m:
+            connected = m.group("connected")
+            last = {
+                "protocol": " ".join(m.group("protocol").split()),
+                "prefix": m.group("prefix"),
+                "distance": m.group("distance") or "0",
+                "metric": m.group("metric") or "0",
+                "nexthop": m.group("nexthop") or "directly connected",
+                "interface": m.group("interface") or connected or "",
+                "age": m.group("age") or "",
+            }
+            records.append(last)
+            continue
+        cont = _IOS_ROUTE_CONT_RE.match(line)
+        if cont and last is not None:
+            records.append(
+                {
+                    **last,
+                    "distance": cont.group("distance"),
+                    "metric": cont.group("metric"),
+                    "nexthop": cont.group("nexthop"),
+                    "interface": cont.group("interface") or "",
+                    "age": cont.group("age") or "",
+                }
+            )
+    return records
+
+
+# --- TextFSM support (optional) --------------------------------------------
+
+
+@lru_cache(maxsize=128)
+def _load_textfsm_source(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def textfsm_template(
+    path: str | Path,
+    key: Iterable[str],
+    *,
+    ignore_fields: Iterable[str] = (),
+) -> RecordTemplate:
+    """Create a template backed by a TextFSM file.
+
+    The template file is read once and compiled once per thread (TextFSM
+    parsers are stateful, so instances are not shared across threads).
+    Field names are lowercased to match the built-in templates.
+    """
+    try:
+        import textfsm  # type: ignore[import-untyped]
+    except ImportError as e:
+        error_msg = "TextFSM package required. Install with: pip install textfsm"
+        raise ImportError(error_msg) from e
+
+    source_path = str(path)
+    local = threading.local()
+
+    def parse(lines: Iterable[str]) -> list[Record]:
+        fsm: Any = getattr(local, "fsm", None)
+        if fsm is None:
+            fsm = textfsm.TextFSM(io.StringIO(_load_textfsm_source(source_path)))
+            local.fsm = fsm
+        fsm.Reset()
+        rows = fsm.ParseText("\n".join(lines))
+        headers = [_normalize_column(h) for h in fsm.header]
+        return [
+            {
+                h: " ".join(v) if isinstance(v, list) else str(v)
+                for h, v in zip(headers, row, strict=False)
+            }
+            for row in rows
+        ]
+
+    return RecordTemplate(
+        name=Path(source_path).stem,
+        key=tuple(_normalize_column(k) for k in key),
+        parse=parse,
+        ignore_fields=frozenset(_normalize_column(f) for f in ignore_fields),
+    )
+
+
+# --- Template registry ------------------------------------------------------
+
+_ROUTEROS_TYPES = ("mikrotik_routeros",)
+_IOS_TYPES = ("cisco_iosxe", "cisco_ios")
+
+_TEMPLATES: dict[tuple[str, str], RecordTemplate] = {}
+
+
+def normalize_command(command: str) -> str:
+    """Normalize a command for registry lookups.
+
+    RouterOS path syntax (``/ip/route/print``) is folded to the space form
+    (``/ip route print``) and whitespace is collapsed.
+    """
+    cmd = " ".join(command.split())
+    if cmd.startswith("/"):
+        head, _, rest = cmd.partition(" ")
+        head = "/" + head.strip("/").replace("/", " ")
+        cmd = f"{head} {rest}".strip()
+    return cmd
+
+
+def register_template(
+    device_types: str | Iterable[str], command: str, template: RecordTemplate
+) -> None:
+    """Register (or replace) the template used for a command on device types."""
+    types = (device_types,) if isinstance(device_types, str) else device_types
+    for device_type in types:
+        _TEMPLATES[(device_type, normalize_command(command))] = template
+
+
+def get_template(device_type: str | None, command: str) -> RecordTemplate | None:
+    """Return the template for a device type and command, if one is known."""
+    if not device_type:
+        return None
+    return _TEMPLATES.get((device_type, normalize_command(command)))
+
+
+def _register_builtin_templates() -> None:
+    ios_route = RecordTemplate(
+        name="ios_ip_route",
+        key=("prefix", "nexthop"),
+        parse=parse_ios_routes,
+        ignore_fields=frozenset({"age"}),
+    )
+    register_template(_IOS_TYPES, "show ip route", ios_route)
+    register_template(
+        _IOS_TYPES,
+        "show ip interface brief",
+        RecordTemplate(
+            name="ios_ip_interface_brief",
+            key=("interface",),
+            parse=fixed_width_table_parser(("Interface", "Status", "Protocol")),
+        ),
+    )
+
+    ros_tables: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+        # command: (identity fields, columns required to detect the header)
+        "/ip route print": (("dst-address", "gateway"), ("DST-ADDRESS", "GATEWAY")),
+        "/ip address print": (("address", "interface"), ("ADDRESS", "INTERFACE")),
+        "/interface print": (("name",), ("NAME", "TYPE")),
+    }
+    for cmd, (key, header) in ros_tables.items():
+        name = "ros_" + cmd.strip("/").replace(" print", "").replace(" ", "_")
+        # Row numbers and dynamic flags shift between runs; they are not state.
+        volatile = frozenset({"#"})
+        register_template(
+            _ROUTEROS_TYPES,
+            cmd,
+            RecordTemplate(
+                name=name,
+                key=key,
+                parse=fixed_width_table_parser(header),
+                ignore_fields=volatile,
+            ),
+        )
+        for variant in ("terse", "detail"):
+            register_template(
+                _ROUTEROS_TYPES,
+                f"{cmd} {variant}",
+                RecordTemplate(
+                    name=f"{name}_{variant}",
+                    key=key,
+                    parse=parse_key_value_records,
+                    ignore_fields=frozenset({"uptime", "age"}),
+                ),
+            )
+
+
+_register_builtin_templates()
+
+
+class StructuredDiffer:
+    """Diff command outputs as keyed record sets using a :class:`RecordTemplate`."""
+
+    def __init__(self, template: RecordTemplate) -> None:
+        self.template = template
+
+    @classmethod
+    def for_command(
+        cls, device_type: str | None, command: str
+    ) -> StructuredDiffer | None:
+        """Return a differ for the command, or None if no template is known."""
+        template = get_template(device_type, command)
+        return cls(template) if template else None
+
+    def diff(
+        self, text_a: str | Iterable[str], text_b: str | Iterable[str]
+    ) -> HeuristicDiffOutcome:
+        """Compare two outputs record by record."""
+        lines_a = text_a.splitlines() if isinstance(text_a, str) else text_a
+        lines_b = text_b.splitlines() if isinstance(text_b, str) else text_b
+        map_a = self.template.records_by_key(lines_a)
+        map_b = self.template.records_by_key(lines_b)
+
+        outcome = HeuristicDiffOutcome()
+        for key in sorted(map_b.keys() - map_a.keys()):
+            outcome.high_confidence.append(f"[+] Added: {self._label(key)}")
+        for key in sorted(map_a.keys() - map_b.keys()):
+            outcome.high_confidence.append(f"[-] Removed: {self._label(key)}")
+        for key in sorted(map_a.keys() & map_b.keys()):
+            rec_a, rec_b = map_a[key], map_b[key]
+            if rec_a == rec_b:
+                continue
+            label = self._label(key)
+            for name in sorted(rec_a.keys() | rec_b.keys()):
+                old, new = rec_a.get(name, ""), rec_b.get(name, "")
+                if old != new:
+                    outcome.high_confidence.append(f"~ {label}: {name} {old} -> {new}")
+        return outcome
+
+    def _label(self, key: tuple[str, ...]) -> str:
+        parts = [
+            f"{name}={value}"
+            for name, value in zip(self.template.key, key, strict=False)
+        ]
+        parts.extend(key[len(self.template.key) :])
+        return f"{self.template.name} " + " ".join(parts)
@@ -13,6 +13,7 @@ from time import perf_counter
 from network_toolkit.api.run import RunTotals, TargetResolution
 from network_toolkit.config import NetworkConfig
 from network_toolkit.device import DeviceSession
+from network_toolkit.device_transfers import SharedUploadSource
 from network_toolkit.exceptions import NetworkToolkitError
 from network_toolkit.inventory.resolve import resolve_named_targets
 from network_toolkit.ip_device import extract_ips_from_target, is_ip_list
@@ -119,6 +120,7 @@ def _get_session(
 def _upload_single_device(
     device_name: str,
     options: UploadOptions,
+    source: SharedUploadSource | None = None,
 ) -> DeviceUploadResult:
     """Execute upload for a single device."""
     try:
@@ -130,6 +132,7 @@ def _upload_single_device(
                 remote_filename=options.remote_filename,
                 verify_upload=options.verify,
                 verify_checksum=options.checksum_verify,
+                source=source,
             )
 
             if not success:
@@ -196,9 +199,13 @@ def upload_file(options: UploadOptions) -> UploadResult:
     # Execute uploads
     max_workers = options.max_concurrent if len(resolution.resolved) > 1 else 1
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # One shared read-only mapping (and one checksum) for all device transfers
+    with (
+        SharedUploadSource(options.local_file) as source,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
         future_to_device = {
-            executor.submit(_upload_single_device, device, options): device
+            executor.submit(_upload_single_device, device, options, source): device
             for device in resolution.resolved
         }
 
@@ -0,0 +1,319 @@
+# SPDX-FileCopyrightText: 2025-present Network Team <network@company.com>
+#
+# SPDX-License-Identifier: MIT
+"""Jump host (bastion) routing, connection sharing and session limits.
+
+Devices reach a bastion either explicitly (``DeviceConfig.bastion`` naming a
+``bastions`` entry or a ``[user@]host[:port]`` jump host) or, with
+``general.bastions_from_ssh_config``, through the ``ProxyJump`` of their host
+in ``~/.ssh/config``.
+
+All traffic to one bastion shares a single authenticated connection:
+
+- OpenSSH (Scrapli's ``system`` transport, ``nw cli``): the hop is replaced
+  by a ``ProxyCommand`` running ``ssh -W`` against a ControlMaster for the
+  bastion, so every device session is a ``direct-tcpip`` channel on the
+  same connection instead of a new bastion login.
+- paramiko (SFTP transfers): device transports run over ``direct-tcpip``
+  channels of one pooled bastion transport (see
+  :meth:`network_toolkit.ssh_multiplex.SharedTransportPool.tunnel`).
+
+:class:`BastionSlots` caps device sessions per bastion that are connecting
+or running a command at the same time, and :func:`spread_across_bastions` orders work so parallel runs draw on all
+bastions evenly rather than queueing behind one.
+"""
+
+from __future__ import annotations
+
+import logging
+import shlex
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from network_toolkit.exceptions import ConfigurationError, DeviceConnectionError
+from network_toolkit.ssh_multiplex import ssh_control_options
+
+if TYPE_CHECKING:
+    from network_toolkit.config import NetworkConfig
+    from network_toolkit.inventory.ssh_config import CompiledSSHConfig
+
+logger = logging.getLogger(__name__)
+
+USER_SSH_CONFIG = Path("~/.ssh/config")
+
+
+@dataclass(frozen=True, slots=True)
+class BastionRoute:
+    """How to reach the bastion in front of a device.
+
+    ``host`` is what OpenSSH connects to and may be an ``~/.ssh/config``
+    alias; ``hostname`` is the address behind such an alias, for clients
+    that do not read the SSH config (paramiko).
+    """
+
+    name: str
+    host: str
+    port: int | None = None
+    user: str | None = None
+    max_sessions: int = 10
+    hostname: str | None = None
+    identity_file: str | None = None
+    strict_host_key: bool = False
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return (self.hostname or self.host, self.port or 22)
+
+
+def parse_jump_spec(spec: str) -> tuple[str | None, str, int | None]:
+    """Split a single ``[user@]host[:port]`` hop into its parts."""
+    user, _, hostport = spec.strip().rpartition("@")
+    host, port = hostport, None
+    if hostport.startswith("["):
+        # [IPv6]:port
+        bracketed, _, rest = hostport[1:].partition("]")
+        host = bracketed
+        if rest.startswith(":") and rest[1:].isdigit():
+            port = int(rest[1:])
+    elif hostport.count(":") == 1:
+        name, _, port_text = hostport.partition(":")
+        if port_text.isdigit():
+            host, port = name, int(port_text)
+    return user or None, host, port
+
+
+def bastion_route(config: NetworkConfig, device_name: str) -> BastionRoute | None:
+    """Return the bastion a device is reached through, if any.
+
+    Raises:
+        ConfigurationError: If the device names a multi-hop jump chain.
+    """
+    devices = config.devices
+    device = devices.get(device_name) if isinstance(devices, dict) else None
+    if device is None:
+        return None
+    general = config.general
+    limit = general.bastion_max_sessions
+    strict = general.ssh_strict_host_key_checking
+
+    spec = device.bastion
+    if spec:
+        named = (config.bastions or {}).get(spec)
+        if named is not None:
+            return BastionRoute(
+                name=spec,
+                host=named.host,
+                port=named.port,
+                user=named.user,
+                max_sessions=named.max_sessions or limit,
+                strict_host_key=strict,
+            )
+        if "," in spec:
+            msg = (
+                f"Device '{device_name}' uses a multi-hop bastion '{spec}'; "
+                "configure the chain with ProxyJump in ~/.ssh/config instead"
+            )
+            raise ConfigurationError(msg, details={"device": device_name})
+        user, host, port = parse_jump_spec(spec)
+        return BastionRoute(
+            name=spec,
+            host=host,
+            port=port,
+            user=user,
+            max_sessions=limit,
+            strict_host_key=strict,
+        )
+
+    if general.bastions_from_ssh_config and general.ssh_config_file:
+        return _route_from_ssh_config(device.host, limit, strict=strict)
+    return None
+
+
+def _route_from_ssh_config(
+    host: str, limit: int, *, strict: bool
+) -> BastionRoute | None:
+    compiled = _user_ssh_config()
+    if compiled is None:
+        return None
+    jump = compiled.lookup(host).get("proxyjump")
+    if not jump or jump.lower() == "none":
+        return None
+    if "," in jump:
+        # Multi-hop chains stay with OpenSSH's own ProxyJump handling
+        logger.debug("Not pooling multi-hop ProxyJump %s for %s", jump, host)
+        return None
+
+    user, alias, port = parse_jump_spec(jump)
+    options = compiled.lookup(alias)
+    port_option = options.get("port", "")
+    return BastionRoute(
+        name=jump,
+        host=alias,
+        port=port or (int(port_option) if port_option.isdigit() else None),
+        user=user or options.get("user"),
+        max_sessions=limit,
+        hostname=options.get("hostname"),
+        identity_file=options.get("identityfile"),
+        strict_host_key=strict,
+    )
+
+
+def _user_ssh_config() -> CompiledSSHConfig | None:
+    path = USER_SSH_CONFIG.expanduser()
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _compile_cached(str(path), mtime)
+
+
+@lru_cache(maxsize=4)
+def _compile_cached(path: str, _mtime_ns: int) -> CompiledSSHConfig | None:
+    from network_toolkit.inventory.ssh_config import compile_ssh_config
+
+    try:
+        return compile_ssh_config(Path(path))
+    except ConfigurationError as e:
+        logger.warning("Ignoring unreadable SSH config for bastions: %s", e)
+        return None
+
+
+def proxy_command(route: BastionRoute, control_persist: int) -> str:
+    """Return an OpenSSH ``ProxyCommand`` tunnelling through the bastion's master.
+
+    The outer ssh expands ``%h``/``%p`` to the device; ``%%`` keeps the
+    control socket tokens for the inner ssh.
+    """
+    args = ["ssh"]
+    args.extend(opt.replace("%", "%%") for opt in ssh_control_options(control_persist))
+    if route.port is not None:
+        args.extend(["-p", str(route.port)])
+    if route.user:
+        args.extend(["-l", route.user])
+    args.extend(["-W", "%h:%p", route.host])
+    return " ".join(shlex.quote(arg) for arg in args)
+
+
+def bastion_ssh_options(route: BastionRoute | None, control_persist: int) -> list[str]:
+    """Return ``ssh`` arguments routing a connection through ``route``."""
+    if route is None:
+        return []
+    return ["-o", f"ProxyCommand={proxy_command(route, control_persist)}"]
+
+
+class BastionSlots:
+    """Per-bastion limits on concurrently active device sessions.
+
+    Sessions hold a slot while they connect or run a command, not while they
+    sit idle (e.g. in a session pool), so pooled sessions never lock out
+    further devices. The limit of a bastion is fixed by the first route that
+    uses it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._in_use: dict[str, int] = {}
+
+    def _semaphore(self, route: BastionRoute) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(route.name)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(max(1, route.max_sessions))
+                self._semaphores[route.name] = semaphore
+            return semaphore
+
+    def acquire(self, route: BastionRoute, timeout: float | None = None) -> None:
+        """Block until a session slot on the bastion is free.
+
+        Raises:
+            DeviceConnectionError: If no slot frees up within ``timeout`` seconds.
+        """
+        semaphore = self._semaphore(route)
+        if not semaphore.acquire(blocking=False):
+            logger.debug("Waiting for a free session on bastion %s", route.name)
+            if not semaphore.acquire(timeout=timeout):
+                msg = (
+                    f"No free session on bastion '{route.name}' after {timeout:g}s "
+                    f"({route.max_sessions} in use)"
+                )
+                raise DeviceConnectionError(
+                    msg,
+                    host=route.host,
+                    port=route.port,
+                    details={"bastion": route.name},
+                )
+        with self._lock:
+            self._in_use[route.name] = self._in_use.get(route.name, 0) + 1
+
+    def release(self, route: BastionRoute) -> None:
+        with self._lock:
+            self._in_use[route.name] -= 1
+        self._semaphore(route).release()
+
+    def in_use(self, name: str) -> int:
+        """Number of sessions currently holding a slot on bastion ``name``."""
+        with self._lock:
+            return self._in_use.get(name, 0)
+
+
+_slots = BastionSlots()
+
+
+def get_bastion_slots() -> BastionSlots:
+    """Return the process-wide bastion session limits."""
+    return _slots
+
+
+def spread_across_bastions(
+    items: Iterable[Any], key: Callable[[Any], Hashable]
+) -> list[int]:
+    """Return item indexes interleaved round-robin across ``key`` groups.
+
+    Order within each group is kept, so a worker pool consuming the result
+    alternates between bastions instead of working through one at a time.
+    """
+    groups: dict[Hashable, list[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(key(item), []).append(index)
+    if len(groups) <= 1:
+        return [i for indexes in groups.values() for i in indexes]
+
+    order: list[int] = []
+    queues = [iter(indexes) for indexes in groups.values()]
+    while queues:
+        remaining = []
+        for queue in queues:
+            position = next(queue, None)
+            if position is not None:
+                order.append(position)
+                remaining.append(queue)
+        queues = remaining
+    return order
+
+
+def bastion_key(config: NetworkConfig) -> Callable[[str], str | None] | None:
+    """Return a device name -> bastion name function, or None without bastions.
+
+    Used as the ``spread_key`` of parallel runs.
+    """
+    general = config.general
+    uses_bastions = general.bastions_from_ssh_config or any(
+        device.bastion for device in (config.devices or {}).values()
+    )
+    if not uses_bastions:
+        return None
+
+    def _key(device_name: str) -> str | None:
+        try:
+            route = bastion_route(config, device_name)
+        except ConfigurationError:
+            # Reported when the device's session is created
+            return None
+        return route.name if route is not None else None
+
+    return _key
@@ -27,6 +27,7 @@ from network_toolkit.commands.firmware import register as register_firmware
 from network_toolkit.commands.info import register as register_info
 from network_toolkit.commands.list import register as register_list
 from network_toolkit.commands.platforms import register as register_platforms
+from network_toolkit.commands.results import register as register_results
 from network_toolkit.commands.run import register as register_run
 from network_toolkit.commands.schema import register as register_schema
 from network_toolkit.commands.ssh import register as register_ssh
@@ -38,6 +39,7 @@ from network_toolkit.common.output import get_output_manager
 from network_toolkit.config import NetworkConfig
 from network_toolkit.device import DeviceSession as _DeviceSession
 from network_toolkit.runtime import set_runtime_settings
+from network_toolkit.tracing import TRACE_FILE_ENV, enable_jsonl_tracing
 
 
 class _DynamicConsoleProxy:
@@ -79,6 +81,7 @@ class CategorizedHelpGroup(TyperGroup):
             "list",
             "config",
             "schema",
+            "results",
         ]
 
         def rows(names: list[str]) -> list[tuple[str, str]]:
@@ -139,6 +142,7 @@ app = typer.Typer(
 @app.callback()
 def main(
     ctx: typer.Context,
+    *,
     version: Annotated[
         bool, typer.Option("--version", help="Show version information")
     ] = False,
@@ -167,11 +171,22 @@ def main(
             show_default=False,
         ),
     ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace-file",
+            envvar=TRACE_FILE_ENV,
+            help="Append trace spans (run, device, command) as JSON lines to this file",
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """Configure global settings for the network toolkit."""
     set_runtime_settings(
         inventory_paths=list(inventory or []), inventory_prefer=inventory_prefer
     )
+    if trace_file is not None:
+        enable_jsonl_tracing(trace_file)
 
     if version:
         cmd_ctx = CommandContext()
@@ -283,6 +298,7 @@ register_schema(app)
 register_ssh(app)
 register_sync(app)
 register_platforms(app)
+register_results(app)
 
 # Expose a Click-compatible command for documentation tools (e.g., mkdocs-click)
 # Create this after all subcommands have been registered
@@ -10,6 +10,12 @@ from network_toolkit.common.defaults import DEFAULT_CONFIG_PATH
 from network_toolkit.config import NetworkConfig, load_config
 from network_toolkit.sequence_manager import SequenceManager
 from network_toolkit.session_pool import SessionPool
+from network_toolkit.tracing import (
+    JsonLinesSpanExporter,
+    enable_jsonl_tracing,
+    enable_tracing_from_env,
+    shutdown_tracing,
+)
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -42,18 +48,31 @@ class NetworkaClient:
         >>>     client.run("router1", "show ip int brief")
     """
 
-    def __init__(self, config_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        *,
+        trace_file: str | Path | None = None,
+    ) -> None:
         """
         Initialize the Networka client.
 
         Args:
             config_path: Path to the configuration directory or file.
                          If None, defaults to standard locations.
+            trace_file: Write trace spans of all operations as JSON lines to
+                        this file (defaults to ``NW_TRACE_FILE`` if set).
+                        Tracing is process-wide and stops on ``close()``.
         """
         self._config_path = config_path or DEFAULT_CONFIG_PATH
         self._config: NetworkConfig | None = None
         self._sequence_manager: SequenceManager | None = None
         self._session_pool = SessionPool()
+        self._trace_exporter: JsonLinesSpanExporter | None = (
+            enable_jsonl_tracing(trace_file)
+            if trace_file is not None
+            else enable_tracing_from_env()
+        )
 
     @property
     def config(self) -> NetworkConfig:
@@ -282,8 +301,11 @@ class NetworkaClient:
         return upload_file(options)
 
     def close(self) -> None:
-        """Close all active device sessions."""
+        """Close all active device sessions (and tracing started by this client)."""
         self._session_pool.close_all()
+        if self._trace_exporter is not None:
+            shutdown_tracing()
+            self._trace_exporter = None
 
     def __enter__(self) -> NetworkaClient:
         return self
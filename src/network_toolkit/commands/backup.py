@@ -12,6 +12,7 @@ from network_toolkit.common.command_helpers import CommandContext
 from network_toolkit.common.defaults import DEFAULT_CONFIG_PATH
 from network_toolkit.common.logging import setup_logging
 from network_toolkit.config import load_config
+from network_toolkit.metrics import METRICS_FILE_ENV, write_prometheus_textfile
 
 # Create a sub-app for backup commands
 backup_app = typer.Typer(
@@ -59,19 +60,23 @@ def _print_results(ctx: CommandContext, result: BackupResult) -> None:
             if dev_result.error:
                 ctx.print_error(f"  {dev_result.error}")
 
-    # Print summary
-    ctx.output_manager.print_header("Backup Summary")
-    ctx.output_manager.print_info(f"Total: {result.totals.total}")
-    ctx.output_manager.print_success(f"Succeeded: {result.totals.succeeded}")
-    if result.totals.failed > 0:
-        ctx.output_manager.print_error(f"Failed: {result.totals.failed}")
-
-    ctx.output_manager.print_info(f"Duration: {result.duration:.2f}s")
+    # Print summary with run metrics
+    ctx.output_manager.print_summary(
+        target=result.target,
+        operation_type="Backup",
+        name="backup_config",
+        duration=result.duration,
+        status="Success" if result.totals.failed == 0 else "Failed",
+        is_group=result.totals.total > 1,
+        totals=(result.totals.total, result.totals.succeeded, result.totals.failed),
+        metrics=result.metrics,
+    )
 
 
 @backup_app.command("config")
 def config_backup(
     target_name: Annotated[str, typer.Argument(help="Device or group name")],
+    *,
     download: Annotated[
         bool,
         typer.Option(
@@ -92,6 +97,14 @@ def config_backup(
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Enable verbose output")
     ] = False,
+    metrics_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-file",
+            envvar=METRICS_FILE_ENV,
+            help="Write run metrics in Prometheus textfile-collector format",
+        ),
+    ] = None,
 ) -> None:
     """Backup device configuration.
 
@@ -119,6 +132,10 @@ def config_backup(
 
         _print_results(ctx, result)
 
+        if metrics_file is not None and result.metrics is not None:
+            written = write_prometheus_textfile(result.metrics, metrics_file)
+            ctx.print_info(f"Metrics written to: {written}")
+
         if result.totals.failed > 0:
             raise typer.Exit(1)
 
@@ -102,6 +102,16 @@ def register(app: typer.Typer) -> None:
                 help="Use heuristic operational state diffing (ignores timestamps, counters, etc.).",
             ),
         ] = False,
+        structured: Annotated[
+            bool,
+            typer.Option(
+                "--structured",
+                help=(
+                    "Parse known commands (e.g. 'show ip route', '/ip route print') "
+                    "into records and diff them by key; other subjects fall back."
+                ),
+            ),
+        ] = False,
         config_file: Annotated[
             Path, typer.Option("--config", "-c", help="Configuration file path")
         ] = DEFAULT_CONFIG_PATH,
@@ -182,6 +192,7 @@ def register(app: typer.Typer) -> None:
             results_dir=results_dir,
             verbose=verbose,
             heuristic=heuristic,
+            structured=structured,
         )
 
         try:
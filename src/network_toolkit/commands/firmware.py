@@ -47,6 +47,20 @@ def upgrade(
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Enable verbose output")
     ] = False,
+    *,
+    wait_ready: Annotated[
+        bool,
+        typer.Option(
+            "--wait-ready",
+            help="Wait until rebooted devices accept SSH again and report time-to-ready",
+        ),
+    ] = False,
+    ready_timeout: Annotated[
+        float,
+        typer.Option(
+            "--ready-timeout", help="Seconds to wait per run with --wait-ready"
+        ),
+    ] = 600.0,
 ) -> None:
     """Upgrade firmware on network devices.
 
@@ -70,6 +84,8 @@ def upgrade(
             precheck_sequence=precheck_sequence,
             skip_precheck=skip_precheck,
             verbose=verbose,
+            wait_ready=wait_ready,
+            ready_timeout=ready_timeout,
         )
 
         result = upgrade_firmware(options)
@@ -85,6 +101,15 @@ def upgrade(
             )
 
         for dev_res in result.results:
+            if dev_res.readiness is not None:
+                ctx.output_manager.print_text(
+                    style_manager.format_message(
+                        f"{dev_res.device_name}: {dev_res.readiness.message}",
+                        StyleName.SUCCESS
+                        if dev_res.readiness.ready
+                        else StyleName.ERROR,
+                    )
+                )
             if dev_res.success:
                 if dev_res.platform != "unknown":
                     ctx.output_manager.print_text(
@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: MIT
+"""`nw results` command implementation.
+
+Reads single-file result archives written with ``general.results_format``
+set to ``jsonl`` or ``sqlite`` without extracting them.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from rich.markup import escape
+
+from network_toolkit.common.command_helpers import CommandContext
+from network_toolkit.common.output import OutputMode
+from network_toolkit.exceptions import NetworkToolkitError
+from network_toolkit.results_archive import list_archive, read_archive
+
+ArchiveArg = Annotated[
+    Path,
+    typer.Argument(
+        help="Archive file (*.jsonl.gz or *.sqlite) in the results directory",
+        exists=True,
+        dir_okay=False,
+    ),
+]
+DeviceOpt = Annotated[
+    str | None, typer.Option("--device", "-d", help="Only records for this device")
+]
+CommandOpt = Annotated[
+    str | None,
+    typer.Option("--command", help="Only records for this command or sequence"),
+]
+OutputModeOpt = Annotated[
+    OutputMode | None,
+    typer.Option(
+        "--output-mode",
+        "-o",
+        help="Output decoration mode: default, light, dark, no-color, raw",
+        show_default=False,
+    ),
+]
+
+
+def _record_output(archive: Path, record: dict[str, Any]) -> str | None:
+    """Return a record's output, reading captured output from its file."""
+    if "output" in record:
+        return str(record["output"])
+    output_file = record.get("output_file")
+    if not output_file:
+        return None
+    path = archive.parent / str(output_file)
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError as e:
+        msg = f"Captured output not readable: {path}"
+        raise NetworkToolkitError(msg, details={"error": str(e)}) from e
+
+
+def register(app: typer.Typer) -> None:
+    """Register the results command group with the Typer app."""
+    results_app = typer.Typer(
+        name="results",
+        help="Query single-file result archives (jsonl/sqlite) without extracting",
+        no_args_is_help=True,
+        context_settings={"help_option_names": ["-h", "--help"]},
+    )
+
+    @results_app.command("list")
+    def list_cmd(
+        archive: ArchiveArg,
+        device: DeviceOpt = None,
+        command: CommandOpt = None,
+        output_mode: OutputModeOpt = None,
+    ) -> None:
+        """List the records stored in an archive."""
+        ctx = CommandContext(output_mode=output_mode)
+        try:
+            entries = list_archive(archive, device=device, command=command)
+        except NetworkToolkitError as e:
+            ctx.print_error(e.message)
+            raise typer.Exit(1) from None
+
+        if not entries:
+            ctx.print_warning("No matching records")
+            return
+
+        if ctx.is_raw_mode():
+            for entry in entries:
+                ctx.output_manager.print_output(
+                    "\t".join((str(entry.seq), entry.device, entry.kind, entry.command))
+                )
+            return
+
+        table = ctx.output_manager.create_table(
+            title=f"Results: {archive.name}", show_header=True
+        )
+        for column in ("#", "Device", "Kind", "Command", "Timestamp"):
+            table.add_column(column)
+        for entry in entries:
+            table.add_row(
+                str(entry.seq),
+                escape(entry.device),
+                entry.kind,
+                escape(entry.command),
+                entry.timestamp,
+            )
+        ctx.output_manager.print_table(table)
+
+    @results_app.command("show")
+    def show_cmd(
+        archive: ArchiveArg,
+        device: DeviceOpt = None,
+        command: CommandOpt = None,
+        as_json: Annotated[
+            bool, typer.Option("--json", help="Print full records as JSON lines")
+        ] = False,
+        output_mode: OutputModeOpt = None,
+    ) -> None:
+        """Print command outputs (or full records) from an archive."""
+        ctx = CommandContext(output_mode=output_mode)
+        found = False
+        try:
+            for record in read_archive(archive, device=device, command=command):
+                found = True
+                if as_json:
+                    print(json.dumps(record, ensure_ascii=False))
+                    continue
+                output = _record_output(archive, record)
+                if output is None:
+                    continue
+                if ctx.is_raw_mode():
+                    ctx.output_manager.print_output(output)
+                else:
+                    ctx.output_manager.print_command_output(
+                        str(record.get("device_name", "")),
+                        str(record.get("command", "")),
+                        output,
+                    )
+        except NetworkToolkitError as e:
+            ctx.print_error(e.message)
+            raise typer.Exit(1) from None
+
+        if not found:
+            ctx.print_warning("No matching records")
+
+    app.add_typer(results_app, name="results", rich_help_panel="Info & Configuration")
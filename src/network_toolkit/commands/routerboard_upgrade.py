@@ -56,6 +56,19 @@ def register(app: typer.Typer) -> None:
         verbose: Annotated[
             bool, typer.Option("--verbose", "-v", help="Enable verbose output")
         ] = False,
+        wait_ready: Annotated[
+            bool,
+            typer.Option(
+                "--wait-ready",
+                help="Wait until rebooted devices accept SSH again and report time-to-ready",
+            ),
+        ] = False,
+        ready_timeout: Annotated[
+            float,
+            typer.Option(
+                "--ready-timeout", help="Seconds to wait per run with --wait-ready"
+            ),
+        ] = 600.0,
     ) -> None:
         """Upgrade device BIOS/RouterBOOT and reboot to apply.
 
@@ -84,6 +97,8 @@ def register(app: typer.Typer) -> None:
                 precheck_sequence=precheck_sequence,
                 skip_precheck=skip_precheck,
                 verbose=verbose,
+                wait_ready=wait_ready,
+                ready_timeout=ready_timeout,
             )
 
             result = upgrade_routerboard(options)
@@ -96,6 +111,15 @@ def register(app: typer.Typer) -> None:
                 )
 
             for dev_res in result.results:
+                if dev_res.readiness is not None:
+                    if dev_res.readiness.ready:
+                        ctx.print_success(
+                            f"{dev_res.device_name}: {dev_res.readiness.message}"
+                        )
+                    else:
+                        ctx.print_error(
+                            f"{dev_res.device_name}: {dev_res.readiness.message}"
+                        )
                 if dev_res.success:
                     if dev_res.platform != "unknown":
                         ctx.print_info(f"Platform: {dev_res.platform}")
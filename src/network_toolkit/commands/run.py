@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import sys
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Annotated
@@ -26,7 +28,9 @@ from network_toolkit.common.output import (
 )
 from network_toolkit.exceptions import NetworkToolkitError
 from network_toolkit.ip_device import is_ip_list
+from network_toolkit.metrics import METRICS_FILE_ENV, write_prometheus_textfile
 from network_toolkit.results_enhanced import ResultsManager
+from network_toolkit.timing import spans_to_dicts
 from network_toolkit.transport.factory import get_transport_factory
 
 
@@ -131,6 +135,34 @@ def register(app: typer.Typer) -> None:
                 help="Disable strict SSH host key checking (insecure, use only in lab environments)",
             ),
         ] = False,
+        metrics_file: Annotated[
+            Path | None,
+            typer.Option(
+                "--metrics-file",
+                envvar=METRICS_FILE_ENV,
+                help="Write run metrics in Prometheus textfile-collector format",
+            ),
+        ] = None,
+        stream: Annotated[
+            bool,
+            typer.Option(
+                "--stream",
+                help=(
+                    "Print command output line by line as it arrives "
+                    "(for long-running commands)"
+                ),
+            ),
+        ] = False,
+        capture: Annotated[
+            bool,
+            typer.Option(
+                "--capture",
+                help=(
+                    "Write command output to disk as it arrives instead of "
+                    "keeping it in memory (for very large outputs)"
+                ),
+            ),
+        ] = False,
     ) -> None:
         """Execute a single command or a sequence on a device or a group."""
         # Validate transport type early to preserve current CLI behavior
@@ -196,6 +228,8 @@ def register(app: typer.Typer) -> None:
             is_group: bool = False,
             totals: tuple[int, int, int] | None = None,
         ) -> None:
+            # Latency percentiles are only meaningful across several devices
+            metrics = run_result.metrics if is_group else None
             results_dir = (
                 str(results_mgr.session_dir)
                 if results_mgr and results_mgr.store_results and results_mgr.session_dir
@@ -210,6 +244,7 @@ def register(app: typer.Typer) -> None:
                 is_group=is_group,
                 totals=totals,
                 results_dir=results_dir,
+                metrics=metrics,
             )
 
         def _print_unknown_targets(unknown: list[str]) -> None:
@@ -224,6 +259,32 @@ def register(app: typer.Typer) -> None:
             for message in notices:
                 ctx.print_info(message)
 
+        json_mode = raw == RawFormat.JSON
+        print_lock = threading.Lock()
+
+        def _print_chunk(device: str, chunk: str) -> None:
+            # Called from device worker threads while commands run
+            text = chunk.rstrip("\n")
+            with print_lock:
+                if json_mode:
+                    output_mgr.print_json(
+                        {
+                            "event": "output",
+                            "device": device,
+                            "cmd": command_or_sequence,
+                            "output": chunk,
+                        }
+                    )
+                elif output_mode == OutputMode.RAW:
+                    output_mgr.print_output(text)
+                else:
+                    output_mgr.print_output(
+                        "\n".join(f"[{device}] {line}" for line in text.split("\n"))
+                    )
+
+        if stream and output_mode != OutputMode.RAW:
+            ctx.print_info(f"Streaming output of '{command_or_sequence}' from {target}")
+
         try:
             options = RunOptions(
                 target=target,
@@ -236,6 +297,8 @@ def register(app: typer.Typer) -> None:
                 store_results=store_results,
                 results_dir=results_dir,
                 no_strict_host_key_checking=no_strict_host_key_checking,
+                on_output=_print_chunk if stream else None,
+                capture=capture,
             )
             run_result = run_commands(options)
         except TargetResolutionError as exc:
@@ -255,7 +318,8 @@ def register(app: typer.Typer) -> None:
                 output_mgr.print_error(f"Unexpected error: {exc}")
             raise typer.Exit(1) from exc
 
-        json_mode = raw == RawFormat.JSON
+        if metrics_file is not None and run_result.metrics is not None:
+            write_prometheus_textfile(run_result.metrics, metrics_file)
 
         # Warn about unknown targets but continue when at least one device resolved
         _print_unknown_targets(run_result.resolution.unknown)
@@ -279,8 +343,22 @@ def register(app: typer.Typer) -> None:
         if printing_results_mgr and run_result.results_dir:
             printing_results_mgr.session_dir = Path(run_result.results_dir)
 
+        def _print_timings(
+            device_result: DeviceCommandResult | DeviceSequenceResult,
+        ) -> None:
+            # Per-phase timing breakdown (connect, commands, storage) for JSON
+            if json_mode and device_result.timings:
+                output_mgr.print_json(
+                    {
+                        "event": "timings",
+                        "device": device_result.device,
+                        "spans": spans_to_dicts(device_result.timings),
+                    }
+                )
+
         def _print_sequence_result(device_result: DeviceSequenceResult) -> None:
             if output_mode == OutputMode.RAW:
+                _print_timings(device_result)
                 if not device_result.outputs:
                     return
                 for cmd, output in device_result.outputs.items():
@@ -318,8 +396,38 @@ def register(app: typer.Typer) -> None:
                         output_mgr.print_separator()
             output_mgr.print_blank_line()
 
+        def _print_captured(device_result: DeviceCommandResult) -> None:
+            captured = device_result.captured
+            if captured is None:
+                return
+            if json_mode:
+                output_mgr.print_json(
+                    {
+                        "event": "result",
+                        "device": device_result.device,
+                        "cmd": device_result.command,
+                        "output_file": str(captured.path),
+                        "output_bytes": captured.size,
+                    }
+                )
+            elif output_mode == OutputMode.RAW:
+                if not device_result.streamed:
+                    # Copy from disk in blocks; the output is never loaded whole
+                    for block in captured.iter_text():
+                        sys.stdout.write(block)
+                    sys.stdout.write("\n")
+                captured.discard()
+            else:
+                output_mgr.print_info(
+                    f"Output captured to {captured.path} "
+                    f"({format(captured.size, ',')} bytes)",
+                    device_result.device,
+                )
+
         def _print_command_result(device_result: DeviceCommandResult) -> None:
             if output_mode == OutputMode.RAW:
+                _print_timings(device_result)
+                _print_captured(device_result)
                 if device_result.error or device_result.output is None:
                     return
                 if json_mode:
@@ -341,6 +449,7 @@ def register(app: typer.Typer) -> None:
                 output_mgr.print_error(device_result.error, device_result.device)
             else:
                 output_mgr.print_success("Success", device_result.device)
+                _print_captured(device_result)
                 if device_result.output:
                     output_mgr.print_blank_line()
                     output_mgr.print_output(device_result.output)
@@ -436,6 +545,9 @@ def register(app: typer.Typer) -> None:
                         "total": run_result.totals.total,
                         "succeeded": run_result.totals.succeeded,
                         "failed": run_result.totals.failed,
+                        "metrics": (
+                            run_result.metrics.to_dict() if run_result.metrics else None
+                        ),
                     }
                 )
             return
@@ -527,5 +639,8 @@ def register(app: typer.Typer) -> None:
                     "total": run_result.totals.total,
                     "succeeded": run_result.totals.succeeded,
                     "failed": run_result.totals.failed,
+                    "metrics": (
+                        run_result.metrics.to_dict() if run_result.metrics else None
+                    ),
                 }
             )
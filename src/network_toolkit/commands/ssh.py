@@ -6,7 +6,8 @@ relying on the user's SSH setup (keys/agent). Optionally it can enable
 "synchronize-panes" so a single keyboard input is sent to all panes.
 
 Design goals:
-- No persistence beyond tmux session; no extra daemons.
+- No persistence beyond tmux session; no extra daemons. The opt-in
+  ``--multiplex`` keeps an OpenSSH control master for ControlPersist seconds.
 - Avoid handling passwords; prefer SSH keys. Optionally use sshpass.
 - Minimal, readable code using libtmux.
 """
@@ -20,6 +21,7 @@ import shlex
 import shutil
 import tempfile
 import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -29,6 +31,7 @@ from typing import Annotated, Any
 import typer
 
 # Local application imports
+from network_toolkit.bastion import bastion_route, bastion_ssh_options
 from network_toolkit.commands.ssh_fallback import open_sequential_ssh_sessions
 from network_toolkit.commands.ssh_platform import get_platform_capabilities
 from network_toolkit.common.command_helpers import CommandContext
@@ -44,6 +47,7 @@ from network_toolkit.ip_device import (
     get_supported_platforms,
     is_ip_list,
 )
+from network_toolkit.ssh_multiplex import ssh_control_options
 
 app_help = (
     "Open tmux with CLI panes for a device or group.\n\n"
@@ -202,6 +206,7 @@ def _build_ssh_cmd(
     auth: AuthMode = AuthMode.KEY_FIRST,
     password: str | None = None,
     strict_host_key_checking: bool = False,
+    ssh_options: Sequence[str] = (),
     ctx: CommandContext,
 ) -> str:
     # Determine StrictHostKeyChecking value and related options
@@ -226,6 +231,9 @@ def _build_ssh_cmd(
             ]
         )
 
+    # Connection sharing and bastion routing options
+    base.extend(ssh_options)
+
     # Add authentication options
     base.extend(
         [
@@ -383,6 +391,16 @@ def register(app: typer.Typer) -> None:
                 help="Disable strict SSH host key checking (insecure, use only in lab environments)",
             ),
         ] = False,
+        multiplex: Annotated[
+            bool | None,
+            typer.Option(
+                "--multiplex/--no-multiplex",
+                help=(
+                    "Share SSH connections through an OpenSSH control master "
+                    "(default: general.ssh_multiplexing)"
+                ),
+            ),
+        ] = None,
     ) -> None:
         """
         Open a tmux window with CLI panes for devices in targets.
@@ -481,6 +499,12 @@ def register(app: typer.Typer) -> None:
         # Resolve effective auth mode with legacy flag support
         effective_auth = auth
 
+        if multiplex is None:
+            multiplex = config.general.ssh_multiplexing
+        control_options = (
+            ssh_control_options(config.general.ssh_control_persist) if multiplex else []
+        )
+
         # Prepare connection params and SSH commands per device
         device_cmds: list[tuple[str, str]] = []  # (device_name, ssh_cmd)
         for dev in tgt.devices:
@@ -512,6 +536,13 @@ def register(app: typer.Typer) -> None:
                     auth=mode,
                     password=str(pw) if pw is not None else None,
                     strict_host_key_checking=not no_strict_host_key_checking,
+                    ssh_options=[
+                        *control_options,
+                        *bastion_ssh_options(
+                            bastion_route(config, dev),
+                            config.general.ssh_control_persist,
+                        ),
+                    ],
                     ctx=ctx,
                 )
             except Exception as e:
@@ -18,6 +18,11 @@ SSH_CONFIG_SOURCE_MARKER = "_ssh_config_source"
 # Additional provenance marker for field-level tracking
 SSH_CONFIG_PROVENANCE_MARKER = "_ssh_config_provenance"
 
+# libyaml bindings are an order of magnitude faster on inventories with
+# thousands of hosts; fall back to the pure-Python implementations.
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Default paths
 DEFAULT_SSH_CONFIG = Path("~/.ssh/config")
 DEFAULT_OUTPUT_FILE = "devices/ssh-hosts.yml"
@@ -56,7 +61,7 @@ def _load_existing_inventory(path: Path) -> dict[str, dict[str, Any]]:
         ) from e
 
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YAML_LOADER)  # noqa: S506
     except yaml.YAMLError as e:
         msg = f"Invalid YAML in inventory file: {path}"
         raise ConfigurationError(
@@ -78,7 +83,9 @@ def _load_existing_inventory(path: Path) -> dict[str, dict[str, Any]]:
 def _write_inventory(path: Path, inventory: dict[str, dict[str, Any]]) -> None:
     """Write inventory to YAML file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    yaml_output = yaml.dump(inventory, default_flow_style=False, sort_keys=False)
+    yaml_output = yaml.dump(
+        inventory, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+    )
     path.write_text(yaml_output, encoding="utf-8")
 
 
@@ -311,12 +318,12 @@ def sync_ssh_config(
     if not added and not updated and not removed:
         typer.echo(f"{prefix}No changes ({len(unchanged)} hosts unchanged)")
 
-    # Write output
-    if not dry_run:
+    # Write output; an unchanged inventory is left untouched
+    if dry_run:
+        typer.echo("[DRY RUN] No changes written")
+    elif added or updated or removed or not resolved_output.exists():
         _write_inventory(resolved_output, existing)
         typer.echo(f"Wrote {len(existing)} devices to {resolved_output}")
-    else:
-        typer.echo("[DRY RUN] No changes written")
 
 
 # Register function to be called by cli.py
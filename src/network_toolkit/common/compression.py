@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: MIT
+"""Transparent gzip/zstd compression for stored results and backups.
+
+Writers compress as they write, so no uncompressed copy ever reaches the
+disk. Readers pick the codec from the file suffix (``.gz``, ``.zst``), so
+compressed and plain files can be opened alike.
+
+zstd uses the standard library's ``compression.zstd`` on Python 3.14+ and
+the ``zstandard`` package (the ``zstd`` extra) otherwise.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+import sys
+from pathlib import Path
+from typing import IO, cast
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+COMPRESSION_CHOICES = ("none", *COMPRESSION_SUFFIXES)
+
+ZSTD_INSTALL_HINT = "Install with: pip install 'networka[zstd]'"
+
+# Text compresses 10-20x at these levels; higher ones cost far more CPU
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compression_suffix(compression: str | None) -> str:
+    """Return the file suffix for a codec (``""`` for none)."""
+    return COMPRESSION_SUFFIXES.get(compression or "none", "")
+
+
+def compressed_path(path: Path, compression: str | None) -> Path:
+    """Return ``path`` with the codec's suffix appended."""
+    suffix = compression_suffix(compression)
+    return path.with_name(path.name + suffix) if suffix else path
+
+
+def codec_for(path: Path) -> str | None:
+    """Return the codec a file is compressed with, judged by its suffix."""
+    for codec, suffix in COMPRESSION_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            return codec
+    return None
+
+
+def plain_name(path: Path) -> str:
+    """Return the file name without a compression suffix."""
+    codec = codec_for(path)
+    return path.name.removesuffix(compression_suffix(codec))
+
+
+def zstd_available() -> bool:
+    """Return whether a zstd backend can be imported."""
+    return (
+        sys.version_info >= (3, 14) or importlib.util.find_spec("zstandard") is not None
+    )
+
+
+def _open_zstd(path: Path, mode: str) -> IO[bytes]:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError as e:
+            error_msg = (
+                f"zstandard package required for zstd compression. {ZSTD_INSTALL_HINT}"
+            )
+            raise ImportError(error_msg) from e
+        cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if "w" in mode else None
+        return zstandard.open(path, mode, cctx=cctx)  # type: ignore[no-any-return]
+    return zstd.open(path, mode, level=ZSTD_LEVEL if "w" in mode else None)  # type: ignore[no-any-return]
+
+
+def open_binary(
+    path: Path, mode: str = "rb", compression: str | None = None
+) -> IO[bytes]:
+    """Open a possibly compressed file in binary mode (``rb`` or ``wb``).
+
+    ``compression`` defaults to the codec implied by the file suffix.
+    """
+    codec = compression if compression is not None else codec_for(path)
+    if codec == "gzip":
+        return cast(IO[bytes], gzip.GzipFile(path, mode, compresslevel=GZIP_LEVEL))
+    if codec == "zstd":
+        return _open_zstd(path, mode)
+    return path.open(mode)
+
+
+def open_text(path: Path, mode: str = "r", compression: str | None = None) -> IO[str]:
+    """Open a possibly compressed UTF-8 text file (``r`` or ``w``)."""
+    codec = compression if compression is not None else codec_for(path)
+    if codec not in COMPRESSION_SUFFIXES:
+        return path.open(mode, encoding="utf-8")
+    binary = open_binary(path, mode.replace("t", "") + "b", codec)
+    return io.TextIOWrapper(binary, encoding="utf-8")
+
+
+def read_text(path: Path) -> str:
+    """Read a whole, possibly compressed, UTF-8 text file."""
+    with open_text(path) as f:
+        return f.read()
+
+
+def find_variant(path: Path) -> Path | None:
+    """Return ``path`` or its compressed variant, whichever exists."""
+    for suffix in ("", *COMPRESSION_SUFFIXES.values()):
+        candidate = path.with_name(path.name + suffix) if suffix else path
+        if candidate.exists():
+            return candidate
+    return None
@@ -8,11 +8,14 @@ from __future__ import annotations
 import json
 import sys
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from network_toolkit.metrics import RunMetrics
+
 
 class OutputMode(str, Enum):
     """Output decoration modes for the CLI."""
@@ -200,8 +203,9 @@ class OutputManager:
         is_group: bool = False,
         totals: tuple[int, int, int] | None = None,
         results_dir: str | None = None,
+        metrics: RunMetrics | None = None,
     ) -> None:
-        """Print a run summary."""
+        """Print a run summary, followed by a metrics table when given."""
         if self.mode == OutputMode.RAW:
             # Raw mode skips summaries entirely
             return
@@ -309,6 +313,34 @@ class OutputManager:
 
             self._console.print("\n".join(summary_lines))
 
+        if metrics is not None:
+            self._print_metrics_table(metrics)
+
+    def _print_metrics_table(self, metrics: RunMetrics) -> None:
+        """Print throughput, latency percentiles, bytes, retries and failures."""
+        from network_toolkit.metrics import LatencySummary
+
+        def _latency(summary: LatencySummary) -> str:
+            if not summary.count:
+                return "-"
+            return (
+                f"p50 {summary.p50:.2f}s | p95 {summary.p95:.2f}s | "
+                f"p99 {summary.p99:.2f}s ({summary.count})"
+            )
+
+        table = self.create_table(title="Run Metrics")
+        table.add_column("Metric", style="bold")
+        table.add_column("Value")
+        table.add_row("Devices/min", f"{metrics.devices_per_minute:.1f}")
+        table.add_row("Connect latency", _latency(metrics.connect_latency))
+        table.add_row("Command latency", _latency(metrics.command_latency))
+        table.add_row("Bytes transferred", f"{metrics.bytes_transferred:,}")
+        table.add_row("Command output", f"{metrics.bytes_received:,} bytes")
+        table.add_row("Connect retries", str(metrics.retries))
+        for error_class, count in metrics.failures_by_class.items():
+            table.add_row(f"Failures: {error_class}", str(count))
+        self._console.print(table)
+
     def print_results_directory(self, results_dir: str) -> None:
         """Print the results directory information."""
         if self.mode == OutputMode.RAW:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from network_toolkit.exceptions import NetworkToolkitError
 from network_toolkit.inventory.catalog import get_inventory_catalog
+from network_toolkit.inventory.query import is_target_query
 from network_toolkit.inventory.resolve import resolve_named_targets, select_named_target
 from network_toolkit.ip_device import (
     create_ip_based_config,
@@ -81,7 +82,8 @@ class DeviceResolver:
         Parameters
         ----------
         target_expr : str
-            Comma-separated list of device names, group names, or IP addresses
+            Comma-separated list of device names, group names, or IP addresses,
+            or a target query such as ``site:zurich & tag:edge``
 
         Returns
         -------
@@ -101,6 +103,10 @@ class DeviceResolver:
 
         # Use enhanced config for resolution
         config = self._get_ip_enhanced_config(target_expr)
+        if is_target_query(target_expr):
+            result = resolve_named_targets(config, target_expr)
+            return result.resolved_devices, result.unknown_targets
+
         requested = [t.strip() for t in target_expr.split(",") if t.strip()]
         devices: list[str] = []
         unknowns: list[str] = []
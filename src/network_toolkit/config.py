@@ -15,11 +15,17 @@ import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, PrivateAttr, field_validator
 
+from network_toolkit.common.compression import (
+    COMPRESSION_CHOICES,
+    ZSTD_INSTALL_HINT,
+    zstd_available,
+)
 from network_toolkit.common.defaults import DEFAULT_CONFIG_PATH
 
 # from network_toolkit.common.paths import default_modular_config_dir
 from network_toolkit.credentials import (
     ConnectionParameterBuilder,
+    CredentialCache,
     EnvironmentCredentialManager,
 )
 from network_toolkit.exceptions import ConfigurationError, NetworkToolkitError
@@ -165,6 +171,14 @@ class GeneralConfig(ConfigHistoryMixin, BaseModel):
     ssh_strict_host_key_checking: bool = (
         False  # accept-new: auto-accept new keys, verify existing
     )
+    # Share SSH connections between sessions, tmux panes and file transfers
+    ssh_multiplexing: bool = False
+    ssh_control_persist: int = 60  # seconds an idle OpenSSH master stays open
+
+    # Jump hosts: default per-bastion session limit, ProxyJump discovery
+    bastion_max_sessions: int = 10
+    bastion_wait_timeout: int = 300  # seconds to wait for a free bastion slot
+    bastions_from_ssh_config: bool = False
 
     # Connection retry settings
     connection_retries: int = 3
@@ -186,6 +200,8 @@ class GeneralConfig(ConfigHistoryMixin, BaseModel):
     # Results storage configuration
     store_results: bool = False
     results_format: str = "txt"
+    # Compress result files and backup text outputs: none, gzip or zstd
+    results_compression: str = "none"
     results_include_timestamp: bool = True
     results_include_command: bool = True
 
@@ -214,8 +230,25 @@ class GeneralConfig(ConfigHistoryMixin, BaseModel):
     @classmethod
     def validate_results_format(cls, v: str) -> str:
         """Validate results format is supported."""
-        if v.lower() not in ["txt", "json", "yaml"]:
-            msg = "results_format must be one of: txt, json, yaml"
+        if v.lower() not in ["txt", "json", "yaml", "jsonl", "sqlite"]:
+            msg = "results_format must be one of: txt, json, yaml, jsonl, sqlite"
+            raise ValueError(msg)
+        return v.lower()
+
+    @field_validator("results_compression")
+    @classmethod
+    def validate_results_compression(cls, v: str) -> str:
+        """Validate results compression codec is supported."""
+        if v.lower() not in COMPRESSION_CHOICES:
+            msg = "results_compression must be one of: " + ", ".join(
+                COMPRESSION_CHOICES
+            )
+            raise ValueError(msg)
+        if v.lower() == "zstd" and not zstd_available():
+            msg = (
+                "results_compression zstd needs the zstandard package. "
+                + ZSTD_INSTALL_HINT
+            )
             raise ValueError(msg)
         return v.lower()
 
@@ -276,6 +309,17 @@ class DeviceOverrides(BaseModel):
     transfer_timeout: int | None = None
 
 
+class BastionConfig(BaseModel):
+    """A jump host that devices are reached through."""
+
+    host: str
+    port: int = 22
+    user: str | None = None
+    # Concurrent device sessions through this bastion (general default if unset)
+    max_sessions: int | None = None
+    description: str | None = None
+
+
 # Device type is intentionally a free-form string at config load time.
 # Validation of supported values occurs at runtime where appropriate.
 SupportedDeviceType = str
@@ -316,6 +360,8 @@ class DeviceConfig(ConfigHistoryMixin, BaseModel):
     tags: list[str] | None = None
     overrides: DeviceOverrides | None = None
     command_sequences: dict[str, list[str]] | None = None
+    # Name from `bastions`, or a "[user@]host[:port]" jump host
+    bastion: str | None = None
 
     # Private: where this device was loaded from
     _source_path: Path | None = PrivateAttr(default=None)
@@ -413,6 +459,7 @@ class NetworkConfig(BaseModel):
     device_groups: dict[str, DeviceGroup] | None = None
     command_sequence_groups: dict[str, CommandSequenceGroup] | None = None
     file_operations: dict[str, FileOperationConfig] | None = None
+    bastions: dict[str, BastionConfig] | None = None
 
     # Multi-vendor support
     vendor_platforms: dict[str, VendorPlatformConfig] | None = None
@@ -422,6 +469,8 @@ class NetworkConfig(BaseModel):
     # Private: track where this config was loaded from (for sequence resolution)
     _config_source_dir: Path | None = PrivateAttr(default=None)
     _inventory_catalog: InventoryCatalog | None = PrivateAttr(default=None)
+    # Resolved credentials for this config instance (see credentials.py)
+    _credential_cache: CredentialCache = PrivateAttr(default_factory=CredentialCache)
 
     # Helper: device source path accessor (non-schema, uses PrivateAttr on DeviceConfig)
     def get_device_source_path(self, device_name: str) -> Path | None:
@@ -500,22 +549,25 @@ class NetworkConfig(BaseModel):
             raise NetworkToolkitError(msg, details={"group": group_name})
 
         group = self.device_groups[group_name]
-        members: list[str] = []
+        # Dict as an ordered set keeps large tag expansions linear
+        members: dict[str, None] = {}
 
         # Direct members
         if group.members:
-            members.extend(
-                [m for m in group.members if self.devices and m in self.devices]
+            members.update(
+                dict.fromkeys(
+                    m for m in group.members if self.devices and m in self.devices
+                )
             )
 
         # Tag-based members
         if group.match_tags and self.devices:
+            wanted = set(group.match_tags)
             for device_name, device in self.devices.items():
-                if device.tags and all(tag in device.tags for tag in group.match_tags):
-                    if device_name not in members:
-                        members.append(device_name)
+                if device.tags and wanted.issubset(device.tags):
+                    members[device_name] = None
 
-        return members
+        return list(members)
 
     def get_transport_type(
         self, device_name: str, transport_override: str | None = None
@@ -1679,6 +1731,7 @@ def load_modular_config(
             "global_command_sequences": (
                 global_command_sequences if global_command_sequences else None
             ),
+            "bastions": main_config.get("bastions") or None,
         }
 
         logging.debug(f"Loaded modular configuration from {config_dir.resolve()}")
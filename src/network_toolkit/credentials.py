@@ -7,10 +7,16 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+from network_toolkit.bastion import bastion_route, bastion_ssh_options
 from network_toolkit.introspection import LoaderType
+from network_toolkit.ssh_multiplex import ssh_control_options
 
 if TYPE_CHECKING:
     from network_toolkit.config import DeviceConfig, NetworkConfig
@@ -20,6 +26,55 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Scrapli does not have 'cisco_ios' - it uses 'cisco_iosxe' for both IOS and
+# IOS-XE. Linux/generic SSH gets no platform so Scrapli uses the GenericDriver.
+_SCRAPLI_PLATFORMS: dict[str, str | None] = {
+    "cisco_ios": "cisco_iosxe",
+    "linux": None,
+    "generic": None,
+}
+
+# GenericDriver default is r"^\S{0,48}[#>$~@:\]]\s*$"; Linux prompts can carry
+# longer hostnames/paths (user@host:~$, root@host#, user@host:~/path$, ...).
+GENERIC_PROMPT_PATTERN = r"^\S+[\$#]\s*$"
+
+
+@lru_cache(maxsize=256)
+def connection_template(
+    device_type: str,
+    *,
+    timeout: int,
+    transport: str,
+    ssh_config_file: bool,
+) -> Mapping[str, Any]:
+    """Return the immutable connection parameters shared by a device type.
+
+    Everything that depends only on the device type and the general
+    settings is computed once per combination; callers copy the template
+    and add host, port and credentials.
+    """
+    scrapli_platform = _SCRAPLI_PLATFORMS.get(device_type, device_type)
+    params: dict[str, Any] = {
+        "timeout_socket": timeout,
+        "timeout_transport": timeout,
+        "transport": transport,
+        "ssh_config_file": ssh_config_file,
+    }
+    if scrapli_platform is not None:
+        # The platform field is reserved for hardware architecture; Scrapli's
+        # platform selects the network driver and comes from device_type.
+        params["platform"] = scrapli_platform
+    else:
+        params["comms_prompt_pattern"] = GENERIC_PROMPT_PATTERN
+        # Prompt detection on generic connections may take longer
+        params["timeout_ops"] = 60
+
+    logger.debug(
+        "credentials: built template for device_type=%s: %s", device_type, params
+    )
+    return MappingProxyType(params)
+
+
 @dataclass
 class CredentialSource:
     """Describes where a credential value came from.
@@ -49,6 +104,79 @@ class CredentialSource:
         return str(self.loader.value)
 
 
+@dataclass(frozen=True, slots=True)
+class ResolvedCredentials:
+    """Credentials for one device together with where each value came from."""
+
+    username: str
+    password: str = field(repr=False)
+    username_source: CredentialSource
+    password_source: CredentialSource
+
+
+class CredentialCache:
+    """Per-config cache of resolved credentials.
+
+    Resolution consults several environment variables and scans group
+    membership, and runs every time a ``DeviceSession`` is built, including
+    on retries. The cache lives on the :class:`NetworkConfig` it was filled
+    from, so it is scoped to one run or ``NetworkaClient`` and reloading the
+    config starts with an empty cache. Entries are keyed by device name and
+    the override tuple, and are dropped if the device definition object is
+    replaced (e.g. when target resolution selects another inventory source).
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[
+            tuple[str, str | None, str | None], tuple[object, ResolvedCredentials]
+        ] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        device_name: str,
+        device: DeviceConfig,
+        username_override: str | None,
+        password_override: str | None,
+    ) -> ResolvedCredentials | None:
+        key = (device_name, username_override, password_override)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is device:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        device_name: str,
+        device: DeviceConfig,
+        username_override: str | None,
+        password_override: str | None,
+        resolved: ResolvedCredentials,
+    ) -> None:
+        key = (device_name, username_override, password_override)
+        with self._lock:
+            self._entries[key] = (device, resolved)
+
+    def clear(self) -> None:
+        """Forget all resolved credentials."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_credential_cache(config: NetworkConfig) -> CredentialCache | None:
+    """Return the credential cache attached to a config, if present."""
+    cache = getattr(config, "_credential_cache", None)
+    return cache if isinstance(cache, CredentialCache) else None
+
+
 class CredentialResolver:
     """
     Centralized credential resolution with clear precedence chain.
@@ -93,19 +221,53 @@ class CredentialResolver:
         ValueError
             If device not found or credentials cannot be resolved
         """
+        resolved = self.resolve(device_name, username_override, password_override)
+        return resolved.username, resolved.password
+
+    def resolve(
+        self,
+        device_name: str,
+        username_override: str | None = None,
+        password_override: str | None = None,
+    ) -> ResolvedCredentials:
+        """
+        Resolve credentials and their provenance, using the config's cache.
+
+        Raises
+        ------
+        ValueError
+            If device not found in configuration
+        """
         if not self.config.devices or device_name not in self.config.devices:
             msg = f"Device '{device_name}' not found in configuration"
             raise ValueError(msg)
 
         device = self.config.devices[device_name]
+        cache = get_credential_cache(self.config)
+        if cache is not None:
+            cached = cache.get(
+                device_name, device, username_override, password_override
+            )
+            if cached is not None:
+                return cached
 
-        # Resolve username
-        username = self._resolve_username(device_name, device, username_override)
-
-        # Resolve password
-        password = self._resolve_password(device_name, device, password_override)
-
-        return username, password
+        username, user_source = self._resolve_username_with_source(
+            device_name, device, username_override
+        )
+        password, pass_source = self._resolve_password_with_source(
+            device_name, device, password_override
+        )
+        resolved = ResolvedCredentials(
+            username=username,
+            password=password,
+            username_source=user_source,
+            password_source=pass_source,
+        )
+        if cache is not None:
+            cache.put(
+                device_name, device, username_override, password_override, resolved
+            )
+        return resolved
 
     def _resolve_username(
         self,
@@ -156,21 +318,12 @@ class CredentialResolver:
         tuple[tuple[str, str], tuple[CredentialSource, CredentialSource]]
             ((username, password), (username_source, password_source))
         """
-        if not self.config.devices or device_name not in self.config.devices:
-            msg = f"Device '{device_name}' not found in configuration"
-            raise ValueError(msg)
-
-        device = self.config.devices[device_name]
-
-        username, user_source = self._resolve_username_with_source(
-            device_name, device, username_override
-        )
-        password, pass_source = self._resolve_password_with_source(
-            device_name, device, password_override
+        resolved = self.resolve(device_name, username_override, password_override)
+        return (resolved.username, resolved.password), (
+            resolved.username_source,
+            resolved.password_source,
         )
 
-        return (username, password), (user_source, pass_source)
-
     def _resolve_username_with_source(
         self,
         device_name: str,
@@ -424,6 +577,22 @@ class ConnectionParameterBuilder:
         # Apply device overrides
         self._apply_device_overrides(params, device)
 
+        general = self.config.general
+        if str(params["transport"]).lower() == "system":
+            open_cmd = [
+                *(
+                    ssh_control_options(general.ssh_control_persist)
+                    if general.ssh_multiplexing
+                    else []
+                ),
+                *bastion_ssh_options(
+                    bastion_route(self.config, device_name),
+                    general.ssh_control_persist,
+                ),
+            ]
+            if open_cmd:
+                params["transport_options"] = {"open_cmd": open_cmd}
+
         return params
 
     def _build_base_parameters(
@@ -431,66 +600,27 @@ class ConnectionParameterBuilder:
     ) -> dict[str, Any]:
         """Build base connection parameters.
 
-        Uses device_type for Scrapli platform parameter since device_type
-        defines the network driver/protocol, while platform defines hardware architecture.
+        Overlays the per-device fields onto the shared template for the
+        device's type and the current general settings.
         """
-        # Map internal device_type to Scrapli platform names
-        # Scrapli does not have 'cisco_ios' - it uses 'cisco_iosxe' for both IOS and IOS-XE
-        scrapli_platform = self._map_to_scrapli_platform(device.device_type)
-
-        logger.debug(
-            "credentials: device_type=%s scrapli_platform=%s",
+        general = self.config.general
+        template = connection_template(
             device.device_type,
-            scrapli_platform,
+            timeout=general.timeout,
+            transport=general.transport,
+            ssh_config_file=general.ssh_config_file,
         )
-
-        params: dict[str, Any] = {
+        return {
+            **template,
             "host": device.host,
             "auth_username": username,
             "auth_password": password,
-            "port": device.port or self.config.general.port,
-            "timeout_socket": self.config.general.timeout,
-            "timeout_transport": self.config.general.timeout,
-            "transport": self.config.general.transport,
-            "ssh_config_file": self.config.general.ssh_config_file,
+            "port": device.port or general.port,
         }
 
-        # Only add platform if it's not None (for generic/linux connections)
-        if scrapli_platform is not None:
-            # Use mapped platform for Scrapli - this determines the network driver
-            # The platform field is reserved for hardware architecture (x86, arm, etc.)
-            params["platform"] = scrapli_platform
-            logger.debug("credentials: added platform=%s to params", scrapli_platform)
-        else:
-            # For generic/linux connections, use GenericDriver with suitable prompt pattern
-            # GenericDriver default is: r"^\S{0,48}[#>$~@:\]]\s*$"
-            # We extend this for Linux which can have longer hostnames/paths
-            # Pattern matches: user@host:~$, root@host#, user@host:~/path$, etc.
-            # Scrapli uses multiline + case insensitive regex flags
-            params["comms_prompt_pattern"] = r"^\S+[\$#]\s*$"
-            # Increase timeout for generic connections as prompt detection may take longer
-            params["timeout_ops"] = 60
-            logger.debug(
-                "credentials: not adding platform; set comms_prompt_pattern and timeout_ops=60 for generic/linux"
-            )
-
-        logger.debug("credentials: final params keys: %s", list(params.keys()))
-        logger.debug("credentials: 'platform' in params: %s", "platform" in params)
-        if "platform" in params:
-            logger.debug("credentials: params['platform'] = %s", params["platform"])
-        if "comms_prompt_pattern" in params:
-            logger.debug(
-                "credentials: params['comms_prompt_pattern'] = %s",
-                params["comms_prompt_pattern"],
-            )
-        return params
-
     def _map_to_scrapli_platform(self, device_type: str) -> str | None:
         """Map internal device_type to Scrapli platform name.
 
-        Scrapli core drivers use specific platform names that may differ
-        from our internal device_type names. This function handles the mapping.
-
         Parameters
         ----------
         device_type : str
@@ -501,14 +631,7 @@ class ConnectionParameterBuilder:
         str | None
             Scrapli platform name, or None for generic/linux connections
         """
-        # Scrapli does not have 'cisco_ios' - use 'cisco_iosxe' for both IOS and IOS-XE
-        platform_mapping = {
-            "cisco_ios": "cisco_iosxe",
-            # For Linux/generic SSH, don't pass a platform - use GenericDriver
-            "linux": None,
-            "generic": None,
-        }
-        return platform_mapping.get(device_type, device_type)
+        return _SCRAPLI_PLATFORMS.get(device_type, device_type)
 
     def _apply_device_overrides(
         self, params: dict[str, Any], device: DeviceConfig
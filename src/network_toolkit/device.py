@@ -5,30 +5,49 @@
 
 from __future__ import annotations
 
+import ipaddress
 import logging
+import socket
 import threading
 import time
+from collections.abc import Callable, Iterator, Mapping
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
 
 import paramiko
 from scrapli import Scrapli
 from scrapli.exceptions import ScrapliException
 
+from network_toolkit.bastion import bastion_route, get_bastion_slots
 from network_toolkit.common.interactive_confirmation import create_confirmation_handler
-from network_toolkit.device_transfers import calculate_file_checksum, verify_file_upload
+from network_toolkit.device_transfers import (
+    SharedUploadSource,
+    calculate_file_checksum,
+    verify_file_upload,
+)
 from network_toolkit.exceptions import (
+    ConfigurationError,
     DeviceConnectionError,
     DeviceExecutionError,
     FileTransferError,
 )
+from network_toolkit.inventory.ssh_config import (
+    CompiledSSHConfig,
+    compile_ssh_config,
+)
 from network_toolkit.platforms.mikrotik_routeros.confirmation_patterns import (
     MIKROTIK_PACKAGE_DOWNGRADE,
     MIKROTIK_REBOOT,
     MIKROTIK_ROUTERBOARD_UPGRADE,
     MIKROTIK_SYSTEM_RESET,
 )
+from network_toolkit.ssh_multiplex import get_shared_transports
+from network_toolkit.timing import current_recorder, timed
+from network_toolkit.tracing import tracing_enabled
 from network_toolkit.transport.factory import get_transport_factory
 
 if TYPE_CHECKING:
@@ -40,6 +59,128 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _session_defaults(
+    strict_host_key: bool, ssh_config_file: bool
+) -> Mapping[str, Any]:
+    """Immutable connection defaults shared by all sessions with these settings.
+
+    Host key handling for first-time connections:
+    https://scrapli.dev/user_guide/basic_usage/#ssh-key-verification
+    """
+    return MappingProxyType(
+        {
+            "auth_strict_key": strict_host_key,
+            "ssh_config_file": ssh_config_file,
+            "timeout_socket": 10,  # Socket timeout
+            "timeout_transport": 30,  # Transport timeout
+            "timeout_ops": 30,  # Operations timeout
+            "channel_lock": True,  # Ensure thread-safe channel operations
+        }
+    )
+
+
+def _timed_call(span_name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with timed(span_name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _instrument_driver_open(driver: Any) -> None:
+    """Record the phases of a Scrapli driver's ``open()`` as timing spans.
+
+    Scrapli opens in steps: transport open (TCP + SSH handshake, and auth for
+    paramiko/ssh2), in-channel authentication (system SSH, telnet) and the
+    ``on_open`` hook (prompt detection, paging). Wrapping them on the driver
+    instance gives the connect breakdown without touching Scrapli itself.
+    """
+    if driver is None or getattr(driver, "_nw_timing_instrumented", False) is True:
+        return
+    channel = getattr(driver, "channel", None)
+    targets = (
+        (getattr(driver, "transport", None), "open", "connect.transport"),
+        (channel, "channel_authenticate_ssh", "connect.auth"),
+        (channel, "channel_authenticate_telnet", "connect.auth"),
+        (driver, "on_open", "connect.on_open"),
+    )
+    try:
+        for owner, attr, span_name in targets:
+            original = getattr(owner, attr, None) if owner is not None else None
+            if callable(original):
+                setattr(owner, attr, _timed_call(span_name, original))
+        driver._nw_timing_instrumented = True
+    except (AttributeError, TypeError) as e:
+        logger.debug("Could not instrument driver open phases: %s", e)
+
+
+@lru_cache(maxsize=4)
+def _compiled_ssh_config(path: Path, _mtime_ns: int) -> CompiledSSHConfig:
+    return compile_ssh_config(path)
+
+
+def _ssh_config_redirects(host: str, ssh_config_file: Any) -> bool:
+    """Return True if the SSH config sends ``host`` elsewhere or via a proxy.
+
+    Such a host is often an alias that does not resolve locally at all.
+    """
+    if not ssh_config_file:
+        return False
+    path = Path(
+        "~/.ssh/config" if ssh_config_file is True else str(ssh_config_file)
+    ).expanduser()
+    try:
+        options = _compiled_ssh_config(path, path.stat().st_mtime_ns).lookup(host)
+    except OSError:
+        return False
+    except ConfigurationError:
+        # Unreadable config: the transport decides, do not guess
+        return True
+    return not options.keys().isdisjoint({"hostname", "proxyjump", "proxycommand"})
+
+
+def _time_name_resolution(host: Any, port: Any, ssh_config_file: Any) -> None:
+    """Record DNS resolution time for ``host``.
+
+    The lookup is an extra one, made only while trace spans are exported, so
+    it is skipped for IP literals and for hosts the SSH config redirects.
+    """
+    if not isinstance(host, str) or not host:
+        return
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        pass
+    else:
+        return
+    if _ssh_config_redirects(host, ssh_config_file):
+        return
+    try:
+        with timed("connect.dns", host=host):
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError as e:
+        # The transport reports resolution failures with proper context
+        logger.debug("Name resolution for %s failed: %s", host, e)
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _in_bastion_slot(
+    method: Callable[Concatenate[DeviceSession, P], R],
+) -> Callable[Concatenate[DeviceSession, P], R]:
+    """Run a session method while holding a session slot on its bastion."""
+
+    @wraps(method)
+    def wrapper(self: DeviceSession, *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._bastion_slot():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DeviceSession:
     """
     Session manager for network device connections using Scrapli.
@@ -97,28 +238,33 @@ class DeviceSession:
             device_name, username_override, password_override
         )
 
-        # Add SSH host key acceptance settings for first-time connections
-        # https://scrapli.dev/user_guide/basic_usage/#ssh-key-verification
-
-        # Only set defaults if not already provided by config/overrides
-        defaults = {
-            "auth_strict_key": config.general.ssh_strict_host_key_checking,
-            "ssh_config_file": config.general.ssh_config_file,
-            "timeout_socket": 10,  # Socket timeout
-            "timeout_transport": 30,  # Transport timeout
-            "timeout_ops": 30,  # Operations timeout
-            "channel_lock": True,  # Ensure thread-safe channel operations
+        # Jump host in front of the device: session limits and SFTP tunnels
+        self._bastion = bastion_route(config, device_name)
+        transport = str(self._connection_params.get("transport", "system")).lower()
+        if self._bastion is not None and transport != "system":
+            msg = (
+                f"Device '{device_name}' uses bastion '{self._bastion.name}', "
+                f"which needs the system transport; '{transport}' cannot "
+                "tunnel through a bastion"
+            )
+            raise ConfigurationError(msg, details={"device": device_name})
+        self._slot_lock = threading.Lock()
+        self._slot_users = 0
+
+        # Session defaults only fill keys not provided by config/overrides
+        self._connection_params = {
+            **_session_defaults(
+                config.general.ssh_strict_host_key_checking,
+                config.general.ssh_config_file,
+            ),
+            **self._connection_params,
         }
 
-        for key, value in defaults.items():
-            if key not in self._connection_params:
-                self._connection_params[key] = value
-
-        logger.info(f"Initialized session for device: {device_name}")
+        logger.info("Initialized session for device: %s", device_name)
         # Log only non-sensitive connection parameters
         safe_keys = ("host", "port", "auth_username", "platform", "auth_strict_key")
         safe_params = {k: self._connection_params.get(k) for k in safe_keys}
-        logger.debug(f"Connection parameters: {safe_params}")
+        logger.debug("Connection parameters: %s", safe_params)
 
     def connect(self) -> None:
         """Establish connection to the device.
@@ -129,102 +275,174 @@ class DeviceSession:
             If connection cannot be established after retries
         """
         if self._connected:
-            logger.debug(f"Device {self.device_name} already connected")
+            logger.debug("Device %s already connected", self.device_name)
+            return
+
+        with self._bastion_slot():
+            self._open_transport()
+
+    @contextmanager
+    def _bastion_slot(self) -> Iterator[None]:
+        """Hold a session slot on the bastion while connecting or in use.
+
+        Idle connected sessions hold no slot, so sessions kept in a pool do
+        not block other devices behind the same bastion. Nested and
+        concurrent use of one session shares a single slot.
+        """
+        if self._bastion is None:
+            yield
             return
+        with self._slot_lock:
+            if not self._slot_users:
+                with timed(
+                    "bastion.wait", device=self.device_name, bastion=self._bastion.name
+                ):
+                    get_bastion_slots().acquire(
+                        self._bastion, self.config.general.bastion_wait_timeout
+                    )
+            self._slot_users += 1
+        try:
+            yield
+        finally:
+            with self._slot_lock:
+                self._slot_users -= 1
+                if not self._slot_users:
+                    get_bastion_slots().release(self._bastion)
 
+    def _open_transport(self) -> None:
         # Get the transport type for this device
         transport_type = self.config.get_transport_type(
             self.device_name, self.transport_override
         )
         logger.info(
-            f"Connecting to device: {self.device_name} using transport: {transport_type}"
+            "Connecting to device: %s using transport: %s",
+            self.device_name,
+            transport_type,
         )
 
-        try:
-            attempts = self.config.general.connection_retries
-            delay = float(self.config.general.retry_delay)
-            host = self._connection_params.get("host")
-            port = self._connection_params.get("port")
-            username = self._connection_params.get("auth_username")
-            password = self._connection_params.get("auth_password")
-            password_len = len(password) if isinstance(password, str) else 0
-
-            # Create transport via factory and open with retry
-            transport_factory = get_transport_factory(transport_type)
-            self._transport = transport_factory.create_transport(
-                self.device_name, self.config, self._connection_params
-            )
-            for attempt in range(1, max(1, attempts) + 1):
-                try:
-                    logger.info(
-                        f"Opening connection to '{host}' on port '{port}' as user '{username}' (attempt {attempt}/{max(1, attempts)}; password_len={password_len})"
-                    )
-                    # If transport exposes underlying driver, prefer opening it to
-                    # satisfy tests that patch `network_toolkit.device.Scrapli().open`.
-                    raw_drv = getattr(self._transport, "_raw_driver", None)
-                    if raw_drv is not None and hasattr(raw_drv, "open"):
-                        raw_drv.open()
-                    else:
-                        self._transport.open()
-                    self._connected = True
-                    logger.info(
-                        f"Successfully connected to {self.device_name} using {transport_type}"
-                    )
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Connect attempt {attempt} failed for {self.device_name}: {e}"
+        with timed(
+            "connect", device=self.device_name, transport=transport_type
+        ) as span:
+            try:
+                attempts = self.config.general.connection_retries
+                delay = float(self.config.general.retry_delay)
+                host = self._connection_params.get("host")
+                port = self._connection_params.get("port")
+                username = self._connection_params.get("auth_username")
+                password = self._connection_params.get("auth_password")
+                password_len = len(password) if isinstance(password, str) else 0
+
+                # Create transport via factory and open with retry
+                transport_factory = get_transport_factory(transport_type)
+                self._transport = transport_factory.create_transport(
+                    self.device_name, self.config, self._connection_params
+                )
+                timing_active = current_recorder() is not None
+                # The lookup costs a resolver round trip of its own, so only
+                # make it when spans are exported. Behind a bastion the name
+                # is resolved there, not here
+                if tracing_enabled() and self._bastion is None:
+                    _time_name_resolution(
+                        host, port, self._connection_params.get("ssh_config_file")
                     )
-                    if attempt < max(1, attempts):
-                        # Best-effort cleanup of current transport/driver before retry
-                        try:
-                            raw_drv = getattr(self._transport, "_raw_driver", None)
-                            if raw_drv is not None and hasattr(raw_drv, "close"):
-                                raw_drv.close()
-                        except Exception:
-                            pass
-                        try:
-                            if self._transport is not None:
-                                self._transport.close()
-                        except Exception:
-                            pass
-
-                        # Recreate transport/driver for the next attempt to ensure clean state
-                        try:
-                            self._transport = transport_factory.create_transport(
-                                self.device_name, self.config, self._connection_params
+                for attempt in range(1, max(1, attempts) + 1):
+                    span["attempts"] = attempt
+                    try:
+                        if timing_active:
+                            _instrument_driver_open(
+                                getattr(self._transport, "_raw_driver", None)
                             )
-                        except Exception:
-                            # If recreation fails, we'll still respect retry delay
-                            pass
-                        time.sleep(delay)
-                        continue
-                    raise
-
-        except NotImplementedError as e:
-            # Surface a friendly message for transports that are not ready yet
-            logger.error(
-                f"Transport not available for {self.device_name} using {transport_type}: {e}"
-            )
-            raise DeviceConnectionError(
-                str(e), details={"transport_type": transport_type}
-            ) from e
-        except (TypeError, ValueError, KeyError) as e:
-            logger.error(f"Invalid configuration for {self.device_name}: {e}")
-            msg = f"Invalid configuration for {self.device_name}"
-            raise DeviceConnectionError(
-                msg,
-                details={"original_error": str(e)},
-            ) from e
-        except Exception as e:
-            logger.error(
-                f"Failed to connect to {self.device_name} using {transport_type}: {e}"
-            )
-            msg = f"Connection failed for {self.device_name}"
-            raise DeviceConnectionError(
-                msg,
-                details={"original_error": str(e), "transport_type": transport_type},
-            ) from e
+                        logger.info(
+                            "Opening connection to '%s' on port '%s' as user '%s' (attempt %s/%s; password_len=%s)",
+                            host,
+                            port,
+                            username,
+                            attempt,
+                            max(1, attempts),
+                            password_len,
+                        )
+                        # If transport exposes underlying driver, prefer opening it to
+                        # satisfy tests that patch `network_toolkit.device.Scrapli().open`.
+                        raw_drv = getattr(self._transport, "_raw_driver", None)
+                        if raw_drv is not None and hasattr(raw_drv, "open"):
+                            raw_drv.open()
+                        else:
+                            self._transport.open()
+                        self._connected = True
+                        logger.info(
+                            "Successfully connected to %s using %s",
+                            self.device_name,
+                            transport_type,
+                        )
+                        break
+                    except Exception as e:
+                        logger.warning(
+                            "Connect attempt %s failed for %s: %s",
+                            attempt,
+                            self.device_name,
+                            e,
+                        )
+                        if attempt < max(1, attempts):
+                            # Best-effort cleanup of current transport/driver before retry
+                            try:
+                                raw_drv = getattr(self._transport, "_raw_driver", None)
+                                if raw_drv is not None and hasattr(raw_drv, "close"):
+                                    raw_drv.close()
+                            except Exception:
+                                pass
+                            try:
+                                if self._transport is not None:
+                                    self._transport.close()
+                            except Exception:
+                                pass
+
+                            # Recreate transport/driver for the next attempt to ensure clean state
+                            try:
+                                self._transport = transport_factory.create_transport(
+                                    self.device_name,
+                                    self.config,
+                                    self._connection_params,
+                                )
+                            except Exception:
+                                # If recreation fails, we'll still respect retry delay
+                                pass
+                            time.sleep(delay)
+                            continue
+                        raise
+
+            except NotImplementedError as e:
+                # Surface a friendly message for transports that are not ready yet
+                logger.error(
+                    "Transport not available for %s using %s: %s",
+                    self.device_name,
+                    transport_type,
+                    e,
+                )
+                raise DeviceConnectionError(
+                    str(e), details={"transport_type": transport_type}
+                ) from e
+            except (TypeError, ValueError, KeyError) as e:
+                logger.error("Invalid configuration for %s: %s", self.device_name, e)
+                msg = f"Invalid configuration for {self.device_name}"
+                raise DeviceConnectionError(
+                    msg,
+                    details={"original_error": str(e)},
+                ) from e
+            except Exception as e:
+                logger.error(
+                    "Failed to connect to %s using %s: %s",
+                    self.device_name,
+                    transport_type,
+                    e,
+                )
+                msg = f"Connection failed for {self.device_name}"
+                raise DeviceConnectionError(
+                    msg,
+                    details={
+                        "original_error": str(e),
+                        "transport_type": transport_type,
+                    },
+                ) from e
 
     def disconnect(self) -> None:
         """Close connection to the device."""
@@ -255,15 +473,16 @@ class DeviceSession:
 
             transport_type = self.config.get_transport_type(self.device_name)
             logger.info(
-                f"Disconnected from {self.device_name} (transport: {transport_type})"
+                "Disconnected from %s (transport: %s)", self.device_name, transport_type
             )
         except Exception as e:
-            logger.warning(f"Error during disconnect from {self.device_name}: {e}")
+            logger.warning("Error during disconnect from %s: %s", self.device_name, e)
         finally:
             self._connected = False
             self._driver = None
             self._transport = None
 
+    @_in_bastion_slot
     def execute_command(self, command: str) -> str:
         """Execute a single command on the device.
 
@@ -286,10 +505,12 @@ class DeviceSession:
             msg = f"Device {self.device_name} not connected"
             raise DeviceExecutionError(msg)
 
-        logger.debug(f"Executing command on {self.device_name}: {command}")
+        logger.debug("Executing command on %s: %s", self.device_name, command)
 
         try:
-            response = self._transport.send_command(command)
+            with timed("command", device=self.device_name, command=command) as span:
+                response = self._transport.send_command(command)
+                span["bytes_received"] = len((response.result or "").encode())
 
             if response.failed:
                 msg = f"Command failed on {self.device_name}: {command}"
@@ -298,11 +519,11 @@ class DeviceSession:
                     details={"error": response.result},
                 )
 
-            logger.debug(f"Command completed on {self.device_name}")
+            logger.debug("Command completed on %s", self.device_name)
             return response.result
 
         except ScrapliException as e:
-            logger.error(f"Command execution failed on {self.device_name}: {e}")
+            logger.error("Command execution failed on %s: %s", self.device_name, e)
             msg = f"Command execution failed on {self.device_name}"
             raise DeviceExecutionError(
                 msg,
@@ -311,7 +532,7 @@ class DeviceSession:
         except Exception as e:
             # Normalize unknown transport/library exceptions
             logger.error(
-                f"Unexpected error executing command on {self.device_name}: {e}"
+                "Unexpected error executing command on %s: %s", self.device_name, e
             )
             msg = f"Command execution failed on {self.device_name}"
             raise DeviceExecutionError(
@@ -319,6 +540,68 @@ class DeviceSession:
                 details={"command": command, "original_error": str(e)},
             ) from e
 
+    def stream_command(self, command: str) -> Iterator[str]:
+        """Execute a command and yield its output as the device sends it.
+
+        Parameters
+        ----------
+        command : str
+            Command to execute
+
+        Yields
+        ------
+        str
+            Output chunks, in blocks of complete lines where the transport
+            supports streaming and as one chunk otherwise
+
+        Raises
+        ------
+        DeviceExecutionError
+            If command execution fails
+        """
+        if not self._connected or not self._transport:
+            msg = f"Device {self.device_name} not connected"
+            raise DeviceExecutionError(msg)
+
+        logger.debug("Streaming command on %s: %s", self.device_name, command)
+        with self._bastion_slot():
+            yield from self._stream_command(command)
+
+    def _stream_command(self, command: str) -> Iterator[str]:
+        stream = getattr(self._transport, "stream_command", None)
+        if stream is None:
+            # Transports without streaming support deliver the whole output
+            yield self.execute_command(command)
+            return
+
+        received = 0
+        try:
+            with timed(
+                "command", device=self.device_name, command=command, streamed=True
+            ) as span:
+                for chunk in stream(command):
+                    received += len(chunk.encode())
+                    yield chunk
+                span["bytes_received"] = received
+            logger.debug("Command completed on %s", self.device_name)
+        except ScrapliException as e:
+            logger.error("Command execution failed on %s: %s", self.device_name, e)
+            msg = f"Command execution failed on {self.device_name}"
+            raise DeviceExecutionError(
+                msg,
+                details={"command": command, "original_error": str(e)},
+            ) from e
+        except Exception as e:
+            logger.error(
+                "Unexpected error executing command on %s: %s", self.device_name, e
+            )
+            msg = f"Command execution failed on {self.device_name}"
+            raise DeviceExecutionError(
+                msg,
+                details={"command": command, "original_error": str(e)},
+            ) from e
+
+    @_in_bastion_slot
     def execute_commands(self, commands: list[str]) -> dict[str, str]:
         """Execute multiple commands on the device.
 
@@ -339,17 +622,20 @@ class DeviceSession:
                 result = self.execute_command(command)
                 results[command] = result
             except DeviceExecutionError as e:
-                logger.error(f"Command '{command}' failed: {e}")
+                logger.error("Command '%s' failed: %s", command, e)
                 results[command] = f"ERROR: {e}"
 
         return results
 
+    @_in_bastion_slot
     def upload_file(
         self,
         local_path: str | Path,
         remote_filename: str | None = None,
         verify_upload: bool = True,
         verify_checksum: bool | None = None,
+        *,
+        source: SharedUploadSource | None = None,
     ) -> bool:
         """Upload a file to the MikroTik device using SCP.
 
@@ -363,6 +649,9 @@ class DeviceSession:
             Whether to verify the upload by checking if the file exists on the device
         verify_checksum : bool, optional
             Whether to verify file integrity using checksums. If None, uses config setting
+        source : SharedUploadSource, optional
+            Shared memory-mapped view of ``local_path`` used when the same file
+            is sent to many devices; its checksum is computed only once
 
         Returns
         -------
@@ -400,14 +689,20 @@ class DeviceSession:
             verify_checksum = getattr(self.config.general, "verify_checksums", False)
 
         logger.info(
-            f"Uploading file '{local_path}' to {self.device_name} as '{remote_filename}'"
+            "Uploading file '%s' to %s as '%s'",
+            local_path,
+            self.device_name,
+            remote_filename,
         )
 
         # Calculate local file checksum if verification is enabled
         local_checksum = None
         if verify_checksum:
-            local_checksum = calculate_file_checksum(local_path)
-            logger.debug(f"Local file SHA256: {local_checksum}")
+            if source is not None:
+                local_checksum = source.checksum()
+            else:
+                local_checksum = calculate_file_checksum(local_path)
+            logger.debug("Local file SHA256: %s", local_checksum)
 
         # Get connection parameters for SCP
         host = self._connection_params["host"]
@@ -417,14 +712,24 @@ class DeviceSession:
 
         transport: paramiko.Transport | None = None
         sftp: paramiko.SFTPClient | None = None
+        shared = self._multiplexing_enabled()
+        session_transport = self._session_transport() if shared else None
 
         try:
             # Create transport and connect
-            transport = paramiko.Transport((host, port))
-            transport.connect(username=username, password=password)
+            with timed("transfer.connect", device=self.device_name):
+                if session_transport is not None:
+                    transport = session_transport
+                elif shared:
+                    transport = get_shared_transports().acquire(
+                        host, port, username, password, via=self._bastion
+                    )
+                else:
+                    transport = paramiko.Transport(self._transfer_socket(host, port))
+                    transport.connect(username=username, password=password)
 
-            # Create SFTP client
-            sftp = paramiko.SFTPClient.from_transport(transport)
+                # Create SFTP client
+                sftp = paramiko.SFTPClient.from_transport(transport)
             if sftp is None:
                 msg = "Failed to create SFTP client"
                 raise FileTransferError(msg)
@@ -432,15 +737,24 @@ class DeviceSession:
             # Upload the file to root directory
             remote_path = f"/{remote_filename}"
 
-            # Get file size for logging
-            file_size = local_path.stat().st_size
-            logger.debug(f"Uploading file of size {file_size} bytes")
-
             # Upload the file
-            sftp.put(str(local_path), remote_path)
+            with timed(
+                "transfer.upload", device=self.device_name, remote_path=remote_path
+            ) as span:
+                if source is not None:
+                    file_size = source.size
+                    logger.debug("Uploading file of size %s bytes", file_size)
+                    sftp.putfo(source.reader(), remote_path, file_size=file_size)
+                else:
+                    file_size = local_path.stat().st_size
+                    logger.debug("Uploading file of size %s bytes", file_size)
+                    sftp.put(str(local_path), remote_path)
+                span["bytes"] = file_size
 
             logger.info(
-                f"File '{local_path.name}' uploaded successfully as '{remote_filename}'"
+                "File '%s' uploaded successfully as '%s'",
+                local_path.name,
+                remote_filename,
             )
 
             # CRITICAL: Wait for device to finish processing the uploaded file
@@ -451,13 +765,15 @@ class DeviceSession:
             # Verify upload if requested
             if verify_upload:
                 logger.debug("Starting upload verification...")
-                verification_success = self._verify_file_upload(
-                    remote_filename,
-                    expected_size=file_size,
-                    expected_checksum=local_checksum if verify_checksum else None,
-                    max_retries=5,
-                    retry_delay=3.0,
-                )
+                with timed("transfer.verify", device=self.device_name) as span:
+                    verification_success = self._verify_file_upload(
+                        remote_filename,
+                        expected_size=file_size,
+                        expected_checksum=local_checksum if verify_checksum else None,
+                        max_retries=5,
+                        retry_delay=3.0,
+                    )
+                    span["ok"] = verification_success
                 if verification_success:
                     verification_msg = "Upload verified: file found on device"
                     if verify_checksum:
@@ -477,7 +793,9 @@ class DeviceSession:
 
         except paramiko.AuthenticationException as e:
             logger.error(
-                f"Authentication failed during file upload to {self.device_name}: {e}"
+                "Authentication failed during file upload to %s: %s",
+                self.device_name,
+                e,
             )
             msg = f"Authentication failed during file upload to {self.device_name}"
             raise DeviceExecutionError(
@@ -486,7 +804,9 @@ class DeviceSession:
             ) from e
 
         except paramiko.SSHException as e:
-            logger.error(f"SSH error during file upload to {self.device_name}: {e}")
+            if shared and session_transport is None:
+                get_shared_transports().discard(host, port, username, password)
+            logger.error("SSH error during file upload to %s: %s", self.device_name, e)
             msg = f"SSH error during file upload to {self.device_name}"
             raise DeviceExecutionError(
                 msg,
@@ -494,7 +814,7 @@ class DeviceSession:
             ) from e
 
         except Exception as e:
-            logger.error(f"File upload failed to {self.device_name}: {e}")
+            logger.error("File upload failed to %s: %s", self.device_name, e)
             msg = f"File upload failed to {self.device_name}"
             raise DeviceExecutionError(
                 msg,
@@ -511,13 +831,14 @@ class DeviceSession:
                 try:
                     sftp.close()
                 except Exception as e:
-                    logger.warning(f"Error closing SFTP connection: {e}")
+                    logger.warning("Error closing SFTP connection: %s", e)
 
-            if transport:
+            # Pooled transports stay open for the next transfer
+            if transport and not shared:
                 try:
                     transport.close()
                 except Exception as e:
-                    logger.warning(f"Error closing transport connection: {e}")
+                    logger.warning("Error closing transport connection: %s", e)
 
     # Removed: _calculate_file_checksum, _verify_file_upload, _verify_file_size,
     # and _verify_file_checksum; delegated to network_toolkit.device_transfers
@@ -574,6 +895,8 @@ class DeviceSession:
 
         results: dict[str, bool] = {}
         upload_lock = threading.Lock()
+        # Map and hash the file once for all workers
+        source = SharedUploadSource(local_path)
 
         def upload_to_device(device_name: str) -> tuple[str, bool]:
             """Upload file to a single device."""
@@ -584,21 +907,24 @@ class DeviceSession:
                         remote_filename=remote_filename,
                         verify_upload=verify_upload,
                         verify_checksum=verify_checksum,
+                        source=source,
                     )
                     with upload_lock:
                         logger.info(
-                            f"Upload to {device_name}: {'SUCCESS' if success else 'FAILED'}"
+                            "Upload to %s: %s",
+                            device_name,
+                            "SUCCESS" if success else "FAILED",
                         )
                     return device_name, success
 
             except Exception as e:
                 with upload_lock:
-                    logger.error(f"Upload to {device_name} failed: {e}")
+                    logger.error("Upload to %s failed: %s", device_name, e)
                 return device_name, False
 
         # Use ThreadPoolExecutor for concurrent uploads
         max_workers = min(max_concurrent, len(device_names))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with source, ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all upload tasks
             future_to_device = {
                 executor.submit(upload_to_device, device_name): device_name
@@ -613,10 +939,11 @@ class DeviceSession:
         # Log summary
         successful = sum(results.values())
         total = len(device_names)
-        logger.info(f"File upload summary: {successful}/{total} devices successful")
+        logger.info("File upload summary: %s/%s devices successful", successful, total)
 
         return results
 
+    @_in_bastion_slot
     def deploy_config_with_reset(
         self,
         local_config_path: Path,
@@ -702,14 +1029,16 @@ class DeviceSession:
         # Determine remote filename
         remote_name = remote_filename or local_config_path.name
 
-        logger.warning(f"🚨 NUCLEAR CONFIG DEPLOYMENT INITIATED on {self.device_name}!")
-        logger.warning(f"   Config file: {local_config_path}")
-        logger.warning(f"   Remote name: {remote_name}")
+        logger.warning(
+            "🚨 NUCLEAR CONFIG DEPLOYMENT INITIATED on %s!", self.device_name
+        )
+        logger.warning("   Config file: %s", local_config_path)
+        logger.warning("   Remote name: %s", remote_name)
         logger.warning("   This will RESET the device configuration!")
 
         try:
             # Step 1: Upload the configuration file
-            logger.info(f"Step 1/3: Uploading config file {local_config_path.name}")
+            logger.info("Step 1/3: Uploading config file %s", local_config_path.name)
             upload_success = self.upload_file(
                 local_path=local_config_path,
                 remote_filename=remote_filename,
@@ -748,11 +1077,11 @@ class DeviceSession:
 
             reset_command = " ".join(reset_cmd_parts)
 
-            logger.info(f"Step 2/3: Preparing reset command: {reset_command}")
+            logger.info("Step 2/3: Preparing reset command: %s", reset_command)
 
             # Step 3: Execute the nuclear reset with auto-confirmation
             logger.warning(
-                f"Step 3/3: Executing NUCLEAR RESET in {pre_reset_delay}s..."
+                "Step 3/3: Executing NUCLEAR RESET in %ss...", pre_reset_delay
             )
             logger.warning("🚨 DEVICE WILL LOSE CONNECTION AND REBOOT! 🚨")
 
@@ -769,7 +1098,7 @@ class DeviceSession:
                 # Use send_interactive to handle the confirmation prompt
                 # This method is designed for commands that require interactive responses
                 try:
-                    logger.debug(f"Sending reset command: {reset_command}")
+                    logger.debug("Sending reset command: %s", reset_command)
 
                     # Create confirmation handler
                     if self._transport is None:
@@ -786,9 +1115,7 @@ class DeviceSession:
                         description="system reset",
                     )
 
-                    logger.info(
-                        f"Interactive command completed. Response: {response!r}"
-                    )
+                    logger.info("Interactive command completed. Response: %r", response)
 
                     logger.warning("🚨 NUCLEAR RESET EXECUTED! Device is rebooting...")
                     logger.warning("🔄 Device will apply new configuration on startup")
@@ -811,7 +1138,9 @@ class DeviceSession:
                             "eof",
                         ]
                     ):
-                        logger.info(f"Device disconnected during reset (expected): {e}")
+                        logger.info(
+                            "Device disconnected during reset (expected): %s", e
+                        )
                         logger.warning(
                             "🚨 NUCLEAR RESET EXECUTED! Device is rebooting..."
                         )
@@ -823,7 +1152,7 @@ class DeviceSession:
                         self._connected = False
                         return True
                     else:
-                        logger.error(f"Unexpected error during reset: {e}")
+                        logger.error("Unexpected error during reset: %s", e)
                         msg = f"Reset command failed: {e}"
                         raise DeviceConnectionError(msg) from e
 
@@ -833,7 +1162,7 @@ class DeviceSession:
                     phrase in str(e).lower()
                     for phrase in ["connection", "disconnect", "timeout", "closed"]
                 ):
-                    logger.info(f"Device disconnected during reset (expected): {e}")
+                    logger.info("Device disconnected during reset (expected): %s", e)
                     logger.warning(
                         "🚨 NUCLEAR RESET LIKELY EXECUTED! Device is rebooting..."
                     )
@@ -843,7 +1172,7 @@ class DeviceSession:
                     self._connected = False
                     return True
                 else:
-                    logger.error(f"Unexpected error during reset: {e}")
+                    logger.error("Unexpected error during reset: %s", e)
                     msg = f"Reset command failed: {e}"
                     raise DeviceConnectionError(msg) from e
 
@@ -854,7 +1183,7 @@ class DeviceSession:
                 raise DeviceExecutionError(msg)
 
         except Exception as e:
-            logger.error(f"Nuclear config deployment failed: {e}")
+            logger.error("Nuclear config deployment failed: %s", e)
             if isinstance(
                 e, DeviceConnectionError | DeviceExecutionError | FileNotFoundError
             ):
@@ -866,6 +1195,7 @@ class DeviceSession:
                     details={"error": str(e)},
                 ) from e
 
+    @_in_bastion_slot
     def upload_firmware_and_reboot(
         self,
         local_firmware_path: Path,
@@ -958,16 +1288,20 @@ class DeviceSession:
         remote_name = remote_filename or local_firmware_path.name
 
         logger.warning(
-            f"🚨 NUCLEAR FIRMWARE DEPLOYMENT INITIATED on {self.device_name}!"
+            "🚨 NUCLEAR FIRMWARE DEPLOYMENT INITIATED on %s!", self.device_name
+        )
+        logger.warning("   Firmware file: %s", local_firmware_path)
+        logger.warning("   Remote name: %s", remote_name)
+        logger.warning(
+            "   File size: %s bytes", format(local_firmware_path.stat().st_size, ",")
         )
-        logger.warning(f"   Firmware file: {local_firmware_path}")
-        logger.warning(f"   Remote name: {remote_name}")
-        logger.warning(f"   File size: {local_firmware_path.stat().st_size:,} bytes")
         logger.warning("   This will REBOOT the device to apply firmware!")
 
         try:
             # Step 1: Upload the firmware file
-            logger.info(f"Step 1/3: Uploading firmware file {local_firmware_path.name}")
+            logger.info(
+                "Step 1/3: Uploading firmware file %s", local_firmware_path.name
+            )
             upload_success = self.upload_file(
                 local_path=local_firmware_path,
                 remote_filename=remote_filename,
@@ -990,18 +1324,18 @@ class DeviceSession:
             try:
                 # Check if the firmware package is recognized
                 package_result = self.execute_command("/system/package/print")
-                logger.debug(f"Current packages: {package_result}")
+                logger.debug("Current packages: %s", package_result)
 
                 # The uploaded .npk will be automatically recognized on reboot
                 logger.info("OK Firmware upload completed, ready for reboot")
 
             except DeviceExecutionError as e:
-                logger.warning(f"Could not verify packages (non-critical): {e}")
+                logger.warning("Could not verify packages (non-critical): %s", e)
                 # Continue anyway - package verification is not critical
 
             # Step 3: Execute the reboot command with auto-confirmation
             logger.warning(
-                f"Step 3/3: Executing NUCLEAR REBOOT in {pre_reboot_delay}s..."
+                "Step 3/3: Executing NUCLEAR REBOOT in %ss...", pre_reboot_delay
             )
             logger.warning("🚨 DEVICE WILL LOSE CONNECTION AND REBOOT! 🚨")
             logger.warning("🔄 FIRMWARE WILL BE APPLIED DURING BOOT PROCESS! 🔄")
@@ -1035,7 +1369,7 @@ class DeviceSession:
                     )
 
                     logger.info(
-                        f"Interactive reboot command completed. Response: {response!r}"
+                        "Interactive reboot command completed. Response: %r", response
                     )
 
                     logger.warning("🚨 NUCLEAR REBOOT EXECUTED! Device is rebooting...")
@@ -1063,7 +1397,7 @@ class DeviceSession:
                         ]
                     ):
                         logger.info(
-                            f"Device disconnected during reboot (expected): {e}"
+                            "Device disconnected during reboot (expected): %s", e
                         )
                         logger.warning(
                             "🚨 NUCLEAR REBOOT EXECUTED! Device is rebooting..."
@@ -1079,7 +1413,7 @@ class DeviceSession:
                         self._connected = False
                         return True
                     else:
-                        logger.error(f"Unexpected error during reboot: {e}")
+                        logger.error("Unexpected error during reboot: %s", e)
                         msg = f"Reboot command failed: {e}"
                         raise DeviceConnectionError(msg) from e
 
@@ -1089,7 +1423,7 @@ class DeviceSession:
                     phrase in str(e).lower()
                     for phrase in ["connection", "disconnect", "timeout", "closed"]
                 ):
-                    logger.info(f"Device disconnected during reboot (expected): {e}")
+                    logger.info("Device disconnected during reboot (expected): %s", e)
                     logger.warning(
                         "🚨 NUCLEAR REBOOT LIKELY EXECUTED! Device is rebooting..."
                     )
@@ -1102,12 +1436,12 @@ class DeviceSession:
                     self._connected = False
                     return True
                 else:
-                    logger.error(f"Unexpected error during reboot: {e}")
+                    logger.error("Unexpected error during reboot: %s", e)
                     msg = f"Reboot command failed: {e}"
                     raise DeviceConnectionError(msg) from e
 
         except Exception as e:
-            logger.error(f"Nuclear firmware deployment failed: {e}")
+            logger.error("Nuclear firmware deployment failed: %s", e)
             if isinstance(
                 e,
                 DeviceConnectionError
@@ -1123,6 +1457,7 @@ class DeviceSession:
                     details={"error": str(e)},
                 ) from e
 
+    @_in_bastion_slot
     def downgrade_firmware_and_reboot(
         self,
         local_firmware_path: Path,
@@ -1178,15 +1513,21 @@ class DeviceSession:
 
         remote_name = remote_filename or local_firmware_path.name
 
-        logger.warning(f"DOWNGRADE FIRMWARE DOWNGRADE INITIATED on {self.device_name}!")
-        logger.warning(f"   Firmware file: {local_firmware_path}")
-        logger.warning(f"   Remote name: {remote_name}")
-        logger.warning(f"   File size: {local_firmware_path.stat().st_size:,} bytes")
+        logger.warning(
+            "DOWNGRADE FIRMWARE DOWNGRADE INITIATED on %s!", self.device_name
+        )
+        logger.warning("   Firmware file: %s", local_firmware_path)
+        logger.warning("   Remote name: %s", remote_name)
+        logger.warning(
+            "   File size: %s bytes", format(local_firmware_path.stat().st_size, ",")
+        )
         logger.warning("   This will REBOOT the device to apply downgrade!")
 
         try:
             # Step 1: Upload the firmware file
-            logger.info(f"Step 1/4: Uploading firmware file {local_firmware_path.name}")
+            logger.info(
+                "Step 1/4: Uploading firmware file %s", local_firmware_path.name
+            )
             upload_success = self.upload_file(
                 local_path=local_firmware_path,
                 remote_filename=remote_filename,
@@ -1205,9 +1546,9 @@ class DeviceSession:
             logger.info("Step 2/4: Verifying firmware packages (optional)")
             try:
                 package_result = self.execute_command("/system/package/print")
-                logger.debug(f"Current packages: {package_result}")
+                logger.debug("Current packages: %s", package_result)
             except DeviceExecutionError as e:
-                logger.warning(f"Could not verify packages (non-critical): {e}")
+                logger.warning("Could not verify packages (non-critical): %s", e)
 
             # Step 3: Schedule downgrade with interactive confirmation
             logger.info(
@@ -1235,7 +1576,8 @@ class DeviceSession:
                         description="package downgrade",
                     )
                     logger.info(
-                        f"Interactive downgrade command completed. Response: {response!r}"
+                        "Interactive downgrade command completed. Response: %r",
+                        response,
                     )
                     logger.warning("🔁 DOWNGRADE INITIATED! Device is rebooting...")
                     logger.warning(
@@ -1256,7 +1598,7 @@ class DeviceSession:
                         ]
                     ):
                         logger.info(
-                            f"Device disconnected during downgrade (expected): {e}"
+                            "Device disconnected during downgrade (expected): %s", e
                         )
                         logger.warning("🔁 DOWNGRADE INITIATED! Device is rebooting...")
                         logger.warning(
@@ -1265,7 +1607,7 @@ class DeviceSession:
                         self._connected = False
                         return True
                     else:
-                        logger.error(f"Unexpected error during downgrade: {e}")
+                        logger.error("Unexpected error during downgrade: %s", e)
                         msg = f"Downgrade command failed: {e}"
                         raise DeviceConnectionError(msg) from e
             except Exception as e:
@@ -1273,7 +1615,9 @@ class DeviceSession:
                     phrase in str(e).lower()
                     for phrase in ["connection", "disconnect", "timeout", "closed"]
                 ):
-                    logger.info(f"Device disconnected during downgrade (expected): {e}")
+                    logger.info(
+                        "Device disconnected during downgrade (expected): %s", e
+                    )
                     logger.warning(
                         "🔁 DOWNGRADE LIKELY EXECUTED! Device is rebooting..."
                     )
@@ -1283,11 +1627,11 @@ class DeviceSession:
                     self._connected = False
                     return True
                 else:
-                    logger.error(f"Failed to schedule downgrade: {e}")
+                    logger.error("Failed to schedule downgrade: %s", e)
                     raise
 
         except Exception as e:
-            logger.error(f"Firmware downgrade deployment failed: {e}")
+            logger.error("Firmware downgrade deployment failed: %s", e)
             if isinstance(
                 e,
                 DeviceConnectionError
@@ -1303,6 +1647,7 @@ class DeviceSession:
                     details={"error": str(e)},
                 ) from e
 
+    @_in_bastion_slot
     def routerboard_upgrade_and_reboot(
         self,
         pre_reboot_delay: float = 3.0,
@@ -1339,10 +1684,10 @@ class DeviceSession:
             if verify_before:
                 try:
                     info = self.execute_command("/system/routerboard/print")
-                    logger.debug(f"RouterBOARD status before upgrade: {info}")
+                    logger.debug("RouterBOARD status before upgrade: %s", info)
                 except DeviceExecutionError as e:
                     logger.warning(
-                        f"Could not fetch RouterBOARD status (non-critical): {e}"
+                        "Could not fetch RouterBOARD status (non-critical): %s", e
                     )
 
             logger.info("Issuing RouterBOARD upgrade command...")
@@ -1365,15 +1710,15 @@ class DeviceSession:
                     timeout_ops=confirmation_timeout,
                     description="RouterBOARD upgrade",
                 )
-                logger.debug(f"RouterBOARD upgrade response: {upgrade_resp}")
+                logger.debug("RouterBOARD upgrade response: %s", upgrade_resp)
                 logger.info("✅ RouterBOARD upgrade scheduled (requires reboot)")
             except Exception as e:
-                logger.error(f"RouterBOARD upgrade command failed: {e}")
+                logger.error("RouterBOARD upgrade command failed: %s", e)
                 error_msg = f"RouterBOARD upgrade failed: {e}"
                 raise DeviceExecutionError(error_msg) from e
 
             logger.warning(
-                f"Rebooting in {pre_reboot_delay}s to apply RouterBOARD upgrade..."
+                "Rebooting in %ss to apply RouterBOARD upgrade...", pre_reboot_delay
             )
             logger.warning("🚨 DEVICE WILL LOSE CONNECTION AND REBOOT! 🚨")
             time.sleep(pre_reboot_delay)
@@ -1399,7 +1744,7 @@ class DeviceSession:
                         description="RouterBOARD upgrade reboot",
                     )
                     logger.info(
-                        f"Interactive reboot command completed. Response: {response!r}"
+                        "Interactive reboot command completed. Response: %r", response
                     )
                     logger.warning("🔁 REBOOT EXECUTED! Device is rebooting...")
                     self._connected = False
@@ -1417,13 +1762,13 @@ class DeviceSession:
                         ]
                     ):
                         logger.info(
-                            f"Device disconnected during reboot (expected): {e}"
+                            "Device disconnected during reboot (expected): %s", e
                         )
                         logger.warning("🔁 REBOOT EXECUTED! Device is rebooting...")
                         self._connected = False
                         return True
                     else:
-                        logger.error(f"Unexpected error during reboot: {e}")
+                        logger.error("Unexpected error during reboot: %s", e)
                         msg = f"Reboot command failed: {e}"
                         raise DeviceConnectionError(msg) from e
             except Exception as e:
@@ -1431,17 +1776,17 @@ class DeviceSession:
                     phrase in str(e).lower()
                     for phrase in ["connection", "disconnect", "timeout", "closed"]
                 ):
-                    logger.info(f"Device disconnected during reboot (expected): {e}")
+                    logger.info("Device disconnected during reboot (expected): %s", e)
                     logger.warning("🔁 REBOOT LIKELY EXECUTED! Device is rebooting...")
                     self._connected = False
                     return True
                 else:
-                    logger.error(f"Unexpected error during reboot: {e}")
+                    logger.error("Unexpected error during reboot: %s", e)
                     msg = f"Reboot command failed: {e}"
                     raise DeviceConnectionError(msg) from e
 
         except Exception as e:
-            logger.error(f"RouterBOARD upgrade failed: {e}")
+            logger.error("RouterBOARD upgrade failed: %s", e)
             if isinstance(e, DeviceConnectionError | DeviceExecutionError):
                 raise
             else:
@@ -1451,6 +1796,7 @@ class DeviceSession:
                     details={"error": str(e)},
                 ) from e
 
+    @_in_bastion_slot
     def download_file(
         self,
         remote_filename: str,
@@ -1494,7 +1840,10 @@ class DeviceSession:
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(
-            f"Downloading file '{remote_filename}' from {self.device_name} to '{local_path}'"
+            "Downloading file '%s' from %s to '%s'",
+            remote_filename,
+            self.device_name,
+            local_path,
         )
 
         # Get connection parameters for SFTP
@@ -1505,14 +1854,24 @@ class DeviceSession:
 
         transport: paramiko.Transport | None = None
         sftp: paramiko.SFTPClient | None = None
+        shared = self._multiplexing_enabled()
+        session_transport = self._session_transport() if shared else None
 
         try:
             # Create transport and connect
-            transport = paramiko.Transport((host, port))
-            transport.connect(username=username, password=password)
+            with timed("transfer.connect", device=self.device_name):
+                if session_transport is not None:
+                    transport = session_transport
+                elif shared:
+                    transport = get_shared_transports().acquire(
+                        host, port, username, password, via=self._bastion
+                    )
+                else:
+                    transport = paramiko.Transport(self._transfer_socket(host, port))
+                    transport.connect(username=username, password=password)
 
-            # Create SFTP client
-            sftp = paramiko.SFTPClient.from_transport(transport)
+                # Create SFTP client
+                sftp = paramiko.SFTPClient.from_transport(transport)
             if sftp is None:
                 msg = "Failed to create SFTP client"
                 raise FileTransferError(msg)
@@ -1524,16 +1883,22 @@ class DeviceSession:
             try:
                 remote_stat = sftp.stat(remote_path)
                 remote_size = remote_stat.st_size
-                logger.debug(f"Remote file size: {remote_size} bytes")
+                logger.debug("Remote file size: %s bytes", remote_size)
             except FileNotFoundError:
-                logger.error(f"Remote file not found: {remote_path}")
+                logger.error("Remote file not found: %s", remote_path)
                 return False
 
             # Download the file
-            sftp.get(remote_path, str(local_path))
+            with timed(
+                "transfer.download",
+                device=self.device_name,
+                remote_path=remote_path,
+                bytes=remote_size,
+            ):
+                sftp.get(remote_path, str(local_path))
 
             logger.info(
-                f"File '{remote_filename}' downloaded successfully to '{local_path}'"
+                "File '%s' downloaded successfully to '%s'", remote_filename, local_path
             )
 
             # Verify download if requested
@@ -1543,7 +1908,9 @@ class DeviceSession:
                     logger.info("Download verified: file sizes match")
                 else:
                     logger.error(
-                        f"Download verification failed: size mismatch (remote: {remote_size}, local: {local_size})"
+                        "Download verification failed: size mismatch (remote: %s, local: %s)",
+                        remote_size,
+                        local_size,
                     )
                     return False
 
@@ -1554,17 +1921,19 @@ class DeviceSession:
                     self.execute_command(
                         f'/file/remove numbers=[find name="{remote_filename}"]'
                     )
-                    logger.info(f"Remote file '{remote_filename}' deleted")
+                    logger.info("Remote file '%s' deleted", remote_filename)
                 except Exception as e:
                     logger.warning(
-                        f"Failed to delete remote file '{remote_filename}': {e}"
+                        "Failed to delete remote file '%s': %s", remote_filename, e
                     )
 
             return True
 
         except paramiko.AuthenticationException as e:
             logger.error(
-                f"Authentication failed during file download from {self.device_name}: {e}"
+                "Authentication failed during file download from %s: %s",
+                self.device_name,
+                e,
             )
             msg = f"Authentication failed during file download from {self.device_name}"
             raise DeviceExecutionError(
@@ -1573,7 +1942,11 @@ class DeviceSession:
             ) from e
 
         except paramiko.SSHException as e:
-            logger.error(f"SSH error during file download from {self.device_name}: {e}")
+            if shared and session_transport is None:
+                get_shared_transports().discard(host, port, username, password)
+            logger.error(
+                "SSH error during file download from %s: %s", self.device_name, e
+            )
             msg = f"SSH error during file download from {self.device_name}"
             raise DeviceExecutionError(
                 msg,
@@ -1581,7 +1954,7 @@ class DeviceSession:
             ) from e
 
         except Exception as e:
-            logger.error(f"File download failed from {self.device_name}: {e}")
+            logger.error("File download failed from %s: %s", self.device_name, e)
             msg = f"File download failed from {self.device_name}"
             raise DeviceExecutionError(
                 msg,
@@ -1598,13 +1971,36 @@ class DeviceSession:
                 try:
                     sftp.close()
                 except Exception as e:
-                    logger.warning(f"Error closing SFTP connection: {e}")
+                    logger.warning("Error closing SFTP connection: %s", e)
 
-            if transport:
+            # Pooled transports stay open for the next transfer
+            if transport and not shared:
                 try:
                     transport.close()
                 except Exception as e:
-                    logger.warning(f"Error closing transport connection: {e}")
+                    logger.warning("Error closing transport connection: %s", e)
+
+    def _transfer_socket(
+        self, host: str, port: int
+    ) -> tuple[str, int] | paramiko.Channel:
+        """Address for a transfer connection, tunnelled through the bastion."""
+        if self._bastion is None:
+            return (host, port)
+        return get_shared_transports().tunnel(self._bastion, host, port)
+
+    def _session_transport(self) -> paramiko.Transport | None:
+        """The connected session's own paramiko transport, if it uses one."""
+        if not self._connected:
+            return None
+        driver = getattr(self._transport, "_raw_driver", None)
+        session = getattr(getattr(driver, "transport", None), "session", None)
+        if session is None or not isinstance(session, paramiko.Transport):
+            return None
+        return session if session.is_active() else None
+
+    def _multiplexing_enabled(self) -> bool:
+        """Whether transfers should reuse the device's pooled SSH transport."""
+        return getattr(self.config.general, "ssh_multiplexing", False) is True
 
     def __enter__(self) -> DeviceSession:
         """Sync context manager entry."""
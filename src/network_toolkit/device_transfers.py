@@ -9,10 +9,14 @@ logging context.
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
+import mmap
 import tempfile
+import threading
 import time
 from pathlib import Path
+from types import TracebackType
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,120 @@ def calculate_file_checksum(file_path: Path) -> str:
     return sha256_hash.hexdigest()
 
 
+class SharedUploadSource:
+    """Read-only, memory-mapped view of one local file shared by many uploads.
+
+    When the same image goes to many devices, every worker used to open and
+    read the file and hash it again. A shared source maps the file once,
+    hashes it once (lazily, on first request) and hands each worker its own
+    cursor over the same pages via :meth:`reader`. Mapping is deferred to
+    first use so creating a source for a run that never uploads is free.
+
+    Use as a context manager; close it only after all uploads finished.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file: io.BufferedReader | None = None
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self._checksum: str | None = None
+
+    def __enter__(self) -> SharedUploadSource:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _buffer(self) -> memoryview:
+        with self._lock:
+            if self._view is None:
+                fh = self.path.open("rb")
+                size = fh.seek(0, io.SEEK_END)
+                if size == 0:
+                    fh.close()
+                    self._view = memoryview(b"")
+                else:
+                    self._file = fh
+                    self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._view = memoryview(self._mmap)
+            return self._view
+
+    @property
+    def size(self) -> int:
+        """Size of the file in bytes."""
+        return len(self._buffer())
+
+    def checksum(self) -> str:
+        """SHA256 of the file, computed once for all uploads."""
+        view = self._buffer()
+        with self._lock:
+            if self._checksum is None:
+                self._checksum = hashlib.sha256(view).hexdigest()
+                logger.debug(f"Local file SHA256 ({self.path.name}): {self._checksum}")
+            return self._checksum
+
+    def reader(self) -> _SharedReader:
+        """Return an independent file-like reader over the shared buffer."""
+        return _SharedReader(self)
+
+    def close(self) -> None:
+        """Release the mapping and the underlying file."""
+        with self._lock:
+            if self._view is not None:
+                self._view.release()
+                self._view = None
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _SharedReader(io.RawIOBase):
+    """Per-upload cursor over a :class:`SharedUploadSource` buffer."""
+
+    def __init__(self, source: SharedUploadSource) -> None:
+        super().__init__()
+        self._source = source
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos}.get(whence)
+        if base is None:
+            base = self._source.size
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        view = self._source._buffer()
+        end = len(view) if size is None or size < 0 else self._pos + size
+        chunk = bytes(view[self._pos : end])
+        self._pos += len(chunk)
+        return chunk
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
 def verify_file_upload(
     *,
     session: object,
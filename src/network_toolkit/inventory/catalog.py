@@ -10,15 +10,18 @@ ambiguity and optionally select a preferred source.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from network_toolkit.exceptions import NetworkToolkitError
 
 if TYPE_CHECKING:
     from network_toolkit.config import DeviceConfig, DeviceGroup, NetworkConfig
 
+T = TypeVar("T")
+
 
 @dataclass(frozen=True, slots=True)
 class InventorySourceRef:
@@ -55,13 +58,30 @@ def set_inventory_catalog(config: NetworkConfig, catalog: InventoryCatalog) -> N
     config._inventory_catalog = catalog
 
 
+# Upper bound on memoized target expressions per catalog
+RESOLUTION_CACHE_SIZE = 256
+
+
 @dataclass
 class InventoryCatalog:
-    """Index devices and groups across multiple sources."""
+    """Index devices and groups across multiple sources.
+
+    ``version`` increases whenever a source is added. Derived indexes (the
+    per-source tag index and the target resolution cache) are keyed by it, so
+    they are rebuilt lazily after the catalog changes.
+    """
 
     devices_by_name: dict[str, list[DeviceEntry]] = field(default_factory=dict)
     groups_by_name: dict[str, list[GroupEntry]] = field(default_factory=dict)
     sources: dict[str, InventorySourceRef] = field(default_factory=dict)
+    version: int = 0
+    # name -> (version, index) for indexes derived from the entries above
+    _derived: dict[str, tuple[int, Any]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _resolution_cache: dict[tuple[int, Hashable], Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def add_source(
         self,
@@ -89,6 +109,9 @@ class InventoryCatalog:
             grp_entry = GroupEntry(name=name, group=grp, ref=ref)
             self.groups_by_name.setdefault(name, []).append(grp_entry)
 
+        self.version += 1
+        self._resolution_cache.clear()
+
     def list_device_entries(self) -> list[DeviceEntry]:
         out: list[DeviceEntry] = []
         for entries in self.devices_by_name.values():
@@ -101,6 +124,53 @@ class InventoryCatalog:
             out.extend(entries)
         return out
 
+    def devices_with_tags(self, source_id: str, tags: Iterable[str]) -> list[str]:
+        """Return names of devices in ``source_id`` carrying all ``tags``.
+
+        Names are returned in catalog order. Lookups go through a per-source
+        tag index, so the cost is bounded by the rarest tag's posting list
+        rather than by the size of the inventory.
+        """
+        wanted = list(dict.fromkeys(tags))
+        if not wanted:
+            return []
+        index = self._tags_for_source(source_id)
+        postings: list[dict[str, None]] = []
+        for tag in wanted:
+            names = index.get(tag)
+            if not names:
+                return []
+            postings.append(names)
+        postings.sort(key=len)
+        rarest, rest = postings[0], postings[1:]
+        return [name for name in rarest if all(name in p for p in rest)]
+
+    def cached_resolution(self, key: Hashable) -> Any | None:
+        """Return a memoized resolution for ``key`` at the current version."""
+        return self._resolution_cache.get((self.version, key))
+
+    def store_resolution(self, key: Hashable, value: Any) -> None:
+        """Memoize ``value`` for ``key`` at the current version."""
+        cache = self._resolution_cache
+        if len(cache) >= RESOLUTION_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del cache[next(iter(cache))]
+        cache[(self.version, key)] = value
+
+    def derived(self, name: str, build: Callable[[InventoryCatalog], T]) -> T:
+        """Return the index ``name``, building it once per catalog version."""
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == self.version:
+            return cast(T, cached[1])
+        index = build(self)
+        self._derived[name] = (self.version, index)
+        return index
+
+    def _tags_for_source(self, source_id: str) -> dict[str, dict[str, None]]:
+        # source_id -> tag -> device names, in catalog order (dict as ordered set)
+        index = self.derived("tags", _build_tag_index)
+        return index.get(source_id, {})
+
     def resolve_device(
         self, name: str, *, prefer: str | None = None, source_id: str | None = None
     ) -> DeviceEntry | None:
@@ -173,6 +243,18 @@ class InventoryCatalog:
         )
 
 
+def _build_tag_index(
+    catalog: InventoryCatalog,
+) -> dict[str, dict[str, dict[str, None]]]:
+    index: dict[str, dict[str, dict[str, None]]] = {}
+    for name, entries in catalog.devices_by_name.items():
+        for entry in entries:
+            by_tag = index.setdefault(entry.ref.source_id, {})
+            for tag in getattr(entry.device, "tags", None) or ():
+                by_tag.setdefault(tag, {})[name] = None
+    return index
+
+
 def _build_conflict_details(entries: list[Any]) -> dict[str, Any]:
     """Build details showing what differs between conflicting entries.
 
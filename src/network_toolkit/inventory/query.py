@@ -0,0 +1,383 @@
+# SPDX-FileCopyrightText: 2025-present Network Team <network@company.com>
+#
+# SPDX-License-Identifier: MIT
+"""Target query language evaluated as bitset operations over inventory indexes.
+
+Plain targets stay what they always were: comma-separated device and group
+names. An expression that uses an operator or a ``field:value`` term is a
+query instead::
+
+    site:zurich & tag:edge & !model:CCR1036
+    (core | edge) & source:config
+    name:/^fw-[0-9]+$/ | host:10.1.*
+
+Grammar (whitespace is insignificant)::
+
+    query := inter (("|" | ",") inter)*
+    inter := unary ("&" unary)*
+    unary := "!" unary | "(" query ")" | term
+    term  := NAME | FIELD ":" VALUE
+
+``NAME`` is a device or group name, resolved exactly like a plain target.
+``FIELD`` is one of :data:`QUERY_FIELDS` (``type`` is the device type,
+``site`` an alias for ``location``). ``VALUE`` matches exactly,
+as a shell-style glob when it contains ``*``, ``?`` or ``[``, or as an
+unanchored regular expression when written ``/.../``.
+
+Queries are parsed once (parsed trees are memoized) and evaluated against a
+:class:`TargetIndex` of posting lists built once per catalog version. Every
+term becomes an integer bitset over catalog entries, so ``&``, ``|`` and
+``!`` cost one big-integer operation regardless of inventory size. Matches
+are returned in inventory order.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from network_toolkit.exceptions import NetworkToolkitError
+
+if TYPE_CHECKING:
+    from network_toolkit.inventory.catalog import DeviceEntry, InventoryCatalog
+
+# Query field -> DeviceConfig attribute (None for catalog-level attributes)
+QUERY_FIELDS: dict[str, str | None] = {
+    "tag": "tags",
+    "type": "device_type",
+    "platform": "platform",
+    "model": "model",
+    "location": "location",
+    "host": "host",
+    "name": None,
+    "source": None,
+    "group": None,
+}
+FIELD_ALIASES = {"site": "location"}
+
+_FIELD_NAMES = [*QUERY_FIELDS, *FIELD_ALIASES]
+_OPERATOR_CHARS = frozenset("&|!()")
+_DELIMITERS = frozenset("&|(),")
+_GLOB_CHARS = frozenset("*?[")
+_FIELD_TERM = re.compile(rf"\s*({'|'.join(_FIELD_NAMES)}):")
+_REGEX_TERM = re.compile(rf"({'|'.join(_FIELD_NAMES)}):/")
+
+
+@dataclass(frozen=True, slots=True)
+class Term:
+    """A name (``field is None``) or ``field:value`` term."""
+
+    field: str | None
+    value: str
+    regex: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Not:
+    operand: QueryNode
+
+
+@dataclass(frozen=True, slots=True)
+class And:
+    operands: tuple[QueryNode, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Or:
+    operands: tuple[QueryNode, ...]
+
+
+QueryNode = Term | Not | And | Or
+
+
+def is_target_query(expr: str) -> bool:
+    """Return True if ``expr`` needs the query language (not a plain name list)."""
+    if any(ch in _OPERATOR_CHARS for ch in expr):
+        return True
+    return any(_FIELD_TERM.match(part) for part in expr.split(","))
+
+
+def _query_error(expr: str, position: int, message: str) -> NetworkToolkitError:
+    return NetworkToolkitError(
+        f"Invalid target query at position {position}: {message}",
+        details={"query": expr, "position": position},
+    )
+
+
+def _tokenize(expr: str) -> Iterator[tuple[int, str, Term | None]]:
+    """Yield ``(position, operator, term)``; operator is "" for terms."""
+    i, n = 0, len(expr)
+    while i < n:
+        ch = expr[i]
+        if ch.isspace():
+            i += 1
+            continue
+        if ch in _OPERATOR_CHARS or ch == ",":
+            yield i, ch, None
+            i += 1
+            continue
+
+        start = i
+        regex_term = _REGEX_TERM.match(expr, i)
+        if regex_term is not None:
+            # Regex literal: runs to the next unescaped slash and may contain
+            # operator characters.
+            prefix = regex_term.group(1)
+            j = regex_term.end()
+            chars: list[str] = []
+            while j < n and expr[j] != "/":
+                if expr[j] == "\\" and j + 1 < n and expr[j + 1] == "/":
+                    j += 1
+                chars.append(expr[j])
+                j += 1
+            if j >= n:
+                raise _query_error(expr, start, "unterminated regular expression")
+            i = j + 1
+            yield start, "", Term(_canonical(prefix), "".join(chars), regex=True)
+            continue
+
+        while i < n and not expr[i].isspace() and expr[i] not in _DELIMITERS:
+            i += 1
+        word = expr[start:i]
+        field_name, sep, value = word.partition(":")
+        if not sep:
+            yield start, "", Term(None, word)
+            continue
+        if field_name not in QUERY_FIELDS and field_name not in FIELD_ALIASES:
+            raise _query_error(
+                expr,
+                start,
+                f"unknown field '{field_name}' (expected one of "
+                f"{', '.join(_FIELD_NAMES)})",
+            )
+        if not value:
+            raise _query_error(expr, start, f"missing value for '{field_name}:'")
+        yield start, "", Term(_canonical(field_name), value)
+
+
+def _canonical(field_name: str) -> str:
+    return FIELD_ALIASES.get(field_name, field_name)
+
+
+class _Parser:
+    def __init__(self, expr: str) -> None:
+        self.expr = expr
+        self.tokens = list(_tokenize(expr))
+        self.pos = 0
+
+    def _peek(self) -> str | None:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][1]
+        return None
+
+    def _error(self, message: str) -> NetworkToolkitError:
+        position = (
+            self.tokens[self.pos][0] if self.pos < len(self.tokens) else len(self.expr)
+        )
+        return _query_error(self.expr, position, message)
+
+    def parse(self) -> QueryNode:
+        node = self._union()
+        if self.pos < len(self.tokens):
+            msg = f"unexpected '{self.tokens[self.pos][1]}'"
+            raise self._error(msg)
+        return node
+
+    def _union(self) -> QueryNode:
+        operands = [self._intersection()]
+        while self._peek() in ("|", ","):
+            self.pos += 1
+            operands.append(self._intersection())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _intersection(self) -> QueryNode:
+        operands = [self._unary()]
+        while self._peek() == "&":
+            self.pos += 1
+            operands.append(self._unary())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def _unary(self) -> QueryNode:
+        if self.pos >= len(self.tokens):
+            msg = "expression ends unexpectedly"
+            raise self._error(msg)
+        _, op, term = self.tokens[self.pos]
+        self.pos += 1
+        if op == "!":
+            return Not(self._unary())
+        if op == "(":
+            node = self._union()
+            if self._peek() != ")":
+                msg = "missing ')'"
+                raise self._error(msg)
+            self.pos += 1
+            return node
+        if term is None:
+            self.pos -= 1
+            msg = f"unexpected '{op}'"
+            raise self._error(msg)
+        return term
+
+
+@lru_cache(maxsize=256)
+def parse_target_query(expr: str) -> QueryNode:
+    """Parse a target query into an immutable tree.
+
+    Raises:
+        NetworkToolkitError: On syntax errors, unknown fields or invalid
+            regular expressions; ``details`` carries the query and position.
+    """
+    node = _Parser(expr).parse()
+    _validate(expr, node)
+    return node
+
+
+def _validate(expr: str, node: QueryNode) -> None:
+    if isinstance(node, Term):
+        if node.regex:
+            try:
+                re.compile(node.value)
+            except re.error as exc:
+                msg = f"invalid regular expression /{node.value}/: {exc}"
+                raise _query_error(expr, 0, msg) from None
+        return
+    if isinstance(node, Not):
+        _validate(expr, node.operand)
+        return
+    for operand in node.operands:
+        _validate(expr, operand)
+
+
+def match_keys(keys: Iterable[str], value: str, *, regex: bool = False) -> list[str]:
+    """Return the ``keys`` matched by a term value (exact, glob or regex)."""
+    if regex:
+        pattern = re.compile(value)
+        return [k for k in keys if pattern.search(k)]
+    if _GLOB_CHARS.intersection(value):
+        return [k for k in keys if fnmatch.fnmatchcase(k, value)]
+    return [value] if value in keys else []
+
+
+def _mask(positions: Iterable[int], size: int) -> int:
+    buf = bytearray((size + 7) // 8)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, "little")
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of set bits in ascending order."""
+    bits = bin(mask)[:1:-1]
+    pos = bits.find("1")
+    while pos != -1:
+        yield pos
+        pos = bits.find("1", pos + 1)
+
+
+@dataclass(slots=True)
+class TargetIndex:
+    """Posting lists over all device entries of a catalog.
+
+    Entry positions follow catalog order. Bitsets for a field value are
+    built on first use and memoized.
+    """
+
+    entries: list[DeviceEntry]
+    positions: dict[tuple[str, str], int]
+    postings: dict[str, dict[str, list[int]]]
+    _masks: dict[tuple[str, str], int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, catalog: InventoryCatalog) -> TargetIndex:
+        entries: list[DeviceEntry] = []
+        positions: dict[tuple[str, str], int] = {}
+        postings: dict[str, dict[str, list[int]]] = {
+            name: {} for name in QUERY_FIELDS if name != "group"
+        }
+        attrs = {name: attr for name, attr in QUERY_FIELDS.items() if attr is not None}
+        for name, dev_entries in catalog.devices_by_name.items():
+            for entry in dev_entries:
+                pos = len(entries)
+                entries.append(entry)
+                positions[(name, entry.ref.source_id)] = pos
+                postings["name"].setdefault(name, []).append(pos)
+                postings["source"].setdefault(entry.ref.source_id, []).append(pos)
+                for field_name, attr in attrs.items():
+                    value = getattr(entry.device, attr, None)
+                    if not value:
+                        continue
+                    values = value if isinstance(value, list) else [value]
+                    by_value = postings[field_name]
+                    for item in values:
+                        by_value.setdefault(str(item), []).append(pos)
+        return cls(entries=entries, positions=positions, postings=postings)
+
+    @property
+    def universe(self) -> int:
+        return (1 << len(self.entries)) - 1
+
+    def mask_of(self, positions: Iterable[int]) -> int:
+        return _mask(positions, len(self.entries))
+
+    def match(self, field_name: str, value: str, *, regex: bool = False) -> int:
+        """Bitset of entries whose ``field_name`` matches ``value``."""
+        key = (field_name, f"/{value}/" if regex else value)
+        cached = self._masks.get(key)
+        if cached is not None:
+            return cached
+
+        by_value = self.postings[field_name]
+        keys = match_keys(by_value.keys(), value, regex=regex)
+        mask = self.mask_of([pos for k in keys for pos in by_value[k]])
+        self._masks[key] = mask
+        return mask
+
+
+def evaluate_query(
+    node: QueryNode,
+    index: TargetIndex,
+    *,
+    resolve_term: Callable[[Term], int | None],
+    unknown: list[str],
+) -> int:
+    """Evaluate ``node`` to a bitset over ``index.entries``.
+
+    Bare names and ``group:`` terms depend on inventory semantics (source
+    preference, group membership) and go through ``resolve_term``; it
+    returns None for names that match nothing, which are appended to
+    ``unknown``. All other fields are answered from the index.
+    """
+    if isinstance(node, Term):
+        if node.field is not None and node.field != "group":
+            return index.match(node.field, node.value, regex=node.regex)
+        mask = resolve_term(node)
+        if mask is None:
+            unknown.append(node.value if node.field is None else f"group:{node.value}")
+            return 0
+        return mask
+
+    if isinstance(node, Not):
+        operand = evaluate_query(
+            node.operand, index, resolve_term=resolve_term, unknown=unknown
+        )
+        return index.universe & ~operand
+
+    # Evaluate every operand so unknown names are reported consistently
+    masks = [
+        evaluate_query(operand, index, resolve_term=resolve_term, unknown=unknown)
+        for operand in node.operands
+    ]
+    if isinstance(node, And):
+        result = index.universe
+        for mask in masks:
+            result &= mask
+        return result
+
+    result = 0
+    for mask in masks:
+        result |= mask
+    return result
@@ -15,6 +15,16 @@ from network_toolkit.inventory.catalog import (
     InventoryCatalog,
     get_inventory_catalog,
 )
+from network_toolkit.inventory.query import (
+    QueryNode,
+    TargetIndex,
+    Term,
+    evaluate_query,
+    is_target_query,
+    iter_bits,
+    match_keys,
+    parse_target_query,
+)
 from network_toolkit.runtime import get_runtime_settings
 
 if TYPE_CHECKING:
@@ -75,7 +85,11 @@ def select_named_target(
 def resolve_named_targets(
     config: NetworkConfig, target_expr: str, *, prefer: str | None = None
 ) -> TargetResolutionResult:
-    """Resolve a comma-separated target expression to concrete device names.
+    """Resolve a target expression to concrete device names.
+
+    ``target_expr`` is either a comma-separated list of device and group
+    names or a target query (see :mod:`network_toolkit.inventory.query`),
+    e.g. ``site:zurich & tag:edge & !model:CCR1036``.
 
     This resolver:
     - Detects ambiguity across inventory sources and raises an error unless a
@@ -90,6 +104,10 @@ def resolve_named_targets(
         config object with resolved entries populated.
     """
     prefer_token = _prefer_token(prefer)
+    query = target_expr.strip()
+    if is_target_query(query):
+        return _resolve_query(config, query, prefer_token)
+
     requested = [t.strip() for t in target_expr.split(",") if t.strip()]
     if not requested:
         return TargetResolutionResult(
@@ -100,33 +118,190 @@ def resolve_named_targets(
     if catalog is None:
         return _resolve_simple(config, requested)
 
-    resolved: list[str] = []
-    unknown: list[str] = []
+    # Memoized per catalog version; selections are replayed onto the config
+    # so callers see the same mutations as on a fresh resolution.
+    cache_key = (tuple(requested), prefer_token)
+    resolution: _CatalogResolution | None = catalog.cached_resolution(cache_key)
+    if resolution is None:
+        resolution = _resolve_in_catalog(config, catalog, requested, prefer_token)
+        catalog.store_resolution(cache_key, resolution)
+    return _apply_resolution(config, resolution)
+
+
+def _resolve_query(
+    config: NetworkConfig, query: str, prefer: str | None
+) -> TargetResolutionResult:
+    node = parse_target_query(query)
+    catalog = get_inventory_catalog(config)
+    if catalog is None:
+        return _resolve_query_simple(config, node)
+
+    cache_key = (query, prefer)
+    resolution: _CatalogResolution | None = catalog.cached_resolution(cache_key)
+    if resolution is None:
+        resolution = _resolve_query_in_catalog(config, catalog, node, prefer)
+        catalog.store_resolution(cache_key, resolution)
+    return _apply_resolution(config, resolution)
+
 
-    def _add_device(name: str) -> None:
-        if name not in resolved:
-            resolved.append(name)
+@dataclass(frozen=True, slots=True)
+class _CatalogResolution:
+    """Outcome of resolving one target expression against a catalog."""
+
+    devices: tuple[tuple[str, DeviceEntry], ...]
+    groups: tuple[tuple[str, GroupEntry], ...]
+    unknown: tuple[str, ...]
+
+
+def _apply_resolution(
+    config: NetworkConfig, resolution: _CatalogResolution
+) -> TargetResolutionResult:
+    for name, grp_entry in resolution.groups:
+        _apply_group_selection(config, name, grp_entry)
+    for name, dev_entry in resolution.devices:
+        _apply_device_selection(config, name, dev_entry)
+
+    return TargetResolutionResult(
+        resolved_devices=[name for name, _ in resolution.devices],
+        unknown_targets=list(resolution.unknown),
+        config=config,
+    )
+
+
+def _resolve_in_catalog(
+    config: NetworkConfig,
+    catalog: InventoryCatalog,
+    requested: list[str],
+    prefer: str | None,
+) -> _CatalogResolution:
+    # Dicts double as ordered sets: first occurrence fixes the position, the
+    # last selection for a name wins (as with repeated config assignment).
+    devices: dict[str, DeviceEntry] = {}
+    groups: dict[str, GroupEntry] = {}
+    unknown: list[str] = []
 
     for name in requested:
-        dev_entry = catalog.resolve_device(name, prefer=prefer_token)
+        dev_entry = catalog.resolve_device(name, prefer=prefer)
         if dev_entry is not None:
-            _apply_device_selection(config, name, dev_entry)
-            _add_device(name)
+            devices[name] = dev_entry
             continue
 
-        grp_entry = catalog.resolve_group(name, prefer=prefer_token)
+        grp_entry = catalog.resolve_group(name, prefer=prefer)
         if grp_entry is None:
             unknown.append(name)
             continue
 
-        _apply_group_selection(config, name, grp_entry)
+        groups[name] = grp_entry
+        for member_name, member_entry in _group_members_in_source(
+            config, grp_entry, catalog
+        ):
+            devices[member_name] = member_entry
+
+    return _CatalogResolution(
+        devices=tuple(devices.items()),
+        groups=tuple(groups.items()),
+        unknown=tuple(unknown),
+    )
+
+
+def _resolve_query_in_catalog(
+    config: NetworkConfig,
+    catalog: InventoryCatalog,
+    node: QueryNode,
+    prefer: str | None,
+) -> _CatalogResolution:
+    index = catalog.derived("query", TargetIndex.build)
+    groups: dict[str, GroupEntry] = {}
+
+    def _members(grp_entry: GroupEntry) -> int:
+        groups[grp_entry.name] = grp_entry
         members = _group_members_in_source(config, grp_entry, catalog)
-        for member_name, member_entry in members:
-            _apply_device_selection(config, member_name, member_entry)
-            _add_device(member_name)
+        return index.mask_of(
+            index.positions[(name, entry.ref.source_id)] for name, entry in members
+        )
+
+    def _resolve_term(term: Term) -> int | None:
+        if term.field is None:
+            dev_entry = catalog.resolve_device(term.value, prefer=prefer)
+            if dev_entry is not None:
+                return index.mask_of(
+                    [index.positions[(term.value, dev_entry.ref.source_id)]]
+                )
+            grp_entry = catalog.resolve_group(term.value, prefer=prefer)
+            return None if grp_entry is None else _members(grp_entry)
+
+        names = match_keys(catalog.groups_by_name, term.value, regex=term.regex)
+        if not names:
+            return None
+        mask = 0
+        for name in names:
+            grp_entry = catalog.resolve_group(name, prefer=prefer)
+            if grp_entry is not None:
+                mask |= _members(grp_entry)
+        return mask
 
+    unknown: list[str] = []
+    mask = evaluate_query(node, index, resolve_term=_resolve_term, unknown=unknown)
+
+    # Entries are indexed name by name, so same-name matches from several
+    # sources are adjacent; they are disambiguated like plain device names.
+    matched: dict[str, list[DeviceEntry]] = {}
+    for pos in iter_bits(mask):
+        entry = index.entries[pos]
+        matched.setdefault(entry.name, []).append(entry)
+    devices = {
+        name: entries[0]
+        if len(entries) == 1
+        else catalog._resolve_one(entries, name, prefer=prefer, source_id=None)
+        for name, entries in matched.items()
+    }
+
+    return _CatalogResolution(
+        devices=tuple(devices.items()),
+        groups=tuple(groups.items()),
+        unknown=tuple(unknown),
+    )
+
+
+def _resolve_query_simple(
+    config: NetworkConfig, node: QueryNode
+) -> TargetResolutionResult:
+    # Configs built without a catalog: index config.devices on the fly and
+    # expand groups with the legacy-aware simple resolver.
+    catalog = InventoryCatalog()
+    catalog.add_source(
+        source_id="config",
+        kind="config",
+        root=None,
+        inventory_file=None,
+        devices=config.devices or {},
+        groups={},
+    )
+    index = TargetIndex.build(catalog)
+    group_names = list(config.device_groups or {})
+
+    def _mask(names: list[str]) -> int | None:
+        result = _resolve_simple(config, names)
+        if result.unknown_targets and not result.resolved_devices:
+            return None
+        return index.mask_of(
+            index.positions[(name, "config")]
+            for name in result.resolved_devices
+            if (name, "config") in index.positions
+        )
+
+    def _resolve_term(term: Term) -> int | None:
+        if term.field is None:
+            return _mask([term.value])
+        names = match_keys(group_names, term.value, regex=term.regex)
+        return _mask(names) if names else None
+
+    unknown: list[str] = []
+    mask = evaluate_query(node, index, resolve_term=_resolve_term, unknown=unknown)
     return TargetResolutionResult(
-        resolved_devices=resolved, unknown_targets=unknown, config=config
+        resolved_devices=[index.entries[pos].name for pos in iter_bits(mask)],
+        unknown_targets=unknown,
+        config=config,
     )
 
 
@@ -147,16 +322,12 @@ def list_unique_group_names(config: NetworkConfig) -> list[str]:
 def _resolve_simple(
     config: NetworkConfig, requested: list[str]
 ) -> TargetResolutionResult:
-    devices: list[str] = []
+    devices: dict[str, None] = {}
     unknowns: list[str] = []
 
-    def _add_device(name: str) -> None:
-        if name not in devices:
-            devices.append(name)
-
     for name in requested:
         if config.devices and name in config.devices:
-            _add_device(name)
+            devices[name] = None
             continue
         if config.device_groups and name in config.device_groups:
             group = config.device_groups[name]
@@ -176,20 +347,19 @@ def _resolve_simple(
                     str(t) for t in (getattr(group, "match_tags", None) or [])
                 ]
 
-            for member in members:
-                _add_device(member)
+            devices.update(dict.fromkeys(members))
 
             if match_tags and config.devices:
                 tags = set(match_tags)
                 for dev_name, dev in config.devices.items():
-                    dev_tags = set(getattr(dev, "tags", None) or [])
+                    dev_tags = getattr(dev, "tags", None) or ()
                     if tags.issubset(dev_tags):
-                        _add_device(dev_name)
+                        devices[dev_name] = None
             continue
         unknowns.append(name)
 
     return TargetResolutionResult(
-        resolved_devices=devices, unknown_targets=unknowns, config=config
+        resolved_devices=list(devices), unknown_targets=unknowns, config=config
     )
 
 
@@ -212,20 +382,13 @@ def _group_members_in_source(
 ) -> list[tuple[str, DeviceEntry]]:
     source_id = group_entry.ref.source_id
     group: DeviceGroup = group_entry.group
-    members = list(group.members or [])
+    members = dict.fromkeys(group.members or [])
 
     # Tag-based membership is only supported for config source in v1.
     if source_id == "config" and group.match_tags:
-        tags = set(group.match_tags)
-        for dev_name, entries in catalog.devices_by_name.items():
-            for entry in entries:
-                if entry.ref.source_id != "config":
-                    continue
-                dev_tags = set(getattr(entry.device, "tags", None) or [])
-                if tags.issubset(dev_tags):
-                    if dev_name not in members:
-                        members.append(dev_name)
-                    break
+        members.update(
+            dict.fromkeys(catalog.devices_with_tags("config", group.match_tags))
+        )
 
     resolved: list[tuple[str, DeviceEntry]] = []
     for member in members:
@@ -1,24 +1,34 @@
 """SSH config inventory parser.
 
 Parse ~/.ssh/config to extract host definitions for inventory sync.
-Uses Paramiko for SSH config parsing with custom host enumeration.
+
+The config is compiled in one pass: ``Include`` directives are followed
+(relative paths resolve against the directory of the top-level file, which
+is ``~/.ssh`` for the default config, as OpenSSH does), ``Host`` stanzas that
+name hosts literally are indexed by host, and every wildcard stanza is
+evaluated once against the whole host list. Resolving N hosts therefore costs
+O(N) plus one pass per wildcard stanza instead of one full walk of the file
+per host. Options follow OpenSSH's first-value-wins rule.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import glob
+import logging
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from paramiko import SSHConfig
-
 from network_toolkit.exceptions import ConfigurationError
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+logger = logging.getLogger(__name__)
+
 # Pattern validation constants
 MAX_PATTERN_LENGTH = 200
 MAX_PATTERN_WILDCARDS = 20
@@ -26,6 +36,11 @@ MAX_PATTERN_WILDCARDS = 20
 # Valid hostname pattern (letters, numbers, dots, hyphens, underscores)
 VALID_HOSTNAME_PATTERN = re.compile(r"^[a-zA-Z0-9._-]+$")
 
+# Same nesting limit as OpenSSH's READCONF_MAX_DEPTH
+MAX_INCLUDE_DEPTH = 16
+
+_DIRECTIVE = re.compile(r"^\s*(\S+?)(?:\s*=\s*|\s+)(.*?)\s*$")
+
 
 @dataclass
 class SSHConfigOptions:
@@ -47,67 +62,221 @@ class SSHHost:
     port: int | None
 
 
-def enumerate_ssh_hosts(config_path: Path) -> list[str]:
-    """Extract concrete Host entries (no wildcards).
+@dataclass(slots=True)
+class _Stanza:
+    """One ``Host`` (or ``Match``) block and the options it sets."""
+
+    patterns: tuple[str, ...]
+    negated: tuple[str, ...] = ()
+    options: dict[str, str] = field(default_factory=dict)
+    literal: bool = False
+    _regex: re.Pattern[str] | None = None
+
+    @classmethod
+    def for_patterns(
+        cls, patterns: Iterable[str], negated: Iterable[str] = ()
+    ) -> _Stanza:
+        positive = tuple(patterns)
+        literal = not any(_is_wildcard(p) for p in positive)
+        regex = None
+        if not literal:
+            regex = re.compile("|".join(fnmatch.translate(p) for p in positive))
+        return cls(positive, tuple(negated), literal=literal, _regex=regex)
+
+    def matches(self, host: str) -> bool:
+        if self.literal:
+            if host not in self.patterns:
+                return False
+        elif self._regex is None or not self._regex.match(host):
+            return False
+        return not any(fnmatch.fnmatchcase(host, p) for p in self.negated)
+
+
+@dataclass(slots=True)
+class CompiledSSHConfig:
+    """An SSH config flattened across Includes into ordered stanzas."""
+
+    stanzas: list[_Stanza] = field(default_factory=list)
+    # Concrete host names in file order (first occurrence)
+    hosts: list[str] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+
+    def resolve(self, hosts: Iterable[str]) -> dict[str, dict[str, str]]:
+        """Return the effective options of each host in ``hosts``.
+
+        Each stanza is applied once: literal stanzas touch only the hosts
+        they name, wildcard stanzas are matched against every host.
+        """
+        resolved: dict[str, dict[str, str]] = {host: {} for host in hosts}
+        names = list(resolved)
+        for stanza in self.stanzas:
+            if not stanza.options:
+                continue
+            if stanza.literal:
+                targets: Iterable[str] = (
+                    h for h in stanza.patterns if h in resolved and stanza.matches(h)
+                )
+            else:
+                targets = (h for h in names if stanza.matches(h))
+            for host in targets:
+                options = resolved[host]
+                for key, value in stanza.options.items():
+                    options.setdefault(key, value)
+
+        for host, options in resolved.items():
+            if "hostname" in options:
+                options["hostname"] = _expand_hostname(options["hostname"], host)
+        return resolved
+
+    def lookup(self, host: str) -> dict[str, str]:
+        """Return the effective options of a single host."""
+        return self.resolve([host])[host]
+
+
+def _is_wildcard(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern
+
+
+def _expand_hostname(value: str, host: str) -> str:
+    if "%" not in value:
+        return value
+    return value.replace("%%", "\0").replace("%h", host).replace("\0", "%")
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _read_error(path: Path, exc: Exception) -> ConfigurationError:
+    if isinstance(exc, FileNotFoundError):
+        msg = f"SSH config file not found: {path}"
+        return ConfigurationError(msg, details={"path": str(path)})
+    if isinstance(exc, PermissionError):
+        msg = f"Permission denied reading SSH config: {path}"
+        return ConfigurationError(msg, details={"path": str(path)})
+    if isinstance(exc, UnicodeDecodeError):
+        msg = f"SSH config file contains invalid encoding: {path}"
+        return ConfigurationError(msg, details={"path": str(path), "error": str(exc)})
+    msg = f"Failed to read SSH config: {path}"
+    return ConfigurationError(msg, details={"path": str(path), "error": str(exc)})
+
+
+def _include_targets(value: str, base_dir: Path) -> list[Path]:
+    targets: list[Path] = []
+    for raw in value.split():
+        pattern = Path(_unquote(raw)).expanduser()
+        if not pattern.is_absolute():
+            pattern = base_dir / pattern
+        # Like OpenSSH: globs expand in sorted order, missing files are skipped
+        targets.extend(Path(p) for p in sorted(glob.glob(str(pattern))))
+    return targets
+
+
+def _directives(
+    path: Path, base_dir: Path, files: list[Path], depth: int = 0
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(keyword, value)`` pairs with Includes spliced in place."""
+    if depth > MAX_INCLUDE_DEPTH:
+        msg = f"SSH config Include nesting exceeds {MAX_INCLUDE_DEPTH} levels: {path}"
+        raise ConfigurationError(msg, details={"path": str(path)})
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise _read_error(path, e) from e
+    files.append(path)
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = _DIRECTIVE.match(stripped)
+        if match is None:
+            continue
+        keyword, value = match.group(1).lower(), match.group(2)
+        if keyword == "include":
+            for target in _include_targets(value, base_dir):
+                yield from _directives(target, base_dir, files, depth + 1)
+            continue
+        yield keyword, value
+
+
+def _match_stanza(value: str) -> _Stanza | None:
+    """Translate the host-based subset of ``Match`` into a stanza."""
+    criteria = value.split()
+    if [c.lower() for c in criteria] == ["all"]:
+        return _Stanza.for_patterns(["*"])
+    if len(criteria) == 2 and criteria[0].lower() in ("host", "originalhost"):
+        patterns = criteria[1].split(",")
+        return _Stanza.for_patterns(
+            [p for p in patterns if not p.startswith("!")],
+            [p[1:] for p in patterns if p.startswith("!")],
+        )
+    logger.debug("Ignoring unsupported SSH config 'Match %s'", value)
+    return None
 
-    Paramiko doesn't expose the host list directly, so we parse the file
-    to find Host directives and filter out wildcard patterns.
+
+def compile_ssh_config(config_path: Path) -> CompiledSSHConfig:
+    """Compile an SSH config file (and its Includes) in a single pass.
 
     Args:
         config_path: Path to SSH config file.
 
     Returns:
-        List of concrete host names (no wildcards).
+        The compiled config.
 
     Raises:
-        ConfigurationError: If the file cannot be read or contains unsupported
-            directives.
+        ConfigurationError: If a file cannot be read or Includes nest too deeply.
     """
-    hosts: list[str] = []
-    expanded_path = config_path.expanduser()
+    path = config_path.expanduser()
+    compiled = CompiledSSHConfig()
+    seen_hosts: set[str] = set()
+    # Options before the first Host/Match apply to every host
+    global_stanza = _Stanza.for_patterns(["*"])
+    compiled.stanzas.append(global_stanza)
+    current: _Stanza | None = global_stanza
+
+    for keyword, value in _directives(path, path.parent, compiled.files):
+        if keyword == "host":
+            patterns = [_unquote(p) for p in value.split()]
+            positive = [p for p in patterns if not p.startswith("!")]
+            current = _Stanza.for_patterns(
+                positive, [p[1:] for p in patterns if p.startswith("!")]
+            )
+            compiled.stanzas.append(current)
+            for pattern in positive:
+                if _is_wildcard(pattern) or pattern in seen_hosts:
+                    continue
+                seen_hosts.add(pattern)
+                # Validate hostname characters
+                if VALID_HOSTNAME_PATTERN.match(pattern):
+                    compiled.hosts.append(pattern)
+            continue
+        if keyword == "match":
+            current = _match_stanza(value)
+            if current is not None:
+                compiled.stanzas.append(current)
+            continue
+        if current is not None:
+            current.options.setdefault(keyword, _unquote(value))
+
+    return compiled
 
-    try:
-        with open(expanded_path, encoding="utf-8") as f:
-            for line in f:
-                # Detect Include directives (not currently supported)
-                if re.match(r"^\s*Include\s+", line, re.IGNORECASE):
-                    msg = (
-                        "SSH config files with 'Include' directives are not "
-                        "currently supported. Please flatten your SSH config or "
-                        "specify the included file directly."
-                    )
-                    raise ConfigurationError(
-                        msg,
-                        details={"path": str(config_path), "line": line.strip()},
-                    )
-
-                if match := re.match(r"^\s*Host\s+(.+)", line, re.IGNORECASE):
-                    for pattern in match.group(1).split():
-                        # Skip wildcard patterns
-                        if "*" not in pattern and "?" not in pattern:
-                            # Validate hostname characters
-                            if VALID_HOSTNAME_PATTERN.match(pattern):
-                                hosts.append(pattern)
-    except FileNotFoundError as e:
-        msg = f"SSH config file not found: {config_path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(config_path)},
-        ) from e
-    except PermissionError as e:
-        msg = f"Permission denied reading SSH config: {config_path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(config_path)},
-        ) from e
-    except UnicodeDecodeError as e:
-        msg = f"SSH config file contains invalid encoding: {config_path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(config_path), "error": str(e)},
-        ) from e
 
-    return hosts
+def enumerate_ssh_hosts(config_path: Path) -> list[str]:
+    """Extract concrete Host entries (no wildcards), following Includes.
+
+    Args:
+        config_path: Path to SSH config file.
+
+    Returns:
+        List of concrete host names (no wildcards), in file order.
+
+    Raises:
+        ConfigurationError: If a file cannot be read.
+    """
+    return compile_ssh_config(config_path).hosts
 
 
 def _validate_pattern(pattern: str) -> None:
@@ -188,40 +357,10 @@ def parse_ssh_config(options: SSHConfigOptions) -> dict[str, SSHHost]:
         for pattern in options.exclude_patterns:
             _validate_pattern(pattern)
 
-    config = SSHConfig()
-    path = options.path.expanduser()
-
-    try:
-        with open(path, encoding="utf-8") as f:
-            config.parse(f)
-    except FileNotFoundError as e:
-        msg = f"SSH config file not found: {path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(path)},
-        ) from e
-    except PermissionError as e:
-        msg = f"Permission denied reading SSH config: {path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(path)},
-        ) from e
-    except UnicodeDecodeError as e:
-        msg = f"SSH config file contains invalid encoding: {path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(path), "error": str(e)},
-        ) from e
-    except OSError as e:
-        msg = f"Failed to read SSH config: {path}"
-        raise ConfigurationError(
-            msg,
-            details={"path": str(path), "error": str(e)},
-        ) from e
-
-    hosts: dict[str, SSHHost] = {}
+    compiled = compile_ssh_config(options.path)
 
-    for host_name in enumerate_ssh_hosts(path):
+    selected: list[str] = []
+    for host_name in compiled.hosts:
         # Apply include patterns
         if options.include_patterns:
             if not any(fnmatch.fnmatch(host_name, p) for p in options.include_patterns):
@@ -232,9 +371,10 @@ def parse_ssh_config(options: SSHConfigOptions) -> dict[str, SSHHost]:
             if any(fnmatch.fnmatch(host_name, p) for p in options.exclude_patterns):
                 continue
 
-        # Lookup resolved values from Paramiko
-        host_config = config.lookup(host_name)
+        selected.append(host_name)
 
+    hosts: dict[str, SSHHost] = {}
+    for host_name, host_config in compiled.resolve(selected).items():
         hosts[host_name] = SSHHost(
             name=host_name,
             hostname=host_config.get("hostname", host_name),
@@ -0,0 +1,309 @@
+"""Run-level metrics aggregated from per-device timing spans.
+
+The execution layer feeds every device's outcome and timing spans
+(:mod:`network_toolkit.timing`) into a :class:`RunMetrics` instance. From
+those it derives throughput (devices per minute), connect and command latency
+percentiles, bytes transferred, connection retries and failures grouped by
+error class.
+
+The CLI prints the aggregate through :meth:`OutputManager.print_summary` and
+can write it in the Prometheus text exposition format with
+:func:`write_prometheus_textfile`. Point that file into node_exporter's
+textfile-collector directory (``--collector.textfile.directory``) to scrape
+nightly jobs without running a network service inside networka. The file is
+replaced atomically so the collector never reads a partial write.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from network_toolkit.timing import TimingSpan
+
+METRICS_FILE_ENV = "NW_METRICS_FILE"
+METRIC_PREFIX = "networka_run"
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Catch-all class for failures that did not surface as a failed span
+UNCLASSIFIED_ERROR = "Unclassified"
+
+_TRANSFER_SPANS = frozenset({"transfer.upload", "transfer.download"})
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySummary:
+    """Percentiles over a set of latency observations, in seconds."""
+
+    count: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> LatencySummary:
+        ordered = sorted(values)
+        if not ordered:
+            return cls(count=0, total=0.0, p50=0.0, p95=0.0, p99=0.0, max=0.0)
+        return cls(
+            count=len(ordered),
+            total=sum(ordered),
+            p50=percentile(ordered, 0.5),
+            p95=percentile(ordered, 0.95),
+            p99=percentile(ordered, 0.99),
+            max=ordered[-1],
+        )
+
+    def quantiles(self) -> dict[float, float]:
+        """Return the percentiles keyed by quantile (0.5, 0.95, 0.99)."""
+        return dict(zip(QUANTILES, (self.p50, self.p95, self.p99), strict=True))
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def classify_failure(timings: Iterable[TimingSpan]) -> str:
+    """Return the exception class name of the first failed span."""
+    for span in timings:
+        if span.error:
+            return span.error.split(":", 1)[0]
+    return UNCLASSIFIED_ERROR
+
+
+class RunMetrics:
+    """Thread-safe aggregator for one run (``nw run``, ``nw backup``, ...)."""
+
+    def __init__(self, operation: str, target: str) -> None:
+        self.operation = operation
+        self.target = target
+        self.duration = 0.0
+        self.completed_at: float | None = None
+        self._lock = threading.Lock()
+        self._devices = 0
+        self._failed = 0
+        self._connect: list[float] = []
+        self._command: list[float] = []
+        self._bytes_transferred = 0
+        self._bytes_received = 0
+        self._retries = 0
+        self._failures: dict[str, int] = {}
+
+    def observe_device(
+        self, timings: Iterable[TimingSpan], *, error: str | None = None
+    ) -> None:
+        """Add one device's outcome and timing spans."""
+        spans = list(timings)
+        with self._lock:
+            self._devices += 1
+            for span in spans:
+                if span.name == "connect":
+                    self._connect.append(span.duration)
+                    self._retries += max(0, int(span.attributes.get("attempts", 1)) - 1)
+                elif span.name == "command":
+                    self._command.append(span.duration)
+                    self._bytes_received += int(
+                        span.attributes.get("bytes_received", 0)
+                    )
+                elif span.name in _TRANSFER_SPANS and span.error is None:
+                    self._bytes_transferred += int(span.attributes.get("bytes", 0))
+            if error is not None:
+                self._failed += 1
+                error_class = classify_failure(spans)
+                self._failures[error_class] = self._failures.get(error_class, 0) + 1
+
+    def observe_unresolved(self, count: int) -> None:
+        """Count targets that never reached a device (unknown names)."""
+        if count <= 0:
+            return
+        with self._lock:
+            self._devices += count
+            self._failed += count
+            self._failures["UnknownTarget"] = (
+                self._failures.get("UnknownTarget", 0) + count
+            )
+
+    def finish(self, duration: float) -> None:
+        """Record the run's wall-clock duration."""
+        self.duration = duration
+        self.completed_at = time.time()
+
+    @property
+    def devices(self) -> int:
+        return self._devices
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    @property
+    def succeeded(self) -> int:
+        return self._devices - self._failed
+
+    @property
+    def devices_per_minute(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+        return self._devices * 60.0 / self.duration
+
+    @property
+    def connect_latency(self) -> LatencySummary:
+        with self._lock:
+            return LatencySummary.from_values(self._connect)
+
+    @property
+    def command_latency(self) -> LatencySummary:
+        with self._lock:
+            return LatencySummary.from_values(self._command)
+
+    @property
+    def bytes_transferred(self) -> int:
+        return self._bytes_transferred
+
+    @property
+    def bytes_received(self) -> int:
+        return self._bytes_received
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def failures_by_class(self) -> dict[str, int]:
+        with self._lock:
+            return dict(sorted(self._failures.items()))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot."""
+        return {
+            "operation": self.operation,
+            "target": self.target,
+            "duration": round(self.duration, 6),
+            "devices": self.devices,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "devices_per_minute": round(self.devices_per_minute, 3),
+            "connect_latency": _latency_dict(self.connect_latency),
+            "command_latency": _latency_dict(self.command_latency),
+            "bytes_transferred": self.bytes_transferred,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "failures_by_class": self.failures_by_class,
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        labels = {"operation": self.operation, "target": self.target}
+        lines: list[str] = []
+
+        def _metric(name: str, help_text: str, value: float) -> None:
+            full = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} gauge")
+            lines.append(f"{full}{_labels(labels)} {_number(value)}")
+
+        _metric(
+            "last_completion_timestamp_seconds",
+            "Unix time the run finished.",
+            self.completed_at or time.time(),
+        )
+        _metric("duration_seconds", "Wall-clock duration of the run.", self.duration)
+        _metric("devices", "Devices targeted by the run.", self.devices)
+        _metric("devices_succeeded", "Devices that completed.", self.succeeded)
+        _metric("devices_failed", "Devices that failed.", self.failed)
+        _metric("devices_per_minute", "Device throughput.", self.devices_per_minute)
+        _metric(
+            "transfer_bytes",
+            "Bytes moved by file uploads and downloads.",
+            self.bytes_transferred,
+        )
+        _metric(
+            "command_output_bytes",
+            "Bytes of command output received.",
+            self.bytes_received,
+        )
+        _metric(
+            "connect_retries", "Connection attempts beyond the first.", self.retries
+        )
+
+        for name, help_text, summary in (
+            ("connect_seconds", "Connection setup latency.", self.connect_latency),
+            ("command_seconds", "Per-command latency.", self.command_latency),
+        ):
+            full = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} summary")
+            for q, value in summary.quantiles().items():
+                quantile_labels = {**labels, "quantile": str(q)}
+                lines.append(f"{full}{_labels(quantile_labels)} {_number(value)}")
+            lines.append(f"{full}_sum{_labels(labels)} {_number(summary.total)}")
+            lines.append(f"{full}_count{_labels(labels)} {summary.count}")
+
+        full = f"{METRIC_PREFIX}_failures"
+        lines.append(f"# HELP {full} Failed devices by error class.")
+        lines.append(f"# TYPE {full} gauge")
+        for error_class, count in self.failures_by_class.items():
+            failure_labels = {**labels, "error_class": error_class}
+            lines.append(f"{full}{_labels(failure_labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(metrics: RunMetrics, path: str | Path) -> Path:
+    """Atomically write ``metrics`` to ``path`` for the textfile collector.
+
+    node_exporter only reads files ending in ``.prom``; the content is written
+    to a temporary file in the same directory and renamed into place.
+    """
+    target = Path(path).expanduser()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(metrics.to_prometheus())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _latency_dict(summary: LatencySummary) -> dict[str, Any]:
+    return {
+        "count": summary.count,
+        "p50": round(summary.p50, 6),
+        "p95": round(summary.p95, 6),
+        "p99": round(summary.p99, 6),
+        "max": round(summary.max, 6),
+    }
+
+
+def _labels(labels: dict[str, str]) -> str:
+    rendered = ",".join(
+        f'{key}="{_escape_label(value)}"' for key, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(float(value), 6))
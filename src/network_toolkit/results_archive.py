@@ -0,0 +1,302 @@
+"""Single-file, append-only result archives for large runs.
+
+Instead of one directory per device and one file per command, every record of
+a run is appended to a single file next to the other sessions in
+``results_dir``. Two formats are supported and selected via
+``general.results_format``:
+
+- ``jsonl``: ``<session>.jsonl.gz``. Each record is written as its own gzip
+  member (the file is still a valid gzip stream for ``zcat``), and a sidecar
+  ``<session>.jsonl.gz.idx`` holds one JSON line per record with its device,
+  command and byte offset so single records can be read without decompressing
+  the whole archive.
+- ``sqlite``: ``<session>.sqlite`` with a ``records`` table indexed by device
+  and command.
+
+Both writers open their file lazily on the first record and are safe to call
+from multiple threads.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from network_toolkit.exceptions import NetworkToolkitError
+
+ARCHIVE_SUFFIXES: dict[str, str] = {
+    "jsonl": ".jsonl.gz",
+    "sqlite": ".sqlite",
+}
+INDEX_SUFFIX = ".idx"
+
+
+@dataclass(slots=True)
+class ArchiveEntry:
+    """Index entry describing one record in an archive."""
+
+    seq: int
+    device: str
+    command: str
+    kind: str
+    timestamp: str
+    offset: int | None = None
+    length: int | None = None
+
+
+def _record_command(record: dict[str, Any]) -> str:
+    return str(
+        record.get("command")
+        or record.get("command_or_sequence")
+        or record.get("sequence_name")
+        or ""
+    )
+
+
+def record_kind(record: dict[str, Any]) -> str:
+    """Classify a results record by the fields it carries."""
+    if "group_name" in record:
+        return "group_error" if record.get("status") == "failed" else "group_summary"
+    if "sequence_name" in record:
+        return "sequence_command" if "command" in record else "sequence_summary"
+    return "command"
+
+
+class ResultArchiveWriter(Protocol):
+    """Append-only sink for result records."""
+
+    path: Path
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one record."""
+        ...
+
+    def close(self) -> None:
+        """Flush and close the archive."""
+        ...
+
+
+class JsonlArchiveWriter:
+    """Gzip-member-per-record JSON lines archive with a byte-offset index."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.index_path = path.with_name(path.name + INDEX_SUFFIX)
+        self._lock = threading.Lock()
+        self._data: Any = None
+        self._index: Any = None
+        self._seq = 0
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Compress and append one record, then index it."""
+        payload = gzip.compress(
+            (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        )
+        with self._lock:
+            if self._data is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._data = self.path.open("ab")
+                self._index = self.index_path.open("a", encoding="utf-8")
+            offset = self._data.tell()
+            self._data.write(payload)
+            self._seq += 1
+            entry = {
+                "seq": self._seq,
+                "device": str(record.get("device_name", "")),
+                "command": _record_command(record),
+                "kind": record_kind(record),
+                "timestamp": str(record.get("timestamp", "")),
+                "offset": offset,
+                "length": len(payload),
+            }
+            self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Close the data and index files."""
+        with self._lock:
+            for fh in (self._data, self._index):
+                if fh is not None:
+                    fh.close()
+            self._data = self._index = None
+
+
+class SqliteArchiveWriter:
+    """SQLite archive with one row per record."""
+
+    _SCHEMA = (
+        (
+            "CREATE TABLE IF NOT EXISTS records ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " device TEXT NOT NULL, command TEXT NOT NULL, kind TEXT NOT NULL,"
+            " timestamp TEXT NOT NULL, data TEXT NOT NULL)"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS idx_records_device_command"
+            " ON records (device, command)"
+        ),
+    )
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Insert one record."""
+        row = (
+            str(record.get("device_name", "")),
+            _record_command(record),
+            record_kind(record),
+            str(record.get("timestamp", "")),
+            json.dumps(record, ensure_ascii=False),
+        )
+        with self._lock:
+            if self._conn is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                for stmt in self._SCHEMA:
+                    self._conn.execute(stmt)
+            self._conn.execute(
+                "INSERT INTO records (device, command, kind, timestamp, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_archive_writer(
+    results_dir: Path, session_name: str, results_format: str
+) -> ResultArchiveWriter:
+    """Create the archive writer for a session in ``results_dir``."""
+    path = results_dir / f"{session_name}{ARCHIVE_SUFFIXES[results_format]}"
+    if results_format == "sqlite":
+        return SqliteArchiveWriter(path)
+    return JsonlArchiveWriter(path)
+
+
+# --- Reading ----------------------------------------------------------------
+
+
+def _is_sqlite(path: Path) -> bool:
+    return path.name.endswith(ARCHIVE_SUFFIXES["sqlite"])
+
+
+def _matches(entry: ArchiveEntry, device: str | None, command: str | None) -> bool:
+    return (device is None or entry.device == device) and (
+        command is None or entry.command == command
+    )
+
+
+def _connect_readonly(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def list_archive(
+    path: Path, *, device: str | None = None, command: str | None = None
+) -> list[ArchiveEntry]:
+    """Return index entries of an archive, optionally filtered."""
+    if not path.exists():
+        msg = f"Results archive not found: {path}"
+        raise NetworkToolkitError(msg)
+
+    if _is_sqlite(path):
+        query = "SELECT seq, device, command, kind, timestamp FROM records"
+        clauses: list[str] = []
+        params: list[str] = []
+        if device is not None:
+            clauses.append("device = ?")
+            params.append(device)
+        if command is not None:
+            clauses.append("command = ?")
+            params.append(command)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        conn = _connect_readonly(path)
+        try:
+            rows = conn.execute(query + " ORDER BY seq", params).fetchall()
+        finally:
+            conn.close()
+        return [ArchiveEntry(*row) for row in rows]
+
+    index_path = path.with_name(path.name + INDEX_SUFFIX)
+    if index_path.exists():
+        entries = []
+        with index_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    entry = ArchiveEntry(**json.loads(line))
+                    if _matches(entry, device, command):
+                        entries.append(entry)
+        return entries
+
+    # No index (e.g. copied without sidecar): scan the archive once
+    entries = []
+    for seq, record in enumerate(_scan_jsonl(path), 1):
+        entry = ArchiveEntry(
+            seq=seq,
+            device=str(record.get("device_name", "")),
+            command=_record_command(record),
+            kind=record_kind(record),
+            timestamp=str(record.get("timestamp", "")),
+        )
+        if _matches(entry, device, command):
+            entries.append(entry)
+    return entries
+
+
+def _scan_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_archive(
+    path: Path, *, device: str | None = None, command: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield full records matching the filters without extracting the archive.
+
+    JSONL archives seek straight to the indexed gzip members; SQLite archives
+    use the device/command index.
+    """
+    entries = list_archive(path, device=device, command=command)
+    if _is_sqlite(path):
+        conn = _connect_readonly(path)
+        try:
+            for entry in entries:
+                row = conn.execute(
+                    "SELECT data FROM records WHERE seq = ?", (entry.seq,)
+                ).fetchone()
+                if row:
+                    yield json.loads(row[0])
+        finally:
+            conn.close()
+        return
+
+    if entries and all(e.offset is not None for e in entries):
+        with path.open("rb") as fh:
+            for entry in entries:
+                fh.seek(entry.offset or 0)
+                member = fh.read(entry.length or 0)
+                yield json.loads(gzip.decompress(member))
+        return
+
+    wanted = {e.seq for e in entries}
+    for seq, record in enumerate(_scan_jsonl(path), 1):
+        if seq in wanted:
+            yield record
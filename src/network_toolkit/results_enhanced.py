@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+import atexit
+import codecs
 import datetime as dt
+import io
 import json
 import logging
+import os
+import queue
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 
 import yaml
 
+from network_toolkit.common.compression import (
+    compressed_path,
+    compression_suffix,
+    open_binary,
+    open_text,
+)
 from network_toolkit.common.filename_utils import normalize_filename
+from network_toolkit.results_archive import (
+    ARCHIVE_SUFFIXES,
+    ResultArchiveWriter,
+    create_archive_writer,
+)
+from network_toolkit.timing import timed
 
 if TYPE_CHECKING:
     from network_toolkit.config import NetworkConfig
@@ -20,6 +41,256 @@ logger = logging.getLogger(__name__)
 
 # Constants
 MAX_FILENAME_LEN = 100
+DEFAULT_WRITER_QUEUE_SIZE = 1024
+DEFAULT_WRITER_BATCH_SIZE = 64
+
+
+@dataclass(slots=True)
+class _WriteJob:
+    filepath: Path
+    data: dict[str, Any]
+    is_single_command: bool
+
+
+class ResultWriter:
+    """Dedicated writer thread that takes result file I/O off device workers.
+
+    ``write`` is called as ``write(filepath, data, is_single_command=...)``.
+
+    Jobs go through a bounded queue: ``submit`` returns immediately while there
+    is room and blocks (backpressure) only when ``max_pending`` writes are
+    outstanding. The writer drains the queue in batches, creates each missing
+    directory once per batch and then writes the files. Pending writes are
+    flushed on ``close()`` and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        write: Callable[..., None],
+        *,
+        max_pending: int = DEFAULT_WRITER_QUEUE_SIZE,
+        batch_size: int = DEFAULT_WRITER_BATCH_SIZE,
+        create_dirs: bool = True,
+    ) -> None:
+        self._write = write
+        self._create_dirs = create_dirs
+        self._batch_size = max(1, batch_size)
+        self._queue: queue.Queue[_WriteJob | None] = queue.Queue(
+            maxsize=max(1, max_pending)
+        )
+        self._created_dirs: set[Path] = set()
+        self._closed = False
+        # Orders submissions against close() so none lands after the sentinel
+        self._lock = threading.Lock()
+        # Written by the writer thread; complete once close() has returned
+        self.failed_paths: list[Path] = []
+        self._thread = threading.Thread(
+            target=self._run, name="nw-results-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(
+        self, filepath: Path, data: dict[str, Any], *, is_single_command: bool
+    ) -> None:
+        """Queue a result file write."""
+        job = _WriteJob(filepath, data, is_single_command)
+        with self._lock:
+            if not self._closed:
+                self._queue.put(job)
+                return
+        # Late submissions after close are written inline rather than lost
+        self._write_batch([job])
+
+    def flush(self) -> None:
+        """Block until every queued write has been performed."""
+        if not self._closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        stopping = False
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < self._batch_size or stopping:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = stopping or None in batch
+            self._write_batch([job for job in batch if job is not None])
+            for _ in batch:
+                self._queue.task_done()
+            if stopping and self._queue.empty():
+                return
+
+    def _write_batch(self, jobs: list[_WriteJob]) -> None:
+        new_dirs = (
+            {job.filepath.parent for job in jobs} - self._created_dirs
+            if self._create_dirs
+            else set()
+        )
+        for directory in new_dirs:
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(directory)
+            except OSError as e:  # pragma: no cover - filesystem error
+                logger.error("Failed to create results directory %s: %s", directory, e)
+        for job in jobs:
+            try:
+                self._write(
+                    job.filepath, job.data, is_single_command=job.is_single_command
+                )
+                logger.debug("Stored result file: %s", job.filepath)
+            except Exception as e:  # pragma: no cover - filesystem error
+                self.failed_paths.append(job.filepath)
+                logger.error("Failed to store result to %s: %s", job.filepath, e)
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedOutput:
+    """Command output captured to a file instead of held in memory.
+
+    The output is the ``size`` bytes of ``path`` starting at ``offset``
+    (text result files begin with a header). Spooled captures, made when
+    results are not stored, are temporary files; :meth:`discard` them once
+    consumed.
+    """
+
+    path: Path
+    size: int
+    offset: int = 0
+    spooled: bool = False
+
+    def iter_text(self, block_size: int = 1 << 16) -> Iterator[str]:
+        """Yield the output in decoded blocks without loading it whole."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        remaining = self.size
+        with open_binary(self.path) as f:
+            f.seek(self.offset)
+            while remaining > 0:
+                block = f.read(min(block_size, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield decoder.decode(block, final=remaining <= 0)
+
+    def read_text(self) -> str:
+        """Return the whole output as a string."""
+        return "".join(self.iter_text())
+
+    def discard(self) -> None:
+        """Delete a spooled capture; stored results are left alone."""
+        if self.spooled:
+            self.path.unlink(missing_ok=True)
+
+
+class CommandResultStream:
+    """One command result being written while the command runs.
+
+    Created by :meth:`ResultsManager.open_command_stream`. Chunks go to an
+    open file as they arrive and are flushed immediately, so the output is
+    never held in memory and the file can be followed during the run. That
+    file is either the text result itself or, for captured output, a raw
+    ``.out`` file the result record refers to. Without a file, chunks are
+    collected and stored as a whole on :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        manager: ResultsManager,
+        filepath: Path,
+        data: dict[str, Any],
+        *,
+        file: IO[str] | None = None,
+        offset: int = 0,
+        output_path: Path | None = None,
+        spooled: bool = False,
+        flush: bool = True,
+    ) -> None:
+        self._manager = manager
+        self._filepath = filepath
+        self._data = data
+        self._file = file
+        # Set when the file holds only the output, not the result record
+        self._output_path = output_path
+        self._spooled = spooled
+        # Compressed writers would give up compression on every flush
+        self._flush = flush
+        self._offset = offset
+        self._size = 0
+        self._chunks: list[str] = []
+        self._last = ""
+        self.bytes_written = 0
+        self.captured: CapturedOutput | None = None
+
+    def write(self, chunk: str) -> None:
+        """Add an output chunk to the result."""
+        if not chunk:
+            return
+        self.bytes_written += len(chunk)
+        self._last = chunk
+        if self._file is None:
+            self._chunks.append(chunk)
+            return
+        self._file.write(chunk)
+        self._size += len(chunk.encode("utf-8"))
+        if self._flush:
+            self._file.flush()
+
+    def close(self, error: str | None = None) -> Path | None:
+        """Finish the result; ``error`` marks output cut short by a failure.
+
+        Returns where the result was stored, if it was. For output written to
+        a file, :attr:`captured` then refers to it.
+        """
+        metadata = dict(self._data.get("metadata") or {})
+        if error:
+            metadata.update(incomplete=True, error=error)
+
+        if self._file is None:
+            return self._manager.store_command_result(
+                self._data["device_name"],
+                self._data["command"],
+                "".join(self._chunks),
+                metadata,
+            )
+
+        size = self._size
+        if self._output_path is not None:
+            self._file.close()
+            self.captured = CapturedOutput(
+                self._output_path, size, spooled=self._spooled
+            )
+            if self._spooled:
+                return None
+            return self._manager._store_captured_result(
+                self._filepath,
+                self._data,
+                self.captured,
+                metadata,
+            )
+
+        with self._file:
+            if not self.bytes_written:
+                self._file.write("(no output)")
+            if not self._last.endswith("\n"):
+                self._file.write("\n")
+            if error:
+                self._file.write(f"\n# Output incomplete: {error}\n")
+        self.captured = CapturedOutput(self._filepath, size, self._offset)
+        logger.debug("Stored streamed command result: %s", self._filepath)
+        return self._filepath
 
 
 class ResultsManager:
@@ -31,6 +302,12 @@ class ResultsManager:
     - Individual files per device and command
     - Proper file naming with underscores
     - Support for multiple output formats
+    - Optional background writer (``async_writes``) so device workers never
+      wait on result storage; call ``close()`` when the run is finished
+    - Single-file archive formats (``jsonl``, ``sqlite``) that append every
+      record of the run to one file instead of one file per command
+    - Streamed command results (``open_command_stream``) written while the
+      command is still running
     """
 
     def __init__(
@@ -40,6 +317,7 @@ class ResultsManager:
         store_results: bool | None = None,
         results_dir: str | Path | None = None,
         command_context: str | None = None,
+        async_writes: bool = False,
     ) -> None:
         """Initialize results manager."""
         self.config = config
@@ -50,18 +328,93 @@ class ResultsManager:
             Path(results_dir) if results_dir else Path(config.general.results_dir)
         )
         self.results_format = config.general.results_format
+        # Archive formats are single files with their own storage layout
+        self.results_compression = (
+            "none"
+            if self.results_format in ARCHIVE_SUFFIXES
+            else config.general.results_compression
+        )
+        self._file_suffix = f".{self.results_format}" + compression_suffix(
+            self.results_compression
+        )
         self.include_timestamp = config.general.results_include_timestamp
         self.include_command = config.general.results_include_command
         self.command_context = command_context  # Store the nw command used
         # Cached session directory for this run
         self.session_dir: Path | None = None
+        # Single-file archive for this run (archive formats only)
+        self._archive: ResultArchiveWriter | None = None
 
         # Create results directory if it doesn't exist and initialize session folder
         if self.store_results:
             self.results_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Results will be stored in: {self.results_dir}")
-            # Create a single session directory at the start of the run
-            self.session_dir = self._create_session_directory()
+            if self.results_format in ARCHIVE_SUFFIXES:
+                self._archive = create_archive_writer(
+                    self.results_dir, self._session_name(), self.results_format
+                )
+            else:
+                # Create a single session directory at the start of the run
+                self.session_dir = self._create_session_directory()
+
+        self._writer: ResultWriter | None = None
+        if self.store_results and async_writes:
+            self._writer = ResultWriter(
+                self._write_result_file, create_dirs=self._archive is None
+            )
+
+    @property
+    def archive_path(self) -> Path | None:
+        """Path of the single-file archive when an archive format is used."""
+        return self._archive.path if self._archive is not None else None
+
+    @property
+    def results_location(self) -> Path | None:
+        """Where this run's results live: session directory or archive file."""
+        return self.archive_path or self.session_dir
+
+    def __enter__(self) -> ResultsManager:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Wait until all queued result writes are on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    @property
+    def failed_writes(self) -> list[Path]:
+        """Files whose queued write failed; complete once :meth:`close` returned.
+
+        Paths handed out for these files by the ``store_*`` methods point to
+        files that were never written.
+        """
+        return list(self._writer.failed_paths) if self._writer is not None else []
+
+    def close(self) -> None:
+        """Flush queued writes, stop the background writer and close archives."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._archive is not None:
+            self._archive.close()
+
+    def _device_dir(self, session_dir: Path, device_name: str) -> Path:
+        device_dir = session_dir / self._sanitize_filename(device_name)
+        if self._writer is None and self._archive is None:
+            device_dir.mkdir(parents=True, exist_ok=True)
+        return device_dir
+
+    def _session_root(self) -> Path:
+        if self._archive is not None:
+            # Archive formats never create per-session directories; file paths
+            # are only used as record identifiers in that mode
+            return self.results_dir
+        return self.session_dir or self._create_session_directory()
+
+    def _stored_location(self, filepath: Path) -> Path:
+        return self._archive.path if self._archive is not None else filepath
 
     def _sanitize_filename(self, text: str) -> str:
         """Sanitize text for use in filenames.
@@ -70,8 +423,8 @@ class ResultsManager:
         """
         return normalize_filename(text, max_length=MAX_FILENAME_LEN)
 
-    def _create_session_directory(self) -> Path:
-        """Create a directory for this execution session."""
+    def _session_name(self) -> str:
+        """Build the session name from the start timestamp and command context."""
         timestamp = datetime.now(tz=dt.UTC).strftime("%Y%m%d_%H%M%S")
 
         # Create session folder name with command context
@@ -81,8 +434,11 @@ class ResultsManager:
             sanitized_cmd = self._sanitize_filename(self.command_context)
             session_name_parts.append(sanitized_cmd)
 
-        session_dir_name = "_".join(session_name_parts)
-        session_dir = self.results_dir / session_dir_name
+        return "_".join(session_name_parts)
+
+    def _create_session_directory(self) -> Path:
+        """Create a directory for this execution session."""
+        session_dir = self.results_dir / self._session_name()
         session_dir.mkdir(parents=True, exist_ok=True)
 
         return session_dir
@@ -98,13 +454,152 @@ class ResultsManager:
         if not self.store_results:
             return None
 
-        session_dir = self.session_dir or self._create_session_directory()
-        device_dir = session_dir / self._sanitize_filename(device_name)
-        device_dir.mkdir(parents=True, exist_ok=True)
+        with timed(
+            "results.store",
+            device=device_name,
+            kind="command",
+            queued=self._writer is not None,
+        ):
+            filepath, result_data = self._command_record(
+                device_name, command, output, metadata
+            )
+
+            if self._writer is not None:
+                self._writer.submit(filepath, result_data, is_single_command=True)
+                return self._stored_location(filepath)
+
+            try:
+                self._write_result_file(filepath, result_data, is_single_command=True)
+                logger.debug(f"Stored command result: {filepath}")
+                return self._stored_location(filepath)
+            except Exception as e:  # pragma: no cover - filesystem error
+                logger.error(f"Failed to store command result to {filepath}: {e}")
+                return None
+
+    def open_command_stream(
+        self,
+        device_name: str,
+        command: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        capture: bool = False,
+    ) -> CommandResultStream | None:
+        """Start a command result whose output is written as it arrives.
+
+        Text results go straight to their file chunk by chunk. The structured
+        formats hold one complete document per result, so there the output
+        is stored when the stream is closed.
+
+        With ``capture``, the output always goes to a file and never into
+        memory: text results as above, structured formats into a raw ``.out``
+        file next to the record (which refers to it as ``output_file``), and
+        into a temporary spool file when results are not stored. Without
+        ``capture``, returns None when results are not stored.
+        """
+        if not self.store_results:
+            if not capture:
+                return None
+            fd, spool = tempfile.mkstemp(
+                prefix=f"nw-{self._sanitize_filename(device_name)}-", suffix=".out"
+            )
+            return CommandResultStream(
+                self,
+                Path(spool),
+                {},
+                file=os.fdopen(fd, "w", encoding="utf-8"),
+                output_path=Path(spool),
+                spooled=True,
+            )
+
+        filepath, result_data = self._command_record(device_name, command, "", metadata)
+        if self._archive is not None or self.results_format in ("json", "yaml"):
+            if not capture:
+                return CommandResultStream(self, filepath, result_data)
+            output_path = self._output_file_path(filepath)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            return CommandResultStream(
+                self,
+                filepath,
+                result_data,
+                file=open_text(output_path, "w", self.results_compression),
+                output_path=output_path,
+                flush=self.results_compression == "none",
+            )
 
-        cmd_filename = f"cmd_{self._sanitize_filename(command)}.{self.results_format}"
-        filepath = device_dir / cmd_filename
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        header = io.StringIO()
+        self._write_text_preamble(header, result_data)
+        self._write_text_command_header(header, result_data)
+        f = open_text(filepath, "w", self.results_compression)
+        f.write(header.getvalue())
+        f.flush()
+        return CommandResultStream(
+            self,
+            filepath,
+            result_data,
+            file=f,
+            offset=len(header.getvalue().encode("utf-8")),
+            flush=self.results_compression == "none",
+        )
+
+    def _store_captured_result(
+        self,
+        filepath: Path,
+        data: dict[str, Any],
+        captured: CapturedOutput,
+        metadata: dict[str, Any] | None = None,
+    ) -> Path | None:
+        """Store a command record whose output lives in a captured file.
 
+        ``output_file`` is relative to the directory of the file holding the
+        record (the result file, or the archive).
+        """
+        record_dir = (
+            self._archive.path.parent if self._archive is not None else filepath.parent
+        )
+        record = {key: value for key, value in data.items() if key != "output"} | {
+            "output_file": captured.path.relative_to(record_dir).as_posix(),
+            "output_bytes": captured.size,
+            "metadata": metadata if metadata is not None else data["metadata"],
+        }
+        with timed(
+            "results.store",
+            device=data["device_name"],
+            kind="captured",
+            queued=self._writer is not None,
+        ):
+            if self._writer is not None:
+                self._writer.submit(filepath, record, is_single_command=True)
+                return self._stored_location(filepath)
+            try:
+                self._write_result_file(filepath, record, is_single_command=True)
+                return self._stored_location(filepath)
+            except Exception as e:  # pragma: no cover - filesystem error
+                logger.error("Failed to store command result to %s: %s", filepath, e)
+                return None
+
+    def _output_file_path(self, filepath: Path) -> Path:
+        """Where captured output of the result at ``filepath`` goes."""
+        if self._archive is None:
+            plain = filepath.name.removesuffix(self._file_suffix)
+            return compressed_path(
+                filepath.with_name(f"{plain}.out"), self.results_compression
+            )
+        # Archives are single files; their captured outputs sit beside them
+        archive = self._archive.path
+        relative = filepath.relative_to(self.results_dir)
+        return archive.parent / f"{archive.name}.outputs" / relative.with_suffix(".out")
+
+    def _command_record(
+        self,
+        device_name: str,
+        command: str,
+        output: str,
+        metadata: dict[str, Any] | None,
+    ) -> tuple[Path, dict[str, Any]]:
+        session_dir = self._session_root()
+        device_dir = self._device_dir(session_dir, device_name)
+        cmd_filename = f"cmd_{self._sanitize_filename(command)}{self._file_suffix}"
         result_data: dict[str, Any] = {
             "timestamp": datetime.now(tz=dt.UTC).isoformat(),
             "device_name": device_name,
@@ -113,14 +608,7 @@ class ResultsManager:
             "nw_command": self.command_context,
             "metadata": metadata or {},
         }
-
-        try:
-            self._write_result_file(filepath, result_data, is_single_command=True)
-            logger.debug(f"Stored command result: {filepath}")
-            return filepath
-        except Exception as e:  # pragma: no cover - filesystem error
-            logger.error(f"Failed to store command result to {filepath}: {e}")
-            return None
+        return device_dir / cmd_filename, result_data
 
     def store_sequence_results(
         self,
@@ -133,63 +621,85 @@ class ResultsManager:
         if not self.store_results:
             return []
 
-        session_dir = self.session_dir or self._create_session_directory()
-        device_dir = session_dir / self._sanitize_filename(device_name)
-        device_dir.mkdir(parents=True, exist_ok=True)
+        with timed(
+            "results.store",
+            device=device_name,
+            kind="sequence",
+            queued=self._writer is not None,
+        ):
+            session_dir = self._session_root()
+            device_dir = self._device_dir(session_dir, device_name)
+
+            stored_files: list[Path] = []
+            for i, (command, output) in enumerate(results.items(), 1):
+                cmd_filename = (
+                    f"{i:02d}_{self._sanitize_filename(command)}{self._file_suffix}"
+                )
+                filepath = device_dir / cmd_filename
 
-        stored_files: list[Path] = []
-        for i, (command, output) in enumerate(results.items(), 1):
-            cmd_filename = (
-                f"{i:02d}_{self._sanitize_filename(command)}.{self.results_format}"
-            )
-            filepath = device_dir / cmd_filename
+                result_data: dict[str, Any] = {
+                    "timestamp": datetime.now(tz=dt.UTC).isoformat(),
+                    "device_name": device_name,
+                    "sequence_name": sequence_name,
+                    "command_number": i,
+                    "total_commands": len(results),
+                    "command": command,
+                    "output": output,
+                    "nw_command": self.command_context,
+                    "metadata": metadata or {},
+                }
+
+                if self._writer is not None:
+                    self._writer.submit(filepath, result_data, is_single_command=True)
+                    stored_files.append(self._stored_location(filepath))
+                    continue
 
-            result_data: dict[str, Any] = {
+                try:
+                    self._write_result_file(
+                        filepath, result_data, is_single_command=True
+                    )
+                    stored_files.append(self._stored_location(filepath))
+                    logger.debug(f"Stored command result: {filepath}")
+                except Exception as e:  # pragma: no cover - filesystem error
+                    logger.error(f"Failed to store command result to {filepath}: {e}")
+
+            summary_filename = (
+                f"00_sequence_summary_{self._sanitize_filename(sequence_name)}"
+                f"{self._file_suffix}"
+            )
+            summary_filepath = device_dir / summary_filename
+            summary_data: dict[str, Any] = {
                 "timestamp": datetime.now(tz=dt.UTC).isoformat(),
                 "device_name": device_name,
                 "sequence_name": sequence_name,
-                "command_number": i,
-                "total_commands": len(results),
-                "command": command,
-                "output": output,
+                "commands_executed": len(results),
                 "nw_command": self.command_context,
+                "results_summary": {
+                    cmd: f"Command {i + 1}: {cmd}"
+                    for i, cmd in enumerate(results.keys())
+                },
                 "metadata": metadata or {},
             }
 
+            if self._writer is not None:
+                self._writer.submit(
+                    summary_filepath, summary_data, is_single_command=False
+                )
+                stored_files.append(self._stored_location(summary_filepath))
+                return stored_files
+
             try:
-                self._write_result_file(filepath, result_data, is_single_command=True)
-                stored_files.append(filepath)
-                logger.debug(f"Stored command result: {filepath}")
+                self._write_result_file(
+                    summary_filepath, summary_data, is_single_command=False
+                )
+                stored_files.append(self._stored_location(summary_filepath))
+                logger.debug(f"Stored sequence summary: {summary_filepath}")
             except Exception as e:  # pragma: no cover - filesystem error
-                logger.error(f"Failed to store command result to {filepath}: {e}")
-
-        summary_filename = (
-            f"00_sequence_summary_{self._sanitize_filename(sequence_name)}."
-            f"{self.results_format}"
-        )
-        summary_filepath = device_dir / summary_filename
-        summary_data: dict[str, Any] = {
-            "timestamp": datetime.now(tz=dt.UTC).isoformat(),
-            "device_name": device_name,
-            "sequence_name": sequence_name,
-            "commands_executed": len(results),
-            "nw_command": self.command_context,
-            "results_summary": {
-                cmd: f"Command {i + 1}: {cmd}" for i, cmd in enumerate(results.keys())
-            },
-            "metadata": metadata or {},
-        }
-
-        try:
-            self._write_result_file(
-                summary_filepath, summary_data, is_single_command=False
-            )
-            stored_files.append(summary_filepath)
-            logger.debug(f"Stored sequence summary: {summary_filepath}")
-        except Exception as e:  # pragma: no cover - filesystem error
-            logger.error(f"Failed to store sequence summary to {summary_filepath}: {e}")
+                logger.error(
+                    f"Failed to store sequence summary to {summary_filepath}: {e}"
+                )
 
-        return stored_files
+            return stored_files
 
     def store_group_results(
         self,
@@ -203,17 +713,16 @@ class ResultsManager:
         if not self.store_results:
             return []
 
-        session_dir = self.session_dir or self._create_session_directory()
+        session_dir = self._session_root()
         stored_files: list[Path] = []
 
         for device_name, device_results, error in group_results:
-            device_dir = session_dir / self._sanitize_filename(device_name)
-            device_dir.mkdir(parents=True, exist_ok=True)
+            device_dir = self._device_dir(session_dir, device_name)
 
             if error:
                 error_filename = (
-                    f"ERROR_{self._sanitize_filename(command_or_sequence)}."
-                    f"{self.results_format}"
+                    f"ERROR_{self._sanitize_filename(command_or_sequence)}"
+                    f"{self._file_suffix}"
                 )
                 error_filepath = device_dir / error_filename
 
@@ -228,14 +737,24 @@ class ResultsManager:
                     "nw_command": self.command_context,
                 }
 
+                if self._writer is not None:
+                    self._writer.submit(
+                        error_filepath, error_data, is_single_command=True
+                    )
+                    stored_files.append(self._stored_location(error_filepath))
+                    continue
+
                 try:
                     self._write_result_file(
                         error_filepath, error_data, is_single_command=True
                     )
-                    stored_files.append(error_filepath)
+                    stored_files.append(self._stored_location(error_filepath))
                 except Exception as e:  # pragma: no cover - filesystem error
                     logger.error(f"Failed to store error file to {error_filepath}: {e}")
 
+            elif device_results is None:
+                # Output was streamed to its result file while running
+                continue
             elif is_sequence and isinstance(device_results, dict):
                 files = self.store_sequence_results(
                     device_name,
@@ -252,7 +771,7 @@ class ResultsManager:
 
         group_summary_filename = (
             f"GROUP_SUMMARY_{self._sanitize_filename(group_name)}_"
-            f"{self._sanitize_filename(command_or_sequence)}.{self.results_format}"
+            f"{self._sanitize_filename(command_or_sequence)}{self._file_suffix}"
         )
         group_summary_filepath = session_dir / group_summary_filename
 
@@ -272,11 +791,18 @@ class ResultsManager:
             "failed_device_list": failed_devices,
         }
 
+        if self._writer is not None:
+            self._writer.submit(
+                group_summary_filepath, group_summary_data, is_single_command=False
+            )
+            stored_files.append(self._stored_location(group_summary_filepath))
+            return stored_files
+
         try:
             self._write_result_file(
                 group_summary_filepath, group_summary_data, is_single_command=False
             )
-            stored_files.append(group_summary_filepath)
+            stored_files.append(self._stored_location(group_summary_filepath))
             logger.debug(f"Stored group summary: {group_summary_filepath}")
         except Exception as e:  # pragma: no cover - filesystem error
             logger.error(
@@ -289,35 +815,23 @@ class ResultsManager:
         self, filepath: Path, data: dict[str, Any], *, is_single_command: bool
     ) -> None:
         """Write result data to file in the configured format."""
-        if self.results_format == "json":
-            with filepath.open("w", encoding="utf-8") as f:
+        if self._archive is not None:
+            self._archive.append(data)
+
+        elif self.results_format == "json":
+            with open_text(filepath, "w", self.results_compression) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
         elif self.results_format == "yaml":
-            with filepath.open("w", encoding="utf-8") as f:
+            with open_text(filepath, "w", self.results_compression) as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
 
         else:  # txt format (default)
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write("# Network Toolkit Results\n")
-                f.write(f"# Generated: {data['timestamp']}\n")
-                if data.get("device_name"):
-                    f.write(f"# Device: {data['device_name']}\n")
-                if data.get("nw_command"):
-                    f.write(f"# NW Command: {data['nw_command']}\n")
-                f.write("\n")
+            with open_text(filepath, "w", self.results_compression) as f:
+                self._write_text_preamble(f, data)
 
                 if is_single_command:
-                    if "sequence_name" in data:
-                        f.write(f"Sequence: {data['sequence_name']}\n")
-                        f.write(
-                            "Command "
-                            f"{data['command_number']}/{data['total_commands']}: "
-                            f"{data['command']}\n"
-                        )
-                    else:
-                        f.write(f"Command: {data['command']}\n")
-                    f.write("=" * 80 + "\n\n")
+                    self._write_text_command_header(f, data)
 
                     if data.get("output"):
                         f.write(data["output"])
@@ -356,3 +870,26 @@ class ResultsManager:
                         for _, desc in data["results_summary"].items():
                             f.write(f"  - {desc}\n")
                         f.write("\n")
+
+    @staticmethod
+    def _write_text_preamble(f: IO[str], data: dict[str, Any]) -> None:
+        f.write("# Network Toolkit Results\n")
+        f.write(f"# Generated: {data['timestamp']}\n")
+        if data.get("device_name"):
+            f.write(f"# Device: {data['device_name']}\n")
+        if data.get("nw_command"):
+            f.write(f"# NW Command: {data['nw_command']}\n")
+        f.write("\n")
+
+    @staticmethod
+    def _write_text_command_header(f: IO[str], data: dict[str, Any]) -> None:
+        if "sequence_name" in data:
+            f.write(f"Sequence: {data['sequence_name']}\n")
+            f.write(
+                "Command "
+                f"{data['command_number']}/{data['total_commands']}: "
+                f"{data['command']}\n"
+            )
+        else:
+            f.write(f"Command: {data['command']}\n")
+        f.write("=" * 80 + "\n\n")
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -37,6 +39,10 @@ class SessionPool:
     - Thread-safe access via internal locking
     - Automatic stale session detection and removal
     - Dict-like interface for backward compatibility
+    - Optional bounds for long-lived pools: ``max_sessions`` evicts the least
+      recently used idle sessions and ``idle_timeout`` disconnects sessions
+      that have not been used for that many seconds. Sessions taken with
+      :meth:`checkout` are never evicted until :meth:`checkin`.
 
     Usage:
         pool = SessionPool()
@@ -47,16 +53,121 @@ class SessionPool:
 
         # Stale session handling
         pool.remove("router1")  # Remove stale session before retry
+
+        # Bounded, idle-expiring pool (e.g. for an interactive app)
+        pool = SessionPool(max_sessions=32, idle_timeout=300)
+        session = pool.checkout("router1")
+        ...
+        pool.checkin("router1")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_sessions: int | None = None,
+        idle_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._sessions: dict[str, DeviceSession] = {}
         self._lock = threading.Lock()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._last_used: dict[str, float] = {}
+        self._checked_out: dict[str, int] = {}
+
+    def _is_expired(self, device_name: str, now: float) -> bool:
+        if self.idle_timeout is None or self._checked_out.get(device_name):
+            return False
+        last = self._last_used.get(device_name, now)
+        return now - last > self.idle_timeout
+
+    def _pop(self, device_name: str) -> DeviceSession | None:
+        self._last_used.pop(device_name, None)
+        return self._sessions.pop(device_name, None)
+
+    @staticmethod
+    def _disconnect(sessions: dict[str, DeviceSession], reason: str) -> None:
+        # Called without holding the lock; disconnects can block on the network
+        for device_name, session in sessions.items():
+            logger.debug("Closing pooled session for %s (%s)", device_name, reason)
+            try:
+                session.disconnect()
+            except Exception as e:
+                logger.warning(
+                    "Failed to disconnect session for %s: %s", device_name, e
+                )
 
     def get(self, device_name: str) -> DeviceSession | None:
-        """Get a session from the pool, or None if not present."""
+        """Get a session from the pool, or None if not present or idle-expired."""
+        expired: dict[str, DeviceSession] = {}
+        with self._lock:
+            now = self._clock()
+            session = self._sessions.get(device_name)
+            if session is not None and self._is_expired(device_name, now):
+                self._pop(device_name)
+                expired[device_name] = session
+                session = None
+            elif session is not None:
+                self._last_used[device_name] = now
+        self._disconnect(expired, "idle timeout")
+        return session
+
+    def checkout(self, device_name: str) -> DeviceSession | None:
+        """Like :meth:`get`, but pin the session until :meth:`checkin`.
+
+        Pinned sessions are skipped by LRU eviction and idle expiry. The pin is
+        taken even when no session is pooled yet, so a session stored for this
+        device while checked out is pinned as well.
+        """
+        session = self.get(device_name)
+        with self._lock:
+            self._checked_out[device_name] = self._checked_out.get(device_name, 0) + 1
+        return session
+
+    def checkin(self, device_name: str) -> None:
+        """Release a pin taken with :meth:`checkout` and mark the session used."""
+        evicted: dict[str, DeviceSession] = {}
+        with self._lock:
+            count = self._checked_out.get(device_name, 0) - 1
+            if count > 0:
+                self._checked_out[device_name] = count
+            else:
+                self._checked_out.pop(device_name, None)
+            if device_name in self._sessions:
+                self._last_used[device_name] = self._clock()
+            evicted = self._evict_over_limit()
+        self._disconnect(evicted, "pool full")
+
+    def _evict_over_limit(self) -> dict[str, DeviceSession]:
+        """Pop least recently used idle sessions beyond ``max_sessions``."""
+        evicted: dict[str, DeviceSession] = {}
+        if self.max_sessions is None:
+            return evicted
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return evicted
+        candidates = sorted(
+            (name for name in self._sessions if not self._checked_out.get(name)),
+            key=lambda name: self._last_used.get(name, 0.0),
+        )
+        for name in candidates[:excess]:
+            session = self._pop(name)
+            if session is not None:
+                evicted[name] = session
+        return evicted
+
+    def expire_idle(self) -> list[str]:
+        """Disconnect and remove sessions idle for longer than ``idle_timeout``."""
+        expired: dict[str, DeviceSession] = {}
         with self._lock:
-            return self._sessions.get(device_name)
+            now = self._clock()
+            for name in [n for n in self._sessions if self._is_expired(n, now)]:
+                session = self._pop(name)
+                if session is not None:
+                    expired[name] = session
+        self._disconnect(expired, "idle timeout")
+        return list(expired)
 
     def __getitem__(self, device_name: str) -> DeviceSession:
         """Get a session, raising KeyError if not found."""
@@ -65,8 +176,12 @@ class SessionPool:
 
     def __setitem__(self, device_name: str, session: DeviceSession) -> None:
         """Store a session in the pool."""
+        evicted: dict[str, DeviceSession] = {}
         with self._lock:
             self._sessions[device_name] = session
+            self._last_used[device_name] = self._clock()
+            evicted = self._evict_over_limit()
+        self._disconnect(evicted, "pool full")
 
     def __contains__(self, device_name: str) -> bool:
         """Check if a session exists in the pool."""
@@ -81,12 +196,13 @@ class SessionPool:
         Use this to clear stale sessions before creating new ones.
         """
         with self._lock:
-            return self._sessions.pop(device_name, None)
+            return self._pop(device_name)
 
     def clear(self) -> None:
         """Remove all sessions from the pool."""
         with self._lock:
             self._sessions.clear()
+            self._last_used.clear()
 
     def close_all(self) -> None:
         """Disconnect and remove all sessions."""
@@ -101,6 +217,7 @@ class SessionPool:
                     )
                     failed_devices.append(device_name)
             self._sessions.clear()
+            self._last_used.clear()
             if failed_devices:
                 logger.warning(
                     "Sessions failed to disconnect cleanly: %s",
@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2025-present Network Team <network@company.com>
+#
+# SPDX-License-Identifier: MIT
+"""Opt-in SSH connection multiplexing.
+
+One workflow can touch a device several times: the Scrapli session, the
+``nw cli`` tmux panes and SFTP file transfers. Without multiplexing, each of
+them performs a full SSH handshake and authentication. With
+``general.ssh_multiplexing: true``, they share connections instead:
+
+- OpenSSH clients (Scrapli's ``system`` transport, ``nw cli`` panes) use
+  ``ControlMaster=auto`` with a per-user control socket directory. The first
+  ``ssh`` to a host becomes the master. Later clients, including separate
+  ``nw`` invocations within ``ControlPersist`` seconds, open sessions over its
+  authenticated connection.
+- SFTP transfers open their channel on the session's own connection when
+  the session uses Scrapli's ``paramiko`` transport. Otherwise they use a
+  process-wide pool of authenticated paramiko transports, so a ``system``
+  session and its transfers still log in twice; the control master cannot
+  carry SFTP for paramiko.
+
+Bastion connections are pooled the same way, independent of this setting
+(see :mod:`network_toolkit.bastion`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections.abc import Hashable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import paramiko
+
+    from network_toolkit.bastion import BastionRoute
+
+logger = logging.getLogger(__name__)
+
+_PoolKey = tuple[str, int, str, str]
+
+
+def control_socket_dir() -> Path:
+    """Return the user-only directory holding OpenSSH control sockets.
+
+    Prefers XDG_RUNTIME_DIR (0700 tmpfs), else ~/.cache/networka/cm. Socket
+    paths are length-limited, so the directory name is kept short and
+    sockets are named by OpenSSH's ``%C`` connection hash.
+    """
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(xdg) / "networka" if xdg else Path.home() / ".cache" / "networka"
+    path = base / "cm"
+    path.mkdir(parents=True, exist_ok=True)
+    path.chmod(0o700)
+    return path
+
+
+def ssh_control_options(persist: int) -> list[str]:
+    """Return ``ssh`` arguments that create or reuse a control master.
+
+    Parameters
+    ----------
+    persist : int
+        Seconds an idle master connection stays open after its last client
+        exits
+
+    Returns
+    -------
+    list[str]
+        ``-o`` options, or an empty list where OpenSSH does not support
+        connection sharing (Windows)
+    """
+    if sys.platform.startswith("win"):
+        return []
+    return [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={control_socket_dir() / '%C'}",
+        "-o",
+        f"ControlPersist={persist}",
+    ]
+
+
+def _pool_key(host: str, port: int, username: str, password: str | None) -> _PoolKey:
+    digest = hashlib.sha256((password or "").encode()).hexdigest()
+    return (host, port, username, digest)
+
+
+class SharedTransportPool:
+    """Authenticated paramiko transports shared by SFTP transfers.
+
+    Transports are keyed by host, port, username and a digest of the
+    password, so a transport is never reused for other credentials.
+    Connecting happens outside the pool lock, so transfers to different
+    devices do not wait for each other's handshakes. A transport that is no
+    longer active is replaced on the next :meth:`acquire`.
+
+    Bastion transports are pooled per bastion; devices behind one are
+    reached over ``direct-tcpip`` channels of the bastion's transport.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._transports: dict[_PoolKey, paramiko.Transport] = {}
+        self._bastions: dict[str, paramiko.SSHClient] = {}
+        self._connecting: dict[Hashable, threading.Lock] = {}
+        self.opened = 0
+        self.reused = 0
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._connecting.setdefault(key, threading.Lock())
+
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None,
+        *,
+        via: BastionRoute | None = None,
+    ) -> paramiko.Transport:
+        """Return an authenticated transport for the device, connecting once."""
+        import paramiko
+
+        key = _pool_key(host, port, username, password)
+        with self._key_lock(key):
+            transport = self._transports.get(key)
+            if transport is not None and transport.is_active():
+                with self._lock:
+                    self.reused += 1
+                return transport
+
+            logger.debug(
+                "Opening shared SSH transport to %s@%s:%s", username, host, port
+            )
+            sock = self.tunnel(via, host, port) if via is not None else (host, port)
+            transport = paramiko.Transport(sock)
+            try:
+                transport.connect(username=username, password=password)
+            except Exception:
+                transport.close()
+                raise
+            with self._lock:
+                self._transports[key] = transport
+                self.opened += 1
+            return transport
+
+    def tunnel(self, route: BastionRoute, host: str, port: int) -> paramiko.Channel:
+        """Open a ``direct-tcpip`` channel to ``host:port`` through the bastion."""
+        import paramiko
+
+        with self._key_lock(("bastion", route.name)):
+            client = self._bastions.get(route.name)
+            transport = client.get_transport() if client is not None else None
+            if transport is None or not transport.is_active():
+                logger.debug("Opening shared bastion connection to %s", route.name)
+                client = paramiko.SSHClient()
+                client.load_system_host_keys()
+                client.set_missing_host_key_policy(
+                    paramiko.RejectPolicy()
+                    if route.strict_host_key
+                    else paramiko.AutoAddPolicy()
+                )
+                bastion_host, bastion_port = route.address
+                client.connect(
+                    bastion_host,
+                    port=bastion_port,
+                    username=route.user,
+                    key_filename=(
+                        str(Path(route.identity_file).expanduser())
+                        if route.identity_file
+                        else None
+                    ),
+                    allow_agent=True,
+                    look_for_keys=True,
+                )
+                with self._lock:
+                    self._bastions[route.name] = client
+                transport = client.get_transport()
+            if transport is None:
+                msg = f"Bastion {route.name} has no active transport"
+                raise paramiko.SSHException(msg)
+        return transport.open_channel("direct-tcpip", (host, port), ("127.0.0.1", 0))
+
+    def discard(
+        self, host: str, port: int, username: str, password: str | None
+    ) -> None:
+        """Close and forget the transport for a device (e.g. after an error)."""
+        key = _pool_key(host, port, username, password)
+        with self._lock:
+            transport = self._transports.pop(key, None)
+        if transport is not None:
+            transport.close()
+
+    def close_all(self) -> None:
+        """Close every pooled transport."""
+        with self._lock:
+            closables: list[paramiko.Transport | paramiko.SSHClient] = [
+                *self._transports.values(),
+                *self._bastions.values(),
+            ]
+            self._transports.clear()
+            self._bastions.clear()
+        for closable in closables:
+            try:
+                closable.close()
+            except Exception as e:
+                logger.debug("Error closing shared SSH transport: %s", e)
+
+    def __len__(self) -> int:
+        return len(self._transports)
+
+
+_shared_transports = SharedTransportPool()
+atexit.register(_shared_transports.close_all)
+
+
+def get_shared_transports() -> SharedTransportPool:
+    """Return the process-wide transport pool."""
+    return _shared_transports
@@ -0,0 +1,158 @@
+"""Per-device timing spans for connection, command, transfer and storage phases.
+
+A slow run can be slow because of AAA, the WAN, the devices or the local
+disk. To tell these apart, the execution stack records named spans
+(``connect.transport``, ``command``, ``results.store``, ...) into the
+:class:`TimingRecorder` that is active for the current thread or task.
+
+Recording is opt-in per unit of work: the API wraps each device's work in
+:func:`recording` and attaches the collected spans to its result objects.
+When tracing is enabled (:mod:`network_toolkit.tracing`) every timed block is
+also exported as a trace span. With neither active, :func:`timed` does nothing
+beyond a context variable lookup.
+
+Span names used by the toolkit:
+
+``connect``
+    Whole :meth:`DeviceSession.connect` including retries.
+``connect.dns``
+    Host name resolution (skipped for IP literals). An extra lookup, so it is
+    only made while trace spans are exported.
+``connect.transport``
+    Transport open: TCP connect and SSH handshake; for paramiko/ssh2 based
+    transports this includes authentication.
+``connect.auth``
+    In-channel authentication (system SSH and telnet transports).
+``connect.on_open``
+    Prompt detection and session setup (paging, privilege level).
+``command``
+    One command sent and its output received.
+``transfer.connect`` / ``transfer.upload`` / ``transfer.download`` /
+``transfer.verify``
+    SFTP session setup, payload transfer and post-transfer verification.
+``results.store``
+    Writing (or queueing) results via :class:`ResultsManager`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from network_toolkit.tracing import trace_span, tracing_enabled
+
+
+@dataclass(slots=True)
+class TimingSpan:
+    """A single timed phase of work."""
+
+    name: str
+    start: float
+    duration: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        data: dict[str, Any] = {
+            "name": self.name,
+            "start": self.start,
+            "duration": round(self.duration, 6),
+        }
+        if self.attributes:
+            data["attributes"] = dict(self.attributes)
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class TimingRecorder:
+    """Thread-safe collection of spans for one unit of work (usually a device)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[TimingSpan] = []
+
+    def add(self, span: TimingSpan) -> None:
+        """Append a finished span."""
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[TimingSpan]:
+        """Recorded spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def totals(self) -> dict[str, float]:
+        """Total seconds per span name."""
+        result: dict[str, float] = {}
+        for span in self.spans:
+            result[span.name] = result.get(span.name, 0.0) + span.duration
+        return result
+
+
+_current_recorder: ContextVar[TimingRecorder | None] = ContextVar(
+    "network_toolkit_timing_recorder", default=None
+)
+
+
+def current_recorder() -> TimingRecorder | None:
+    """Return the recorder active in this context, if any."""
+    return _current_recorder.get()
+
+
+@contextmanager
+def recording(recorder: TimingRecorder | None = None) -> Iterator[TimingRecorder]:
+    """Make ``recorder`` (or a new one) receive spans from the enclosed block."""
+    active = recorder if recorder is not None else TimingRecorder()
+    token = _current_recorder.set(active)
+    try:
+        yield active
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextmanager
+def timed(name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Record the enclosed block as span ``name`` in the active recorder.
+
+    Yields the span's attribute dict so callers can add values that are only
+    known at the end (e.g. bytes transferred). Exceptions are recorded on the
+    span and re-raised.
+    """
+    recorder = _current_recorder.get()
+    if recorder is None and not tracing_enabled():
+        yield attributes
+        return
+    start_wall = time.time()
+    started = time.perf_counter()
+    error: str | None = None
+    with trace_span(name) as trace:
+        try:
+            yield attributes
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            trace.set_attributes(attributes)
+            if recorder is not None:
+                recorder.add(
+                    TimingSpan(
+                        name=name,
+                        start=start_wall,
+                        duration=time.perf_counter() - started,
+                        attributes=attributes,
+                        error=error,
+                    )
+                )
+
+
+def spans_to_dicts(spans: list[TimingSpan]) -> list[dict[str, Any]]:
+    """Convert spans to JSON-serializable dicts."""
+    return [span.to_dict() for span in spans]
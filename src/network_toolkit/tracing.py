@@ -0,0 +1,322 @@
+"""Trace spans for runs, devices and commands, compatible with OpenTelemetry.
+
+Tracing is off by default. While it is off, :func:`trace_span` returns a
+shared no-op span after a single global check, so the hooks in the execution
+stack cost nothing measurable. Enable it with :func:`configure_tracing` (any
+:class:`SpanExporter`), :func:`enable_jsonl_tracing`, ``nw --trace-file`` or
+the ``NW_TRACE_FILE`` environment variable.
+
+Spans follow the OpenTelemetry data model: 128-bit trace ids, 64-bit span
+ids, parent links, nanosecond timestamps, attributes and an OK/ERROR status.
+:class:`JsonLinesSpanExporter` writes one OTLP/JSON-style span per line, so a
+run can be inspected offline (``jq``, a notebook, or a trace viewer that
+imports OTLP JSON) without a collector. To forward spans to an OpenTelemetry
+SDK instead, pass an exporter that converts :class:`TraceSpan` objects.
+
+Span hierarchy produced by the toolkit::
+
+    nw.run / nw.backup / nw.diff        one per API call
+      nw.device                         one per device (device.name, device.type,
+                                        network.transport)
+        connect, connect.*              session setup phases
+        command                         one per command (command, bytes_received)
+        transfer.*, results.store       file transfers and result storage
+
+The current span is kept in a context variable. Work submitted to thread
+pools must run in a copy of the caller's context (``contextvars.copy_context``)
+for device spans to attach to their run span.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from functools import wraps
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_ENV = "NW_TRACE_FILE"
+SERVICE_NAME = "networka"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class TraceSpan:
+    """A span in a trace; finished spans are handed to the exporter."""
+
+    __slots__ = (
+        "attributes",
+        "end_time_ns",
+        "name",
+        "parent_span_id",
+        "span_id",
+        "start_time_ns",
+        "status_code",
+        "status_message",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        trace_id: str,
+        parent_span_id: str | None,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: int | None = None
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.status_code = "UNSET"
+        self.status_message: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute."""
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Set several attributes."""
+        self.attributes.update(attributes)
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed."""
+        self.status_code = "ERROR"
+        self.status_message = message
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is open)."""
+        if self.end_time_ns is None:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return an OTLP/JSON-style representation."""
+        status: dict[str, Any] = {"code": self.status_code}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": "INTERNAL",
+            "startTimeUnixNano": self.start_time_ns,
+            "endTimeUnixNano": self.end_time_ns or self.start_time_ns,
+            "attributes": self.attributes,
+            "status": status,
+            "resource": {"service.name": SERVICE_NAME},
+        }
+
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Receives finished spans."""
+
+    def export(self, span: TraceSpan) -> None:
+        """Handle one finished span; must be thread-safe."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        ...
+
+
+class JsonLinesSpanExporter:
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._fh = self.path.open("a", encoding="utf-8")
+
+    def export(self, span: TraceSpan) -> None:
+        line = json.dumps(span.to_dict(), default=str, separators=(",", ":"))
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.write(line + "\n")
+            # Spans are few and large runs may be killed; keep the file current
+            self._fh.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+
+class _NoopSpan:
+    """Shared span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[TraceSpan | None] = ContextVar(
+    "network_toolkit_trace_span", default=None
+)
+_exporter: SpanExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+class _ActiveSpan:
+    """Context manager that makes a new span current and exports it on exit."""
+
+    __slots__ = ("_exporter", "_span", "_token")
+
+    def __init__(self, exporter: SpanExporter, span: TraceSpan) -> None:
+        self._exporter = exporter
+        self._span = span
+        self._token: Token[TraceSpan | None] | None = None
+
+    def __enter__(self) -> TraceSpan:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        span = self._span
+        span.end_time_ns = time.time_ns()
+        if exc is not None:
+            span.set_error(f"{type(exc).__name__}: {exc}")
+        elif span.status_code == "UNSET":
+            span.status_code = "OK"
+        if self._token is not None:
+            _current_span.reset(self._token)
+        try:
+            self._exporter.export(span)
+        except Exception as e:
+            logger.debug("Span export failed: %s", e)
+
+
+def configure_tracing(exporter: SpanExporter | None) -> None:
+    """Install ``exporter`` (or disable tracing with None).
+
+    A previously installed exporter is shut down.
+    """
+    global _exporter
+    with _exporter_lock:
+        previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+
+
+def enable_jsonl_tracing(path: str | Path) -> JsonLinesSpanExporter:
+    """Write spans to ``path`` as JSON lines until the process exits."""
+    exporter = JsonLinesSpanExporter(path)
+    configure_tracing(exporter)
+    atexit.register(shutdown_tracing)
+    return exporter
+
+
+def enable_tracing_from_env() -> JsonLinesSpanExporter | None:
+    """Enable JSON-lines tracing if ``NW_TRACE_FILE`` is set."""
+    path = os.environ.get(TRACE_FILE_ENV, "").strip()
+    if not path or _exporter is not None:
+        return None
+    return enable_jsonl_tracing(path)
+
+
+def shutdown_tracing() -> None:
+    """Flush the exporter and disable tracing."""
+    configure_tracing(None)
+
+
+def tracing_enabled() -> bool:
+    """Return True if spans are being exported."""
+    return _exporter is not None
+
+
+def current_span() -> TraceSpan | None:
+    """Return the active span in this context, if any."""
+    return _current_span.get()
+
+
+def trace_span(name: str, **attributes: Any) -> Any:
+    """Start a child of the current span (or a new trace) as a context manager.
+
+    The context manager yields the span, whose ``set_attribute``,
+    ``set_attributes`` and ``set_error`` can be called while it is open.
+    Returns a shared no-op span when tracing is disabled.
+    """
+    exporter = _exporter
+    if exporter is None:
+        return _NOOP_SPAN
+    parent = _current_span.get()
+    span = TraceSpan(
+        name,
+        trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+        parent_span_id=parent.span_id if parent is not None else None,
+        attributes=attributes,
+    )
+    return _ActiveSpan(exporter, span)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator form of :func:`trace_span` for whole functions."""
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with trace_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def device_span(config: Any, device_name: str, name: str = "nw.device") -> Any:
+    """Start a per-device span with device type and transport attributes."""
+    if _exporter is None:
+        return _NOOP_SPAN
+    attributes: dict[str, Any] = {"device.name": device_name}
+    try:
+        device = (config.devices or {}).get(device_name)
+        if device is not None and device.device_type:
+            attributes["device.type"] = device.device_type
+        attributes["network.transport"] = config.get_transport_type(device_name)
+    except Exception as e:
+        logger.debug("Could not resolve trace attributes for %s: %s", device_name, e)
+    return trace_span(name, **attributes)
@@ -5,6 +5,7 @@ Keep it minimal: sync-only, small contract.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
@@ -41,6 +42,8 @@ class Transport(Protocol):
 
     def send_command(self, command: str) -> CommandResult: ...
 
+    def stream_command(self, command: str) -> Iterator[str]: ...
+
     def send_interactive(
         self, interact_events: list[tuple[str, str, bool]], timeout_ops: float
     ) -> str: ...
@@ -6,6 +6,8 @@ import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from nornir import Nornir
 
 from network_toolkit.transport.interfaces import CommandResult, ConnectionState
@@ -208,6 +210,18 @@ class NornirNetmikoTransport:
 
         return results
 
+    def stream_command(self, command: str) -> Iterator[str]:
+        """Yield the command output.
+
+        Netmiko returns output only once the command has completed, so the
+        whole output is yielded as a single chunk.
+        """
+        response = self.send_command(command)
+        if response.failed:
+            error_msg = f"Failed to execute command '{command}' on {self.device_name}"
+            raise RuntimeError(error_msg)
+        yield response.result
+
     def send_interactive(
         self,
         _interact_events: list[tuple[str, str, bool]],
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import codecs
+import time
+from collections.abc import Iterator
+
 from scrapli import Scrapli
+from scrapli.exceptions import ScrapliTimeout
 
 from network_toolkit.transport.interfaces import CommandResult
 
@@ -26,6 +31,67 @@ class ScrapliSyncTransport:
             result=resp.result, failed=bool(getattr(resp, "failed", False))
         )
 
+    def stream_command(self, command: str) -> Iterator[str]:
+        """Send a command and yield its output in blocks of lines as it arrives.
+
+        Reads the channel directly instead of waiting for the whole response,
+        holding back only the current, incomplete line. Output ends when that
+        line matches the driver's prompt; the prompt itself is not yielded.
+        The driver's ``timeout_ops`` limits the time between two reads that
+        return data rather than the whole command, so long-running commands
+        stream until the device returns to its prompt as long as it keeps
+        sending output. ScrapliTimeout is raised once the device stays silent
+        for longer than that.
+        """
+        channel = self._driver.channel
+        channel_args = channel._base_channel_args
+        prompt = channel._get_prompt_pattern(
+            class_pattern=channel_args.comms_prompt_pattern
+        )
+        # A prompt never spans more than the search depth, so longer partial
+        # lines are output and can be passed on before their newline arrives
+        depth = channel_args.comms_prompt_search_depth
+        idle_timeout = channel_args.timeout_ops
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = b""
+        started = False
+        mid_line = False
+
+        with channel._channel_lock():
+            channel.write(channel_input=command)
+            channel._read_until_input(channel_input=command.encode())
+            channel.send_return()
+            last_read = time.monotonic()
+            while True:
+                chunk = channel.read()
+                if chunk:
+                    last_read = time.monotonic()
+                elif idle_timeout and time.monotonic() - last_read > idle_timeout:
+                    msg = f"no output from device for {idle_timeout}s while streaming"
+                    raise ScrapliTimeout(msg)
+                pending += chunk
+                if not started:
+                    # Drop the echoed return ahead of the output
+                    pending = pending.lstrip(b"\n")
+                    started = bool(pending)
+                    if not started:
+                        continue
+
+                lines, newline, partial = pending.rpartition(b"\n")
+                if newline:
+                    mid_line = False
+                if not mid_line and prompt.search(partial):
+                    if lines:
+                        yield decoder.decode(lines + newline, final=True)
+                    return
+
+                if len(partial) > depth:
+                    lines, newline, partial = pending, b"", b""
+                    mid_line = True
+                if lines or newline:
+                    yield decoder.decode(lines + newline)
+                pending = partial
+
     def send_interactive(
         self, interact_events: list[tuple[str, str, bool]], timeout_ops: float
     ) -> str:
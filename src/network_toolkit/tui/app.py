@@ -11,6 +11,7 @@ import asyncio
 import logging
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -22,6 +23,11 @@ from network_toolkit.tui.data import TuiData
 from network_toolkit.tui.keymap import KEYMAP
 from network_toolkit.tui.layout import compose_root
 from network_toolkit.tui.models import RunCallbacks, SelectionState
+from network_toolkit.tui.output_buffer import (
+    OUTPUT_FRAME_INTERVAL,
+    OutputCoalescer,
+    line_buffer,
+)
 from network_toolkit.tui.output_manager import OutputPanelManager
 from network_toolkit.tui.services import ExecutionService
 
@@ -62,7 +68,7 @@ def run(config: str | Path = "config") -> None:
     class _App(app_cls):
         _errors: list[str]
         _meta: list[str]
-        _output_lines: list[str]
+        _output_lines: deque[str]
         _summary_filter: str
         _output_filter: str
         _summary_user_hidden: bool
@@ -73,8 +79,9 @@ def run(config: str | Path = "config") -> None:
         _controller: TuiController
         # Per-device output structures
         _output_device_logs: dict[str, Any]
-        _output_device_lines: dict[str, list[str]]
+        _output_device_lines: dict[str, deque[str]]
         _output_mgr: OutputPanelManager
+        _output_buffer: OutputCoalescer
 
         CSS = APP_CSS
         BINDINGS: ClassVar[list[Any]] = [
@@ -102,6 +109,41 @@ def run(config: str | Path = "config") -> None:
             self._output_device_lines = {}
             # Create output manager abstraction
             self._output_mgr = OutputPanelManager(self, compat)
+            # Worker threads queue output here; it is rendered once per frame
+            self._output_buffer = OutputCoalescer()
+            try:
+                self.set_interval(OUTPUT_FRAME_INTERVAL, self._flush_output)
+            except Exception:
+                pass
+            # Periodically close pooled sessions left idle between runs
+            try:
+                self.set_interval(60, self._expire_idle_sessions)
+            except Exception:
+                pass
+
+        def _show_run_progress(self, done: int, total: int, limit: int) -> None:
+            """Show run progress and the adaptive concurrency limit."""
+            try:
+                self.query_one("#run-status").update(
+                    f"Status: running {done}/{total} — concurrency {limit}"
+                )
+            except Exception:
+                pass
+
+        def _flush_output(self) -> None:
+            """Render output queued since the last frame (UI thread only)."""
+            try:
+                chunks = self._output_buffer.drain()
+            except Exception:
+                return
+            if chunks:
+                self._output_mgr.append_batch(chunks)
+
+        async def _expire_idle_sessions(self) -> None:
+            try:
+                await asyncio.to_thread(service.expire_idle_sessions)
+            except Exception:
+                pass
 
         async def on_input_changed(self, event: Any) -> None:  # Textual Input change
             await self._controller.on_input_changed(event)
@@ -112,7 +154,7 @@ def run(config: str | Path = "config") -> None:
                 out_log.clear()
             # reset buffered output lines for fresh run
             try:
-                self._output_lines = []
+                self._output_lines = line_buffer()
             except Exception:
                 pass
             # reset summary and any previous errors
@@ -164,16 +206,19 @@ def run(config: str | Path = "config") -> None:
                     self.query_one("#run-status").update(f"Status: running 0/{total}")
                 except Exception:
                     pass
+                buffer = self._output_buffer
+                buffer.clear()
                 summary_result = await service.run_plan(
                     plan,
                     RunCallbacks(
-                        on_output=lambda m: self.call_from_thread(
-                            self._output_append, m
-                        ),
+                        on_output=buffer.push,
                         on_error=lambda m: self.call_from_thread(self._add_error, m),
                         on_meta=lambda m: self.call_from_thread(self._add_meta, m),
+                        on_device_output=lambda d, m: buffer.push(m, device=d),
+                        on_progress=self._show_run_progress,
                     ),
                 )
+                self._flush_output()
                 # Update summary panel (include errors if any)
                 try:
                     elapsed = time.monotonic() - start_ts
@@ -1271,5 +1316,8 @@ def run(config: str | Path = "config") -> None:
 
     # Note: We rely on DeviceSession raising NetworkToolkitError for failures
 
-    # Launch the app
-    _App().run()
+    # Launch the app; pooled device sessions live as long as the app
+    try:
+        _App().run()
+    finally:
+        service.close()
@@ -14,6 +14,7 @@ from typing import Any
 
 from network_toolkit.tui.constants import STARTUP_NOTICE
 from network_toolkit.tui.models import CancellationToken
+from network_toolkit.tui.output_buffer import line_buffer
 
 # Single-source cancel prompt text used in toasts
 CANCEL_TOAST = (
@@ -69,7 +70,7 @@ class TuiController:
             app._dark_mode = True
         app._summary_filter = ""
         app._output_filter = ""
-        app._output_lines = []
+        app._output_lines = line_buffer()
         app._refresh_bottom_visibility()
         # Async task + cancellation token for active run
         app._run_task = None
@@ -151,7 +152,7 @@ class TuiController:
         if hasattr(out_log, "clear"):
             out_log.clear()
         try:
-            app._output_lines = []
+            app._output_lines = line_buffer()
         except Exception:
             pass
         # Clear per-device tabs and buffers to start fresh
@@ -223,18 +224,42 @@ class TuiController:
                     pass
                 from network_toolkit.tui.models import RunCallbacks
 
-                summary_result = await service.run_plan(
-                    plan,
-                    RunCallbacks(
+                def _show_progress(done: int, total: int, limit: int) -> None:
+                    # Runs on the UI loop; show the adaptive concurrency limit
+                    try:
+                        app.query_one("#run-status").update(
+                            f"Status: running {done}/{total} — concurrency {limit} "
+                            "(press Ctrl+C to cancel)"
+                        )
+                    except Exception:
+                        pass
+
+                buffer = getattr(app, "_output_buffer", None)
+                if buffer is not None:
+                    # Coalesce output; the app renders it once per frame
+                    buffer.clear()
+                    callbacks = RunCallbacks(
+                        on_output=buffer.push,
+                        on_error=lambda m: app._dispatch_ui(app._add_error, m),
+                        on_meta=lambda m: app._dispatch_ui(app._add_meta, m),
+                        on_device_output=lambda d, m: buffer.push(m, device=d),
+                        on_progress=_show_progress,
+                    )
+                else:
+                    callbacks = RunCallbacks(
                         on_output=lambda m: app._dispatch_ui(app._output_append, m),
                         on_error=lambda m: app._dispatch_ui(app._add_error, m),
                         on_meta=lambda m: app._dispatch_ui(app._add_meta, m),
                         on_device_output=lambda d, m: app._dispatch_ui(
                             app._output_append_device, d, m
                         ),
-                    ),
-                    cancel=app._cancel_token,
+                        on_progress=_show_progress,
+                    )
+                summary_result = await service.run_plan(
+                    plan, callbacks, cancel=app._cancel_token
                 )
+                if buffer is not None:
+                    app._flush_output()
                 try:
                     if getattr(app, "_output_lines", None):
                         app._show_output_panel()
@@ -250,12 +275,13 @@ class TuiController:
                             lines: list[str] = [
                                 str(x)
                                 for x in (getattr(app, "_output_lines", []) or [])
+                                if not filt or (filt in str(x).lower())
                             ]
-                            for line in lines:
-                                if not filt or (filt in line.lower()):
-                                    from network_toolkit.tui.helpers import log_write
+                            if lines:
+                                from network_toolkit.tui.helpers import log_write
 
-                                    log_write(out_log2, line)
+                                # One write for the whole (bounded) buffer
+                                log_write(out_log2, "\n".join(lines))
                         except Exception:
                             pass
                     elapsed = time.monotonic() - start_ts
@@ -44,6 +44,7 @@ from network_toolkit.tui.constants import (
     LBL_SUMMARY,
     LBL_TARGETS,
 )
+from network_toolkit.tui.output_buffer import OUTPUT_MAX_LINES
 
 
 def compose_root(compat: Any) -> Any:
@@ -102,10 +103,21 @@ def compose_root(compat: Any) -> Any:
                 yield static(LBL_OUTPUT, classes="pane-title title")
                 with tabbed_content(id=ID_OUTPUT_TABS):
                     with tab_pane("All", id=ID_OUTPUT_TAB_ALL):
-                        yield compat.TextLogClass(id=ID_OUTPUT_LOG, classes="scroll")
+                        yield _output_log(compat)
                 yield _filter_input(compat, ID_FILTER_OUTPUT, "Filter output...")
     yield footer()
 
 
+def _output_log(compat: Any) -> Any:
+    """The All output log, bounded like the output buffers when supported."""
+    try:
+        return compat.TextLogClass(
+            id=ID_OUTPUT_LOG, classes="scroll", max_lines=OUTPUT_MAX_LINES
+        )
+    except TypeError:
+        # Log widgets without max_lines keep everything
+        return compat.TextLogClass(id=ID_OUTPUT_LOG, classes="scroll")
+
+
 def _filter_input(compat: Any, element_id: str, placeholder: str) -> Any:
     return compat.Input(placeholder=placeholder, id=element_id, classes="search")
@@ -61,6 +61,9 @@ class RunCallbacks(BaseModel):
     on_meta: Callable[[str], None]
     # Optional per-device output; if provided, it will be preferred over on_output
     on_device_output: Callable[[str, str], None] | None = None
+    # Optional progress hook: (completed, total, current concurrency limit).
+    # Called on the event loop thread running the plan.
+    on_progress: Callable[[int, int, int], None] | None = None
 
 
 def iter_commands(text: str) -> Iterable[str]:
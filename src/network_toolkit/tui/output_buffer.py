@@ -0,0 +1,99 @@
+"""Coalescing output buffer between execution threads and the TUI.
+
+Worker threads must not touch widgets for every output line: a
+``show running-config`` against 100 devices would queue hundreds of thousands
+of UI callbacks and freeze the event loop. Instead, workers push whole output
+chunks into an :class:`OutputCoalescer` (a lock and a list append), and the
+app drains it once per frame (``OUTPUT_FRAME_INTERVAL``) and renders each
+batch with one write per log widget.
+
+Line buffers are ``deque`` ring buffers (``OUTPUT_MAX_LINES`` per device and for
+the All view); log widgets are created with the same ``max_lines`` so render
+cost depends on what is kept and visible, not on total output.
+
+This module does not import Textual.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+# Drain/render cadence for streamed output (seconds)
+OUTPUT_FRAME_INTERVAL = 0.05
+# Lines kept per device buffer, for the All buffer and in each log widget
+OUTPUT_MAX_LINES = 5000
+
+OutputChunk = tuple[str | None, list[str]]
+
+
+def line_buffer(lines: Iterable[str] = (), limit: int = OUTPUT_MAX_LINES) -> deque[str]:
+    """Return a ring buffer that keeps only the newest ``limit`` lines."""
+    return deque(lines, maxlen=max(1, limit))
+
+
+class OutputCoalescer:
+    """Thread-safe staging area for output awaiting the next UI frame.
+
+    ``push`` may be called from any thread. ``drain`` is called on the UI
+    thread and returns the chunks received since the last drain, in arrival
+    order. When more than ``max_pending_lines`` lines of one device pile up
+    between two frames, that device's oldest pending lines are dropped; its
+    ring buffer and log widget could not keep them anyway.
+    """
+
+    def __init__(self, *, max_pending_lines: int = OUTPUT_MAX_LINES) -> None:
+        self._lock = threading.Lock()
+        self._pending: deque[OutputChunk] = deque()
+        self._pending_lines = 0
+        self._per_device: dict[str | None, int] = {}
+        self._max_pending_lines = max(1, max_pending_lines)
+        self.dropped_lines = 0
+
+    def push(self, text: str, device: str | None = None) -> None:
+        """Queue output text (may contain many lines) for the next frame."""
+        lines = str(text).splitlines()
+        if not lines:
+            return
+        with self._lock:
+            self._pending.append((device, lines))
+            self._pending_lines += len(lines)
+            count = self._per_device.get(device, 0) + len(lines)
+            self._per_device[device] = count
+            if count > self._max_pending_lines:
+                self._drop_oldest_locked(device, count - self._max_pending_lines)
+
+    def _drop_oldest_locked(self, device: str | None, excess: int) -> None:
+        kept: deque[OutputChunk] = deque()
+        for chunk_device, chunk_lines in self._pending:
+            lines = chunk_lines
+            if excess > 0 and chunk_device == device:
+                removed = min(excess, len(lines))
+                excess -= removed
+                self._pending_lines -= removed
+                self._per_device[device] -= removed
+                self.dropped_lines += removed
+                lines = lines[removed:]
+                if not lines:
+                    continue
+            kept.append((chunk_device, lines))
+        self._pending = kept
+
+    def drain(self) -> list[OutputChunk]:
+        """Return and clear all pending chunks."""
+        with self._lock:
+            chunks, self._pending = list(self._pending), deque()
+            self._pending_lines = 0
+            self._per_device.clear()
+        return chunks
+
+    def clear(self) -> None:
+        """Discard pending output (e.g. when a new run starts)."""
+        self.drain()
+
+    @property
+    def pending_lines(self) -> int:
+        """Number of lines waiting for the next frame."""
+        with self._lock:
+            return self._pending_lines
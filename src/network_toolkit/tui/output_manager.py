@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
 from typing import Any
 
 from network_toolkit.tui.helpers import log_write
+from network_toolkit.tui.output_buffer import OUTPUT_MAX_LINES, OutputChunk, line_buffer
 
 
 class OutputPanelManager:
@@ -12,11 +16,18 @@ class OutputPanelManager:
     This class encapsulates interaction with TabbedContent/TabPane across
     Textual versions and maintains in-memory buffers so the UI can be
     reconstructed at any time.
+
+    Buffers are bounded to ``max_lines`` lines each (oldest lines are dropped)
+    and new lines are written with one widget write per batch, see
+    :meth:`append_batch`.
     """
 
-    def __init__(self, app: Any, compat: Any) -> None:
+    def __init__(
+        self, app: Any, compat: Any, *, max_lines: int = OUTPUT_MAX_LINES
+    ) -> None:
         self.app = app
         self.compat = compat
+        self.max_lines = max_lines
         # Expose buffers/maps on the app for legacy access/tests
         if not hasattr(app, "_output_device_logs"):
             app._output_device_logs = {}
@@ -25,7 +36,7 @@ class OutputPanelManager:
         if not hasattr(app, "_output_device_panes"):
             app._output_device_panes = {}
         if not hasattr(app, "_output_lines"):
-            app._output_lines = []
+            app._output_lines = line_buffer(limit=max_lines)
 
     # ----- public API -----
     def reset(self) -> None:
@@ -38,7 +49,7 @@ class OutputPanelManager:
         except Exception:
             pass
         try:
-            self.app._output_lines = []
+            self.app._output_lines = line_buffer(limit=self.max_lines)
         except Exception:
             pass
         # Remove all device tabs (prefer removing actual TabPane objects)
@@ -122,8 +133,16 @@ class OutputPanelManager:
             return None
         tab_id = self._tab_id_for_device(dev_key)
         # Create content log (id must match pane id for ContentSwitcher)
+        log = None
         try:
-            log = self.compat.TextLogClass(id=tab_id, classes="scroll")
+            log = self.compat.TextLogClass(
+                id=tab_id, classes="scroll", max_lines=self.max_lines
+            )
+        except TypeError:
+            try:
+                log = self.compat.TextLogClass(id=tab_id, classes="scroll")
+            except Exception:
+                log = None
         except Exception:
             log = None
         if log is None:
@@ -167,7 +186,9 @@ class OutputPanelManager:
             return None
         self.app._output_device_logs[dev_key] = log
         self.app._output_device_panes[dev_key] = pane
-        self.app._output_device_lines.setdefault(dev_key, [])
+        self.app._output_device_lines.setdefault(
+            dev_key, line_buffer(limit=self.max_lines)
+        )
         return log
 
     def append_all(self, text: str) -> None:
@@ -178,10 +199,7 @@ class OutputPanelManager:
             self.app._maybe_show_output_panel()
         except Exception:
             pass
-        try:
-            self.app._output_lines.extend(lines)
-        except Exception:
-            self.app._output_lines = list(lines)
+        self._extend_all(lines)
         # Render depending on filter
         try:
             out_log = self.app.query_one("#output-log")
@@ -193,8 +211,7 @@ class OutputPanelManager:
         if filt:
             self._render_filtered(out_log, self.app._output_lines, filt)
         else:
-            for line in lines:
-                log_write(out_log, line)
+            self._write_lines(out_log, lines)
 
     def append_device(self, device: str, text: str) -> None:
         lines = self._split_lines(text)
@@ -204,14 +221,33 @@ class OutputPanelManager:
             self.app._maybe_show_output_panel()
         except Exception:
             pass
-        dev_key = str(device)
+        self.append_batch([(str(device), lines)])
+
+    def append_batch(self, chunks: list[OutputChunk]) -> None:
+        """Render a frame's worth of output chunks.
+
+        ``chunks`` are ``(device, lines)`` pairs in arrival order; ``device``
+        is None for output without a device tab. Every affected log widget
+        receives a single write, limited to the lines it can keep.
+        """
+        all_lines = [line for _device, lines in chunks for line in lines]
+        if not all_lines:
+            return
         try:
-            self.app._output_lines.extend(lines)
+            self.app._maybe_show_output_panel()
         except Exception:
-            self.app._output_lines = list(lines)
-        buf = self.app._output_device_lines.setdefault(dev_key, [])
-        buf.extend(lines)
-        log_dev = self.ensure_device_tab(dev_key)
+            pass
+        self._extend_all(all_lines)
+        per_device: dict[str, list[str]] = {}
+        for device, lines in chunks:
+            if device is not None:
+                per_device.setdefault(str(device), []).extend(lines)
+        device_logs: dict[str, Any] = {}
+        for dev_key, lines in per_device.items():
+            buffers = self.app._output_device_lines
+            buffers[dev_key] = self._bounded(buffers.get(dev_key))
+            buffers[dev_key].extend(lines)
+            device_logs[dev_key] = self.ensure_device_tab(dev_key)
         filt = (getattr(self.app, "_output_filter", "") or "").strip().lower()
         if filt:
             try:
@@ -221,17 +257,12 @@ class OutputPanelManager:
             return
         # Append to All and device logs
         try:
-            out_all = self.app.query_one("#output-log")
-            for line in lines:
-                log_write(out_all, line)
+            self._write_lines(self.app.query_one("#output-log"), all_lines)
         except Exception:
             pass
-        try:
+        for dev_key, log_dev in device_logs.items():
             if log_dev is not None:
-                for line in lines:
-                    log_write(log_dev, line)
-        except Exception:
-            pass
+                self._write_lines(log_dev, per_device[dev_key])
 
     def apply_filter(self, value: str) -> None:
         self.app._output_filter = value
@@ -271,8 +302,7 @@ class OutputPanelManager:
             log = self.ensure_device_tab(dev_key)
             if log is None:
                 continue
-            for line in self.app._output_device_lines.get(dev_key, []):
-                log_write(log, line)
+            self._write_lines(log, self.app._output_device_lines.get(dev_key, []))
         # Re-render All
         try:
             out_all = self.app.query_one("#output-log")
@@ -282,8 +312,7 @@ class OutputPanelManager:
             else:
                 if hasattr(out_all, "clear"):
                     out_all.clear()
-                for line in self.app._output_lines:
-                    log_write(out_all, line)
+                self._write_lines(out_all, self.app._output_lines)
         except Exception:
             pass
 
@@ -305,18 +334,41 @@ class OutputPanelManager:
             s = f"{text}"
         return list(s.splitlines())
 
-    def _render_filtered(self, log_widget: Any, lines: list[str], filt: str) -> None:
+    def _bounded(self, lines: Any) -> deque[str]:
+        """Return ``lines`` as a ring buffer of ``max_lines``.
+
+        Callers outside this class reset buffers to plain lists; those are
+        converted on their next append.
+        """
+        if isinstance(lines, deque) and lines.maxlen == self.max_lines:
+            return lines
+        return line_buffer(lines or (), self.max_lines)
+
+    def _extend_all(self, lines: list[str]) -> None:
+        buf = self._bounded(getattr(self.app, "_output_lines", None))
+        buf.extend(lines)
+        self.app._output_lines = buf
+
+    def _write_lines(self, log_widget: Any, lines: Sequence[str]) -> None:
+        """Write many lines with a single widget update."""
+        if not lines:
+            return
+        skip = max(0, len(lines) - self.max_lines)
+        log_write(log_widget, "\n".join(islice(lines, skip, None)))
+
+    def _render_filtered(
+        self, log_widget: Any, lines: Sequence[str], filt: str
+    ) -> None:
         try:
             if hasattr(log_widget, "clear"):
                 log_widget.clear()
         except Exception:
             pass
-        for line in lines:
-            try:
-                if not filt or (filt in line.lower()):
-                    log_write(log_widget, line)
-            except Exception:
-                pass
+        try:
+            matched = [line for line in lines if not filt or filt in line.lower()]
+        except Exception:
+            matched = []
+        self._write_lines(log_widget, matched)
 
     def _find_device_key(self, dev_id_part: str) -> str:
         # Match sanitized id first
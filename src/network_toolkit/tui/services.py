@@ -10,11 +10,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
+from network_toolkit.api.execution import AdaptiveLimiter
 from network_toolkit.common.resolver import DeviceResolver
+from network_toolkit.session_pool import SessionPool
 from network_toolkit.tui.data import TuiData
 from network_toolkit.tui.models import (
     CancellationToken,
@@ -24,6 +28,12 @@ from network_toolkit.tui.models import (
     iter_commands,
 )
 
+# Sessions kept open between runs so repeated commands skip SSH setup
+POOL_MAX_SESSIONS = 32
+POOL_IDLE_TIMEOUT = 300.0
+# Upper bound for the adaptive device concurrency
+MAX_CONCURRENCY = 32
+
 
 class DeviceRunResult(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -38,18 +48,63 @@ class ExecutionService:
     Cancellation semantics:
     - Cooperative: ongoing device tasks periodically check the provided
       ``CancellationToken`` and bail between commands.
-    - Bounded scheduling: only up to ``concurrency`` devices are scheduled at
-      a time. When cancelled, we stop scheduling new devices so at most
-      ``concurrency`` device tasks remain to finish.
+    - Bounded scheduling: only up to the current concurrency limit of devices
+      are scheduled at a time. When cancelled, we stop scheduling new devices
+      so at most that many device tasks remain to finish.
+
+    Adaptive concurrency: ``concurrency`` is the starting limit of an
+    :class:`AdaptiveLimiter` that grows while connect and command latencies
+    stay flat and halves on timeouts, resets or throttling (up to
+    ``MAX_CONCURRENCY``). The current value is available as :attr:`concurrency`.
+
+    Session reuse: connected sessions are kept in a bounded, idle-expiring
+    :class:`SessionPool` for the lifetime of the service, so repeated runs
+    against the same devices skip SSH setup. Call :meth:`close` on shutdown.
     """
 
-    def __init__(self, data: TuiData, *, concurrency: int = 5) -> None:
+    def __init__(
+        self,
+        data: TuiData,
+        *,
+        concurrency: int = 5,
+        session_pool: SessionPool | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> None:
         self._data = data
-        self._concurrency = max(1, int(concurrency))
-        self._sem = asyncio.Semaphore(self._concurrency)
+        initial = max(1, int(concurrency))
+        self._limiter = limiter or AdaptiveLimiter(
+            initial, max_limit=max(MAX_CONCURRENCY, initial)
+        )
         # Track active sessions for hard-cancel support
         self._active_sessions: set[object] = set()
         self._active_lock = threading.Lock()
+        self._pool = session_pool or SessionPool(
+            max_sessions=max(POOL_MAX_SESSIONS, self._limiter.max_limit),
+            idle_timeout=POOL_IDLE_TIMEOUT,
+        )
+
+    @property
+    def concurrency(self) -> int:
+        """Current adaptive limit on devices running at once."""
+        return self._limiter.limit
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """Limiter that sets how many devices run at once."""
+        return self._limiter
+
+    @property
+    def session_pool(self) -> SessionPool:
+        """Pool of sessions reused across runs."""
+        return self._pool
+
+    def expire_idle_sessions(self) -> list[str]:
+        """Disconnect pooled sessions that have been idle too long."""
+        return self._pool.expire_idle()
+
+    def close(self) -> None:
+        """Disconnect all pooled sessions."""
+        self._pool.close_all()
 
     # --- Hard-cancel support
     def _register_session(self, session: object) -> None:
@@ -84,6 +139,8 @@ class ExecutionService:
         except Exception:
             sessions = []
         for s in sessions:
+            # Closed sessions must not be handed out again by the pool
+            self._drop_pooled(s)
             try:
                 disc = getattr(s, "disconnect", None)
                 if callable(disc):
@@ -91,6 +148,32 @@ class ExecutionService:
             except Exception as e:
                 logging.debug(f"Hard cancel disconnect failed: {e}")
 
+    # --- Session pooling
+    def _drop_pooled(self, session: object) -> None:
+        device = getattr(session, "device_name", None)
+        if isinstance(device, str) and self._pool.get(device) is session:
+            self._pool.remove(device)
+
+    def _discard_session(self, session: object) -> None:
+        self._drop_pooled(session)
+        try:
+            disc = getattr(session, "disconnect", None)
+            if callable(disc):
+                disc()
+        except Exception as e:
+            logging.debug(f"Discarding pooled session failed: {e}")
+
+    def _open_session(self, device: str) -> Any:
+        # Import here to avoid making CLI a hard dependency of module import
+        from network_toolkit.cli import DeviceSession
+
+        session = DeviceSession(device, self._data.config)
+        started = time.monotonic()
+        session.connect()
+        self._limiter.record_success(time.monotonic() - started, key="connect")
+        self._pool[device] = session
+        return session
+
     def resolve_devices(
         self, devices: Iterable[str], groups: Iterable[str]
     ) -> list[str]:
@@ -157,35 +240,43 @@ class ExecutionService:
             return RunResult(total=total, successes=successes, failures=failures)
 
         async def run_device(device: str, commands: list[str]) -> DeviceRunResult:
-            async with self._sem:
-                if cancel and cancel.is_set():
-                    # Inform callbacks that we cancelled this device before starting
-                    try:
-                        cb.on_meta(f"{device}: cancelled before start")
-                    except Exception:
-                        pass
-                    return DeviceRunResult(
-                        device=device,
-                        ok=False,
-                        output_lines=[f"{device}: cancelled before start"],
-                    )
-                # Call into blocking runner, accommodating older test monkeypatches
-                from typing import Any, cast
-
-                def _invoke() -> Any:
-                    try:
-                        return self._run_device_blocking(device, commands, cb, cancel)
-                    except TypeError:
-                        # Back-compat for tests that monkeypatch a 3-param function
-                        return self._run_device_blocking(device, commands, cb)
-
-                result = await asyncio.to_thread(_invoke)
-                # _run_device_blocking may return DeviceRunResult (new) or bool (tests)
-                if hasattr(result, "device") and hasattr(result, "output_lines"):
-                    return cast(DeviceRunResult, result)
-                return DeviceRunResult(device=device, ok=bool(result), output_lines=[])
-
-        # Schedule lazily up to concurrency; stop scheduling once cancelled
+            # Concurrency is bounded by the scheduler below
+            if cancel and cancel.is_set():
+                # Inform callbacks that we cancelled this device before starting
+                try:
+                    cb.on_meta(f"{device}: cancelled before start")
+                except Exception:
+                    pass
+                return DeviceRunResult(
+                    device=device,
+                    ok=False,
+                    output_lines=[f"{device}: cancelled before start"],
+                )
+            # Call into blocking runner, accommodating older test monkeypatches
+            from typing import cast
+
+            def _invoke() -> Any:
+                try:
+                    return self._run_device_blocking(device, commands, cb, cancel)
+                except TypeError:
+                    # Back-compat for tests that monkeypatch a 3-param function
+                    return self._run_device_blocking(device, commands, cb)
+
+            result = await asyncio.to_thread(_invoke)
+            # _run_device_blocking may return DeviceRunResult (new) or bool (tests)
+            if hasattr(result, "device") and hasattr(result, "output_lines"):
+                return cast(DeviceRunResult, result)
+            return DeviceRunResult(device=device, ok=bool(result), output_lines=[])
+
+        def _progress() -> None:
+            if cb.on_progress is None:
+                return
+            try:
+                cb.on_progress(completed, total, self._limiter.limit)
+            except Exception:
+                pass
+
+        # Schedule lazily up to the adaptive limit; stop scheduling once cancelled
         items = list(plan.items())
         idx = 0
         active: set[asyncio.Task[DeviceRunResult]] = set()
@@ -194,13 +285,14 @@ class ExecutionService:
             nonlocal idx
             while (
                 idx < len(items)
-                and len(active) < self._concurrency
+                and len(active) < self._limiter.limit
                 and not (cancel and cancel.is_set())
             ):
                 dev, cmds = items[idx]
                 idx += 1
                 active.add(asyncio.create_task(run_device(dev, cmds)))
 
+        _progress()
         _schedule_next()
         while active:
             done, pending = await asyncio.wait(
@@ -221,6 +313,7 @@ class ExecutionService:
                     failures += 1
                 results_by_device[res.device] = res
                 cb.on_meta(f"progress: {completed}/{total}")
+            _progress()
             active = set(pending)
             if cancel and cancel.is_set():
                 cb.on_meta("cancellation requested; stopping scheduling")
@@ -244,42 +337,136 @@ class ExecutionService:
         cancel: CancellationToken | None = None,
     ) -> DeviceRunResult:
         ok = True
-        # Collect output lines for return (not emitted here); we stream per-command chunks
-        buf: list[str] = []
         try:
-            # Import here to avoid making CLI a hard dependency of module import
-            from network_toolkit.cli import DeviceSession
-
             cb.on_meta(f"{device}: connecting...")
             if cancel and cancel.is_set():
                 cb.on_meta(f"{device}: cancelled before connect")
-                return DeviceRunResult(device=device, ok=False, output_lines=buf)
-            with DeviceSession(device, self._data.config) as session:
-                # Make this session visible for hard-cancel
-                try:
-                    self._register_session(session)
-                except Exception:
-                    pass
-                cb.on_meta(f"{device}: connected")
-                for cmd in commands:
-                    if cancel and cancel.is_set():
-                        cb.on_meta(f"{device}: cancelled")
-                        ok = False
-                        break
-                    # Execute command and process output
-                    cb.on_meta(f"{device}$ {cmd}")
-                    try:
-                        text = session.execute_command(cmd)
-                        out_strip = text.strip()
-                        if out_strip:
-                            for line in text.rstrip().splitlines():
-                                cb.on_output(line)
-                    except Exception as e:
-                        ok = False
-                        cb.on_error(f"{device}: command error: {e}")
+                return DeviceRunResult(device=device, ok=False, output_lines=[])
+            pooled = self._pool.checkout(device)
+            try:
+                ok = self._run_on_session(device, pooled, commands, cb, cancel)
+            finally:
+                self._pool.checkin(device)
             cb.on_meta(f"{device}: done")
         except Exception as e:
             ok = False
+            self._limiter.record_failure(e)
             cb.on_error(f"{device}: Failed: {e}")
-        # Return whatever we collected (may be empty) on failure
+        # Output is streamed per command; nothing is buffered for the caller
         return DeviceRunResult(device=device, ok=ok, output_lines=[])
+
+    def _execute_timed(
+        self,
+        session: Any,
+        command: str,
+        emit: Callable[[str], None],
+        cancel: CancellationToken | None,
+    ) -> bool:
+        """Run a command, emitting its output as it arrives.
+
+        The command latency is fed to the limiter. Returns False when the
+        run was cancelled before the command finished.
+        """
+        started = time.monotonic()
+        stream = getattr(session, "stream_command", None)
+        if stream is None:
+            text = session.execute_command(command)
+            if text.strip():
+                emit(text.rstrip())
+        else:
+            chunks = stream(command)
+            pending = ""
+            try:
+                for chunk in chunks:
+                    # Chunks may end mid-line; emit whole lines only, without
+                    # the newline that ends the block
+                    lines, newline, pending = (pending + chunk).rpartition("\n")
+                    if newline:
+                        emit(lines)
+                    if cancel and cancel.is_set():
+                        return False
+            finally:
+                chunks.close()
+                if pending.strip():
+                    emit(pending)
+        self._limiter.record_success(time.monotonic() - started, key=command)
+        return True
+
+    @staticmethod
+    def _emit_output(cb: RunCallbacks, device: str, text: str) -> None:
+        """Hand a block of command output to the UI."""
+        if cb.on_device_output is not None:
+            cb.on_device_output(device, text)
+        else:
+            cb.on_output(text)
+
+    def _run_on_session(
+        self,
+        device: str,
+        pooled: Any,
+        commands: list[str],
+        cb: RunCallbacks,
+        cancel: CancellationToken | None,
+    ) -> bool:
+        reused = pooled is not None and bool(getattr(pooled, "is_connected", False))
+        if reused:
+            session = pooled
+            cb.on_meta(f"{device}: connected (reused session)")
+        else:
+            if pooled is not None:
+                self._discard_session(pooled)
+            session = self._open_session(device)
+            cb.on_meta(f"{device}: connected")
+        # Make this session visible for hard-cancel
+        self._register_session(session)
+        ok = True
+        emitted = False
+
+        def emit(text: str) -> None:
+            nonlocal emitted
+            emitted = True
+            self._emit_output(cb, device, text)
+
+        try:
+            for index, cmd in enumerate(commands):
+                if cancel and cancel.is_set():
+                    cb.on_meta(f"{device}: cancelled")
+                    ok = False
+                    break
+                cb.on_meta(f"{device}$ {cmd}")
+                try:
+                    finished = self._execute_timed(session, cmd, emit, cancel)
+                except Exception as e:
+                    if (
+                        emitted
+                        or not (reused and index == 0)
+                        or (cancel and cancel.is_set())
+                    ):
+                        ok = False
+                        self._limiter.record_failure(e)
+                        cb.on_error(f"{device}: command error: {e}")
+                        continue
+                    # A pooled connection may have gone stale (idle drop,
+                    # reboot); retry the first command once on a fresh one
+                    cb.on_meta(f"{device}: pooled session stale, reconnecting...")
+                    self._unregister_session(session)
+                    self._discard_session(session)
+                    session = self._open_session(device)
+                    self._register_session(session)
+                    try:
+                        finished = self._execute_timed(session, cmd, emit, cancel)
+                    except Exception as retry_error:
+                        ok = False
+                        self._limiter.record_failure(retry_error)
+                        cb.on_error(f"{device}: command error: {retry_error}")
+                        continue
+                if not finished:
+                    # The device is still sending output for the abandoned
+                    # command; the session cannot be reused
+                    cb.on_meta(f"{device}: cancelled")
+                    self._discard_session(session)
+                    ok = False
+                    break
+        finally:
+            self._unregister_session(session)
+        return ok
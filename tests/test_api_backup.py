@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import gzip
+import json
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
@@ -116,3 +118,45 @@ def test_run_backup_failure(
     assert result.totals.failed == 1
     assert not result.device_results[0].success
     assert "Backup failed" in str(result.device_results[0].error)
+    assert result.metrics is not None
+    assert result.metrics.failed == 1
+    assert result.metrics.failures_by_class == {"Unclassified": 1}
+
+
+def test_run_backup_collects_metrics(
+    sample_config: NetworkConfig,
+    patch_device_session: None,
+    mock_platform_ops: MagicMock,
+    tmp_path: Path,
+) -> None:
+    sample_config.general.backup_dir = str(tmp_path)
+
+    result = run_backup(
+        BackupOptions(target="test_device1,unknown_device", config=sample_config)
+    )
+
+    metrics = result.metrics
+    assert metrics is not None
+    assert metrics.devices == 2
+    assert metrics.succeeded == 1
+    assert metrics.failures_by_class == {"UnknownTarget": 1}
+    assert metrics.duration == result.duration
+
+
+def test_run_backup_compresses_text_outputs(
+    sample_config: NetworkConfig,
+    patch_device_session: None,
+    mock_platform_ops: MagicMock,
+    tmp_path: Path,
+) -> None:
+    sample_config.general.backup_dir = str(tmp_path)
+    sample_config.general.results_compression = "gzip"
+
+    result = run_backup(BackupOptions(target="test_device1", config=sample_config))
+
+    device_result = result.device_results[0]
+    assert device_result.backup_dir is not None
+    backup_file = device_result.backup_dir / "config.rsc.gz"
+    assert gzip.decompress(backup_file.read_bytes()) == b"dummy config"
+    manifest = json.loads((device_result.backup_dir / "manifest.json").read_text())
+    assert manifest["text_outputs"] == ["config.rsc.gz"]
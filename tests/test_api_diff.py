@@ -2,7 +2,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from network_toolkit.api.diff import DiffOptions, diff_targets
+from network_toolkit.api.diff import DiffOptions, diff_files, diff_targets
+from network_toolkit.api.state_diff import IgnoreRuleSet
 from network_toolkit.config import NetworkConfig
 
 
@@ -81,3 +82,65 @@ def test_diff_baseline_no_change(mock_session_cls, mock_config, tmp_path):
     result = diff_targets(options)
 
     assert result.results[0].outcome.changed is False
+
+
+def test_ignore_rule_set_filters_line_iterators():
+    rules = IgnoreRuleSet.compile([r"^uptime", r"counter \d+"])
+
+    lines = ["hostname r1", "uptime 5d", "x counter 42", "vlan 10"]
+
+    assert list(rules.filter(lines)) == ["hostname r1", "vlan 10"]
+    assert rules.matches("uptime 1h")
+    assert not IgnoreRuleSet.compile(None)
+
+
+def test_ignore_rule_set_with_builtin_merges_patterns():
+    rules = IgnoreRuleSet.compile([r"^uptime"])
+
+    merged = rules.with_builtin
+
+    assert merged is rules.with_builtin
+    assert merged.matches("! comment")
+    assert merged.matches("uptime 5d")
+    assert not rules.matches("! comment")
+
+
+def test_diff_options_compiles_ignore_rules_once(mock_config):
+    options = DiffOptions(
+        targets="dev1",
+        subject="config",
+        config=mock_config,
+        ignore_patterns=[r"^uptime"],
+    )
+
+    assert options.ignore_rules is options.ignore_rules
+
+
+def test_diff_files_heuristic_applies_user_ignore_patterns(tmp_path):
+    file_a = tmp_path / "a.txt"
+    file_b = tmp_path / "b.txt"
+    file_a.write_text("interface ether1\n mtu 1500\nserial ABC\n", encoding="utf-8")
+    file_b.write_text("interface ether1\n mtu 1500\nserial XYZ\n", encoding="utf-8")
+
+    assert diff_files(file_a, file_b, heuristic=True).changed is True
+    outcome = diff_files(file_a, file_b, heuristic=True, ignore_patterns=[r"^serial"])
+    assert outcome.changed is False
+
+
+def test_diff_files_heuristic_ignores_headers_before_segmenting(tmp_path):
+    file_a = tmp_path / "a.txt"
+    file_b = tmp_path / "b.txt"
+    file_a.write_text(
+        "interface ether1\n mtu 1500\nlast-change 1\n speed 1G\n", encoding="utf-8"
+    )
+    file_b.write_text(
+        "interface ether1\n mtu 1500\nlast-change 2\n speed 10G\n", encoding="utf-8"
+    )
+
+    outcome = diff_files(
+        file_a, file_b, heuristic=True, ignore_patterns=[r"^last-change"]
+    )
+
+    # The ignored header does not open a block; its children stay with the
+    # interface, as when ignore patterns pre-filtered the raw text
+    assert "interface ether1: speed 1G -> speed 10G" in outcome.output
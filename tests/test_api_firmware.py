@@ -95,3 +95,50 @@ def test_upgrade_firmware_file_not_found(mock_config):
 
     with pytest.raises(NetworkToolkitError, match="Firmware file not found"):
         upgrade_firmware(options)
+
+
+@patch("network_toolkit.api.firmware.check_operation_support")
+@patch("network_toolkit.api.firmware.get_platform_file_extensions")
+@patch("network_toolkit.api.firmware.DeviceSession")
+def test_upgrade_firmware_wait_ready_fails_unready_devices(
+    mock_session_cls,
+    mock_get_exts,
+    mock_check_support,
+    mock_config,
+    tmp_path,
+):
+    from network_toolkit.api.readiness import DeviceReadiness
+
+    firmware_file = tmp_path / "firmware.bin"
+    firmware_file.touch()
+    mock_check_support.return_value = (True, None)
+    mock_get_exts.return_value = [".bin"]
+    mock_platform_ops = MagicMock()
+    mock_platform_ops.firmware_upgrade.return_value = True
+    readiness = {"dev1": DeviceReadiness("dev1", ready=False, message="Timed out")}
+
+    with (
+        patch(
+            "network_toolkit.api.firmware.get_platform_operations",
+            return_value=mock_platform_ops,
+        ),
+        patch(
+            "network_toolkit.api.firmware.wait_for_rebooted_devices",
+            return_value=readiness,
+        ) as mock_wait,
+    ):
+        result = upgrade_firmware(
+            FirmwareUpgradeOptions(
+                target="dev1",
+                firmware_file=firmware_file,
+                config=mock_config,
+                wait_ready=True,
+                ready_timeout=30.0,
+            )
+        )
+
+    mock_wait.assert_called_once_with(mock_config, ["dev1"], timeout=30.0)
+    assert result.success_count == 0
+    assert result.failed_count == 1
+    assert result.results[0].readiness is not None
+    assert result.results[0].readiness.message == "Timed out"
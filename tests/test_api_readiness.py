@@ -0,0 +1,198 @@
+"""Tests for the post-reboot readiness poller."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from network_toolkit.api.readiness import (
+    ReadinessOptions,
+    wait_for_devices_ready,
+    wait_for_devices_ready_async,
+)
+from network_toolkit.config import NetworkConfig
+from network_toolkit.exceptions import NetworkToolkitError
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _config(ports: dict[str, int]) -> MagicMock:
+    config = MagicMock(spec=NetworkConfig)
+    config.devices = {
+        name: MagicMock(
+            host="127.0.0.1",
+            port=port,
+            overrides=None,
+            device_type="mikrotik_routeros",
+            bastion=None,
+        )
+        for name, port in ports.items()
+    }
+    config.general = MagicMock(port=22, bastions_from_ssh_config=False)
+    return config
+
+
+def _fast_options(config: MagicMock, devices: list[str], **kwargs) -> ReadinessOptions:
+    defaults = {
+        "timeout": 2.0,
+        "initial_delay": 0.0,
+        "probe_interval": 0.02,
+        "max_probe_interval": 0.05,
+        "connect_timeout": 0.2,
+    }
+    defaults.update(kwargs)
+    return ReadinessOptions(devices=devices, config=config, **defaults)
+
+
+@pytest.mark.asyncio
+async def test_devices_become_ready_concurrently() -> None:
+    ports = {"r1": _free_port(), "r2": _free_port()}
+    config = _config(ports)
+
+    async def _accept(_reader, writer) -> None:
+        writer.close()
+
+    # r1 is up right away, r2 comes back a little later
+    server1 = await asyncio.start_server(_accept, "127.0.0.1", ports["r1"])
+    servers = [server1]
+
+    async def _boot_r2() -> None:
+        await asyncio.sleep(0.15)
+        servers.append(await asyncio.start_server(_accept, "127.0.0.1", ports["r2"]))
+
+    checked: list[tuple[str, str]] = []
+
+    def _fake_check(device_name, _config, command) -> str:
+        checked.append((device_name, command))
+        return "routeros 7.15"
+
+    try:
+        with patch("network_toolkit.api.readiness._run_check", _fake_check):
+            boot = asyncio.create_task(_boot_r2())
+            result = await wait_for_devices_ready_async(
+                _fast_options(config, ["r1", "r2"], expected_version="7.15")
+            )
+            await boot
+    finally:
+        for server in servers:
+            server.close()
+
+    assert result.ready_count == 2
+    by_name = {r.device_name: r for r in result.results}
+    assert by_name["r2"].probes > 1
+    assert by_name["r1"].time_to_ready is not None
+    assert by_name["r2"].time_to_ready is not None
+    assert by_name["r2"].time_to_ready > by_name["r1"].time_to_ready
+    assert ("r1", "/system/package/print") in checked
+
+
+def test_unreachable_device_times_out() -> None:
+    config = _config({"r1": _free_port()})
+
+    result = wait_for_devices_ready(_fast_options(config, ["r1"], timeout=0.2))
+
+    status = result.results[0]
+    assert result.not_ready_count == 1
+    assert status.ready is False
+    assert status.time_to_port is None
+    assert "Timed out" in status.message
+
+
+@pytest.mark.asyncio
+async def test_failed_ssh_check_retries_and_version_mismatch_fails() -> None:
+    port = _free_port()
+    config = _config({"r1": port})
+
+    async def _accept(_reader, writer) -> None:
+        writer.close()
+
+    attempts = {"n": 0}
+
+    def _flaky_check(_device_name, _config, _command) -> str:
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            msg = "Authentication not ready"
+            raise NetworkToolkitError(msg)
+        return "routeros 7.14"
+
+    server = await asyncio.start_server(_accept, "127.0.0.1", port)
+    try:
+        with patch("network_toolkit.api.readiness._run_check", _flaky_check):
+            result = await wait_for_devices_ready_async(
+                _fast_options(config, ["r1"], expected_version="7.15")
+            )
+    finally:
+        server.close()
+
+    status = result.results[0]
+    assert attempts["n"] == 2
+    assert status.ready is False
+    assert "7.15" in status.message
+    assert status.check_output == "routeros 7.14"
+
+
+def test_unknown_device_raises() -> None:
+    with pytest.raises(NetworkToolkitError, match="not found"):
+        wait_for_devices_ready(_fast_options(_config({}), ["ghost"]))
+
+
+def test_slow_check_is_cut_off_at_the_timeout(sample_config: NetworkConfig) -> None:
+    seen: list[NetworkConfig] = []
+
+    def _hanging_check(_device_name, config, _command) -> str:
+        seen.append(config)
+        time.sleep(1.0)
+        return "routeros 7.15"
+
+    async def _port_open(*_args) -> bool:
+        return True
+
+    started = time.monotonic()
+    with (
+        patch("network_toolkit.api.readiness._probe_port", _port_open),
+        patch("network_toolkit.api.readiness._run_check", _hanging_check),
+    ):
+        result = wait_for_devices_ready(
+            _fast_options(sample_config, ["test_device1"], timeout=0.3)
+        )
+
+    assert time.monotonic() - started < 0.9
+    status = result.results[0]
+    assert status.ready is False
+    assert "did not finish" in status.message
+    # Checks connect once; retries would outlast the deadline
+    assert seen[0].general.connection_retries == 1
+    assert sample_config.general.connection_retries != 1
+
+
+@pytest.mark.asyncio
+async def test_bastion_devices_skip_the_port_probe() -> None:
+    # Nothing listens locally; the device is only reachable via its bastion
+    config = _config({"r1": _free_port()})
+    config.devices["r1"].bastion = "ops@jump:2222"
+    config.bastions = {}
+    config.general.bastion_max_sessions = 4
+    checked: list[str] = []
+
+    def _fake_check(device_name, _config, _command) -> str:
+        checked.append(device_name)
+        if len(checked) < 2:
+            msg = "Connection refused"
+            raise OSError(msg)
+        return "routeros 7.15"
+
+    with patch("network_toolkit.api.readiness._run_check", _fake_check):
+        result = await wait_for_devices_ready_async(_fast_options(config, ["r1"]))
+
+    status = result.results[0]
+    assert status.ready
+    assert checked == ["r1", "r1"]
+    assert status.time_to_port is None
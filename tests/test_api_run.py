@@ -85,6 +85,36 @@ def test_run_commands_single_device_command(
     assert result.results_dir.exists()
 
 
+def test_run_commands_drops_paths_of_failed_writes(
+    sample_config: NetworkConfig,
+    tmp_path: Path,
+    patch_device_session: Callable[[DummyDeviceSession], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    patch_device_session(DummyDeviceSession)
+
+    def _fail(*_args: Any, **_kwargs: Any) -> None:
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    monkeypatch.setattr(
+        "network_toolkit.results_enhanced.ResultsManager._write_result_file", _fail
+    )
+    options = RunOptions(
+        target="test_device1",
+        command_or_sequence="/system/clock/print",
+        config=sample_config,
+        store_results=True,
+        results_dir=str(tmp_path),
+    )
+
+    result = run_commands(options)
+
+    assert result.command_results[0].output == "test_device1:/system/clock/print"
+    assert result.command_results[0].stored_path is None
+    assert any("could not be written" in notice for notice in result.notices)
+
+
 def test_run_commands_group_sequence(
     sample_config: NetworkConfig,
     patch_device_session: Callable[[DummyDeviceSession], None],
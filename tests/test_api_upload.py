@@ -10,6 +10,8 @@ import pytest
 from network_toolkit.api.upload import UploadOptions, upload_file
 from network_toolkit.config import NetworkConfig
 
+SOURCES_SEEN: list[Any] = []
+
 
 class DummyDeviceSession:
     """In-memory DeviceSession replacement for tests."""
@@ -34,7 +36,9 @@ class DummyDeviceSession:
         *,
         verify_upload: bool = True,
         verify_checksum: bool = False,
+        source: Any = None,
     ) -> bool:
+        SOURCES_SEEN.append(source)
         return True
 
 
@@ -84,3 +88,25 @@ def test_upload_group(
     assert result.is_group
     assert result.totals.succeeded == 2
     assert len(result.device_results) == 2
+
+
+def test_upload_group_shares_one_source(
+    sample_config: NetworkConfig,
+    patch_device_session: None,
+    tmp_path: Path,
+) -> None:
+    local_file = tmp_path / "upload.txt"
+    local_file.write_text("content")
+    SOURCES_SEEN.clear()
+
+    upload_file(
+        UploadOptions(
+            target="test_device1,test_device2",
+            local_file=local_file,
+            config=sample_config,
+        )
+    )
+
+    assert len(SOURCES_SEEN) == 2
+    assert SOURCES_SEEN[0] is not None
+    assert SOURCES_SEEN[0] is SOURCES_SEEN[1]
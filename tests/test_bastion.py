@@ -0,0 +1,312 @@
+"""Tests for bastion routing, session limits and load spreading."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from network_toolkit import bastion
+from network_toolkit.api.execution import execute_parallel
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.bastion import (
+    BastionRoute,
+    BastionSlots,
+    bastion_key,
+    bastion_route,
+    get_bastion_slots,
+    parse_jump_spec,
+    proxy_command,
+    spread_across_bastions,
+)
+from network_toolkit.config import NetworkConfig
+from network_toolkit.device import DeviceSession
+from network_toolkit.exceptions import ConfigurationError, DeviceConnectionError
+from network_toolkit.session_pool import SessionPool
+from network_toolkit.ssh_multiplex import SharedTransportPool
+
+
+@pytest.fixture(autouse=True)
+def _env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("NW_USER_DEFAULT", "admin")
+    monkeypatch.setenv("NW_PASSWORD_DEFAULT", "secret")
+
+
+def _config(**general: object) -> NetworkConfig:
+    return NetworkConfig.model_validate(
+        {
+            "general": general,
+            "bastions": {
+                "zrh": {"host": "jump-zrh.example.net", "user": "ops"},
+                "gva": {"host": "jump-gva.example.net", "max_sessions": 2},
+            },
+            "devices": {
+                "zrh-1": {"host": "10.1.0.1", "bastion": "zrh"},
+                "zrh-2": {"host": "10.1.0.2", "bastion": "zrh"},
+                "gva-1": {"host": "10.2.0.1", "bastion": "gva"},
+                "lab-1": {"host": "10.9.0.1", "bastion": "me@lab-jump:2222"},
+                "local": {"host": "192.168.1.1"},
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("jump", (None, "jump", None)),
+        ("ops@jump:2222", ("ops", "jump", 2222)),
+        ("ops@[2001:db8::1]:22", ("ops", "2001:db8::1", 22)),
+        ("2001:db8::1", (None, "2001:db8::1", None)),
+    ],
+)
+def test_parse_jump_spec(
+    spec: str, expected: tuple[str | None, str, int | None]
+) -> None:
+    assert parse_jump_spec(spec) == expected
+
+
+def test_routes_from_config() -> None:
+    config = _config(bastion_max_sessions=5)
+
+    assert bastion_route(config, "zrh-1") == BastionRoute(
+        name="zrh", host="jump-zrh.example.net", port=22, user="ops", max_sessions=5
+    )
+    assert bastion_route(config, "gva-1").max_sessions == 2  # type: ignore[union-attr]
+    assert bastion_route(config, "lab-1") == BastionRoute(
+        name="me@lab-jump:2222", host="lab-jump", port=2222, user="me", max_sessions=5
+    )
+    assert bastion_route(config, "local") is None
+
+    assert config.devices is not None
+    config.devices["local"].bastion = "a,b"
+    with pytest.raises(ConfigurationError, match="multi-hop"):
+        bastion_route(config, "local")
+
+
+def test_routes_from_ssh_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text(
+        "Host jump-*\n"
+        "  HostName %h.example.net\n"
+        "  User ops\n"
+        "  IdentityFile ~/.ssh/jump\n"
+        "Host 10.1.*\n"
+        "  ProxyJump jump-zrh\n"
+        "Host 10.3.*\n"
+        "  ProxyJump a,b\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(bastion, "USER_SSH_CONFIG", ssh_config)
+    config = NetworkConfig.model_validate(
+        {
+            "general": {"bastions_from_ssh_config": True},
+            "devices": {
+                "zrh-1": {"host": "10.1.0.1"},
+                "multi": {"host": "10.3.0.1"},
+                "local": {"host": "192.168.1.1"},
+            },
+        }
+    )
+
+    route = bastion_route(config, "zrh-1")
+
+    assert route == BastionRoute(
+        name="jump-zrh",
+        host="jump-zrh",
+        user="ops",
+        hostname="jump-zrh.example.net",
+        identity_file="~/.ssh/jump",
+    )
+    assert route.address == ("jump-zrh.example.net", 22)
+    assert bastion_route(config, "multi") is None
+    assert bastion_route(config, "local") is None
+
+
+def test_system_transport_tunnels_through_bastion_master(tmp_path: Path) -> None:
+    config = _config(ssh_control_persist=45)
+
+    params = config.get_device_connection_params("zrh-1")
+    open_cmd = params["transport_options"]["open_cmd"]
+
+    assert open_cmd[0] == "-o"
+    command = open_cmd[1].removeprefix("ProxyCommand=")
+    assert command == proxy_command(bastion_route(config, "zrh-1"), 45)  # type: ignore[arg-type]
+    assert command.startswith("ssh -o ControlMaster=auto -o ControlPath=")
+    assert f"{tmp_path}/networka/cm/%%C" in command
+    assert command.endswith("-p 22 -l ops -W %h:%p jump-zrh.example.net")
+    assert "transport_options" not in config.get_device_connection_params("local")
+
+
+@pytest.mark.parametrize("transport", ["paramiko", "ssh2"])
+def test_non_system_transports_reject_bastions(transport: str) -> None:
+    config = _config(transport=transport)
+
+    with pytest.raises(ConfigurationError, match="needs the system transport"):
+        DeviceSession("lab-1", config)
+    DeviceSession("local", config)
+
+
+def test_slots_cap_concurrent_sessions() -> None:
+    slots = BastionSlots()
+    route = BastionRoute(name="gva", host="jump", max_sessions=2)
+    peak = 0
+    lock = threading.Lock()
+
+    def _session() -> None:
+        nonlocal peak
+        slots.acquire(route)
+        with lock:
+            peak = max(peak, slots.in_use("gva"))
+        time.sleep(0.01)
+        slots.release(route)
+
+    threads = [threading.Thread(target=_session) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert slots.in_use("gva") == 0
+
+
+def test_session_holds_slot_only_while_active() -> None:
+    session = DeviceSession("gva-1", _config())
+    slots = get_bastion_slots()
+    seen: list[int] = []
+
+    def _send_command(_command: str) -> MagicMock:
+        seen.append(slots.in_use("gva"))
+        return MagicMock(result="ok", failed=False)
+
+    with patch("network_toolkit.device.get_transport_factory") as factory:
+        transport = factory.return_value.create_transport.return_value
+        transport._raw_driver = None
+        transport.send_command.side_effect = _send_command
+        session.connect()
+        assert slots.in_use("gva") == 0
+        session.execute_commands(["/a", "/b"])
+        assert seen == [1, 1]
+        assert slots.in_use("gva") == 0
+        session.disconnect()
+
+        factory.return_value.create_transport.side_effect = TypeError("bad")
+        with pytest.raises(Exception, match="Invalid configuration"):
+            session.connect()
+        assert slots.in_use("gva") == 0
+
+
+def test_slot_wait_times_out() -> None:
+    slots = BastionSlots()
+    route = BastionRoute(name="gva", host="jump", max_sessions=1)
+    slots.acquire(route)
+
+    with pytest.raises(DeviceConnectionError, match="No free session on bastion"):
+        slots.acquire(route, timeout=0.01)
+    slots.release(route)
+    assert slots.in_use("gva") == 0
+
+
+def test_pooled_sessions_do_not_exhaust_bastion_slots(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config = NetworkConfig.model_validate(
+        {
+            "general": {"bastion_max_sessions": 2, "bastion_wait_timeout": 5},
+            "devices": {
+                f"sw-{i}": {"host": f"10.3.0.{i}", "bastion": "ops@jump-bsl"}
+                for i in range(5)
+            },
+        }
+    )
+    factory = MagicMock()
+    transport = factory.return_value.create_transport.return_value
+    transport._raw_driver = None
+    transport.send_command.return_value = MagicMock(result="ok", failed=False)
+    monkeypatch.setattr("network_toolkit.device.get_transport_factory", factory)
+    pool = SessionPool()
+
+    result = run_commands(
+        RunOptions(
+            target=",".join(config.devices or {}),
+            command_or_sequence="/system/identity/print",
+            config=config,
+            session_pool=pool,
+        )
+    )
+
+    assert result.totals.failed == 0
+    assert result.totals.succeeded == 5
+    assert len(pool) == 5
+    assert all(pool[name].is_connected for name in pool.keys())
+    assert get_bastion_slots().in_use("ops@jump-bsl") == 0
+    pool.close_all()
+
+
+def test_parallel_runs_spread_across_bastions() -> None:
+    config = _config()
+    devices = ["zrh-1", "zrh-2", "gva-1", "lab-1", "local"]
+    key = bastion_key(config)
+    assert key is not None
+    started: list[str] = []
+
+    results = execute_parallel(
+        devices, lambda d: started.append(d) or d.upper(), 1, spread_key=key
+    )
+
+    assert spread_across_bastions(devices, key) == [0, 2, 3, 4, 1]
+    assert started == ["zrh-1", "gva-1", "lab-1", "local", "zrh-2"]
+    assert results == [d.upper() for d in devices]
+    assert bastion_key(NetworkConfig(devices={})) is None
+
+
+def test_transfers_share_one_bastion_connection() -> None:
+    pool = SharedTransportPool()
+    route = BastionRoute(name="zrh", host="jump", user="ops")
+
+    with patch("paramiko.SSHClient") as client_class:
+        bastion_transport = client_class.return_value.get_transport.return_value
+        pool.tunnel(route, "10.1.0.1", 22)
+        pool.tunnel(route, "10.1.0.2", 22)
+
+    client_class.assert_called_once()
+    client_class.return_value.connect.assert_called_once_with(
+        "jump",
+        port=22,
+        username="ops",
+        key_filename=None,
+        allow_agent=True,
+        look_for_keys=True,
+    )
+    assert [c.args[1] for c in bastion_transport.open_channel.call_args_list] == [
+        ("10.1.0.1", 22),
+        ("10.1.0.2", 22),
+    ]
+    pool.close_all()
+    client_class.return_value.close.assert_called_once()
+
+
+def test_device_transfer_runs_over_bastion_channel(tmp_path: Path) -> None:
+    session = DeviceSession("zrh-1", _config())
+    session._connected = True
+    channel = MagicMock()
+    local = tmp_path / "backup.rsc"
+    local.write_text("config")
+
+    with (
+        patch.object(SharedTransportPool, "tunnel", return_value=channel) as tunnel,
+        patch("paramiko.Transport") as transport_class,
+        patch("paramiko.SFTPClient.from_transport") as sftp_from_transport,
+    ):
+        sftp_from_transport.return_value.stat.return_value.st_size = 6
+        assert session.download_file("backup.rsc", local)
+
+    assert tunnel.call_args.args[1:] == ("10.1.0.1", 22)
+    transport_class.assert_called_once_with(channel)
@@ -69,7 +69,7 @@ class TestGeneralConfig:
     def test_results_format_validation(self) -> None:
         """Test results format validation."""
         # Valid formats
-        for fmt in ["txt", "json", "yaml", "TXT", "JSON", "YAML"]:
+        for fmt in ["txt", "json", "yaml", "jsonl", "sqlite", "TXT", "JSON", "YAML"]:
             config = GeneralConfig(results_format=fmt)
             assert config.results_format == fmt.lower()
 
@@ -0,0 +1,74 @@
+"""Tests for the cached per-device-type connection parameter templates."""
+
+from __future__ import annotations
+
+import pytest
+
+from network_toolkit.config import DeviceConfig, GeneralConfig, NetworkConfig
+from network_toolkit.credentials import GENERIC_PROMPT_PATTERN, connection_template
+from network_toolkit.device import DeviceSession
+
+
+@pytest.fixture
+def config(monkeypatch: pytest.MonkeyPatch) -> NetworkConfig:
+    monkeypatch.setenv("NW_USER_DEFAULT", "admin")
+    monkeypatch.setenv("NW_PASSWORD_DEFAULT", "secret")
+    return NetworkConfig(
+        general=GeneralConfig(timeout=45),
+        devices={
+            "r1": DeviceConfig(host="10.0.0.1", device_type="cisco_ios", port=2222),
+            "r2": DeviceConfig(host="10.0.0.2", device_type="cisco_ios"),
+            "srv": DeviceConfig(host="10.0.0.3", device_type="linux"),
+        },
+    )
+
+
+def test_template_is_shared_and_read_only() -> None:
+    first = connection_template(
+        "cisco_ios", timeout=30, transport="system", ssh_config_file=True
+    )
+    second = connection_template(
+        "cisco_ios", timeout=30, transport="system", ssh_config_file=True
+    )
+
+    assert first is second
+    assert first["platform"] == "cisco_iosxe"
+    with pytest.raises(TypeError):
+        first["host"] = "10.0.0.1"  # type: ignore[index]
+
+
+def test_device_fields_overlay_the_template(config: NetworkConfig) -> None:
+    r1 = config.get_device_connection_params("r1")
+    r2 = config.get_device_connection_params("r2")
+    srv = config.get_device_connection_params("srv", "root", "pw")
+
+    assert r1 == {
+        "host": "10.0.0.1",
+        "auth_username": "admin",
+        "auth_password": "secret",
+        "port": 2222,
+        "timeout_socket": 45,
+        "timeout_transport": 45,
+        "transport": "system",
+        "ssh_config_file": True,
+        "platform": "cisco_iosxe",
+    }
+    assert (r2["host"], r2["port"]) == ("10.0.0.2", 22)
+    assert "platform" not in srv
+    assert srv["comms_prompt_pattern"] == GENERIC_PROMPT_PATTERN
+    assert (srv["auth_username"], srv["timeout_ops"]) == ("root", 60)
+
+    # Callers get their own dict; the shared template is never mutated
+    r1["host"] = "changed"
+    assert config.get_device_connection_params("r2")["host"] == "10.0.0.2"
+
+
+def test_session_defaults_only_fill_missing_keys(config: NetworkConfig) -> None:
+    config.general.ssh_strict_host_key_checking = True
+
+    params = DeviceSession("srv", config)._connection_params
+
+    assert params["auth_strict_key"] is True
+    assert params["channel_lock"] is True
+    assert params["timeout_socket"] == 45
+    assert params["timeout_ops"] == 60
@@ -0,0 +1,84 @@
+"""Tests for the per-config credential resolution cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from network_toolkit.config import DeviceConfig, GeneralConfig, NetworkConfig
+from network_toolkit.credentials import (
+    CredentialResolver,
+    get_credential_cache,
+)
+from network_toolkit.introspection import LoaderType
+
+
+@pytest.fixture
+def config(monkeypatch: pytest.MonkeyPatch) -> NetworkConfig:
+    monkeypatch.setenv("NW_USER_DEFAULT", "default_user")
+    monkeypatch.setenv("NW_PASSWORD_DEFAULT", "default_pass")
+    monkeypatch.setenv("NW_USER_SW1", "sw1_user")
+    return NetworkConfig(
+        general=GeneralConfig(),
+        devices={
+            "sw1": DeviceConfig(host="10.0.0.1", device_type="mikrotik_routeros"),
+            "sw2": DeviceConfig(host="10.0.0.2", device_type="mikrotik_routeros"),
+        },
+    )
+
+
+def test_repeated_resolution_is_served_from_cache(config: NetworkConfig) -> None:
+    cache = get_credential_cache(config)
+    assert cache is not None
+
+    with patch.object(
+        CredentialResolver,
+        "_get_group_credentials_with_source",
+        return_value=(None, None, None),
+    ) as group_scan:
+        for _ in range(3):
+            params = config.get_device_connection_params("sw1")
+
+    assert params["auth_username"] == "sw1_user"
+    assert params["auth_password"] == "default_pass"
+    # One resolution (user and password both consult groups), then cache hits
+    assert group_scan.call_count == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_keeps_provenance_and_keys_on_overrides(config: NetworkConfig) -> None:
+    resolver = CredentialResolver(config)
+
+    _, (user_src, pass_src) = resolver.resolve_credentials_with_source("sw1")
+    (user, password), (cli_src, _) = resolver.resolve_credentials_with_source(
+        "sw1", "cli_user", "cli_pass"
+    )
+
+    assert user_src.loader == LoaderType.ENV_VAR
+    assert user_src.identifier == "NW_USER_SW1"
+    assert pass_src.identifier == "NW_PASSWORD_DEFAULT"
+    assert (user, password) == ("cli_user", "cli_pass")
+    assert cli_src.loader == LoaderType.CLI
+    assert resolver.resolve_credentials("sw1") == ("sw1_user", "default_pass")
+
+
+def test_replaced_device_definition_is_resolved_again(config: NetworkConfig) -> None:
+    resolver = CredentialResolver(config)
+    assert resolver.resolve_credentials("sw2")[0] == "default_user"
+
+    assert config.devices is not None
+    config.devices["sw2"] = DeviceConfig(
+        host="10.0.0.2", device_type="mikrotik_routeros", user="inline"
+    )
+
+    assert resolver.resolve_credentials("sw2")[0] == "inline"
+
+
+def test_cache_is_scoped_to_the_config_instance(config: NetworkConfig) -> None:
+    CredentialResolver(config).resolve_credentials("sw1")
+    reloaded = NetworkConfig.model_validate(config.model_dump())
+
+    assert len(get_credential_cache(config) or ()) == 1
+    assert len(get_credential_cache(reloaded) or ()) == 0
+    assert "default_pass" not in repr(CredentialResolver(config).resolve("sw1"))
@@ -0,0 +1,99 @@
+"""Tests for bounded-memory line streaming and unified diffing."""
+
+from __future__ import annotations
+
+import difflib
+from pathlib import Path
+
+from network_toolkit.api.diff import diff_files
+from network_toolkit.api.diff_stream import (
+    iter_text_lines,
+    open_lines,
+    unified_diff_stream,
+)
+
+
+def _apply(a: list[str], diff: list[str]) -> list[str]:
+    """Apply unified diff body lines (without file headers) to ``a``."""
+    out: list[str] = []
+    pos = 0
+    for line in diff:
+        if line.startswith("@@"):
+            old = line.split()[1][1:]
+            start, _, length = old.partition(",")
+            begin = int(start) - 1 if length != "0" else int(start)
+            out.extend(a[pos:begin])
+            pos = begin
+        elif line.startswith(" "):
+            out.append(line[1:])
+            pos += 1
+        elif line.startswith("-"):
+            pos += 1
+        elif line.startswith("+"):
+            out.append(line[1:])
+    out.extend(a[pos:])
+    return out
+
+
+def test_open_lines_streams_file_lines(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.txt"
+    path.write_bytes(b"one\r\ntwo\nthree")
+
+    with open_lines(path) as lines:
+        assert list(lines) == ["one", "two", "three"]
+
+
+def test_open_lines_handles_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.txt"
+    path.write_text("", encoding="utf-8")
+
+    with open_lines(path) as lines:
+        assert list(lines) == []
+
+
+def test_iter_text_lines_matches_splitlines() -> None:
+    text = "a\nb\r\n\nc"
+    assert list(iter_text_lines(text)) == text.splitlines()
+
+
+def test_unified_diff_stream_matches_difflib_for_single_window() -> None:
+    a = [f"line {i}" for i in range(50)]
+    b = [*a[:10], "inserted", *a[10:30], *a[31:]]
+    b[40] = "changed"
+
+    expected = list(difflib.unified_diff(a, b, "base", "curr"))
+
+    assert list(unified_diff_stream(a, b, "base", "curr")) == expected
+
+
+def test_unified_diff_stream_identical_inputs_yield_nothing() -> None:
+    lines = [f"route {i}" for i in range(1000)]
+    assert list(unified_diff_stream(lines, iter(lines), chunk_lines=64)) == []
+
+
+def test_unified_diff_stream_resyncs_across_windows() -> None:
+    a = [f"route 10.{i // 256}.{i % 256}.0/24" for i in range(2000)]
+    b = list(a)
+    b.insert(5, "route 192.0.2.0/24")
+    del b[700]
+    b[1500] = "route 198.51.100.0/24"
+
+    diff = list(unified_diff_stream(a, b, "base", "curr", chunk_lines=100))
+
+    assert _apply(a, diff[2:]) == b
+    changed = [d for d in diff[2:] if d[:1] in "+-"]
+    assert len(changed) == 4
+
+
+def test_diff_files_streams_both_sides(tmp_path: Path) -> None:
+    file_a = tmp_path / "a.txt"
+    file_b = tmp_path / "b.txt"
+    file_a.write_text("x\ny\nz\n", encoding="utf-8")
+    file_b.write_text("x\nY\nz\n", encoding="utf-8")
+
+    outcome = diff_files(file_a, file_b)
+
+    assert outcome.changed is True
+    assert "-y" in outcome.output
+    assert "+Y" in outcome.output
+    assert diff_files(file_a, file_a).changed is False
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, patch
 import paramiko
 
 from network_toolkit.device import DeviceSession
+from network_toolkit.device_transfers import SharedUploadSource, calculate_file_checksum
 from network_toolkit.exceptions import DeviceExecutionError
 
 
@@ -88,6 +89,64 @@ class TestFileUpload(unittest.TestCase):
             # Clean up the temporary file
             Path(temp_file_path).unlink()
 
+    @patch("network_toolkit.device.time.sleep")
+    @patch("network_toolkit.device.calculate_file_checksum")
+    @patch("paramiko.Transport")
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_upload_file_with_shared_source(
+        self, mock_sftp_class, mock_transport_class, mock_checksum, _mock_sleep
+    ):
+        """Shared sources are streamed with putfo and hashed only once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local = Path(temp_dir) / "image.npk"
+            local.write_bytes(b"firmware" * 1000)
+            mock_sftp = MagicMock()
+            mock_sftp_class.return_value = mock_sftp
+            mock_transport_class.return_value = MagicMock()
+            self.device_session._verify_file_upload = MagicMock(return_value=True)
+
+            with SharedUploadSource(local) as source:
+                for _ in range(3):
+                    self.assertTrue(
+                        self.device_session.upload_file(
+                            local, verify_checksum=True, source=source
+                        )
+                    )
+                    reader = mock_sftp.putfo.call_args.args[0]
+                    reader.seek(0)
+                    self.assertEqual(reader.read(), local.read_bytes())
+
+            mock_sftp.put.assert_not_called()
+            self.assertEqual(mock_sftp.putfo.call_count, 3)
+            self.assertEqual(
+                mock_sftp.putfo.call_args.kwargs["file_size"], len(b"firmware") * 1000
+            )
+            mock_checksum.assert_not_called()
+            expected = calculate_file_checksum(local)
+            for call in self.device_session._verify_file_upload.call_args_list:
+                self.assertEqual(call.kwargs["expected_checksum"], expected)
+
+    def test_shared_upload_source_readers_are_independent(self):
+        """Each reader has its own cursor over the same mapping."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local = Path(temp_dir) / "image.bin"
+            local.write_bytes(bytes(range(256)) * 64)
+
+            with SharedUploadSource(local) as source:
+                first, second = source.reader(), source.reader()
+                self.assertEqual(first.read(10), bytes(range(10)))
+                self.assertEqual(second.read(3), bytes(range(3)))
+                self.assertEqual(first.tell(), 10)
+                rest = first.read()
+                self.assertEqual(len(rest), 256 * 64 - 10)
+                self.assertEqual(source.checksum(), calculate_file_checksum(local))
+
+            empty = Path(temp_dir) / "empty.bin"
+            empty.write_bytes(b"")
+            with SharedUploadSource(empty) as source:
+                self.assertEqual(source.size, 0)
+                self.assertEqual(source.reader().read(), b"")
+
     @patch("paramiko.Transport")
     def test_upload_file_authentication_error(self, mock_transport_class):
         """Test upload_file handles authentication errors."""
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from network_toolkit.config import DeviceConfig, NetworkConfig, load_modular_config
+from network_toolkit.inventory.catalog import get_inventory_catalog
+from network_toolkit.inventory.resolve import resolve_named_targets
+
+
+def _write_yaml(path: Path, content: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        yaml.safe_dump(content, f)
+
+
+def _load(tmp_path: Path) -> NetworkConfig:
+    devices = {
+        f"sw{i:02d}": {
+            "host": f"10.0.0.{i + 1}",
+            "device_type": "mikrotik_routeros",
+            "tags": ["core" if i % 2 else "edge", "site-a" if i < 5 else "site-b"],
+        }
+        for i in range(10)
+    }
+    _write_yaml(
+        tmp_path / "config.yml",
+        {
+            "inventory": {"discover_local": False},
+            "devices": devices,
+            "device_groups": {
+                "core": {"description": "core", "match_tags": ["core"]},
+                "core_a": {"description": "core a", "match_tags": ["core", "site-a"]},
+                "picked": {"description": "picked", "members": ["sw09", "sw01"]},
+            },
+        },
+    )
+    return load_modular_config(tmp_path)
+
+
+def test_overlapping_groups_dedupe_in_first_seen_order(tmp_path: Path) -> None:
+    cfg = _load(tmp_path)
+
+    result = resolve_named_targets(cfg, "picked,core_a,sw02,core,sw01")
+
+    assert result.resolved_devices == ["sw09", "sw01", "sw03", "sw02", "sw05", "sw07"]
+    assert result.unknown_targets == []
+
+
+def test_tag_index_matches_all_tags(tmp_path: Path) -> None:
+    cfg = _load(tmp_path)
+    catalog = get_inventory_catalog(cfg)
+    assert catalog is not None
+
+    assert catalog.devices_with_tags("config", ["core", "site-a"]) == ["sw01", "sw03"]
+    assert catalog.devices_with_tags("config", ["core", "missing"]) == []
+    assert catalog.devices_with_tags("other", ["core"]) == []
+
+
+def test_cached_resolution_reapplies_selections(tmp_path: Path) -> None:
+    cfg = _load(tmp_path)
+    first = resolve_named_targets(cfg, "core_a,nope")
+
+    # Callers may prune the config between runs; a cache hit must restore it.
+    cfg.devices = {}
+    cfg.device_groups = {}
+    second = resolve_named_targets(cfg, "core_a,nope")
+
+    assert second.resolved_devices == first.resolved_devices == ["sw01", "sw03"]
+    assert second.unknown_targets == ["nope"]
+    assert set(cfg.devices) == {"sw01", "sw03"}
+    assert set(cfg.device_groups or {}) == {"core_a"}
+
+
+def test_adding_a_source_invalidates_cached_resolutions(tmp_path: Path) -> None:
+    cfg = _load(tmp_path)
+    catalog = get_inventory_catalog(cfg)
+    assert catalog is not None
+    assert resolve_named_targets(cfg, "extra").unknown_targets == ["extra"]
+
+    version = catalog.version
+    catalog.add_source(
+        source_id="inv1",
+        kind="nornir_simple",
+        root=None,
+        inventory_file=None,
+        devices={"extra": DeviceConfig(host="10.9.9.9", device_type="linux")},
+        groups={},
+    )
+
+    assert catalog.version == version + 1
+    assert resolve_named_targets(cfg, "extra").resolved_devices == ["extra"]
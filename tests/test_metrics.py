@@ -0,0 +1,165 @@
+"""Tests for run-level metrics and the Prometheus textfile export."""
+
+from __future__ import annotations
+
+import json
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+from rich.console import Console
+
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.common.output import OutputManager, OutputMode
+from network_toolkit.config import NetworkConfig
+from network_toolkit.metrics import (
+    RunMetrics,
+    classify_failure,
+    percentile,
+    write_prometheus_textfile,
+)
+from network_toolkit.timing import TimingSpan
+
+
+def _span(name: str, duration: float, error: str | None = None, **attrs: Any) -> Any:
+    return TimingSpan(
+        name=name, start=0.0, duration=duration, attributes=attrs, error=error
+    )
+
+
+def _metrics() -> RunMetrics:
+    metrics = RunMetrics("backup", "core")
+    for i in range(1, 11):
+        metrics.observe_device(
+            [
+                _span("connect", i / 10, attempts=2 if i == 10 else 1),
+                _span("command", 0.01 * i, bytes_received=100),
+                _span("transfer.download", 0.5, bytes=1000),
+            ]
+        )
+    metrics.observe_device(
+        [_span("connect", 3.0, error="DeviceConnectionError: refused", attempts=3)],
+        error="refused",
+    )
+    metrics.observe_device([], error="no backup sequence")
+    metrics.observe_unresolved(1)
+    metrics.finish(30.0)
+    return metrics
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([2.0], 0.99) == 2.0
+
+
+def test_classify_failure_uses_first_failed_span() -> None:
+    spans = [_span("connect", 1.0), _span("command", 1.0, error="TimeoutError: x")]
+    assert classify_failure(spans) == "TimeoutError"
+    assert classify_failure([]) == "Unclassified"
+
+
+def test_run_metrics_aggregates_devices() -> None:
+    metrics = _metrics()
+
+    assert metrics.devices == 13
+    assert metrics.failed == 3
+    assert metrics.succeeded == 10
+    assert metrics.devices_per_minute == 26.0
+    assert metrics.retries == 3
+    assert metrics.bytes_transferred == 10_000
+    assert metrics.bytes_received == 1_000
+    assert metrics.failures_by_class == {
+        "DeviceConnectionError": 1,
+        "Unclassified": 1,
+        "UnknownTarget": 1,
+    }
+    connect = metrics.connect_latency
+    assert connect.count == 11
+    assert connect.p50 == 0.6
+    assert connect.p99 == 3.0
+    json.dumps(metrics.to_dict())
+
+
+def test_prometheus_textfile_is_written_atomically(tmp_path: Path) -> None:
+    target = tmp_path / "collector" / "networka.prom"
+    written = write_prometheus_textfile(_metrics(), target)
+
+    assert written == target
+    assert [p.name for p in target.parent.iterdir()] == ["networka.prom"]
+    text = target.read_text()
+    labels = 'operation="backup",target="core"'
+    assert "# TYPE networka_run_devices gauge" in text
+    assert f"networka_run_devices{{{labels}}} 13" in text
+    assert "# TYPE networka_run_connect_seconds summary" in text
+    assert f'networka_run_connect_seconds{{{labels},quantile="0.95"}} 3.0' in text
+    assert f"networka_run_command_seconds_count{{{labels}}} 10" in text
+    assert (
+        f'networka_run_failures{{{labels},error_class="DeviceConnectionError"}} 1'
+        in text
+    )
+    assert text.endswith("\n")
+
+
+def test_prometheus_labels_are_escaped() -> None:
+    metrics = RunMetrics("run", 'a"b\\c')
+    metrics.finish(1.0)
+    assert 'target="a\\"b\\\\c"' in metrics.to_prometheus()
+
+
+def test_print_summary_renders_metrics_table() -> None:
+    manager = OutputManager(OutputMode.NO_COLOR)
+    buffer = StringIO()
+    manager._console = Console(file=buffer, width=120, color_system=None)
+
+    manager.print_summary(
+        target="core",
+        operation_type="Backup",
+        name="backup_config",
+        duration=30.0,
+        is_group=True,
+        totals=(13, 10, 3),
+        metrics=_metrics(),
+    )
+
+    output = buffer.getvalue()
+    assert "Run Metrics" in output
+    assert "Devices/min" in output
+    assert "26.0" in output
+    assert "Failures: DeviceConnectionError" in output
+
+
+class _Session:
+    def __init__(self, device_name: str, *_args: Any) -> None:
+        self.device_name = device_name
+
+    def __enter__(self) -> _Session:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        return None
+
+    def execute_command(self, command: str) -> str:
+        return "ok"
+
+
+def test_run_metrics_count_unresolved_targets(
+    sample_config: NetworkConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("network_toolkit.device.DeviceSession", _Session)
+
+    result = run_commands(
+        RunOptions(
+            target="test_device1,no_such_device",
+            command_or_sequence="/system/identity/print",
+            config=sample_config,
+        )
+    )
+
+    metrics = result.metrics
+    assert metrics is not None
+    assert metrics.devices == 2
+    assert metrics.failures_by_class == {"UnknownTarget": 1}
@@ -0,0 +1,126 @@
+"""Tests for capturing command output straight to disk."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.commands.results import _record_output
+from network_toolkit.config import NetworkConfig
+from network_toolkit.results_archive import read_archive
+from network_toolkit.results_enhanced import ResultsManager
+
+CHUNKS = ["BGP table version is 42\n", "*> 10.0.0.0/8  192.0.2.1  0 65001 i\n", "ü\n"]
+OUTPUT = "".join(CHUNKS)
+
+
+def _capture(manager: ResultsManager, device: str = "r1") -> Any:
+    stream = manager.open_command_stream(device, "show ip bgp", capture=True)
+    assert stream is not None
+    for chunk in CHUNKS:
+        stream.write(chunk)
+    return stream
+
+
+def test_structured_results_refer_to_captured_file(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    sample_config.general.results_format = "json"
+    with ResultsManager(
+        sample_config, store_results=True, results_dir=tmp_path, async_writes=True
+    ) as manager:
+        stream = _capture(manager)
+        stored = stream.close()
+    assert stored is not None
+
+    record = json.loads(stored.read_text(encoding="utf-8"))
+    assert "output" not in record
+    assert record["output_file"] == stored.with_suffix(".out").name
+    assert record["output_bytes"] == len(OUTPUT.encode())
+    assert stream.captured.path == stored.with_suffix(".out")
+    assert stream.captured.read_text() == OUTPUT
+
+
+def test_text_results_capture_into_the_result_file(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    sample_config.general.results_format = "txt"
+    with ResultsManager(sample_config, store_results=True, results_dir=tmp_path) as m:
+        stream = _capture(m)
+        stored = stream.close()
+
+    captured = stream.captured
+    assert captured.path == stored
+    assert captured.offset > 0
+    assert captured.read_text() == OUTPUT
+    assert "".join(captured.iter_text(block_size=5)) == OUTPUT
+    captured.discard()
+    assert stored.exists()
+
+
+def test_unstored_capture_spools_to_a_temporary_file(
+    sample_config: NetworkConfig,
+) -> None:
+    manager = ResultsManager(sample_config, store_results=False)
+    stream = _capture(manager)
+
+    assert stream.close() is None
+    captured = stream.captured
+    assert captured.spooled
+    assert captured.read_text() == OUTPUT
+    captured.discard()
+    assert not captured.path.exists()
+
+
+class CapturingSession:
+    def __init__(self, device_name: str, *_args: Any) -> None:
+        self.device_name = device_name
+
+    def __enter__(self) -> CapturingSession:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        return None
+
+    def execute_command(self, command: str) -> str:
+        msg = "captured runs must not buffer output"
+        raise AssertionError(msg)
+
+    def stream_command(self, command: str) -> Iterator[str]:
+        yield from CHUNKS
+
+
+def test_run_capture_with_archive(
+    sample_config: NetworkConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("network_toolkit.device.DeviceSession", CapturingSession)
+    sample_config.general.results_format = "jsonl"
+
+    result = run_commands(
+        RunOptions(
+            target="test_device1,test_device2",
+            command_or_sequence="show ip bgp",
+            config=sample_config,
+            store_results=True,
+            results_dir=str(tmp_path),
+            capture=True,
+        )
+    )
+
+    assert result.totals.succeeded == 2
+    first = result.command_results[0]
+    assert first.output is None
+    assert first.captured is not None
+    assert first.captured.read_text() == OUTPUT
+    archive = result.results_dir
+    assert archive is not None
+    records = [
+        r for r in read_archive(archive, command="show ip bgp") if "output_file" in r
+    ]
+    assert len(records) == 2
+    assert all(_record_output(archive, r) == OUTPUT for r in records)
@@ -0,0 +1,114 @@
+"""Tests for single-file result archives and the `nw results` command."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+from network_toolkit.cli import app
+from network_toolkit.exceptions import NetworkToolkitError
+from network_toolkit.results_archive import list_archive, read_archive
+from network_toolkit.results_enhanced import ResultsManager
+
+
+def _config(tmp_path: Path, results_format: str) -> MagicMock:
+    config = MagicMock()
+    config.general.store_results = True
+    config.general.results_dir = str(tmp_path / "results")
+    config.general.results_format = results_format
+    config.general.results_include_timestamp = True
+    config.general.results_include_command = True
+    return config
+
+
+def _populate(manager: ResultsManager) -> None:
+    manager.store_command_result("r1", "/system/identity/print", "name: r1")
+    manager.store_command_result("r2", "/system/identity/print", "name: r2")
+    manager.store_sequence_results(
+        "r1", "health", {"/system/resource/print": "cpu: 3%", "/log/print": "ok"}
+    )
+
+
+@pytest.mark.parametrize(
+    ("results_format", "suffix"), [("jsonl", ".jsonl.gz"), ("sqlite", ".sqlite")]
+)
+@pytest.mark.parametrize("async_writes", [False, True])
+def test_archive_round_trip(
+    tmp_path: Path, results_format: str, suffix: str, *, async_writes: bool
+) -> None:
+    with ResultsManager(
+        _config(tmp_path, results_format), async_writes=async_writes
+    ) as manager:
+        _populate(manager)
+        archive = manager.archive_path
+
+    assert archive is not None
+    assert archive.name.endswith(suffix)
+    assert manager.results_location == archive
+    assert manager.session_dir is None
+    # Only the archive (plus index sidecar) lands in the results directory
+    assert all(p.is_file() for p in archive.parent.iterdir())
+
+    entries = list_archive(archive)
+    assert [e.device for e in entries] == ["r1", "r2", "r1", "r1", "r1"]
+    assert entries[-1].kind == "sequence_summary"
+
+    r1_identity = list(
+        read_archive(archive, device="r1", command="/system/identity/print")
+    )
+    assert [r["output"] for r in r1_identity] == ["name: r1"]
+
+    health = list_archive(archive, command="/system/resource/print")
+    assert len(health) == 1
+    assert health[0].kind == "sequence_command"
+
+
+def test_jsonl_archive_is_plain_gzip_and_works_without_index(tmp_path: Path) -> None:
+    with ResultsManager(_config(tmp_path, "jsonl")) as manager:
+        _populate(manager)
+        archive = manager.archive_path
+    assert archive is not None
+
+    with gzip.open(archive, "rt", encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh]
+    assert len(records) == 5
+
+    archive.with_name(archive.name + ".idx").unlink()
+    outputs = [r["output"] for r in read_archive(archive, device="r2")]
+    assert outputs == ["name: r2"]
+
+
+def test_missing_archive_raises(tmp_path: Path) -> None:
+    with pytest.raises(NetworkToolkitError, match="not found"):
+        list_archive(tmp_path / "nope.sqlite")
+
+
+def test_results_cli_list_and_show(tmp_path: Path) -> None:
+    with ResultsManager(_config(tmp_path, "sqlite")) as manager:
+        _populate(manager)
+        archive = manager.archive_path
+    assert archive is not None
+    runner = CliRunner()
+
+    listed = runner.invoke(
+        app, ["results", "list", str(archive), "--device", "r2", "-o", "raw"]
+    )
+    assert listed.exit_code == 0
+    assert "r2" in listed.output
+    assert "r1" not in listed.output
+
+    shown = runner.invoke(
+        app,
+        ["results", "show", str(archive), "--command", "/log/print", "-o", "raw"],
+    )
+    assert shown.exit_code == 0
+    assert shown.output.strip() == "ok"
+
+    as_json = runner.invoke(app, ["results", "show", str(archive), "--json"])
+    assert as_json.exit_code == 0
+    assert len(as_json.output.strip().splitlines()) == 5
@@ -0,0 +1,113 @@
+"""Tests for compressed result storage and reading compressed baselines."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from network_toolkit.api.diff import (
+    DiffOptions,
+    _find_baseline_file_for_command,
+    diff_targets,
+)
+from network_toolkit.common.compression import open_text, read_text, zstd_available
+from network_toolkit.config import GeneralConfig, NetworkConfig
+from network_toolkit.results_enhanced import ResultsManager
+
+OUTPUT = "interface ether1\n  mtu 1500\nü\n"
+
+
+def test_text_results_are_written_compressed(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    sample_config.general.results_compression = "gzip"
+    with ResultsManager(
+        sample_config, store_results=True, results_dir=tmp_path, async_writes=True
+    ) as manager:
+        manager.store_command_result("r1", "/interface/print", OUTPUT)
+        stream = manager.open_command_stream("r1", "/export", capture=True)
+        assert stream is not None
+        stream.write(OUTPUT)
+        streamed = stream.close()
+
+    stored = next(tmp_path.rglob("cmd_*interface*"))
+    assert stored.name.endswith(".txt.gz")
+    assert OUTPUT in gzip.decompress(stored.read_bytes()).decode("utf-8")
+    assert streamed is not None
+    assert streamed.name.endswith(".txt.gz")
+    assert stream.captured.read_text() == OUTPUT
+
+
+def test_captured_output_sidecar_is_compressed(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    sample_config.general.results_format = "json"
+    sample_config.general.results_compression = "gzip"
+    manager = ResultsManager(sample_config, store_results=True, results_dir=tmp_path)
+    stream = manager.open_command_stream("r1", "show tech", capture=True)
+    assert stream is not None
+    stream.write(OUTPUT)
+    stored = stream.close()
+
+    assert stored is not None
+    assert stored.name.endswith(".json.gz")
+    with open_text(stored) as f:
+        record = json.load(f)
+    assert record["output_file"] == stored.name.replace(".json.gz", ".out.gz")
+    assert record["output_bytes"] == len(OUTPUT.encode())
+    assert read_text(stored.parent / record["output_file"]) == OUTPUT
+
+
+def test_archives_ignore_compression(sample_config: NetworkConfig) -> None:
+    sample_config.general.results_format = "jsonl"
+    sample_config.general.results_compression = "gzip"
+    manager = ResultsManager(sample_config, store_results=False)
+    assert manager.results_compression == "none"
+
+
+def test_unknown_compression_is_rejected() -> None:
+    with pytest.raises(ValidationError, match="results_compression"):
+        GeneralConfig(results_compression="lz4")
+
+
+@patch("network_toolkit.api.diff.DeviceSession")
+def test_diff_reads_compressed_baseline(
+    mock_session_cls: MagicMock, tmp_path: Path
+) -> None:
+    (tmp_path / "dev1.rsc.gz").write_bytes(gzip.compress(b"config A\n"))
+    (tmp_path / "cmd_interface_print.txt.gz").write_bytes(gzip.compress(b"a\n"))
+    session = mock_session_cls.return_value.__enter__.return_value
+    session.execute_command.return_value = "config B"
+    config = MagicMock(spec=NetworkConfig)
+    config.devices = {"dev1": MagicMock()}
+    config.device_groups = {}
+    config.general = MagicMock()
+
+    result = diff_targets(
+        DiffOptions(targets="dev1", subject="config", config=config, baseline=tmp_path)
+    )
+
+    outcome = result.results[0].outcome
+    assert outcome is not None
+    assert "-config A" in outcome.output
+    assert "+config B" in outcome.output
+    assert _find_baseline_file_for_command(tmp_path, "/interface/print") == (
+        tmp_path / "cmd_interface_print.txt.gz"
+    )
+
+
+@pytest.mark.skipif(zstd_available(), reason="zstd support is installed")
+def test_zstd_without_support_names_the_extra(tmp_path: Path) -> None:
+    with pytest.raises(ImportError, match=r"networka\[zstd\]"):
+        open_text(tmp_path / "out.txt.zst", "w")
+
+
+@pytest.mark.skipif(zstd_available(), reason="zstd support is installed")
+def test_zstd_is_rejected_without_a_backend() -> None:
+    with pytest.raises(ValidationError, match=r"networka\[zstd\]"):
+        GeneralConfig(results_compression="zstd")
@@ -1,9 +1,10 @@
 """Tests for results_enhanced module."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
-from network_toolkit.results_enhanced import ResultsManager
+from network_toolkit.results_enhanced import ResultsManager, ResultWriter
 
 
 class TestResultsManager:
@@ -408,3 +409,95 @@ class TestResultsManager:
 
             # mkdir should not be called when store_results is False
             mock_mkdir.assert_not_called()
+
+
+class TestAsyncResultWriter:
+    """Test the background result writer."""
+
+    @staticmethod
+    def _config(tmp_path: Path, results_format: str = "txt") -> MagicMock:
+        config = MagicMock()
+        config.general.store_results = True
+        config.general.results_dir = str(tmp_path)
+        config.general.results_format = results_format
+        config.general.results_include_timestamp = True
+        config.general.results_include_command = True
+        return config
+
+    def test_async_writes_are_flushed_on_close(self, tmp_path: Path) -> None:
+        """Queued command and sequence results land on disk after close()."""
+        with ResultsManager(
+            self._config(tmp_path, "json"), async_writes=True
+        ) as manager:
+            cmd_path = manager.store_command_result("sw1", "/system/identity", "x")
+            seq_paths = manager.store_sequence_results(
+                "sw2", "info", {"/a": "1", "/b": "2"}
+            )
+
+        assert cmd_path is not None
+        assert cmd_path.exists()
+        assert len(seq_paths) == 3
+        assert all(p.exists() for p in seq_paths)
+
+    def test_flush_waits_for_pending_writes(self, tmp_path: Path) -> None:
+        """flush() blocks until every queued file has been written."""
+        manager = ResultsManager(self._config(tmp_path), async_writes=True)
+        try:
+            paths = [
+                manager.store_command_result(f"dev{i}", "/cmd", f"out {i}")
+                for i in range(50)
+            ]
+            manager.flush()
+            assert all(p is not None and p.exists() for p in paths)
+        finally:
+            manager.close()
+
+    def test_writer_applies_backpressure_with_small_queue(self, tmp_path: Path) -> None:
+        """A tiny queue still delivers every write in order."""
+        written: list[str] = []
+
+        def _write(path: Path, data: dict, *, is_single_command: bool) -> None:
+            assert is_single_command
+            written.append(data["n"])
+
+        writer = ResultWriter(_write, max_pending=2, batch_size=2)
+        for n in range(20):
+            writer.submit(tmp_path / "d" / f"{n}.txt", {"n": n}, is_single_command=True)
+        writer.close()
+
+        assert written == list(range(20))
+        assert (tmp_path / "d").is_dir()
+
+    def test_submit_after_close_writes_inline(self, tmp_path: Path) -> None:
+        """Late submissions are not lost."""
+        written: list[Path] = []
+        writer = ResultWriter(lambda path, _data, **_kw: written.append(path))
+        writer.close()
+
+        writer.submit(tmp_path / "late.txt", {}, is_single_command=True)
+
+        assert written == [tmp_path / "late.txt"]
+
+    def test_submit_racing_close_is_not_lost(self, tmp_path: Path) -> None:
+        """Writes submitted while close() runs are written, not dropped."""
+        written: list[Path] = []
+        writer = ResultWriter(
+            lambda path, _data, **_kw: written.append(path), max_pending=1
+        )
+        paths = [tmp_path / f"{n}.txt" for n in range(200)]
+
+        def _submit(chunk: list[Path]) -> None:
+            for path in chunk:
+                writer.submit(path, {}, is_single_command=True)
+
+        threads = [
+            threading.Thread(target=_submit, args=(paths[i::4],)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        writer.close()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert sorted(written) == sorted(paths)
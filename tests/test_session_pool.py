@@ -236,3 +236,58 @@ class TestSessionPoolThreadSafety:
             t.join()
 
         assert len(pool) == 0
+
+
+class TestSessionPoolBoundsAndExpiry:
+    """Test optional LRU bounds, idle expiry and checkout pinning."""
+
+    def test_lru_eviction_disconnects_oldest(self) -> None:
+        now = [0.0]
+        pool = SessionPool(max_sessions=2, clock=lambda: now[0])
+        sessions = {name: MagicMock() for name in ("r1", "r2", "r3")}
+        pool["r1"] = sessions["r1"]
+        now[0] = 1.0
+        pool["r2"] = sessions["r2"]
+        now[0] = 2.0
+        assert pool.get("r1") is sessions["r1"]  # touch r1
+        now[0] = 3.0
+        pool["r3"] = sessions["r3"]
+
+        assert pool.keys() == ["r1", "r3"]
+        sessions["r2"].disconnect.assert_called_once()
+        sessions["r1"].disconnect.assert_not_called()
+
+    def test_checked_out_sessions_are_not_evicted(self) -> None:
+        pool = SessionPool(max_sessions=1)
+        busy, other = MagicMock(), MagicMock()
+        pool["busy"] = busy
+        assert pool.checkout("busy") is busy
+
+        pool["other"] = other
+
+        # Pool may exceed its bound while sessions are pinned
+        assert pool.keys() == ["busy"]
+        other.disconnect.assert_called_once()
+        busy.disconnect.assert_not_called()
+
+        pool.checkin("busy")
+        pool["other"] = other
+        busy.disconnect.assert_called_once()
+
+    def test_idle_sessions_expire(self) -> None:
+        now = [0.0]
+        pool = SessionPool(idle_timeout=10, clock=lambda: now[0])
+        idle, pinned = MagicMock(), MagicMock()
+        pool["idle"] = idle
+        pool["pinned"] = pinned
+        pool.checkout("pinned")
+        now[0] = 11.0
+
+        assert pool.expire_idle() == ["idle"]
+        idle.disconnect.assert_called_once()
+        assert "pinned" in pool
+
+        pool.checkin("pinned")
+        now[0] = 22.0
+        assert pool.get("pinned") is None
+        pinned.disconnect.assert_called_once()
@@ -132,6 +132,44 @@ def test_default_user_inheritance(sample_ssh_config: Path) -> None:
     assert hosts["router-edge-01"].user == "default_user"
 
 
+def test_matches_paramiko_lookup(sample_ssh_config: Path) -> None:
+    """The one-pass compiler resolves the same values as paramiko."""
+    from paramiko import SSHConfig
+
+    reference = SSHConfig.from_path(str(sample_ssh_config))
+    hosts = parse_ssh_config(SSHConfigOptions(path=sample_ssh_config))
+
+    for name, host in hosts.items():
+        expected = reference.lookup(name)
+        assert host.hostname == expected["hostname"]
+        assert host.user == expected.get("user")
+
+
+def test_hostname_token_and_match_all(tmp_path: Path) -> None:
+    """%h in HostName expands to the alias; Match all applies everywhere."""
+    config = tmp_path / "config"
+    config.write_text(
+        """\
+Host edge-1 edge-2
+    HostName %h.mgmt.example.net
+
+Host core-1 !core-*
+    User never
+
+Match all
+    User admin
+    Port 2222
+""",
+        encoding="utf-8",
+    )
+
+    hosts = parse_ssh_config(SSHConfigOptions(path=config))
+
+    assert hosts["edge-2"].hostname == "edge-2.mgmt.example.net"
+    assert hosts["core-1"].user == "admin"
+    assert hosts["core-1"].port == 2222
+
+
 def test_include_and_exclude_combined(sample_ssh_config: Path) -> None:
     """Include and exclude patterns work together."""
     options = SSHConfigOptions(
@@ -206,6 +244,28 @@ Host switch-01
         assert data["router-01"]["device_type"] == "generic"
         assert data["router-01"]["_ssh_config_source"] == "router-01"
 
+    def test_sync_without_changes_leaves_file_untouched(
+        self, ssh_config_file: Path, output_file: Path
+    ) -> None:
+        """A second sync with no SSH config changes does not rewrite the file."""
+        from typer.testing import CliRunner
+
+        from network_toolkit.cli import app
+
+        runner = CliRunner()
+        args = ["sync", "ssh-config", str(ssh_config_file), "-o", str(output_file)]
+        assert runner.invoke(app, args).exit_code == 0
+        output_file.write_text(
+            output_file.read_text(encoding="utf-8") + "# keep me\n", encoding="utf-8"
+        )
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0, result.output
+        assert "No changes" in result.output
+        assert "Wrote" not in result.output
+        assert output_file.read_text(encoding="utf-8").endswith("# keep me\n")
+
     def test_sync_preserves_manual_edits(
         self, ssh_config_file: Path, output_file: Path
     ) -> None:
@@ -736,29 +796,47 @@ class TestSSHConfigErrors:
 
         assert hosts == {}
 
-    def test_parse_ssh_config_with_include_directive(self, tmp_path: Path) -> None:
-        """Should error when Include directive is present."""
-        from network_toolkit.exceptions import ConfigurationError
-
+    def test_parse_ssh_config_follows_include_directive(self, tmp_path: Path) -> None:
+        """Include directives are spliced in place, globs in sorted order."""
+        config_d = tmp_path / "config.d"
+        config_d.mkdir()
+        (config_d / "20-switches").write_text(
+            "Host switch-01\n    HostName 10.2.0.1\n", encoding="utf-8"
+        )
+        (config_d / "10-routers").write_text(
+            "Host router-02\n    HostName 10.1.0.2\n    User ops\n",
+            encoding="utf-8",
+        )
         config = tmp_path / "ssh_config"
         config.write_text(
             """\
 Host router-01
     HostName 10.1.0.1
 
-Include ~/.ssh/config.d/*
+Include config.d/*
 
-Host switch-01
-    HostName 10.2.0.1
+Host *
+    User fallback
 """,
             encoding="utf-8",
         )
 
-        options = SSHConfigOptions(path=config)
-        with pytest.raises(ConfigurationError) as exc_info:
-            parse_ssh_config(options)
+        hosts = parse_ssh_config(SSHConfigOptions(path=config))
+
+        assert list(hosts) == ["router-01", "router-02", "switch-01"]
+        assert hosts["router-02"].user == "ops"
+        assert hosts["switch-01"].hostname == "10.2.0.1"
+        assert hosts["switch-01"].user == "fallback"
+
+    def test_recursive_include_rejected(self, tmp_path: Path) -> None:
+        """Self-including configs stop at the OpenSSH nesting limit."""
+        from network_toolkit.exceptions import ConfigurationError
+
+        config = tmp_path / "ssh_config"
+        config.write_text(f"Include {config}\n", encoding="utf-8")
 
-        assert "include" in str(exc_info.value).lower()
+        with pytest.raises(ConfigurationError, match="nesting"):
+            parse_ssh_config(SSHConfigOptions(path=config))
 
     def test_pattern_too_long_rejected(self, tmp_path: Path) -> None:
         """Should reject patterns that are too long (ReDoS prevention)."""
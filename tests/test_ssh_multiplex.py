@@ -0,0 +1,155 @@
+"""Tests for opt-in SSH connection multiplexing."""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import paramiko
+import pytest
+
+from network_toolkit.commands.ssh import _build_ssh_cmd
+from network_toolkit.config import DeviceConfig, GeneralConfig, NetworkConfig
+from network_toolkit.device import DeviceSession
+from network_toolkit.ssh_multiplex import (
+    SharedTransportPool,
+    get_shared_transports,
+    ssh_control_options,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="OpenSSH connection sharing is POSIX-only"
+)
+
+
+@pytest.fixture(autouse=True)
+def runtime_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("NW_USER_DEFAULT", "admin")
+    monkeypatch.setenv("NW_PASSWORD_DEFAULT", "secret")
+    return tmp_path
+
+
+def _config(**general: object) -> NetworkConfig:
+    return NetworkConfig(
+        general=GeneralConfig.model_validate(general),
+        devices={
+            "r1": DeviceConfig(host="10.0.0.1", device_type="mikrotik_routeros"),
+            "r2": DeviceConfig(
+                host="10.0.0.2",
+                device_type="mikrotik_routeros",
+                overrides={"transport": "paramiko"},
+            ),
+        },
+    )
+
+
+def test_control_options_use_private_socket_dir(runtime_dir: Path) -> None:
+    options = ssh_control_options(90)
+
+    socket_dir = runtime_dir / "networka" / "cm"
+    assert options == [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={socket_dir / '%C'}",
+        "-o",
+        "ControlPersist=90",
+    ]
+    assert stat.S_IMODE(socket_dir.stat().st_mode) == 0o700
+
+
+def test_system_transport_sessions_share_a_control_master() -> None:
+    enabled = _config(ssh_multiplexing=True, ssh_control_persist=30)
+
+    params = enabled.get_device_connection_params("r1")
+
+    assert params["transport_options"] == {"open_cmd": ssh_control_options(30)}
+    assert "transport_options" not in enabled.get_device_connection_params("r2")
+    assert "transport_options" not in _config().get_device_connection_params("r1")
+
+
+def test_cli_command_includes_control_options() -> None:
+    cmd = _build_ssh_cmd(
+        host="10.0.0.1",
+        user="admin",
+        auth=MagicMock(),
+        ssh_options=ssh_control_options(60),
+        ctx=MagicMock(),
+    )
+
+    assert "ControlMaster=auto" in cmd
+    assert cmd.index("ControlPersist=60") < cmd.index("admin@10.0.0.1")
+
+
+def test_pool_reuses_active_transports() -> None:
+    pool = SharedTransportPool()
+    with patch("paramiko.Transport", side_effect=lambda _addr: MagicMock()):
+        first = pool.acquire("10.0.0.1", 22, "admin", "pw")
+        second = pool.acquire("10.0.0.1", 22, "admin", "pw")
+        other = pool.acquire("10.0.0.2", 22, "admin", "pw")
+
+        first.is_active.return_value = False
+        replaced = pool.acquire("10.0.0.1", 22, "admin", "pw")
+
+        other_user = pool.acquire("10.0.0.1", 22, "admin", "other")
+
+    assert first is second
+    assert other is not first
+    assert other_user is not replaced
+    assert replaced is not first
+    assert (pool.opened, pool.reused) == (4, 1)
+    first.close.assert_not_called()
+    second.connect.assert_called_once_with(username="admin", password="pw")
+
+    pool.close_all()
+    assert len(pool) == 0
+
+
+def test_transfers_reuse_the_pooled_transport(tmp_path: Path) -> None:
+    session = DeviceSession("r1", _config(ssh_multiplexing=True))
+    session._connected = True
+    local = tmp_path / "backup.rsc"
+    local.write_text("config")
+    pool = get_shared_transports()
+
+    try:
+        with (
+            patch("paramiko.Transport") as transport_class,
+            patch("paramiko.SFTPClient.from_transport") as sftp_from_transport,
+        ):
+            sftp_from_transport.return_value.stat.return_value.st_size = 6
+            for _ in range(3):
+                assert session.download_file("backup.rsc", local)
+
+        transport = transport_class.return_value
+        transport_class.assert_called_once_with(("10.0.0.1", 22))
+        transport.connect.assert_called_once()
+        transport.close.assert_not_called()
+        assert sftp_from_transport.call_count == 3
+    finally:
+        pool.close_all()
+
+
+def test_transfers_use_the_paramiko_session_connection(tmp_path: Path) -> None:
+    session = DeviceSession("r1", _config(ssh_multiplexing=True))
+    own = MagicMock(spec=paramiko.Transport)
+    own.is_active.return_value = True
+    session._transport = MagicMock()
+    session._transport._raw_driver.transport.session = own
+    session._connected = True
+    local = tmp_path / "backup.rsc"
+    local.write_text("config")
+
+    with (
+        patch.object(get_shared_transports(), "acquire") as acquire,
+        patch("paramiko.SFTPClient.from_transport") as sftp_from_transport,
+    ):
+        sftp_from_transport.return_value.stat.return_value.st_size = 6
+        assert session.download_file("backup.rsc", local)
+
+    sftp_from_transport.assert_called_once_with(own)
+    acquire.assert_not_called()
+    own.close.assert_not_called()
@@ -0,0 +1,209 @@
+"""Tests for streaming command output as it arrives."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from scrapli.exceptions import ScrapliTimeout
+
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.config import NetworkConfig
+from network_toolkit.results_enhanced import ResultsManager
+from network_toolkit.session_pool import SessionPool
+from network_toolkit.transport.scrapli_sync import ScrapliSyncTransport
+
+
+class FakeChannel:
+    """Channel returning scripted reads, as Scrapli's channel does."""
+
+    def __init__(
+        self, reads: list[bytes], depth: int = 1000, timeout_ops: float = 30.0
+    ) -> None:
+        self.reads = list(reads)
+        self.written: list[str] = []
+        self._base_channel_args = SimpleNamespace(
+            comms_prompt_pattern=r"^router#\s*$",
+            comms_prompt_search_depth=depth,
+            timeout_ops=timeout_ops,
+        )
+
+    def _get_prompt_pattern(self, class_pattern: str) -> re.Pattern[bytes]:
+        return re.compile(class_pattern.encode(), flags=re.M | re.I)
+
+    @contextmanager
+    def _channel_lock(self) -> Iterator[None]:
+        yield
+
+    def write(self, channel_input: str) -> None:
+        self.written.append(channel_input)
+
+    def _read_until_input(self, channel_input: bytes) -> bytes:
+        return channel_input
+
+    def send_return(self) -> None:
+        self.written.append("\n")
+
+    def read(self) -> bytes:
+        # Like Scrapli's non-blocking transports, return nothing once idle
+        return self.reads.pop(0) if self.reads else b""
+
+
+def _transport(channel: FakeChannel) -> ScrapliSyncTransport:
+    return ScrapliSyncTransport(SimpleNamespace(channel=channel))  # type: ignore[arg-type]
+
+
+def test_yields_complete_lines_until_prompt() -> None:
+    channel = FakeChannel(
+        [
+            b"\n",
+            b"64 bytes seq=1\n64 by",
+            b"tes seq=2\n",
+            b"gr\xc3",
+            b"\xbc\xc3\x9f\nrouter#",
+        ]
+    )
+
+    chunks = list(_transport(channel).stream_command("ping 10.0.0.1"))
+
+    assert chunks == ["64 bytes seq=1\n", "64 bytes seq=2\n", "grüß\n"]
+    assert channel.written == ["ping 10.0.0.1", "\n"]
+    assert channel.reads == []
+
+
+def test_long_partial_lines_are_not_held_back() -> None:
+    channel = FakeChannel([b"\n" + b"." * 20, b"." * 5 + b"\n", b"router#"], depth=10)
+
+    chunks = list(_transport(channel).stream_command("/tool/torch"))
+
+    assert chunks == ["." * 20, "." * 5 + "\n"]
+
+
+def test_silent_device_times_out_between_reads() -> None:
+    channel = FakeChannel([b"\n", b"first line\n"], timeout_ops=0.05)
+    stream = _transport(channel).stream_command("/log/print follow")
+
+    assert next(stream) == "first line\n"
+    with pytest.raises(ScrapliTimeout, match="no output from device"):
+        next(stream)
+
+
+def test_text_results_are_written_while_streaming(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    sample_config.general.results_format = "txt"
+    manager = ResultsManager(
+        sample_config, store_results=True, results_dir=tmp_path, async_writes=True
+    )
+    stream = manager.open_command_stream("r1", "/log/print follow")
+    assert stream is not None
+
+    stream.write("first line\n")
+    path = next(tmp_path.rglob("cmd_*.txt"))
+    assert path.read_text(encoding="utf-8").endswith("=" * 80 + "\n\nfirst line\n")
+
+    stream.write("second line\n")
+    assert stream.close(error="Connection lost") == path
+    assert path.read_text(encoding="utf-8").endswith(
+        "first line\nsecond line\n\n# Output incomplete: Connection lost\n"
+    )
+    manager.close()
+
+
+class StreamingSession:
+    def __init__(self, device_name: str, *_args: Any) -> None:
+        self.device_name = device_name
+
+    def __enter__(self) -> StreamingSession:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        return None
+
+    def execute_command(self, command: str) -> str:
+        msg = "streamed runs must not buffer output"
+        raise AssertionError(msg)
+
+    def stream_command(self, command: str) -> Iterator[str]:
+        yield f"{self.device_name} line 1\n"
+        yield f"{self.device_name} line 2\n"
+
+
+def test_run_streams_output_to_callback_and_results(
+    sample_config: NetworkConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("network_toolkit.device.DeviceSession", StreamingSession)
+    sample_config.general.results_format = "txt"
+    received: list[tuple[str, str]] = []
+
+    result = run_commands(
+        RunOptions(
+            target="test_device1,test_device2",
+            command_or_sequence="/log/print",
+            config=sample_config,
+            store_results=True,
+            results_dir=str(tmp_path),
+            on_output=lambda device, chunk: received.append((device, chunk)),
+        )
+    )
+
+    assert sorted(received) == [
+        ("test_device1", "test_device1 line 1\n"),
+        ("test_device1", "test_device1 line 2\n"),
+        ("test_device2", "test_device2 line 1\n"),
+        ("test_device2", "test_device2 line 2\n"),
+    ]
+    first = result.command_results[0]
+    assert first.streamed
+    assert first.output is None
+    assert first.stored_path is not None
+    assert first.stored_path.read_text(encoding="utf-8").endswith(
+        "test_device1 line 1\ntest_device1 line 2\n"
+    )
+    assert result.totals.succeeded == 2
+
+
+class DroppingSession(StreamingSession):
+    """Pooled session whose connection drops after the first chunk."""
+
+    runs = 0
+
+    def connect(self) -> None:
+        return None
+
+    def disconnect(self) -> None:
+        return None
+
+    def stream_command(self, command: str) -> Iterator[str]:
+        type(self).runs += 1
+        yield "64 bytes seq=1\n"
+        msg = "Connection lost"
+        raise RuntimeError(msg)
+
+
+def test_pooled_stream_is_not_retried_after_output(
+    sample_config: NetworkConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("network_toolkit.device.DeviceSession", DroppingSession)
+    received: list[str] = []
+    pool = SessionPool()
+
+    result = run_commands(
+        RunOptions(
+            target="test_device1",
+            command_or_sequence="/tool/torch",
+            config=sample_config,
+            session_pool=pool,
+            on_output=lambda _device, chunk: received.append(chunk),
+        )
+    )
+
+    assert DroppingSession.runs == 1
+    assert received == ["64 bytes seq=1\n"]
+    assert result.command_results[0].error == "Connection lost"
+    assert "test_device1" not in pool
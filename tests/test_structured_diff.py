@@ -0,0 +1,151 @@
+"""Tests for the structured (record-based) state diff engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from network_toolkit.api.diff import DiffOptions, diff_targets
+from network_toolkit.api.structured_diff import (
+    StructuredDiffer,
+    get_template,
+    normalize_command,
+    parse_ios_routes,
+    parse_key_value_records,
+)
+from network_toolkit.config import NetworkConfig
+
+IOS_ROUTES_A = """\
+Codes: L - local, C - connected, S - static, O - OSPF
+Gateway of last resort is 10.0.0.1 to network 0.0.0.0
+
+S*    0.0.0.0/0 [1/0] via 10.0.0.1
+      10.0.0.0/8 is variably subnetted, 3 subnets, 2 masks
+C        10.0.0.0/24 is directly connected, GigabitEthernet1
+O        10.1.1.0/24 [110/2] via 10.0.0.2, 00:01:23, GigabitEthernet1
+                     [110/2] via 10.0.0.3, 00:01:23, GigabitEthernet2
+"""
+
+IOS_ROUTES_B = """\
+S*    0.0.0.0/0 [1/0] via 10.0.0.1
+      10.0.0.0/8 is variably subnetted, 3 subnets, 2 masks
+C        10.0.0.0/24 is directly connected, GigabitEthernet1
+O        10.1.1.0/24 [110/5] via 10.0.0.2, 03:11:00, GigabitEthernet1
+O        10.2.2.0/24 [110/2] via 10.0.0.2, 00:00:10, GigabitEthernet1
+"""
+
+ROS_ROUTES_A = """\
+Flags: D - DYNAMIC; A - ACTIVE; c - CONNECT, s - STATIC
+Columns: DST-ADDRESS, GATEWAY, DISTANCE
+#     DST-ADDRESS       GATEWAY       DISTANCE
+0  As 0.0.0.0/0         192.168.88.1         1
+  DAc 192.168.88.0/24   bridge               0
+"""
+
+ROS_ROUTES_B = """\
+Flags: D - DYNAMIC; A - ACTIVE; c - CONNECT, s - STATIC
+Columns: DST-ADDRESS, GATEWAY, DISTANCE
+#     DST-ADDRESS       GATEWAY       DISTANCE
+0  As 0.0.0.0/0         192.168.88.1         5
+1  As 10.9.0.0/16       192.168.88.2         1
+  DAc 192.168.88.0/24   bridge               0
+"""
+
+
+def test_normalize_command_folds_routeros_path_syntax() -> None:
+    assert normalize_command("/ip/route/print") == "/ip route print"
+    assert normalize_command("  /ip   route print terse") == "/ip route print terse"
+    assert normalize_command("show  ip route") == "show ip route"
+
+
+def test_parse_ios_routes_includes_ecmp_continuations() -> None:
+    records = parse_ios_routes(IOS_ROUTES_A.splitlines())
+
+    prefixes = [(r["prefix"], r["nexthop"]) for r in records]
+    assert ("0.0.0.0/0", "10.0.0.1") in prefixes
+    assert ("10.0.0.0/24", "directly connected") in prefixes
+    assert ("10.1.1.0/24", "10.0.0.3") in prefixes
+    assert len(records) == 4
+
+
+def test_parse_key_value_records_handles_quoted_values() -> None:
+    lines = [
+        '0 A dst-address=0.0.0.0/0 gateway=10.0.0.1 comment="default route"',
+        "1 dst-address=10.0.0.0/8",
+        "    gateway=10.0.0.2",
+    ]
+
+    records = parse_key_value_records(lines)
+
+    assert records[0]["comment"] == "default route"
+    assert records[1] == {"dst-address": "10.0.0.0/8", "gateway": "10.0.0.2"}
+
+
+def test_structured_diff_ios_routes_reports_keyed_changes() -> None:
+    differ = StructuredDiffer.for_command("cisco_iosxe", "show ip route")
+    assert differ is not None
+
+    outcome = differ.diff(IOS_ROUTES_A, IOS_ROUTES_B)
+    text = outcome.to_string()
+
+    assert "[+] Added: ios_ip_route prefix=10.2.2.0/24 nexthop=10.0.0.2" in text
+    assert "[-] Removed: ios_ip_route prefix=10.1.1.0/24 nexthop=10.0.0.3" in text
+    assert "metric 2 -> 5" in text
+    # Route age is volatile and must not be reported
+    assert "age" not in text
+    assert not outcome.low_confidence
+
+
+def test_structured_diff_routeros_table_ignores_row_numbers() -> None:
+    differ = StructuredDiffer.for_command("mikrotik_routeros", "/ip/route/print")
+    assert differ is not None
+
+    text = differ.diff(ROS_ROUTES_A, ROS_ROUTES_B).to_string()
+
+    assert "Added: ros_ip_route dst-address=10.9.0.0/16" in text
+    assert "distance 1 -> 5" in text
+    assert "192.168.88.0/24" not in text
+
+
+def test_structured_diff_identical_outputs_reports_nothing() -> None:
+    differ = StructuredDiffer.for_command("mikrotik_routeros", "/ip route print")
+    assert differ is not None
+
+    outcome = differ.diff(ROS_ROUTES_A, ROS_ROUTES_A)
+
+    assert outcome.to_string().startswith("No significant")
+
+
+def test_unknown_command_has_no_template() -> None:
+    assert get_template("mikrotik_routeros", "/system resource print") is None
+    assert get_template(None, "show ip route") is None
+    assert StructuredDiffer.for_command("cisco_iosxe", "show version") is None
+
+
+@patch("network_toolkit.api.diff.DeviceSession")
+def test_diff_targets_structured_mode(mock_session_cls, tmp_path: Path) -> None:
+    config = MagicMock(spec=NetworkConfig)
+    config.devices = {"r1": MagicMock(device_type="mikrotik_routeros")}
+    config.device_groups = {}
+    config.general = MagicMock()
+    config.general.results_dir = "results"
+    session = MagicMock()
+    mock_session_cls.return_value.__enter__.return_value = session
+    session.execute_command.return_value = ROS_ROUTES_B
+    baseline = tmp_path / "routes.txt"
+    baseline.write_text(ROS_ROUTES_A, encoding="utf-8")
+
+    result = diff_targets(
+        DiffOptions(
+            targets="r1",
+            subject="/ip route print",
+            config=config,
+            baseline=baseline,
+            structured=True,
+        )
+    )
+
+    outcome = result.results[0].outcome
+    assert outcome is not None
+    assert outcome.changed is True
+    assert "Added: ros_ip_route dst-address=10.9.0.0/16" in outcome.output
@@ -0,0 +1,147 @@
+"""Tests for the target query language."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from network_toolkit.common.resolver import DeviceResolver
+from network_toolkit.config import NetworkConfig, load_modular_config
+from network_toolkit.exceptions import NetworkToolkitError
+from network_toolkit.inventory.query import (
+    And,
+    Not,
+    Or,
+    Term,
+    is_target_query,
+    parse_target_query,
+)
+from network_toolkit.inventory.resolve import resolve_named_targets
+
+DEVICES = {
+    "zrh-edge-1": {"host": "10.1.0.1", "location": "zurich", "model": "CCR1036"},
+    "zrh-edge-2": {"host": "10.1.0.2", "location": "zurich", "model": "CCR2004"},
+    "zrh-core-1": {"host": "10.1.0.3", "location": "zurich", "model": "CCR2216"},
+    "gva-edge-1": {"host": "10.2.0.1", "location": "geneva", "model": "CCR2004"},
+    "gva-fw-1": {"host": "10.2.0.9", "location": "geneva", "model": "FG100F"},
+}
+
+
+def _config(tmp_path: Path) -> NetworkConfig:
+    devices = {}
+    for name, attrs in DEVICES.items():
+        role = name.split("-")[1]
+        devices[name] = {
+            **attrs,
+            "device_type": "linux" if role == "fw" else "mikrotik_routeros",
+            "tags": [role],
+        }
+    content = {
+        "inventory": {"discover_local": False},
+        "devices": devices,
+        "device_groups": {
+            "zurich": {
+                "description": "Zurich",
+                "members": ["zrh-edge-1", "zrh-edge-2", "zrh-core-1"],
+            },
+            "firewalls": {"description": "Firewalls", "members": ["gva-fw-1"]},
+        },
+    }
+    (tmp_path / "config.yml").write_text(
+        yaml.safe_dump(content, sort_keys=False), encoding="utf-8"
+    )
+    return load_modular_config(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("core,edge", False),
+        ("sw1", False),
+        ("10.0.0.1", False),
+        ("tag:edge", True),
+        ("edge,site:zurich", True),
+        ("core & edge", True),
+        ("!core", True),
+        ("name:/^fw/", True),
+    ],
+)
+def test_is_target_query(expr: str, expected: bool) -> None:
+    assert is_target_query(expr) is expected
+
+
+def test_parse_precedence_and_aliases() -> None:
+    node = parse_target_query("a | site:zurich & !model:CCR1036, name:/x|y/")
+
+    assert node == Or(
+        (
+            Term(None, "a"),
+            And((Term("location", "zurich"), Not(Term("model", "CCR1036")))),
+            Term("name", "x|y", regex=True),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["tag:edge &", "(tag:edge", "tag:edge)", "color:red", "tag:", "name:/(/"],
+)
+def test_parse_errors(expr: str) -> None:
+    with pytest.raises(NetworkToolkitError, match="Invalid target query"):
+        parse_target_query(expr)
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("site:zurich & tag:edge & !model:CCR1036", ["zrh-edge-2"]),
+        ("type:linux | model:CCR2216", ["zrh-core-1", "gva-fw-1"]),
+        ("name:/-edge-\\d$/ & !location:zurich", ["gva-edge-1"]),
+        ("host:10.2.* & !firewalls", ["gva-edge-1"]),
+        ("group:zur* & model:CCR2*", ["zrh-edge-2", "zrh-core-1"]),
+        ("(zurich | firewalls) & !tag:edge", ["zrh-core-1", "gva-fw-1"]),
+    ],
+)
+def test_query_resolution(tmp_path: Path, expr: str, expected: list[str]) -> None:
+    cfg = _config(tmp_path)
+
+    result = resolve_named_targets(cfg, expr)
+
+    assert result.resolved_devices == expected
+    assert result.unknown_targets == []
+
+
+def test_query_reports_unknown_names(tmp_path: Path) -> None:
+    cfg = _config(tmp_path)
+
+    result = resolve_named_targets(cfg, "tag:core | nosuch | group:missing")
+
+    assert result.resolved_devices == ["zrh-core-1"]
+    assert result.unknown_targets == ["nosuch", "group:missing"]
+
+
+def test_query_without_catalog() -> None:
+    cfg = NetworkConfig.model_validate(
+        {
+            "devices": {
+                "r1": {"host": "10.0.0.1", "tags": ["edge"]},
+                "r2": {"host": "10.0.0.2", "tags": ["core"]},
+            },
+            "device_groups": {"all": {"description": "All", "members": ["r1", "r2"]}},
+        }
+    )
+
+    result = resolve_named_targets(cfg, "all & !tag:core")
+
+    assert result.resolved_devices == ["r1"]
+
+
+def test_device_resolver_accepts_queries(tmp_path: Path) -> None:
+    resolver = DeviceResolver(_config(tmp_path))
+
+    devices, unknowns = resolver.resolve_targets("tag:edge & site:geneva")
+
+    assert devices == ["gva-edge-1"]
+    assert unknowns == []
@@ -0,0 +1,222 @@
+"""Tests for per-device timing spans."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from network_toolkit.api.run import RunOptions, run_commands, timings_to_dict
+from network_toolkit.config import NetworkConfig
+from network_toolkit.device import DeviceSession, _time_name_resolution
+from network_toolkit.results_enhanced import ResultsManager
+from network_toolkit.timing import (
+    TimingRecorder,
+    current_recorder,
+    recording,
+    timed,
+)
+from network_toolkit.tracing import configure_tracing
+
+
+class _Part:
+    def __init__(self, calls: list[str], name: str) -> None:
+        self._calls = calls
+        self._name = name
+
+    def open(self) -> None:
+        self._calls.append(self._name)
+
+    def channel_authenticate_ssh(self, **_kwargs: Any) -> None:
+        self._calls.append("auth")
+
+
+class _FakeDriver:
+    """Mimics the open() sequence of a Scrapli driver."""
+
+    def __init__(self, **_params: Any) -> None:
+        self.calls: list[str] = []
+        self.transport = _Part(self.calls, "transport")
+        self.channel = _Part(self.calls, "channel")
+        self.on_open = lambda _conn: self.calls.append("on_open")
+
+    def open(self) -> None:
+        self.transport.open()
+        self.channel.open()
+        self.channel.channel_authenticate_ssh(auth_password="x")
+        self.on_open(self)
+
+    def close(self) -> None:
+        pass
+
+    def send_command(self, command: str) -> Any:
+        return MagicMock(result=f"out:{command}", failed=False)
+
+
+def test_timed_is_noop_without_recorder() -> None:
+    assert current_recorder() is None
+    with timed("command", command="x") as attrs:
+        attrs["bytes"] = 1
+    assert current_recorder() is None
+
+
+def test_recording_collects_spans_and_errors() -> None:
+    with recording() as recorder:
+        with timed("connect", device="r1") as attrs:
+            attrs["attempts"] = 2
+        with pytest.raises(ValueError, match="boom"), timed("command"):
+            msg = "boom"
+            raise ValueError(msg)
+    assert current_recorder() is None
+
+    connect, command = recorder.spans
+    assert connect.name == "connect"
+    assert connect.attributes == {"device": "r1", "attempts": 2}
+    assert connect.duration >= 0
+    assert command.error == "ValueError: boom"
+    assert set(recorder.totals()) == {"connect", "command"}
+    json.dumps([s.to_dict() for s in recorder.spans])
+
+
+def test_device_session_records_connect_phases(sample_config: NetworkConfig) -> None:
+    with patch("network_toolkit.device.Scrapli", _FakeDriver):
+        session = DeviceSession("test_device1", sample_config)
+        with recording() as recorder:
+            session.connect()
+            session.execute_command("/system/identity/print")
+
+    names = [s.name for s in recorder.spans]
+    # Phases complete before the enclosing connect span
+    assert names == [
+        "connect.transport",
+        "connect.auth",
+        "connect.on_open",
+        "connect",
+        "command",
+    ]
+    connect = recorder.spans[3]
+    assert connect.attributes["attempts"] == 1
+    assert recorder.spans[-1].attributes["command"] == "/system/identity/print"
+
+
+def test_name_resolution_skips_ssh_config_aliases(tmp_path: Path) -> None:
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text(
+        "Host core1\n  HostName 10.0.0.1\nHost jump-*\n  ProxyJump bastion\n",
+        encoding="utf-8",
+    )
+    with (
+        patch("network_toolkit.device.socket.getaddrinfo") as getaddrinfo,
+        recording() as recorder,
+    ):
+        _time_name_resolution("core1", 22, str(ssh_config))
+        _time_name_resolution("jump-sw1", 22, str(ssh_config))
+        _time_name_resolution("192.0.2.1", 22, str(ssh_config))
+        _time_name_resolution("sw1.example.net", 22, str(ssh_config))
+        _time_name_resolution("core1", 22, False)
+
+    assert [c.args[0] for c in getaddrinfo.call_args_list] == [
+        "sw1.example.net",
+        "core1",
+    ]
+    assert [s.name for s in recorder.spans] == ["connect.dns", "connect.dns"]
+
+
+def test_name_resolution_is_timed_only_while_tracing(
+    sample_config: NetworkConfig,
+) -> None:
+    resolved: list[str] = []
+    for tracing in (False, True):
+        session = DeviceSession("test_device1", sample_config)
+        configure_tracing(MagicMock() if tracing else None)
+        try:
+            with (
+                patch("network_toolkit.device.Scrapli", _FakeDriver),
+                patch("network_toolkit.device._time_name_resolution") as resolve,
+                recording(),
+            ):
+                session.connect()
+        finally:
+            configure_tracing(None)
+        resolved += [c.args[0] for c in resolve.call_args_list]
+
+    assert resolved == [session._connection_params["host"]]
+
+
+def test_bastion_devices_skip_name_resolution(sample_config: NetworkConfig) -> None:
+    session = DeviceSession("test_device1", sample_config)
+    session._bastion = MagicMock(name="bastion")
+    configure_tracing(MagicMock())
+    try:
+        with (
+            patch("network_toolkit.device.Scrapli", _FakeDriver),
+            patch("network_toolkit.device.get_bastion_slots"),
+            patch("network_toolkit.device._time_name_resolution") as resolve,
+            recording(),
+        ):
+            session.connect()
+    finally:
+        configure_tracing(None)
+
+    resolve.assert_not_called()
+
+
+def test_command_span_counts_bytes(sample_config: NetworkConfig) -> None:
+    with patch("network_toolkit.device.Scrapli", _FakeDriver):
+        session = DeviceSession("test_device1", sample_config)
+        session.connect()
+        with recording() as recorder:
+            session.execute_command("grüß")
+
+    # "out:grüß" is 8 characters but 10 bytes in UTF-8
+    assert recorder.spans[-1].attributes["bytes_received"] == 10
+
+
+def test_results_manager_records_store_span(tmp_path: Path) -> None:
+    config = MagicMock()
+    config.general.results_dir = str(tmp_path)
+    config.general.results_format = "txt"
+    config.general.results_include_timestamp = False
+    config.general.results_include_command = True
+    manager = ResultsManager(config, store_results=True)
+
+    recorder = TimingRecorder()
+    with recording(recorder):
+        manager.store_command_result("r1", "/log/print", "ok")
+
+    (span,) = recorder.spans
+    assert span.name == "results.store"
+    assert span.attributes == {"device": "r1", "kind": "command", "queued": False}
+
+
+def test_run_commands_attaches_timings_per_device(
+    sample_config: NetworkConfig, tmp_path: Path
+) -> None:
+    with patch("network_toolkit.device.Scrapli", _FakeDriver):
+        result = run_commands(
+            RunOptions(
+                target="test_device1,test_device2",
+                command_or_sequence="/system/clock/print",
+                config=sample_config,
+                store_results=True,
+                results_dir=str(tmp_path),
+            )
+        )
+
+    for device_result in result.command_results:
+        names = [s.name for s in device_result.timings]
+        assert "connect" in names
+        assert "command" in names
+        assert "results.store" in names
+        # Spans from parallel workers never leak into another device's result
+        assert all(
+            s.attributes["device"] == device_result.device
+            for s in device_result.timings
+            if "device" in s.attributes
+        )
+
+    exported = json.loads(json.dumps(timings_to_dict(result)))
+    assert set(exported["devices"]) == {"test_device1", "test_device2"}
@@ -0,0 +1,148 @@
+"""Tests for trace spans and the JSON-lines exporter."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from network_toolkit.api.run import RunOptions, run_commands
+from network_toolkit.config import NetworkConfig
+from network_toolkit.tracing import (
+    TraceSpan,
+    configure_tracing,
+    current_span,
+    enable_jsonl_tracing,
+    shutdown_tracing,
+    trace_span,
+    traced,
+    tracing_enabled,
+)
+
+
+class _MemoryExporter:
+    def __init__(self) -> None:
+        self.spans: list[TraceSpan] = []
+        self.shut_down = False
+
+    def export(self, span: TraceSpan) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class _FakeDriver:
+    def __init__(self, **_params: Any) -> None:
+        pass
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def send_command(self, command: str) -> Any:
+        return MagicMock(result=f"output of {command}", failed=False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracing() -> Iterator[None]:
+    yield
+    shutdown_tracing()
+
+
+def test_disabled_tracing_returns_shared_noop_span() -> None:
+    assert not tracing_enabled()
+    first = trace_span("nw.run", target="x")
+    assert first is trace_span("other")
+    with first as span:
+        span.set_attribute("k", "v")
+        span.set_error("ignored")
+    assert current_span() is None
+
+
+def test_spans_nest_and_record_errors() -> None:
+    exporter = _MemoryExporter()
+    configure_tracing(exporter)
+
+    @traced("inner.fn")
+    def inner() -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    with trace_span("root", target="r1") as root:
+        with pytest.raises(RuntimeError):
+            inner()
+        assert current_span() is root
+
+    fn_span, root_span = exporter.spans
+    assert root_span.parent_span_id is None
+    assert fn_span.parent_span_id == root_span.span_id
+    assert fn_span.trace_id == root_span.trace_id
+    assert fn_span.status_code == "ERROR"
+    assert root_span.status_code == "OK"
+    assert root_span.attributes == {"target": "r1"}
+
+    configure_tracing(None)
+    assert exporter.shut_down
+
+
+def test_jsonl_exporter_writes_otlp_style_lines(tmp_path: Path) -> None:
+    trace_file = tmp_path / "traces" / "run.jsonl"
+    enable_jsonl_tracing(trace_file)
+    with trace_span("root"), trace_span("child", bytes_received=10):
+        pass
+    shutdown_tracing()
+
+    lines = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    child, root = lines
+    assert child["name"] == "child"
+    assert child["parentSpanId"] == root["spanId"]
+    assert len(root["traceId"]) == 32
+    assert len(root["spanId"]) == 16
+    assert child["attributes"] == {"bytes_received": 10}
+    assert root["endTimeUnixNano"] >= root["startTimeUnixNano"]
+    assert root["status"] == {"code": "OK"}
+
+
+def test_run_commands_emits_run_device_and_command_spans(
+    sample_config: NetworkConfig,
+) -> None:
+    exporter = _MemoryExporter()
+    configure_tracing(exporter)
+
+    with patch("network_toolkit.device.Scrapli", _FakeDriver):
+        run_commands(
+            RunOptions(
+                target="test_device1,test_device2",
+                command_or_sequence="/system/clock/print",
+                config=sample_config,
+            )
+        )
+
+    by_name: dict[str, list[TraceSpan]] = {}
+    for span in exporter.spans:
+        by_name.setdefault(span.name, []).append(span)
+
+    (run_span,) = by_name["nw.run"]
+    devices = by_name["nw.device"]
+    assert {d.attributes["device.name"] for d in devices} == {
+        "test_device1",
+        "test_device2",
+    }
+    assert all(d.parent_span_id == run_span.span_id for d in devices)
+    assert all(d.attributes["device.type"] == "mikrotik_routeros" for d in devices)
+
+    device_ids = {d.span_id for d in devices}
+    commands = by_name["command"]
+    assert len(commands) == 2
+    assert all(c.parent_span_id in device_ids for c in commands)
+    assert commands[0].attributes["bytes_received"] == len(
+        "output of /system/clock/print"
+    )
+    assert run_span.attributes["devices.total"] == 2
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from network_toolkit.tui.layout import _output_log
+from network_toolkit.tui.output_buffer import OutputCoalescer, line_buffer
+from network_toolkit.tui.output_manager import OutputPanelManager
+
+
+class _DummyLog:
+    def __init__(self) -> None:
+        self.writes: list[str] = []
+
+    def clear(self) -> None:
+        self.writes.clear()
+
+    def write(self, msg: str) -> None:
+        self.writes.append(msg)
+
+
+class _FakeApp:
+    def __init__(self) -> None:
+        self._all = _DummyLog()
+        self._output_filter = ""
+
+    def _maybe_show_output_panel(self) -> None:
+        pass
+
+    def query_one(self, selector: str) -> Any:
+        assert selector == "#output-log"
+        return self._all
+
+
+def _manager(max_lines: int = 100) -> tuple[_FakeApp, OutputPanelManager]:
+    app = _FakeApp()
+    mgr = OutputPanelManager(app, compat=None, max_lines=max_lines)
+    logs: dict[str, _DummyLog] = {}
+    mgr.ensure_device_tab = lambda device: logs.setdefault(device, _DummyLog())  # type: ignore[method-assign]
+    app._output_device_logs = logs  # type: ignore[attr-defined]
+    return app, mgr
+
+
+def test_line_buffer_keeps_newest() -> None:
+    lines = line_buffer([str(i) for i in range(10)], 4)
+    assert list(lines) == ["6", "7", "8", "9"]
+    lines.extend(["10", "11"])
+    assert list(lines) == ["8", "9", "10", "11"]
+
+
+def test_coalescer_drains_in_arrival_order() -> None:
+    buffer = OutputCoalescer()
+    buffer.push("a1\na2", device="r1")
+    buffer.push("b1", device="r2")
+    buffer.push("")
+    buffer.push("a3", device="r1")
+
+    assert buffer.pending_lines == 4
+    assert buffer.drain() == [("r1", ["a1", "a2"]), ("r2", ["b1"]), ("r1", ["a3"])]
+    assert buffer.drain() == []
+    assert buffer.pending_lines == 0
+
+
+def test_coalescer_caps_pending_lines_per_device() -> None:
+    buffer = OutputCoalescer(max_pending_lines=3)
+    buffer.push("q1", device="quiet")
+    buffer.push("1\n2", device="noisy")
+    buffer.push("3\n4\n5", device="noisy")
+
+    assert buffer.dropped_lines == 2
+    assert buffer.drain() == [("quiet", ["q1"]), ("noisy", ["3", "4", "5"])]
+
+
+def test_coalescer_accepts_concurrent_pushes() -> None:
+    buffer = OutputCoalescer()
+
+    def _worker(device: str) -> None:
+        for i in range(200):
+            buffer.push(f"{device}-{i}", device=device)
+
+    threads = [threading.Thread(target=_worker, args=(f"r{n}",)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    chunks = buffer.drain()
+    assert sum(len(lines) for _d, lines in chunks) == 800
+    r0 = [line for d, lines in chunks if d == "r0" for line in lines]
+    assert r0 == [f"r0-{i}" for i in range(200)]
+
+
+def test_append_batch_writes_once_per_widget() -> None:
+    app, mgr = _manager()
+    mgr.append_batch([("r1", ["a", "b"]), ("r2", ["c"]), ("r1", ["d"])])
+
+    assert app._all.writes == ["a\nb\nc\nd"]
+    logs = app._output_device_logs  # type: ignore[attr-defined]
+    assert logs["r1"].writes == ["a\nb\nd"]
+    assert logs["r2"].writes == ["c"]
+    assert list(app._output_device_lines["r1"]) == ["a", "b", "d"]  # type: ignore[attr-defined]
+
+
+def test_append_batch_bounds_buffers_and_writes() -> None:
+    app, mgr = _manager(max_lines=3)
+    mgr.append_batch([("r1", [str(i) for i in range(10)])])
+
+    assert list(app._output_lines) == ["7", "8", "9"]  # type: ignore[attr-defined]
+    assert list(app._output_device_lines["r1"]) == ["7", "8", "9"]  # type: ignore[attr-defined]
+    assert app._all.writes == ["7\n8\n9"]
+
+
+def test_output_log_falls_back_without_max_lines() -> None:
+    class _OldLog:
+        def __init__(self, *, id: str, classes: str) -> None:  # noqa: A002
+            self.id = id
+
+    log = _output_log(SimpleNamespace(TextLogClass=_OldLog))
+
+    assert isinstance(log, _OldLog)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, ClassVar
+
+import pytest
+
+from network_toolkit.tui.data import TuiData
+from network_toolkit.tui.models import RunCallbacks
+from network_toolkit.tui.services import ExecutionService
+
+
+class FakeSession:
+    instances: ClassVar[list[FakeSession]] = []
+
+    def __init__(self, device_name: str, _config: Any) -> None:
+        self.device_name = device_name
+        self.is_connected = False
+        self.fail_next = False
+        self.commands: list[str] = []
+        FakeSession.instances.append(self)
+
+    def connect(self) -> None:
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+    def execute_command(self, command: str) -> str:
+        if self.fail_next:
+            self.fail_next = False
+            msg = "Socket closed"
+            raise OSError(msg)
+        self.commands.append(command)
+        return f"{self.device_name}:{command}"
+
+
+@pytest.fixture
+def service(monkeypatch: Any) -> ExecutionService:
+    FakeSession.instances = []
+    monkeypatch.setattr("network_toolkit.cli.DeviceSession", FakeSession)
+    return ExecutionService(TuiData("config"), concurrency=2)
+
+
+def _callbacks(outputs: list[str], metas: list[str]) -> RunCallbacks:
+    return RunCallbacks(
+        on_output=outputs.append, on_error=outputs.append, on_meta=metas.append
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_runs_reuse_pooled_sessions(service: ExecutionService) -> None:
+    outputs: list[str] = []
+    metas: list[str] = []
+    plan = {"r1": ["show a"], "r2": ["show b"]}
+
+    await service.run_plan(plan, _callbacks(outputs, metas))
+    await service.run_plan(plan, _callbacks(outputs, metas))
+
+    assert len(FakeSession.instances) == 2
+    assert sorted(service.session_pool.keys()) == ["r1", "r2"]
+    assert sum("reused session" in m for m in metas) == 2
+    assert outputs.count("r1:show a") == 2
+
+    service.close()
+    assert len(service.session_pool) == 0
+    assert not any(s.is_connected for s in FakeSession.instances)
+
+
+@pytest.mark.asyncio
+async def test_stale_pooled_session_is_replaced(service: ExecutionService) -> None:
+    outputs: list[str] = []
+    metas: list[str] = []
+    await service.run_plan({"r1": ["show a"]}, _callbacks(outputs, metas))
+    first = FakeSession.instances[0]
+    first.fail_next = True
+
+    result = await service.run_plan({"r1": ["show a"]}, _callbacks(outputs, metas))
+
+    assert result.failures == 0
+    assert len(FakeSession.instances) == 2
+    assert service.session_pool.get("r1") is FakeSession.instances[1]
+    assert not first.is_connected
+    assert any("stale" in m for m in metas)
+
+
+def test_hard_cancel_drops_sessions_from_pool(service: ExecutionService) -> None:
+    session = FakeSession("r1", None)
+    session.connect()
+    service.session_pool["r1"] = session
+    service._register_session(session)
+
+    service.request_hard_cancel()
+
+    assert service.session_pool.get("r1") is None
+    assert not session.is_connected
+
+
+@pytest.mark.asyncio
+async def test_progress_reports_adaptive_concurrency(service: ExecutionService) -> None:
+    outputs: list[str] = []
+    progress: list[tuple[int, int, int]] = []
+    cb = RunCallbacks(
+        on_output=outputs.append,
+        on_error=outputs.append,
+        on_meta=lambda _m: None,
+        on_progress=lambda done, total, limit: progress.append((done, total, limit)),
+    )
+
+    await service.run_plan({f"r{i}": ["show a"] for i in range(4)}, cb)
+
+    assert progress[0] == (0, 4, 2)
+    assert progress[-1][:2] == (4, 4)
+    # Fast, error-free connects and commands raise the limit
+    assert service.concurrency > 2
+    assert progress[-1][2] == service.concurrency
+
+
+class StreamingSession(FakeSession):
+    def stream_command(self, _command: str) -> Iterator[str]:
+        yield from ["first\n\n", "a long li", "ne\n", "\nlast\n"]
+
+
+def test_streamed_lines_are_joined_across_chunks(service: ExecutionService) -> None:
+    emitted: list[str] = []
+
+    finished = service._execute_timed(
+        StreamingSession("r1", None), "/log/print", emitted.append, None
+    )
+
+    assert finished
+    assert emitted == ["first\n", "a long line", "\nlast"]
+    assert "\n".join(emitted) == "first\n\na long line\n\nlast"
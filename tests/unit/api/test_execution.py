@@ -1,8 +1,16 @@
 """Tests for parallel execution utilities."""
 
+import threading
+import time
+
 import pytest
 
-from network_toolkit.api.execution import execute_parallel
+from network_toolkit.api.execution import (
+    AdaptiveLimiter,
+    execute_parallel,
+    is_congestion_error,
+)
+from network_toolkit.exceptions import DeviceConnectionError
 
 
 def test_execute_parallel_empty_list():
@@ -53,3 +61,92 @@ def test_execute_parallel_preserves_input_order():
     items = [3, 1, 2]
     result = execute_parallel(items, lambda x: x)
     assert result == items
+
+
+def test_adaptive_limiter_increases_after_flat_window():
+    """The limit grows by one per window of fast, successful operations."""
+    limiter = AdaptiveLimiter(initial=2, max_limit=4)
+    for _ in range(2):
+        limiter.record_success(0.1, key="connect")
+    assert limiter.limit == 3
+    for _ in range(3 + 4):
+        limiter.record_success(0.1, key="connect")
+    assert limiter.limit == 4  # capped at max_limit
+
+
+def test_adaptive_limiter_holds_when_latency_rises():
+    """Rising latency for a key stops additive increase."""
+    limiter = AdaptiveLimiter(initial=2, latency_tolerance=2.0, smoothing=1.0)
+    limiter.record_success(0.1, key="show version")
+    for _ in range(5):
+        limiter.record_success(1.0, key="show version")
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter_backs_off_once_per_window_on_congestion():
+    """Congestion halves the limit; errors from the same burst do not compound."""
+    limiter = AdaptiveLimiter(initial=8)
+    assert limiter.record_failure(TimeoutError("timed out")) is True
+    assert limiter.limit == 4
+    limiter.record_failure(ConnectionResetError())
+    assert limiter.limit == 4
+    for _ in range(8):
+        limiter.record_failure("Connection reset by peer")
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter_ignores_non_congestion_failures():
+    """Command and auth errors do not reduce concurrency."""
+    limiter = AdaptiveLimiter(initial=4)
+    assert limiter.record_failure(ValueError("invalid command")) is False
+    assert limiter.record_failure(ConnectionRefusedError()) is False
+    assert limiter.limit == 4
+
+
+def test_is_congestion_error_follows_cause_chain():
+    """Wrapped transport errors are classified by their cause."""
+    try:
+        try:
+            raise TimeoutError
+        except TimeoutError as e:
+            msg = "Failed to connect to r1"
+            raise DeviceConnectionError(msg) from e
+    except DeviceConnectionError as wrapped:
+        assert is_congestion_error(wrapped)
+    assert is_congestion_error("Error reading SSH protocol banner")
+    assert not is_congestion_error("Authentication failed")
+
+
+def test_execute_parallel_with_limiter_bounds_in_flight():
+    """With a limiter, no more than its limit run at once and order is kept."""
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(x):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x * 2
+
+    items = list(range(8))
+    assert execute_parallel(items, work, limiter=limiter) == [x * 2 for x in items]
+    assert peak <= 2
+
+
+def test_execute_parallel_with_limiter_backs_off_and_propagates():
+    """Congestion errors reach the limiter and are still raised."""
+    limiter = AdaptiveLimiter(initial=4)
+
+    def work(_x):
+        msg = "timed out"
+        raise TimeoutError(msg)
+
+    with pytest.raises(TimeoutError):
+        execute_parallel([0], work, limiter=limiter)
+    assert limiter.limit == 2